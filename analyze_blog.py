@@ -1,22 +1,306 @@
 #!/usr/bin/env python3
 """
 Analyze WordPress export XML to extract blog patterns for GeekBlog templates.
+
+The export is streamed with iterparse: each <item> is analyzed as soon as it
+is parsed, then cleared, and statistics are accumulated in a single pass
+(BlogStats). Numeric per-post features are kept as a columnar NumPy
+matrix (FeatureMatrix, a few hundred bytes per post), from which the
+report derives its means, percentiles, histograms and per-category figures.
+
+With --workers N, batches of posts are analyzed by a pool of N processes
+and their BlogStats are merged in post order; the report is identical to
+the serial one.
+
+With --cache PATH, per-post results are kept in a SQLite file keyed by post
+GUID and content hash: later runs only analyze new or edited posts and
+rebuild the report from the cached feature vectors.
+
+Usage:
+    python analyze_blog.py [export.xml] [--output report.json] [--workers N]
+                           [--cache analysis_cache.sqlite]
 """
 
-import xml.etree.ElementTree as ET
-import re
-from collections import Counter
+import argparse
+import hashlib
 import json
+import os
+import re
+import sqlite3
+import xml.etree.ElementTree as ET
+from array import array
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from email.utils import parsedate_to_datetime
+from itertools import compress
+
+import numpy as np
+
+DEFAULT_XML_FILE = (
+    "/mnt/c/code/geekblog/examples/lesgeeksatempspartiel.WordPress.2025-06-28.xml"
+)
+DEFAULT_OUTPUT_FILE = "/mnt/c/code/geekblog/blog_analysis_report.json"
+
+# WordPress XML namespaces
+WP_NS = "{http://wordpress.org/export/1.2/}"
+CONTENT_NS = "{http://purl.org/rss/1.0/modules/content/}"
+
+HTML_TAG_RE = re.compile(r"<[^>]+>")
+WHITESPACE_RE = re.compile(r"\s+")
+ENTITY_RE = re.compile(r"&[^;]+;")
+SENTENCE_SPLIT_RE = re.compile(r"[.!?]+")
+LINK_RE = re.compile(r"https?://[^\s]+")
+# Structural tags counted in one scan: img, code, ol/ul, h1-h6
+STRUCTURE_TAG_RE = re.compile(r"<(img|code|[ou]l|h[1-6])[^>]*>")
+PERSONAL_PRONOUN_RE = re.compile(r"\b(je|j\'|me|moi|mon|ma|mes|nous|notre|nos)\b")
+# Tokens for term matching: words, whitespace runs, and punctuation kept as
+# separate tokens (a term only matches text with the same spacing)
+TOKEN_RE = re.compile(r"\w+|\s+|[^\w\s]")
+
+TITLE_PATTERNS = {
+    "questions": ["comment", "pourquoi", "que", "qui", "où", "quand", "?"],
+    "how_to": [
+        "guide",
+        "tutorial",
+        "tuto",
+        "comment faire",
+        "installer",
+        "configurer",
+    ],
+    "reviews": ["test", "review", "analyse", "évaluation", "comparaison"],
+    "news": ["nouvelle", "news", "sortie", "lancé", "annonce"],
+    "opinions": ["opinion", "avis", "pensée", "réflexion", "mon point de vue"],
+    "tutorials": ["étape", "pas à pas", "méthode", "technique"],
+    "lists": ["top", "liste", "meilleur", "conseil", "astuce"],
+    "series": ["série", "partie", "episode", "chapitre", "#"],
+}
+
+STRUCTURE_FIELDS = (
+    "paragraph_count",
+    "sentence_count",
+    "word_count",
+    "avg_sentence_length",
+    "link_count",
+    "image_count",
+    "code_count",
+    "list_count",
+    "header_count",
+)
+TONE_FIELDS = (
+    "personal_pronouns_ratio",
+    "questions_ratio",
+    "exclamations_ratio",
+    "tech_terms_ratio",
+    "informal_ratio",
+    "geek_slang_ratio",
+)
+# Layout of the per-post feature vectors (cache); all fields but the ratios
+# and avg_sentence_length are integers. text_word_count is counted on the
+# cleaned text, the structure word_count on the HTML.
+FEATURE_FIELDS = ("content_length", "text_word_count") + STRUCTURE_FIELDS + TONE_FIELDS
+FLOAT_FEATURES = frozenset(TONE_FIELDS) | {"avg_sentence_length"}
+
+# Bump when the per-post analysis changes (cached vectors become stale)
+ANALYSIS_VERSION = 2
+
+
+# Posts sent to a worker process at once (--workers)
+BATCH_SIZE = 64
+# Posts looked up in the cache at once (--cache)
+CACHE_BATCH_SIZE = 1000
+
+
+def _terms(alternation):
+    """Split a "|"-separated vocabulary, dropping duplicates."""
+    return tuple(dict.fromkeys(alternation.split("|")))
+
+
+TECH_TERMS = _terms(
+    "api|framework|code|développement|programmation|serveur|base de données|"
+    "algorithme|javascript|python|linux|windows|mac|ios|android|app|application|"
+    "logiciel|software|hardware|cloud|ia|intelligence artificielle|machine learning|"
+    "blockchain|crypto|bitcoin|tesla|spacex|google|apple|microsoft|amazon|meta|"
+    "facebook|twitter|github|stackoverflow"
+)
+
+INFORMAL_EXPRESSIONS = _terms(
+    "bref|en fait|du coup|genre|style|truc|machin|super|cool|top|génial|excellent|"
+    "incroyable|impressionnant"
+)
+
+GEEK_SLANG = _terms(
+    "geek|nerd|dev|admin|user|noob|pro|hacker|bug|debug|crash|lag|troll|epic|fail|"
+    "win|lol|mdr|wtf|omg|fyi|asap|diy|faq|gui|cli|ui|ux|seo|poo|mvc|rest|json|xml|"
+    "html|css|js|sql|nosql|crud|mvp|poc|roi|kpi|saas|paas|iaas|b2b|b2c|startup|"
+    "scale|pivot|disrupt|unicorn|exit|ipo|vc|angel|seed|series|bootstrapped|lean|"
+    "agile|scrum|kanban|sprint|standup|retro|demo|prototype|alpha|beta|ga|rtm|eol|"
+    "lts|cdn|dns|ssl|https|vpn|firewall|ddos|phishing|malware|ransomware|2fa|mfa|"
+    "oauth|jwt|rbac|gdpr|rgpd|open source|proprietary|freemium|premium|enterprise|"
+    "community|contributor|maintainer|fork|pull request|merge|commit|push|pull|"
+    "clone|branch|tag|release|hotfix|patch|rollback|deploy|ci|cd|devops|"
+    "infrastructure|monitoring|logging|analytics|metrics|dashboard|alert|incident|"
+    "postmortem|sla|slo|rpo|rto|backup|restore|disaster recovery|high availability|"
+    "load balancing|horizontal scaling|vertical scaling|microservices|monolith|"
+    "serverless|container|docker|kubernetes|aws|gcp|azure|heroku|netlify|vercel|"
+    "firebase|supabase|mongodb|postgresql|mysql|redis|elasticsearch|kafka|rabbitmq|"
+    "nginx|apache|cloudflare|datadog|sentry|slack|discord|zoom|teams|notion|figma|"
+    "sketch|photoshop|illustrator|premiere|after effects|blender|unity|unreal|godot|"
+    "react|vue|angular|svelte|next|nuxt|gatsby|eleventy|wordpress|drupal|joomla|"
+    "magento|shopify|woocommerce|stripe|paypal|twilio|sendgrid|mailchimp|hubspot|"
+    "salesforce|zendesk|intercom|typeform|airtable|zapier|ifttt|github actions|"
+    "gitlab ci|jenkins|travis|circle ci|drone|terraform|ansible|chef|puppet|vagrant|"
+    "packer|consul|vault|nomad|istio|linkerd|prometheus|grafana|kibana|logstash|"
+    "beats|fluentd|jaeger|zipkin|opentelemetry|new relic|splunk|sumo logic|"
+    "pager duty|opsgenie|victor ops|statuspage|pingdom|uptimerobot|gtmetrix|"
+    "lighthouse|webpagetest|browserstack|sauce labs|cypress|selenium|puppeteer|"
+    "playwright|jest|mocha|chai|jasmine|karma|protractor|nightwatch|testcafe|"
+    "storybook|chromatic|percy|applitools|browserling|lambdatest|"
+    "cross browser testing|responsinator|am i responsive|what is my viewport|"
+    "can i use|mdn|w3c|whatwg|ecma|iso|ieee|rfc|owasp|nist|sans|cwe|cve|nvd|mitre|"
+    "cisa|cert|ncsc|anssi|enisa|ccpa|hipaa|sox|pci dss|iso 27001|nist csf|"
+    "cis controls|owasp top 10|sans top 25|mitre att&ck|kill chain|diamond model|"
+    "pyramid of pain|threat modeling|risk assessment|vulnerability assessment|"
+    "penetration testing|red team|blue team|purple team|soc|csirt|cti|"
+    "threat intelligence|ioc|ttp|apt|malware analysis|reverse engineering|forensics|"
+    "incident response|threat hunting|security orchestration|soar|siem|ueba|casb|"
+    "ztna|sase|sd wan|mpls|bgp|ospf|eigrp|rip|vlan|stp|lacp|hsrp|vrrp|glbp|nat|pat|"
+    "acl|qos|ipsec|tls|pki|ca|crl|ocsp|dnssec|dmarc|spf|dkim|smtp|pop3|imap|ldap|"
+    "radius|tacacs|kerberos|ntlm|saml|openid|abac|dac|mac|bac|sod|pam|iam|ad|"
+    "azure ad|okta|ping|auth0|keycloak|gluu|wso2|forgerock|sailpoint|cyberark|"
+    "hashicorp vault|aws iam|gcp iam|azure iam|cisco ise|aruba clearpass|f5 apm|"
+    "citrix netscaler|vmware nsx|palo alto|fortinet|checkpoint|cisco asa|"
+    "juniper srx|sophos|watchguard|sonicwall|barracuda|imperva|akamai|fastly|"
+    "cloudfront|azure cdn|gcp cdn|keycdn|bunnycdn|stackpath|maxcdn|rackspace|linode|"
+    "digitalocean|vultr|hetzner|ovh|scaleway|upcloud|godaddy|namecheap|hover|gandi|"
+    "name|enom|1and1|ionos|hostgator|bluehost|siteground|dreamhost|hostinger|"
+    "a2hosting|inmotionhosting|greengeeks|fatcow|ipage|justhost|arvixe|hostmonster|"
+    "lunarpages|webhostinghub|hostpapa|11|midphase|powweb|startlogic|globat|yahoo|"
+    "microsoft|google|apple|amazon|meta|facebook|twitter|linkedin|instagram|youtube|"
+    "tiktok|snapchat|pinterest|reddit|skype|whatsapp|telegram|signal|viber|line|"
+    "wechat|qq|weibo|baidu|yandex|duckduckgo|bing|ask|aol|excite|lycos|altavista|"
+    "hotbot|infoseek|webcrawler|dogpile|metacrawler|ixquick|startpage|searx|brave|"
+    "tor|i2p|freenet|gnunet|ipfs|blockchain|bitcoin|ethereum|litecoin|dogecoin|"
+    "cardano|polkadot|solana|avalanche|terra|fantom|polygon|binance|coinbase|kraken|"
+    "gemini|bitfinex|bittrex|kucoin|huobi|okex|gate|bitmart|crypto|defi|nft|dao|"
+    "dapp|smart contract|web3|metaverse|vr|ar|mr|xr|oculus|quest|rift|pico|vive|"
+    "index|psvr|gear vr|daydream|cardboard|hololens|magic leap|apple vision|"
+    "google glass|snapchat spectacles|ray ban stories|meta ray ban|tesla|spacex|"
+    "boring company|neuralink|starlink|hyperloop|solarcity|gigafactory|supercharger|"
+    "model s|model 3|model x|model y|cybertruck|roadster|semi|plaid|ludicrous|"
+    "autopilot|fsd|neural net|dojo|4680|structural pack|cybercab|robovan|optimus|"
+    "falcon 9|falcon heavy|starship|dragon|crew dragon|cargo dragon|raptor|merlin|"
+    "mars|moon|iss|nasa|esa|jaxa|roscosmos|blue origin|virgin galactic|"
+    "relativity space|rocket lab|firefly|astra|vector|planet|skybox|blacksky|"
+    "capella|iceye|spire|swarm|momentus|d orbit|astroscale|clearspace|leo|meo|geo|"
+    "sso|polar|molniya|gto|gte|escape velocity|delta v|specific impulse|thrust|isp|"
+    "lox|rp1|methane|hydrogen|xenon|argon|krypton|hall thruster|ion thruster|"
+    "chemical rocket|nuclear rocket|solar sail|tether|skyhook|railgun|coilgun|"
+    "mass driver|space elevator|orbital ring|dyson sphere|kardashev scale|"
+    "fermi paradox|drake equation|seti|breakthrough listen|arecibo|fast|ska|hubble|"
+    "jwst|kepler|tess|gaia|chandra|spitzer|planck|wmap|cobe|lisa|ligo|virgo|kagra|"
+    "et|cosmic explorer|neutron star|black hole|white dwarf|red giant|supernova|"
+    "gamma ray burst|pulsar|quasar|blazar|agn|smbh|stellar mass|solar mass|"
+    "earth mass|jupiter mass|au|parsec|light year|redshift|"
+    "cosmic microwave background|dark matter|dark energy|lambda cdm|big bang|"
+    "inflation|multiverse|string theory|loop quantum gravity|quantum mechanics|"
+    "general relativity|special relativity|standard model|higgs boson|lhc|cern|"
+    "fermilab|slac|desy|kek|belle|babar|lhcb|atlas|cms|alice|na62|mu2e|g 2|nova|"
+    "dune|hyper k|icecube|antares|km3net|auger|telescope array|pamela|ams|euclid|"
+    "roman|bet|sn|wfirst|tmt|elt|gmt|lofar|alma|vla|vlba|eht|parkes|green bank|"
+    "lovell|effelsberg|nancay|westerbork|gmrt|meerkat|hera|paper|lwa|ovro lwa|nicer|"
+    "nustar|swift|fermi|integral|xmm newton|suzaku|hitomi|xrism|athena|lynx|axis|"
+    "strobe x|arcus|hxi|force|ixpe|polarlight|xpolarimeter|smile|theseus|euxo|xpol"
+)
+
+
+class TermMatcher:
+    """
+    Count vocabulary terms in text with a token trie.
+
+    Replaces `\\b(term1|term2|...)\\b` alternations with thousands of
+    branches, with the same counts. Terms and text are split into the same
+    tokens (words, whitespace runs and punctuation), so every match starts
+    and ends on a word boundary and keeps the exact spacing of the term; no
+    failure links are needed: the scan tries each token position once and
+    follows the trie for multi-word terms ("base de données"). As in the
+    regex, the term listed first wins among those matching at a position
+    ("azure" before "azure ad"), and matches do not overlap. Each vocabulary
+    is counted independently, in a single walk over the tokens.
+    """
+
+    def __init__(self, vocabularies):
+        self.names = tuple(vocabularies)
+        # token -> [children, {vocabulary index: rank of the term ending here}]
+        self._root = {}
+        for index, name in enumerate(self.names):
+            for rank, term in enumerate(vocabularies[name]):
+                children = self._root
+                node = None
+                for token in TOKEN_RE.findall(term.lower()):
+                    node = children.setdefault(token, [{}, {}])
+                    children = node[0]
+                if node is not None:
+                    node[1].setdefault(index, rank)
+
+    def count_tokens(self, tokens):
+        """Number of matches of each vocabulary in a TOKEN_RE token list."""
+        counts = [0] * len(self.names)
+        resume = [0] * len(self.names)
+        root = self._root
+        size = len(tokens)
+
+        # Only positions whose token starts a term are visited (filtered in C)
+        for start in compress(range(size), map(root.__contains__, tokens)):
+            children, ends = root[tokens[start]]
+            if not children:
+                # Single-token term, not the prefix of a longer one
+                for index in ends:
+                    if start >= resume[index]:
+                        counts[index] += 1
+                        resume[index] = start + 1
+                continue
+
+            # First-listed term per vocabulary: (rank, end)
+            first = {index: (rank, start + 1) for index, rank in ends.items()}
+            end = start + 1
+            while end < size and children:
+                node = children.get(tokens[end])
+                if node is None:
+                    break
+                children, ends = node
+                end += 1
+                for index, rank in ends.items():
+                    if index not in first or rank < first[index][0]:
+                        first[index] = (rank, end)
+            for index, (_, match_end) in first.items():
+                if start >= resume[index]:
+                    counts[index] += 1
+                    resume[index] = match_end
+
+        return dict(zip(self.names, counts))
+
+    def count(self, text):
+        """Number of matches of each vocabulary in (lowercase) text."""
+        return self.count_tokens(TOKEN_RE.findall(text))
+
+
+TONE_MATCHER = TermMatcher(
+    {
+        "tech_terms": TECH_TERMS,
+        "informal": INFORMAL_EXPRESSIONS,
+        "geek_slang": GEEK_SLANG,
+    }
+)
 
 
 def clean_html(html_content):
     """Clean HTML content and extract plain text."""
     # Remove HTML tags
-    clean_text = re.sub(r"<[^>]+>", " ", html_content)
+    clean_text = HTML_TAG_RE.sub(" ", html_content)
     # Remove extra whitespace
-    clean_text = re.sub(r"\s+", " ", clean_text)
+    clean_text = WHITESPACE_RE.sub(" ", clean_text)
     # Remove entities
-    clean_text = re.sub(r"&[^;]+;", " ", clean_text)
+    clean_text = ENTITY_RE.sub(" ", clean_text)
     return clean_text.strip()
 
 
@@ -27,7 +311,6 @@ def extract_categories_and_tags(item):
 
     for category in item.findall("category"):
         domain = category.get("domain", "")
-        nicename = category.get("nicename", "")
         text = category.text or ""
 
         if domain == "category":
@@ -38,85 +321,22 @@ def extract_categories_and_tags(item):
     return categories, tags
 
 
+def classify_title(title):
+    """Names of the title patterns a title belongs to."""
+    title_lower = title.lower()
+    return [
+        pattern
+        for pattern, words in TITLE_PATTERNS.items()
+        if any(word in title_lower for word in words)
+    ]
+
+
 def analyze_title_patterns(titles):
     """Analyze title patterns to identify common structures."""
-    patterns = {
-        "questions": [],
-        "how_to": [],
-        "reviews": [],
-        "news": [],
-        "opinions": [],
-        "tutorials": [],
-        "lists": [],
-        "series": [],
-    }
-
+    patterns = {pattern: [] for pattern in TITLE_PATTERNS}
     for title in titles:
-        title_lower = title.lower()
-
-        # Question patterns
-        if any(
-            word in title_lower
-            for word in ["comment", "pourquoi", "que", "qui", "où", "quand", "?"]
-        ):
-            patterns["questions"].append(title)
-
-        # How-to patterns
-        if any(
-            word in title_lower
-            for word in [
-                "guide",
-                "tutorial",
-                "tuto",
-                "comment faire",
-                "installer",
-                "configurer",
-            ]
-        ):
-            patterns["how_to"].append(title)
-
-        # Review patterns
-        if any(
-            word in title_lower
-            for word in ["test", "review", "analyse", "évaluation", "comparaison"]
-        ):
-            patterns["reviews"].append(title)
-
-        # News patterns
-        if any(
-            word in title_lower
-            for word in ["nouvelle", "news", "sortie", "lancé", "annonce"]
-        ):
-            patterns["news"].append(title)
-
-        # Opinion patterns
-        if any(
-            word in title_lower
-            for word in ["opinion", "avis", "pensée", "réflexion", "mon point de vue"]
-        ):
-            patterns["opinions"].append(title)
-
-        # Tutorial patterns
-        if any(
-            word in title_lower
-            for word in ["étape", "pas à pas", "méthode", "technique"]
-        ):
-            patterns["tutorials"].append(title)
-
-        # List patterns
-        if any(
-            word in title_lower
-            for word in ["top", "liste", "meilleur", "conseil", "astuce"]
-        ):
-            patterns["lists"].append(title)
-
-        # Series patterns
-        if any(
-            word in title_lower
-            for word in ["série", "partie", "episode", "chapitre", "#"]
-        ):
-            patterns["series"].append(title)
-
+        for pattern in classify_title(title):
+            patterns[pattern].append(title)
     return patterns
 
 
@@ -126,43 +346,31 @@ def analyze_content_structure(content):
         return {}
 
     # Count paragraphs
-    paragraphs = content.split("\n\n")
-    paragraph_count = len([p for p in paragraphs if p.strip()])
+    paragraph_count = sum(1 for p in content.split("\n\n") if p.strip())
 
     # Count sentences
-    sentences = re.split(r"[.!?]+", content)
-    sentence_count = len([s for s in sentences if s.strip()])
+    sentence_count = sum(1 for s in SENTENCE_SPLIT_RE.split(content) if s.strip())
 
     # Average sentence length
-    words = content.split()
-    word_count = len(words)
+    word_count = len(content.split())
     avg_sentence_length = word_count / sentence_count if sentence_count > 0 else 0
 
-    # Count links
-    link_count = len(re.findall(r"https?://[^\s]+", content))
-
-    # Count images
-    image_count = len(re.findall(r"<img[^>]*>", content))
-
-    # Count code blocks
-    code_count = len(re.findall(r"<code[^>]*>.*?</code>", content, re.DOTALL))
-
-    # Check for lists
-    list_count = len(re.findall(r"<[ou]l[^>]*>", content))
-
-    # Check for headers
-    header_count = len(re.findall(r"<h[1-6][^>]*>", content))
+    # Images, code blocks, lists and headers in a single scan
+    tags = Counter(
+        "list" if tag[0] in "ou" else "header" if tag[0] == "h" else tag
+        for tag in STRUCTURE_TAG_RE.findall(content)
+    )
 
     return {
         "paragraph_count": paragraph_count,
         "sentence_count": sentence_count,
         "word_count": word_count,
         "avg_sentence_length": avg_sentence_length,
-        "link_count": link_count,
-        "image_count": image_count,
-        "code_count": code_count,
-        "list_count": list_count,
-        "header_count": header_count,
+        "link_count": len(LINK_RE.findall(content)),
+        "image_count": tags["img"],
+        "code_count": tags["code"],
+        "list_count": tags["list"],
+        "header_count": tags["header"],
     }
 
 
@@ -172,274 +380,604 @@ def analyze_writing_tone(content):
         return {}
 
     content_lower = content.lower()
+    personal_pronouns = len(PERSONAL_PRONOUN_RE.findall(content_lower))
+    terms = TONE_MATCHER.count(content_lower)
+    word_count = len(content.split())
 
-    # Personal pronouns
-    personal_pronouns = len(
-        re.findall(r"\b(je|j\'|me|moi|mon|ma|mes|nous|notre|nos)\b", content_lower)
-    )
+    def ratio(count):
+        return count / word_count if word_count > 0 else 0
 
-    # Question marks
-    questions = len(re.findall(r"\?", content))
+    return {
+        "personal_pronouns_ratio": ratio(personal_pronouns),
+        "questions_ratio": ratio(content.count("?")),
+        "exclamations_ratio": ratio(content.count("!")),
+        "tech_terms_ratio": ratio(terms["tech_terms"]),
+        "informal_ratio": ratio(terms["informal"]),
+        "geek_slang_ratio": ratio(terms["geek_slang"]),
+    }
 
-    # Exclamation marks
-    exclamations = len(re.findall(r"!", content))
 
-    # Technical terms (common in geek blogs)
-    tech_terms = len(
-        re.findall(
-            r"\b(api|framework|code|développement|programmation|serveur|base de données|algorithme|javascript|python|linux|windows|mac|ios|android|app|application|logiciel|software|hardware|cloud|ia|intelligence artificielle|machine learning|blockchain|crypto|bitcoin|tesla|spacex|google|apple|microsoft|amazon|meta|facebook|twitter|github|stackoverflow)\b",
-            content_lower,
-        )
-    )
+def iter_posts(xml_file):
+    """
+    Stream the published posts of a WordPress export.
 
-    # Informal expressions
-    informal_expressions = len(
-        re.findall(
-            r"\b(bref|en fait|du coup|genre|style|truc|machin|super|cool|top|génial|excellent|incroyable|impressionnant)\b",
-            content_lower,
-        )
-    )
+    Each <item> is turned into a small dict as soon as its end tag is parsed,
+    then removed from the tree, so memory does not grow with the export.
+    """
+    depth = 0
+    channel = None
+    for event, element in ET.iterparse(xml_file, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if depth == 2:
+                channel = element
+            continue
 
-    # Geek slang
-    geek_slang = len(
-        re.findall(
-            r"\b(geek|nerd|dev|admin|user|noob|pro|hacker|bug|debug|crash|lag|troll|epic|fail|win|lol|mdr|wtf|omg|fyi|asap|diy|faq|gui|cli|ui|ux|seo|poo|mvc|rest|json|xml|html|css|js|sql|nosql|crud|mvp|poc|roi|kpi|saas|paas|iaas|b2b|b2c|startup|scale|pivot|disrupt|unicorn|exit|ipo|vc|angel|seed|series|bootstrapped|lean|agile|scrum|kanban|sprint|standup|retro|demo|mvp|poc|prototype|alpha|beta|ga|rtm|eol|lts|cdn|dns|ssl|https|vpn|firewall|ddos|phishing|malware|ransomware|2fa|mfa|oauth|jwt|rbac|gdpr|rgpd|open source|proprietary|freemium|premium|enterprise|community|contributor|maintainer|fork|pull request|merge|commit|push|pull|clone|branch|tag|release|hotfix|patch|rollback|deploy|ci|cd|devops|infrastructure|monitoring|logging|analytics|metrics|dashboard|alert|incident|postmortem|sla|slo|rpo|rto|backup|restore|disaster recovery|high availability|load balancing|horizontal scaling|vertical scaling|microservices|monolith|serverless|container|docker|kubernetes|aws|gcp|azure|heroku|netlify|vercel|firebase|supabase|mongodb|postgresql|mysql|redis|elasticsearch|kafka|rabbitmq|nginx|apache|cloudflare|datadog|sentry|slack|discord|zoom|teams|notion|figma|sketch|photoshop|illustrator|premiere|after effects|blender|unity|unreal|godot|react|vue|angular|svelte|next|nuxt|gatsby|eleventy|wordpress|drupal|joomla|magento|shopify|woocommerce|stripe|paypal|twilio|sendgrid|mailchimp|hubspot|salesforce|zendesk|intercom|typeform|airtable|zapier|ifttt|github actions|gitlab ci|jenkins|travis|circle ci|drone|terraform|ansible|chef|puppet|vagrant|packer|consul|vault|nomad|istio|linkerd|prometheus|grafana|kibana|logstash|beats|fluentd|jaeger|zipkin|opentelemetry|datadog|new relic|splunk|sumo logic|pager duty|opsgenie|victor ops|statuspage|pingdom|uptimerobot|gtmetrix|lighthouse|webpagetest|browserstack|sauce labs|cypress|selenium|puppeteer|playwright|jest|mocha|chai|jasmine|karma|protractor|nightwatch|testcafe|storybook|chromatic|percy|applitools|browserling|lambdatest|cross browser testing|responsinator|am i responsive|what is my viewport|can i use|mdn|w3c|whatwg|ecma|iso|ieee|rfc|owasp|nist|sans|cwe|cve|nvd|mitre|cisa|cert|ncsc|anssi|enisa|gdpr|ccpa|hipaa|sox|pci dss|iso 27001|nist csf|cis controls|owasp top 10|sans top 25|mitre att&ck|kill chain|diamond model|pyramid of pain|threat modeling|risk assessment|vulnerability assessment|penetration testing|red team|blue team|purple team|soc|csirt|cti|threat intelligence|ioc|ttp|apt|malware analysis|reverse engineering|forensics|incident response|threat hunting|security orchestration|soar|siem|ueba|casb|ztna|sase|sd wan|mpls|bgp|ospf|eigrp|rip|vlan|stp|lacp|hsrp|vrrp|glbp|nat|pat|acl|qos|mpls|vpn|ipsec|ssl|tls|pki|ca|crl|ocsp|dnssec|dmarc|spf|dkim|smtp|pop3|imap|ldap|radius|tacacs|kerberos|ntlm|saml|oauth|openid|jwt|rbac|abac|dac|mac|bac|sod|pam|iam|ad|ldap|radius|tacacs|kerberos|ntlm|saml|oauth|openid|jwt|rbac|abac|dac|mac|bac|sod|pam|iam|ad|azure ad|okta|ping|auth0|keycloak|gluu|wso2|forgerock|sailpoint|cyberark|hashicorp vault|aws iam|gcp iam|azure iam|cisco ise|aruba clearpass|f5 apm|citrix netscaler|vmware nsx|palo alto|fortinet|checkpoint|cisco asa|juniper srx|sophos|watchguard|sonicwall|barracuda|imperva|cloudflare|akamai|fastly|cloudfront|azure cdn|gcp cdn|keycdn|bunnycdn|stackpath|maxcdn|rackspace|linode|digitalocean|vultr|hetzner|ovh|scaleway|upcloud|godaddy|namecheap|hover|gandi|name|enom|1and1|ionos|hostgator|bluehost|siteground|dreamhost|hostinger|a2hosting|inmotionhosting|greengeeks|fatcow|ipage|justhost|arvixe|hostmonster|lunarpages|webhostinghub|hostpapa|11|midphase|powweb|startlogic|globat|yahoo|microsoft|google|apple|amazon|meta|facebook|twitter|linkedin|instagram|youtube|tiktok|snapchat|pinterest|reddit|discord|slack|zoom|teams|skype|whatsapp|telegram|signal|viber|line|wechat|qq|weibo|baidu|yandex|duckduckgo|bing|yahoo|ask|aol|excite|lycos|altavista|hotbot|infoseek|webcrawler|dogpile|metacrawler|ixquick|startpage|searx|brave|tor|i2p|freenet|gnunet|ipfs|blockchain|bitcoin|ethereum|litecoin|dogecoin|cardano|polkadot|solana|avalanche|terra|fantom|polygon|binance|coinbase|kraken|gemini|bitfinex|bittrex|kucoin|huobi|okex|gate|bitmart|crypto|defi|nft|dao|dapp|smart contract|web3|metaverse|vr|ar|mr|xr|oculus|quest|rift|pico|vive|index|psvr|gear vr|daydream|cardboard|hololens|magic leap|apple vision|google glass|snapchat spectacles|ray ban stories|meta ray ban|tesla|spacex|boring company|neuralink|starlink|hyperloop|solarcity|gigafactory|supercharger|model s|model 3|model x|model y|cybertruck|roadster|semi|plaid|ludicrous|autopilot|fsd|neural net|dojo|4680|structural pack|cybercab|robovan|optimus|falcon 9|falcon heavy|starship|dragon|crew dragon|cargo dragon|raptor|merlin|starlink|mars|moon|iss|nasa|esa|jaxa|roscosmos|spacex|blue origin|virgin galactic|relativity space|rocket lab|firefly|astra|vector|planet|skybox|blacksky|capella|iceye|spire|swarm|momentus|d orbit|astroscale|clearspace|leo|meo|geo|sso|polar|molniya|gto|gte|escape velocity|delta v|specific impulse|thrust|isp|lox|rp1|methane|hydrogen|xenon|argon|krypton|hall thruster|ion thruster|chemical rocket|nuclear rocket|solar sail|tether|skyhook|railgun|coilgun|mass driver|space elevator|orbital ring|dyson sphere|kardashev scale|fermi paradox|drake equation|seti|breakthrough listen|arecibo|fast|ska|hubble|jwst|kepler|tess|gaia|chandra|spitzer|planck|wmap|cobe|lisa|ligo|virgo|kagra|et|cosmic explorer|neutron star|black hole|white dwarf|red giant|supernova|gamma ray burst|pulsar|quasar|blazar|agn|smbh|stellar mass|solar mass|earth mass|jupiter mass|au|parsec|light year|redshift|cosmic microwave background|dark matter|dark energy|lambda cdm|big bang|inflation|multiverse|string theory|loop quantum gravity|quantum mechanics|general relativity|special relativity|standard model|higgs boson|lhc|cern|fermilab|slac|desy|kek|belle|babar|lhcb|atlas|cms|alice|na62|mu2e|g 2|nova|dune|hyper k|icecube|antares|km3net|auger|telescope array|pamela|ams|planck|euclid|roman|lisa|bet|sn|wfirst|tmt|elt|gmt|ska|fast|lofar|alma|vla|vlba|eht|parkes|arecibo|green bank|lovell|effelsberg|nancay|westerbork|gmrt|meerkat|hera|paper|lwa|ovro lwa|ligo|virgo|kagra|et|cosmic explorer|nicer|nustar|swift|fermi|integral|xmm newton|chandra|suzaku|hitomi|xrism|athena|lynx|axis|strobe x|arcus|hxi|force|ixpe|polarlight|xpolarimeter|smile|theseus|euxo|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter|xpol|xpolarimeter)\b",
-            content_lower,
-        )
-    )
+        depth -= 1
+        if depth != 2:
+            continue
 
-    word_count = len(content.split())
+        # Direct child of <channel> fully parsed (item, wp:term, wp:author...)
+        if element.tag == "item":
+            post_type = element.findtext(f"{WP_NS}post_type")
+            status = element.findtext(f"{WP_NS}status")
+
+            # Only analyze published posts
+            if post_type == "post" and status == "publish":
+                categories, tags = extract_categories_and_tags(element)
+                yield {
+                    "guid": element.findtext("guid")
+                    or element.findtext(f"{WP_NS}post_id")
+                    or "",
+                    "title": element.findtext("title") or "",
+                    "content": element.findtext(f"{CONTENT_NS}encoded") or "",
+                    "pub_date": element.findtext("pubDate") or "",
+                    "categories": categories,
+                    "tags": tags,
+                }
+        channel.remove(element)
 
+
+def parse_pub_date(pub_date):
+    """RSS pubDate (RFC 822) as a datetime, None if missing or invalid."""
+    try:
+        return parsedate_to_datetime(pub_date) if pub_date else None
+    except (TypeError, ValueError):
+        return None
+
+
+def analyze_post(post):
+    """Per-post features: cleaned content, structure and tone."""
+    clean_content = clean_html(post["content"])
     return {
-        "personal_pronouns_ratio": personal_pronouns / word_count
-        if word_count > 0
-        else 0,
-        "questions_ratio": questions / word_count if word_count > 0 else 0,
-        "exclamations_ratio": exclamations / word_count if word_count > 0 else 0,
-        "tech_terms_ratio": tech_terms / word_count if word_count > 0 else 0,
-        "informal_ratio": informal_expressions / word_count if word_count > 0 else 0,
-        "geek_slang_ratio": geek_slang / word_count if word_count > 0 else 0,
+        "clean_content": clean_content,
+        "content_length": len(clean_content),
+        "word_count": len(clean_content.split()) if clean_content else 0,
+        # Structure is measured on the HTML (tags), tone on the text
+        "structure": analyze_content_structure(post["content"]) if clean_content else None,
+        "tone": analyze_writing_tone(clean_content) if clean_content else None,
     }
 
 
-def main():
-    """Main analysis function."""
-    xml_file = (
-        "/mnt/c/code/geekblog/examples/lesgeeksatempspartiel.WordPress.2025-06-28.xml"
-    )
+def features_to_vector(features):
+    """analyze_post() features as a float64 vector (FEATURE_FIELDS order)."""
+    structure = features["structure"] or {}
+    tone = features["tone"] or {}
+    values = {
+        **structure,
+        **tone,
+        "content_length": features["content_length"],
+        "text_word_count": features["word_count"],
+    }
+    return array("d", (values.get(field, 0) for field in FEATURE_FIELDS))
 
-    try:
-        tree = ET.parse(xml_file)
-        root = tree.getroot()
-
-        # WordPress XML namespace
-        wp_ns = "{http://wordpress.org/export/1.2/}"
-        content_ns = "{http://purl.org/rss/1.0/modules/content/}"
-
-        # Analysis containers
-        posts = []
-        all_categories = []
-        all_tags = []
-        all_titles = []
-        content_structures = []
-        writing_tones = []
-
-        # Parse all items
-        for item in root.findall(".//item"):
-            post_type = item.find(f".//{wp_ns}post_type")
-            status = item.find(f".//{wp_ns}status")
 
-            # Only analyze published posts
-            if (
-                post_type is not None
-                and post_type.text == "post"
-                and status is not None
-                and status.text == "publish"
-            ):
-                title = item.find("title").text or ""
-                content = item.find(f"{content_ns}encoded").text or ""
-                pub_date = item.find("pubDate").text or ""
-
-                # Clean content
-                clean_content = clean_html(content)
-
-                # Extract categories and tags
-                categories, tags = extract_categories_and_tags(item)
-
-                # Store post data
-                post_data = {
-                    "title": title,
-                    "content": clean_content,
-                    "pub_date": pub_date,
-                    "categories": categories,
-                    "tags": tags,
-                    "content_length": len(clean_content),
-                    "word_count": len(clean_content.split()) if clean_content else 0,
-                }
+def vector_to_features(vector):
+    """
+    Features rebuilt from a vector, without clean_content.
+
+    Posts without text content have no structure or tone, as in analyze_post().
+    """
+    values = {
+        field: value if field in FLOAT_FEATURES else int(value)
+        for field, value in zip(FEATURE_FIELDS, vector)
+    }
+    analyzed = values["content_length"] > 0
+    return {
+        "content_length": values["content_length"],
+        "word_count": values["text_word_count"],
+        "structure": {field: values[field] for field in STRUCTURE_FIELDS} if analyzed else None,
+        "tone": {field: values[field] for field in TONE_FIELDS} if analyzed else None,
+    }
+
 
-                posts.append(post_data)
-                all_categories.extend(categories)
-                all_tags.extend(tags)
-                all_titles.append(title)
+class FeatureMatrix:
+    """
+    Columnar per-post features: a posts x FEATURE_FIELDS float64 matrix.
+
+    Rows are appended as flat float64 buffers (no per-post dict), and the
+    (post, category) pairs are kept as two integer columns, so every
+    statistic of the report is a vectorized NumPy reduction. Matrices of
+    consecutive batches of posts are merged by concatenation.
+    """
+
+    PERCENTILES = (10, 25, 50, 75, 90)
+    HISTOGRAM_BINS = 10
+
+    def __init__(self):
+        self.rows = 0
+        self._values = array("d")
+        self._category_rows = array("q")
+        self._category_ids = array("q")
+        self._category_names = {}
+
+    def _category_id(self, name):
+        return self._category_names.setdefault(name, len(self._category_names))
+
+    def add(self, vector, categories=()):
+        """Append a post (FEATURE_FIELDS vector) and its categories."""
+        self._values.extend(vector)
+        # A post counts once per category, even if listed twice
+        for name in dict.fromkeys(categories):
+            self._category_rows.append(self.rows)
+            self._category_ids.append(self._category_id(name))
+        self.rows += 1
+
+    def merge(self, other):
+        """Append the posts of a batch that follows this one."""
+        remap = [self._category_id(name) for name in other._category_names]
+        self._category_rows.extend(row + self.rows for row in other._category_rows)
+        self._category_ids.extend(remap[category] for category in other._category_ids)
+        self._values.extend(other._values)
+        self.rows += other.rows
+        return self
+
+    def matrix(self):
+        """posts x FEATURE_FIELDS array (a copy)."""
+        return np.array(self._values, dtype=np.float64).reshape(self.rows, len(FEATURE_FIELDS))
+
+    def analyzed_mask(self, matrix):
+        """Posts with text content (analyze_post() gives them structure and tone)."""
+        return matrix[:, FEATURE_FIELDS.index("content_length")] > 0
+
+    def means(self, matrix, analyzed_only=True):
+        """Mean of every feature, by name (0 without posts)."""
+        if analyzed_only:
+            matrix = matrix[self.analyzed_mask(matrix)]
+        if not len(matrix):
+            return dict.fromkeys(FEATURE_FIELDS, 0)
+        return dict(zip(FEATURE_FIELDS, matrix.mean(axis=0).tolist()))
+
+    def statistics(self, matrix, category_order=None):
+        """
+        Distribution of the features over the posts with text content.
+
+        Percentiles and histograms per feature, and the feature means of
+        each category (all in a handful of array operations).
+        """
+        mask = self.analyzed_mask(matrix)
+        analyzed = matrix[mask]
+        report = {"posts": int(mask.sum()), "features": {}, "histograms": {}, "by_category": {}}
+        if not len(analyzed):
+            return report
+
+        percentiles = np.percentile(analyzed, self.PERCENTILES, axis=0)
+        for column, field in enumerate(FEATURE_FIELDS):
+            values = analyzed[:, column]
+            summary = {
+                "mean": float(values.mean()),
+                "std": float(values.std()),
+                "min": float(values.min()),
+                "max": float(values.max()),
+            }
+            for rank, percentile in zip(self.PERCENTILES, percentiles[:, column].tolist()):
+                summary[f"p{rank}"] = percentile
+            report["features"][field] = summary
+
+            counts, edges = np.histogram(values, bins=self.HISTOGRAM_BINS)
+            report["histograms"][field] = {
+                "bin_edges": edges.tolist(),
+                "counts": counts.tolist(),
+            }
+
+        # Per category: sums of the analyzed rows of each category with bincount
+        rows = np.array(self._category_rows, dtype=np.int64)
+        categories = np.array(self._category_ids, dtype=np.int64)
+        keep = mask[rows]
+        rows, categories = rows[keep], categories[keep]
+        size = len(self._category_names)
+        posts = np.bincount(categories, minlength=size)
+        sums = np.stack(
+            [
+                np.bincount(categories, weights=matrix[rows, column], minlength=size)
+                for column in range(len(FEATURE_FIELDS))
+            ],
+            axis=1,
+        )
 
-                # Analyze content structure
-                if clean_content:
-                    structure = analyze_content_structure(content)
-                    content_structures.append(structure)
+        names = category_order if category_order is not None else list(self._category_names)
+        for name in names:
+            category = self._category_names.get(name)
+            if category is None or not posts[category]:
+                continue
+            report["by_category"][name] = {
+                "posts": int(posts[category]),
+                "means": dict(
+                    zip(FEATURE_FIELDS, (sums[category] / posts[category]).tolist())
+                ),
+            }
+        return report
 
-                    # Analyze writing tone
-                    tone = analyze_writing_tone(clean_content)
-                    writing_tones.append(tone)
 
-        # Generate analysis report
-        report = {
+class BlogStats:
+    """
+    Single-pass accumulator of the blog report.
+
+    Keeps counters, the title lists of the report, a few sample posts and
+    the FeatureMatrix of the posts, never the posts themselves.
+    Accumulators of consecutive batches of posts can be merged: merging them
+    in post order gives the same report as a single accumulator.
+    """
+
+    SAMPLE_SIZE = 5
+
+    def __init__(self):
+        self.total_posts = 0
+        # (datetime, pubDate string) of the oldest and newest posts
+        self.earliest = None
+        self.latest = None
+        self.categories = Counter()
+        self.tags = Counter()
+        self.title_patterns = {pattern: [] for pattern in TITLE_PATTERNS}
+        self.features = FeatureMatrix()
+        self.sample_posts = []
+
+    def add(self, post, features):
+        """Account for one post and its analyze_post() features."""
+        self.total_posts += 1
+
+        pub_date = post["pub_date"]
+        published = parse_pub_date(pub_date)
+        if published is not None:
+            if self.earliest is None or published < self.earliest[0]:
+                self.earliest = (published, pub_date)
+            if self.latest is None or published > self.latest[0]:
+                self.latest = (published, pub_date)
+
+        self.categories.update(post["categories"])
+        self.tags.update(post["tags"])
+        for pattern in classify_title(post["title"]):
+            self.title_patterns[pattern].append(post["title"])
+
+        self.features.add(features_to_vector(features), post["categories"])
+
+        if len(self.sample_posts) < self.SAMPLE_SIZE:
+            self.sample_posts.append(
+                {
+                    "title": post["title"],
+                    # Cached features do not keep the cleaned text
+                    "content": features["clean_content"]
+                    if "clean_content" in features
+                    else clean_html(post["content"]),
+                    "pub_date": pub_date,
+                    "categories": post["categories"],
+                    "tags": post["tags"],
+                    "content_length": features["content_length"],
+                    "word_count": features["word_count"],
+                }
+            )
+
+    def merge(self, other):
+        """Add the statistics of a batch of posts that follows this one."""
+        self.total_posts += other.total_posts
+
+        # Ties keep the first post, as in add()
+        if other.earliest and (self.earliest is None or other.earliest[0] < self.earliest[0]):
+            self.earliest = other.earliest
+        if other.latest and (self.latest is None or other.latest[0] > self.latest[0]):
+            self.latest = other.latest
+
+        self.categories.update(other.categories)
+        self.tags.update(other.tags)
+        for pattern, titles in other.title_patterns.items():
+            self.title_patterns[pattern].extend(titles)
+
+        self.features.merge(other.features)
+
+        missing = self.SAMPLE_SIZE - len(self.sample_posts)
+        self.sample_posts.extend(other.sample_posts[:max(missing, 0)])
+        return self
+
+    def report(self):
+        """Analysis report (same layout as blog_analysis_report.json)."""
+        matrix = self.features.matrix()
+        posts = self.features.means(matrix, analyzed_only=False)
+        means = self.features.means(matrix)
+        return {
             "blog_info": {
-                "total_posts": len(posts),
+                "total_posts": self.total_posts,
                 "date_range": {
-                    "earliest": min([p["pub_date"] for p in posts if p["pub_date"]])
-                    if posts
-                    else None,
-                    "latest": max([p["pub_date"] for p in posts if p["pub_date"]])
-                    if posts
-                    else None,
+                    "earliest": self.earliest[1] if self.earliest else None,
+                    "latest": self.latest[1] if self.latest else None,
                 },
-                "avg_post_length": sum([p["content_length"] for p in posts])
-                / len(posts)
-                if posts
-                else 0,
-                "avg_word_count": sum([p["word_count"] for p in posts]) / len(posts)
-                if posts
-                else 0,
+                "avg_post_length": posts["content_length"],
+                "avg_word_count": posts["text_word_count"],
             },
             "categories": {
-                "total_unique": len(set(all_categories)),
-                "most_common": dict(Counter(all_categories).most_common(20)),
-                "frequency_distribution": dict(Counter(all_categories)),
+                "total_unique": len(self.categories),
+                "most_common": dict(self.categories.most_common(20)),
+                "frequency_distribution": dict(self.categories),
             },
             "tags": {
-                "total_unique": len(set(all_tags)),
-                "most_common": dict(Counter(all_tags).most_common(30)),
-                "frequency_distribution": dict(Counter(all_tags)),
+                "total_unique": len(self.tags),
+                "most_common": dict(self.tags.most_common(30)),
+                "frequency_distribution": dict(self.tags),
             },
-            "title_patterns": analyze_title_patterns(all_titles),
+            "title_patterns": self.title_patterns,
             "content_analysis": {
-                "avg_paragraphs": sum(
-                    [s["paragraph_count"] for s in content_structures]
-                )
-                / len(content_structures)
-                if content_structures
-                else 0,
-                "avg_sentences": sum([s["sentence_count"] for s in content_structures])
-                / len(content_structures)
-                if content_structures
-                else 0,
-                "avg_words": sum([s["word_count"] for s in content_structures])
-                / len(content_structures)
-                if content_structures
-                else 0,
-                "avg_sentence_length": sum(
-                    [s["avg_sentence_length"] for s in content_structures]
-                )
-                / len(content_structures)
-                if content_structures
-                else 0,
-                "avg_links": sum([s["link_count"] for s in content_structures])
-                / len(content_structures)
-                if content_structures
-                else 0,
-                "avg_images": sum([s["image_count"] for s in content_structures])
-                / len(content_structures)
-                if content_structures
-                else 0,
-                "avg_code_blocks": sum([s["code_count"] for s in content_structures])
-                / len(content_structures)
-                if content_structures
-                else 0,
-                "avg_lists": sum([s["list_count"] for s in content_structures])
-                / len(content_structures)
-                if content_structures
-                else 0,
-                "avg_headers": sum([s["header_count"] for s in content_structures])
-                / len(content_structures)
-                if content_structures
-                else 0,
+                "avg_paragraphs": means["paragraph_count"],
+                "avg_sentences": means["sentence_count"],
+                "avg_words": means["word_count"],
+                "avg_sentence_length": means["avg_sentence_length"],
+                "avg_links": means["link_count"],
+                "avg_images": means["image_count"],
+                "avg_code_blocks": means["code_count"],
+                "avg_lists": means["list_count"],
+                "avg_headers": means["header_count"],
             },
             "writing_style": {
-                "avg_personal_pronouns": sum(
-                    [t["personal_pronouns_ratio"] for t in writing_tones]
-                )
-                / len(writing_tones)
-                if writing_tones
-                else 0,
-                "avg_questions": sum([t["questions_ratio"] for t in writing_tones])
-                / len(writing_tones)
-                if writing_tones
-                else 0,
-                "avg_exclamations": sum(
-                    [t["exclamations_ratio"] for t in writing_tones]
-                )
-                / len(writing_tones)
-                if writing_tones
-                else 0,
-                "avg_tech_terms": sum([t["tech_terms_ratio"] for t in writing_tones])
-                / len(writing_tones)
-                if writing_tones
-                else 0,
-                "avg_informal": sum([t["informal_ratio"] for t in writing_tones])
-                / len(writing_tones)
-                if writing_tones
-                else 0,
-                "avg_geek_slang": sum([t["geek_slang_ratio"] for t in writing_tones])
-                / len(writing_tones)
-                if writing_tones
-                else 0,
+                "avg_personal_pronouns": means["personal_pronouns_ratio"],
+                "avg_questions": means["questions_ratio"],
+                "avg_exclamations": means["exclamations_ratio"],
+                "avg_tech_terms": means["tech_terms_ratio"],
+                "avg_informal": means["informal_ratio"],
+                "avg_geek_slang": means["geek_slang_ratio"],
             },
-            "sample_posts": posts[:5],  # First 5 posts for reference
+            # Distributions and per-category means, for template tuning
+            "feature_statistics": self.features.statistics(
+                matrix, [name for name, _ in self.categories.most_common()]
+            ),
+            "sample_posts": self.sample_posts,  # First 5 posts for reference
         }
 
-        # Save analysis results
-        output_file = "/mnt/c/code/geekblog/blog_analysis_report.json"
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
 
-        print(f"Analysis complete! Report saved to: {output_file}")
+def analysis_fingerprint():
+    """Identifies the analysis code: vocabularies, feature layout, version."""
+    digest = hashlib.sha256(repr((ANALYSIS_VERSION, FEATURE_FIELDS)).encode("utf-8"))
+    for terms in (TECH_TERMS, INFORMAL_EXPRESSIONS, GEEK_SLANG):
+        digest.update("|".join(terms).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def content_hash(post):
+    return hashlib.sha256(post["content"].encode("utf-8")).hexdigest()
 
-        # Print summary
-        print("\n" + "=" * 60)
-        print("BLOG ANALYSIS SUMMARY")
-        print("=" * 60)
-        print(f"Total Posts Analyzed: {report['blog_info']['total_posts']}")
-        print(
-            f"Average Post Length: {report['blog_info']['avg_post_length']:.0f} characters"
-        )
-        print(f"Average Word Count: {report['blog_info']['avg_word_count']:.0f} words")
 
-        print("\nTOP CATEGORIES:")
-        for cat, count in list(report["categories"]["most_common"].items())[:10]:
-            print(f"  {cat}: {count} posts")
+class FeatureCache:
+    """
+    Per-post feature vectors in a SQLite file, keyed by GUID.
 
-        print("\nTOP TAGS:")
-        for tag, count in list(report["tags"]["most_common"].items())[:10]:
-            print(f"  {tag}: {count} posts")
+    A cached vector is only reused if the post content hash still matches.
+    The whole cache is dropped when analysis_fingerprint() changes (new
+    vocabulary, new features), since its vectors would no longer be those
+    of the current code.
+    """
 
-        print("\nTITLE PATTERNS:")
-        for pattern, titles in report["title_patterns"].items():
-            if titles:
-                print(f"  {pattern.replace('_', ' ').title()}: {len(titles)} titles")
+    def __init__(self, path):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS post_features ("
+            "guid TEXT PRIMARY KEY, content_hash TEXT NOT NULL, vector BLOB NOT NULL)"
+        )
 
-        print("\nWRITING STYLE:")
-        print(
-            f"  Personal tone: {report['writing_style']['avg_personal_pronouns']:.3f}"
+        fingerprint = analysis_fingerprint()
+        row = self._db.execute("SELECT value FROM meta WHERE key = 'analysis'").fetchone()
+        if row is None or row[0] != fingerprint:
+            self._db.execute("DELETE FROM post_features")
+            self._db.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('analysis', ?)",
+                (fingerprint,),
+            )
+        self._db.commit()
+
+    def lookup(self, posts):
+        """Cached features of each post (None: new post, edited post or no GUID)."""
+        guids = [post["guid"] for post in posts if post["guid"]]
+        cached = {}
+        # Batches stay below SQLite's bound parameter limit
+        for start in range(0, len(guids), 500):
+            chunk = guids[start:start + 500]
+            cached.update(
+                (guid, (digest, vector))
+                for guid, digest, vector in self._db.execute(
+                    "SELECT guid, content_hash, vector FROM post_features "
+                    f"WHERE guid IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                )
+            )
+
+        results = []
+        for post in posts:
+            entry = cached.get(post["guid"])
+            if entry is not None and entry[0] == content_hash(post):
+                vector = array("d")
+                vector.frombytes(entry[1])
+                results.append(vector_to_features(vector))
+                self.hits += 1
+            else:
+                results.append(None)
+                self.misses += 1
+        return results
+
+    def store(self, posts, features):
+        """Cache the features of freshly analyzed posts."""
+        self._db.executemany(
+            "INSERT OR REPLACE INTO post_features (guid, content_hash, vector) VALUES (?, ?, ?)",
+            [
+                (post["guid"], content_hash(post), features_to_vector(post_features).tobytes())
+                for post, post_features in zip(posts, features)
+                if post["guid"]
+            ],
         )
-        print(f"  Technical content: {report['writing_style']['avg_tech_terms']:.3f}")
-        print(f"  Informal style: {report['writing_style']['avg_informal']:.3f}")
-        print(f"  Geek culture: {report['writing_style']['avg_geek_slang']:.3f}")
+        self._db.commit()
+
+    def close(self):
+        self._db.close()
+
+
+def analyze_posts(posts):
+    """BlogStats of a sequence of posts (unit of work of the worker processes)."""
+    stats = BlogStats()
+    for post in posts:
+        stats.add(post, analyze_post(post))
+    return stats
+
+
+def _batches(posts, size):
+    batch = []
+    for post in posts:
+        batch.append(post)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def analyze_incremental(posts, cache, workers=1, batch_size=CACHE_BATCH_SIZE):
+    """
+    BlogStats of a post stream, reusing the cached features of unchanged posts.
+
+    Only cache misses are analyzed (in a process pool if workers > 1), then
+    stored; the statistics are accumulated in post order from cached and
+    fresh features alike, so the report is the same as a full analysis.
+    """
+    stats = BlogStats()
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        for batch in _batches(posts, batch_size):
+            features = cache.lookup(batch)
+            misses = [post for post, cached in zip(batch, features) if cached is None]
+            if misses:
+                if pool is not None:
+                    chunksize = max(1, len(misses) // (4 * workers))
+                    fresh = list(pool.map(analyze_post, misses, chunksize=chunksize))
+                else:
+                    fresh = [analyze_post(post) for post in misses]
+                cache.store(misses, fresh)
+                fresh = iter(fresh)
+                features = [cached if cached is not None else next(fresh) for cached in features]
+
+            for post, post_features in zip(batch, features):
+                stats.add(post, post_features)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return stats
+
+
+def analyze_export(xml_file, workers=1, batch_size=BATCH_SIZE, cache=None):
+    """
+    Stream a WordPress export and return the analysis report.
+
+    With workers > 1, the main process parses the XML and hands batches of
+    posts to a process pool. At most 2 batches per worker are in flight, so
+    memory stays bounded, and results are merged in submission order.
+    With a FeatureCache, see analyze_incremental().
+    """
+    posts = iter_posts(xml_file)
+    if cache is not None:
+        return analyze_incremental(posts, cache, workers).report()
+    if workers <= 1:
+        return analyze_posts(posts).report()
+
+    stats = BlogStats()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for batch in _batches(posts, batch_size):
+            pending.append(pool.submit(analyze_posts, batch))
+            if len(pending) >= 2 * workers:
+                stats.merge(pending.popleft().result())
+        while pending:
+            stats.merge(pending.popleft().result())
+    return stats.report()
+
+
+def print_summary(report):
+    """Print the headline figures of a report."""
+    print("\n" + "=" * 60)
+    print("BLOG ANALYSIS SUMMARY")
+    print("=" * 60)
+    print(f"Total Posts Analyzed: {report['blog_info']['total_posts']}")
+    print(
+        f"Average Post Length: {report['blog_info']['avg_post_length']:.0f} characters"
+    )
+    print(f"Average Word Count: {report['blog_info']['avg_word_count']:.0f} words")
+
+    print("\nTOP CATEGORIES:")
+    for cat, count in list(report["categories"]["most_common"].items())[:10]:
+        print(f"  {cat}: {count} posts")
+
+    print("\nTOP TAGS:")
+    for tag, count in list(report["tags"]["most_common"].items())[:10]:
+        print(f"  {tag}: {count} posts")
+
+    print("\nTITLE PATTERNS:")
+    for pattern, titles in report["title_patterns"].items():
+        if titles:
+            print(f"  {pattern.replace('_', ' ').title()}: {len(titles)} titles")
+
+    print("\nWRITING STYLE:")
+    print(f"  Personal tone: {report['writing_style']['avg_personal_pronouns']:.3f}")
+    print(f"  Technical content: {report['writing_style']['avg_tech_terms']:.3f}")
+    print(f"  Informal style: {report['writing_style']['avg_informal']:.3f}")
+    print(f"  Geek culture: {report['writing_style']['avg_geek_slang']:.3f}")
+
+
+def main(argv=None):
+    """Main analysis function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("xml_file", nargs="?", default=DEFAULT_XML_FILE)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT_FILE)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="analysis processes (1: serial, 0: one per CPU core)",
+    )
+    parser.add_argument(
+        "--cache",
+        help="SQLite file of per-post results: only new or edited posts are analyzed",
+    )
+    args = parser.parse_args(argv)
+    workers = args.workers or os.cpu_count() or 1
+
+    cache = FeatureCache(args.cache) if args.cache else None
+    try:
+        report = analyze_export(args.xml_file, workers=workers, cache=cache)
+        if cache is not None:
+            print(f"Cache: {cache.hits} posts reused, {cache.misses} analyzed")
+
+        # Save analysis results
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
 
+        print(f"Analysis complete! Report saved to: {args.output}")
+        print_summary(report)
         return report
 
     except Exception as e:
         print(f"Error analyzing blog: {e}")
         return None
+    finally:
+        if cache is not None:
+            cache.close()
 
 
 if __name__ == "__main__":
@@ -6,6 +6,8 @@ from app.api.endpoints import (
     project_management,
     templates,
     health,
+    stats,
+    search,
 )
 
 api_router = APIRouter()
@@ -21,3 +23,5 @@ api_router.include_router(
 api_router.include_router(tasks.router, prefix="/tasks", tags=["Tasks"])
 api_router.include_router(jobs.router, prefix="/jobs", tags=["Jobs"])
 api_router.include_router(templates.router, prefix="/templates", tags=["Templates"])
+api_router.include_router(stats.router, prefix="/stats", tags=["Stats"])
+api_router.include_router(search.router, prefix="/search", tags=["Search"])
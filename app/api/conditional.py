@@ -0,0 +1,66 @@
+"""
+GET conditionnels (ETag / If-None-Match) pour les endpoints de lecture interrogés en boucle
+"""
+
+import hashlib
+from typing import Callable, Optional
+
+from fastapi import Depends, HTTPException, Request, Response
+
+
+def make_etag(fingerprint: str, request: Request) -> str:
+    """
+    ETag faible de la représentation: empreinte des données + paramètres de
+    requête (filtres, pagination) + version de l'API (schémas de réponse)
+    """
+    digest = hashlib.sha256(
+        f"{request.app.version}\x1f{request.url.query}\x1f{fingerprint}".encode("utf-8")
+    ).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Comparaison faible (RFC 9110): le préfixe W/ est ignoré, "*" correspond toujours"""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.removeprefix("W/") == opaque for candidate in candidates)
+
+
+def etag_dependency(fingerprint: Callable[..., Optional[str]]):
+    """
+    Dépendance FastAPI de GET conditionnel
+
+    `fingerprint` est elle-même une dépendance (paramètres de chemin et de
+    requête typés, session DB) qui calcule une empreinte légère des données
+    de la réponse, sans chargement ORM ni sérialisation. Si l'ETag qui en
+    découle figure dans If-None-Match, la requête se termine en 304 avant
+    l'exécution de l'endpoint; sinon l'ETag est ajouté à la réponse.
+
+    Une empreinte None (ressource introuvable, cas non couvert) désactive
+    la validation: l'endpoint s'exécute normalement.
+
+    Usage:
+        @router.get("/{id}", dependencies=[Depends(etag_dependency(_fingerprint))])
+    """
+
+    def conditional_get(
+        request: Request,
+        response: Response,
+        value: Optional[str] = Depends(fingerprint),
+    ) -> Optional[str]:
+        if value is None:
+            return None
+
+        etag = make_etag(value, request)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(status_code=304, headers=headers)
+
+        response.headers.update(headers)
+        return etag
+
+    return conditional_get
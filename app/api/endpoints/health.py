@@ -2,108 +2,25 @@
 Health check endpoints for monitoring and container orchestration.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import text
+from fastapi import APIRouter, HTTPException
 from datetime import datetime
-from typing import Dict, Any
-import redis
 import os
-import psutil
-
-from app.db.config import get_db
-
-router = APIRouter()
-
-
-def check_database_connection(db: Session) -> Dict[str, Any]:
-    """Check database connectivity and basic health."""
-    try:
-        # Execute a simple query
-        result = db.execute(text("SELECT 1"))
-        result.fetchone()
-
-        # Get database statistics
-        stats = db.execute(
-            text("""
-            SELECT
-                count(*) as connection_count,
-                max(state_change) as last_activity
-            FROM pg_stat_activity
-            WHERE datname = current_database()
-        """)
-        ).fetchone()
-
-        return {
-            "status": "healthy",
-            "response_time_ms": 0,  # Would need timing logic
-            "connections": stats.connection_count if stats else 0,
-            "last_activity": stats.last_activity.isoformat()
-            if stats and stats.last_activity
-            else None,
-        }
-    except Exception as e:
-        return {"status": "unhealthy", "error": str(e)}
-
-
-def check_redis_connection() -> Dict[str, Any]:
-    """Check Redis connectivity and basic health."""
-    try:
-        redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-        r = redis.from_url(redis_url)
-
-        # Ping Redis
-        r.ping()
-
-        # Get Redis info
-        info = r.info()
-
-        return {
-            "status": "healthy",
-            "version": info.get("redis_version", "unknown"),
-            "connected_clients": info.get("connected_clients", 0),
-            "used_memory_human": info.get("used_memory_human", "unknown"),
-        }
-    except Exception as e:
-        return {"status": "unhealthy", "error": str(e)}
-
-
-def get_system_metrics() -> Dict[str, Any]:
-    """Get system resource usage metrics."""
-    try:
-        # CPU usage
-        cpu_percent = psutil.cpu_percent(interval=0.1)
-
-        # Memory usage
-        memory = psutil.virtual_memory()
-
-        # Disk usage
-        disk = psutil.disk_usage("/")
-
-        return {
-            "cpu_percent": cpu_percent,
-            "memory": {
-                "percent": memory.percent,
-                "available_mb": memory.available / 1024 / 1024,
-                "total_mb": memory.total / 1024 / 1024,
-            },
-            "disk": {
-                "percent": disk.percent,
-                "free_gb": disk.free / 1024 / 1024 / 1024,
-                "total_gb": disk.total / 1024 / 1024 / 1024,
-            },
-        }
-    except Exception as e:
-        return {"error": str(e)}
+
+from app.core.executors import get_executor_stats
+from app.core.health_monitor import get_health_snapshot
+from app.api.responses import FastJSONRoute
+
+router = APIRouter(route_class=FastJSONRoute)
 
 
 @router.get("/health")
-async def health_check(db: Session = Depends(get_db)):
+async def health_check():
     """
     Basic health check endpoint.
 
-    Returns 200 if the service is healthy, 503 if any critical component is down.
+    Reads the background health snapshot: no database round-trip per request.
     """
+    snapshot = await get_health_snapshot()
     health_status = {
         "status": "healthy",
         "timestamp": datetime.utcnow().isoformat(),
@@ -112,31 +29,32 @@ async def health_check(db: Session = Depends(get_db)):
     }
 
     # Check database
-    db_status = check_database_connection(db)
-    if db_status["status"] == "unhealthy":
+    if snapshot["components"]["database"]["status"] == "unhealthy":
         health_status["status"] = "unhealthy"
 
     return health_status
 
 
 @router.get("/health/detailed")
-async def detailed_health_check(db: Session = Depends(get_db)):
+async def detailed_health_check():
     """
     Detailed health check with component status and metrics.
 
-    Useful for monitoring dashboards and debugging.
+    Useful for monitoring dashboards and debugging. Component checks and
+    system metrics come from the background sampler snapshot (see
+    app.core.health_monitor); "snapshot_age_s" tells how old they are.
     """
-    # Check all components
-    db_status = check_database_connection(db)
-    redis_status = check_redis_connection()
-    system_metrics = get_system_metrics()
+    snapshot = await get_health_snapshot()
+    components = snapshot["components"]
+    system_metrics = snapshot["metrics"]
 
-    # Determine overall health
+    # Determine overall health (Redis is optional: only checked when REDIS_URL is set)
     overall_status = "healthy"
-    if db_status["status"] == "unhealthy" or redis_status["status"] == "unhealthy":
+    if components["database"]["status"] == "unhealthy":
         overall_status = "unhealthy"
     elif (
-        system_metrics.get("cpu_percent", 0) > 90
+        components.get("redis", {}).get("status") == "unhealthy"
+        or system_metrics.get("cpu_percent", 0) > 90
         or system_metrics.get("memory", {}).get("percent", 0) > 90
     ):
         overall_status = "degraded"
@@ -146,8 +64,12 @@ async def detailed_health_check(db: Session = Depends(get_db)):
         "timestamp": datetime.utcnow().isoformat(),
         "version": os.getenv("APP_VERSION", "1.0.0"),
         "environment": os.getenv("ENVIRONMENT", "production"),
-        "components": {"database": db_status, "redis": redis_status},
+        "components": components,
         "metrics": system_metrics,
+        "queue": snapshot["queue"],
+        "executors": get_executor_stats(),
+        "snapshot_collected_at": snapshot["collected_at"],
+        "snapshot_age_s": snapshot["age_s"],
         "features": {
             "templates_enabled": os.getenv("ENABLE_TEMPLATE_CREATION", "true")
             == "true",
@@ -164,6 +86,20 @@ async def detailed_health_check(db: Session = Depends(get_db)):
     return health_report
 
 
+@router.get("/health/executors")
+async def executors_metrics():
+    """
+    Saturation and queueing metrics of the named executors (LLM, DB/CPU).
+
+    A growing queue wait on "llm" means crews are backing up; the "db" pool
+    should stay unaffected.
+    """
+    return {
+        "timestamp": datetime.utcnow().isoformat(),
+        "executors": get_executor_stats(),
+    }
+
+
 @router.get("/health/live")
 async def liveness_probe():
     """
@@ -175,17 +111,18 @@ async def liveness_probe():
 
 
 @router.get("/health/ready")
-async def readiness_probe(db: Session = Depends(get_db)):
+async def readiness_probe():
     """
     Kubernetes readiness probe endpoint.
 
-    Checks if the service is ready to accept traffic.
+    Checks if the service is ready to accept traffic, from the database
+    status of the background health snapshot.
     """
-    # Quick database check
-    try:
-        db.execute(text("SELECT 1"))
-        return {"status": "ready", "timestamp": datetime.utcnow().isoformat()}
-    except Exception as e:
+    snapshot = await get_health_snapshot()
+    database = snapshot["components"]["database"]
+    if database["status"] == "unhealthy":
         raise HTTPException(
-            status_code=503, detail={"status": "not_ready", "error": str(e)}
+            status_code=503,
+            detail={"status": "not_ready", "error": database.get("error")},
         )
+    return {"status": "ready", "timestamp": datetime.utcnow().isoformat()}
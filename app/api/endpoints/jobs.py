@@ -11,8 +11,9 @@ from app.celery_config import celery_app
 from app.models.job_models import AsyncJob
 from app.schemas.job_schemas import JobStatus
 from app.tasks.ai_tasks import planning_task
+from app.api.responses import FastJSONRoute
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 
 @router.get("/{job_id}/status", response_model=JobStatus, tags=["Jobs"])
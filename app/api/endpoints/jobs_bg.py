@@ -12,8 +12,9 @@ from app.core.task_manager import task_manager
 from app.models.job_models import AsyncJob
 from app.schemas.job_schemas import JobStatus
 from app.tasks.ai_tasks_bg import planning_task_bg
+from app.api.responses import FastJSONRoute
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 
 @router.get("/{job_id}/status", response_model=JobStatus, tags=["Jobs"])
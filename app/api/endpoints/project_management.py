@@ -13,7 +13,9 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from app.schemas import schemas
+from app.schemas.job_schemas import JobStatus
 from app.services import project_service
+from app.tasks.project_tasks_bg import duplicate_project_task_bg
 from app.db.config import get_db
 from app.exceptions import (
     ProjectNotFound,
@@ -21,8 +23,9 @@ from app.exceptions import (
     ProjectNotArchived,
     CannotDeleteArchivedProject,
 )
+from app.api.responses import FastJSONRoute
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 # ====== ARCHIVAGE ET GESTION ======
 
@@ -140,6 +143,7 @@ def update_project_settings_endpoint(
 
 class DuplicateProjectRequest(schemas.BaseModel):
     new_name: Optional[str] = None
+    include_outputs: bool = False
 
 
 @router.post(
@@ -156,10 +160,14 @@ def duplicate_project_endpoint(
     Duplique un projet avec toutes ses tâches.
 
     Si aucun nom n'est fourni, ajoute "- Copie" au nom original.
+    Avec include_outputs, le dernier output de chaque type est aussi copié.
     """
     try:
         db_project = project_service.duplicate_project(
-            db=db, project_id=project_id, new_name=request.new_name
+            db=db,
+            project_id=project_id,
+            new_name=request.new_name,
+            include_outputs=request.include_outputs,
         )
         return db_project
     except ProjectNotFound:
@@ -168,6 +176,40 @@ def duplicate_project_endpoint(
         raise HTTPException(status_code=500, detail=f"Duplication failed: {str(e)}")
 
 
+@router.post(
+    "/{project_id}/duplicate-async",
+    response_model=JobStatus,
+    tags=["Project Management", "Async"],
+)
+async def duplicate_project_async_endpoint(
+    project_id: int,
+    request: DuplicateProjectRequest = Body(...),
+    db: Session = Depends(get_db),
+):
+    """
+    Duplique un projet volumineux en arrière-plan.
+
+    Retourne immédiatement un job_id; la progression (tâches copiées) et
+    l'ID du nouveau projet sont disponibles via les endpoints de jobs.
+    """
+    if not project_service.get_project(db, project_id):
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    task_result = await duplicate_project_task_bg.delay(
+        project_id,
+        new_name=request.new_name,
+        include_outputs=request.include_outputs,
+    )
+
+    return JobStatus(
+        job_id=task_result.task_id,
+        status="PENDING",
+        job_type="project_duplication",
+        progress=0.0,
+        step="Démarrage de la duplication...",
+    )
+
+
 # ====== FILTRAGE ET RECHERCHE AVANCÉE ======
 
 
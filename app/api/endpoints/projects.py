@@ -8,8 +8,10 @@ from app.schemas.workflow_schemas import (
     WorkflowExecutionCreate,
     WorkflowExecutionStatus,
     WorkflowLaunchResponse,
+    WorkflowResumeResponse,
     WorkflowOutputsResponse,
     TaskOutputSummary,
+    IncrementalAssemblyResponse,
 )
 from app.services import (
     project_service,
@@ -17,12 +19,23 @@ from app.services import (
     ai_service,
 )  # Ajout de task_service et ai_service
 from app.services import job_service, workflow_service, output_service
+from app.services import assembly_service
+from app.api.conditional import etag_dependency
+from app.core.executors import run_in_llm_executor
 from app.db.config import get_db
 from app.tasks.ai_tasks import planning_task, finishing_task
 from app.tasks.orchestrator_tasks import full_article_workflow_task
+from app.tasks.orchestrator_bg import full_article_workflow_task_bg
 from app.models.workflow_models import WorkflowType
+from app.exceptions import (
+    FinalContentModified,
+    ProjectNotFound,
+    WorkflowNotFound,
+    WorkflowNotResumable,
+)
+from app.api.responses import FastJSONRoute
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 
 @router.post("/", response_model=schemas.Project, status_code=201)
@@ -40,7 +53,19 @@ def read_projects_endpoint(
     return projects
 
 
-@router.get("/{project_id}", response_model=schemas.Project)
+def _project_fingerprint(project_id: int, db: Session = Depends(get_db)):
+    return project_service.get_project_fingerprint(db, project_id)
+
+
+def _workflow_outputs_fingerprint(workflow_id: str, db: Session = Depends(get_db)):
+    return output_service.get_workflow_outputs_fingerprint(db, workflow_id)
+
+
+@router.get(
+    "/{project_id}",
+    response_model=schemas.Project,
+    dependencies=[Depends(etag_dependency(_project_fingerprint))],
+)
 def read_project_endpoint(project_id: int, db: Session = Depends(get_db)):
     db_project = project_service.get_project(db, project_id=project_id)
     if db_project is None:
@@ -240,6 +265,47 @@ async def assemble_and_refine_project_content_async(
     )
 
 
+@router.post(
+    "/{project_id}/assemble-incremental",
+    response_model=IncrementalAssemblyResponse,
+    tags=["Projects", "AI Finishing Crew"],
+)
+async def assemble_project_incremental(
+    project_id: int,
+    refine_changed: bool = False,
+    force: bool = False,
+    db: Session = Depends(get_db),
+):
+    """
+    Met à jour l'article final en ne re-rendant que les sections modifiées
+
+    Sans refine_changed, aucun appel LLM: les sections inchangées sont reprises
+    telles quelles de final_content. Avec refine_changed, seules les sections
+    modifiées passent par le crew de finition.
+
+    409 si final_content n'a pas été produit par l'assemblage incrémental
+    (article du workflow, édition manuelle): force=true le reconstruit.
+    """
+    try:
+        if refine_changed:
+            return await run_in_llm_executor(
+                assembly_service.assemble_project_incremental,
+                db,
+                project_id,
+                refine_section=ai_service.run_section_finishing_crew,
+                force=force,
+            )
+        return assembly_service.assemble_project_incremental(
+            db, project_id, force=force
+        )
+    except ProjectNotFound:
+        raise HTTPException(status_code=404, detail="Project not found")
+    except FinalContentModified as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except EnvironmentError as e:
+        raise HTTPException(status_code=503, detail=f"AI Service Unavailable: {e}")
+
+
 @router.put("/{project_id}", response_model=schemas.Project)
 def update_project_endpoint(
     project_id: int, project: schemas.ProjectUpdate, db: Session = Depends(get_db)
@@ -329,6 +395,48 @@ async def launch_article_workflow(
         )
 
 
+@router.post(
+    "/workflows/{workflow_id}/resume",
+    response_model=WorkflowResumeResponse,
+    tags=["Workflows"],
+)
+async def resume_article_workflow(workflow_id: str, db: Session = Depends(get_db)):
+    """
+    Reprend un workflow échoué ou annulé depuis ses checkpoints
+
+    Les étapes déjà terminées (planning, recherches, assemblage) sont sautées
+    et leurs outputs réutilisés: seule l'étape en échec est relancée.
+    """
+    try:
+        workflow = workflow_service.prepare_workflow_resume(db, workflow_id)
+        skipped_steps = list(workflow_service.get_step_checkpoints(workflow))
+        resumed_from_step = workflow.current_step.get("step_name")
+        project_id = workflow.project_id
+        db.commit()
+    except WorkflowNotFound:
+        raise HTTPException(status_code=404, detail="Workflow not found")
+    except WorkflowNotResumable as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    try:
+        workflow_job = await full_article_workflow_task_bg.delay(
+            project_id, workflow_id, resume=True
+        )
+
+        return WorkflowResumeResponse(
+            workflow_execution_id=workflow_id,
+            primary_job_id=workflow_job.id,
+            resumed_from_step=resumed_from_step,
+            skipped_steps=skipped_steps,
+            message=f"Workflow repris à l'étape '{resumed_from_step}' pour le projet {project_id}",
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Échec de la reprise du workflow: {str(e)}"
+        )
+
+
 @router.get(
     "/workflows/{workflow_id}/status",
     response_model=WorkflowExecutionStatus,
@@ -364,7 +472,7 @@ async def get_workflow_status(workflow_id: str, db: Session = Depends(get_db)):
         completed_at=workflow.completed_at,
         updated_at=workflow.updated_at,
         error_details=workflow.error_details,
-        metadata=workflow.metadata,
+        metadata=workflow.workflow_metadata,
         total_jobs=total_jobs,
         completed_jobs=completed_jobs,
         failed_jobs=failed_jobs,
@@ -375,6 +483,7 @@ async def get_workflow_status(workflow_id: str, db: Session = Depends(get_db)):
     "/workflows/{workflow_id}/outputs",
     response_model=WorkflowOutputsResponse,
     tags=["Workflows"],
+    dependencies=[Depends(etag_dependency(_workflow_outputs_fingerprint))],
 )
 async def get_workflow_outputs(workflow_id: str, db: Session = Depends(get_db)):
     """
@@ -396,11 +505,11 @@ async def get_workflow_outputs(workflow_id: str, db: Session = Depends(get_db)):
             task_title=output.task.title if output.task else "Tâche système",
             output_type=output.output_type,
             content_preview=output.content[:200],
-            word_count=output.metadata.get("word_count")
-            if output.metadata
+            word_count=output.output_metadata.get("word_count")
+            if output.output_metadata
             else len(output.content.split()),
             created_at=output.created_at,
-            metadata=output.metadata,
+            metadata=output.output_metadata,
         )
         output_summaries.append(summary)
 
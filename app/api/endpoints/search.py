@@ -0,0 +1,36 @@
+"""
+Endpoint de recherche plein texte (projets, tâches, outputs).
+"""
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+
+from app.db.config import get_db
+from app.schemas.schemas import SearchResponse
+from app.services import search_service
+from app.api.responses import FastJSONRoute
+
+router = APIRouter(route_class=FastJSONRoute)
+
+
+@router.get("", response_model=SearchResponse)
+def search_endpoint(
+    q: str = Query(..., min_length=1, max_length=200, description="Texte recherché"),
+    types: Optional[List[str]] = Query(
+        None, description="Types d'entités: project, task, output (tous par défaut)"
+    ),
+    project_id: Optional[int] = Query(None, description="Restreindre à un projet"),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+):
+    """
+    Recherche classée dans les projets, tâches et contenus générés.
+
+    Chaque terme est cherché en préfixe et tous doivent être présents.
+    Les extraits surlignent les correspondances avec <mark>.
+    """
+    return search_service.search(
+        db, q, types=types, project_id=project_id, limit=limit, offset=offset
+    )
@@ -0,0 +1,33 @@
+"""
+Endpoints de statistiques (appels LLM).
+"""
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import Any, Dict, Optional
+
+from app.db.config import get_db
+from app.services import llm_stats_service
+from app.api.responses import FastJSONRoute
+
+router = APIRouter(route_class=FastJSONRoute)
+
+
+@router.get("/llm")
+def get_llm_stats(
+    hours: int = Query(
+        24, ge=0, description="Fenêtre glissante en heures (0 = tout l'historique)"
+    ),
+    crew_type: Optional[str] = Query(
+        None, description="planner, researcher, writer ou finisher"
+    ),
+    db: Session = Depends(get_db),
+) -> Dict[str, Any]:
+    """
+    Statistiques des appels LLM par type de crew et par modèle.
+
+    - **wall_time**: percentiles p50/p90/p95/p99, moyenne et total (secondes)
+    - **prompt_tokens / completion_tokens**: tokens consommés
+    - **cost_usd**: coût estimé selon la grille tarifaire des modèles
+    """
+    return llm_stats_service.get_llm_stats(db, hours=hours or None, crew_type=crew_type)
@@ -5,16 +5,19 @@ from typing import List, Optional, Literal
 from app.schemas import schemas
 from app.schemas.job_schemas import JobStatus
 from app.services import task_service, ai_service  # ai_service ajouté
+from app.services import context_service
 from app.services import job_service
 from app.services.exceptions import (
     ProjectNotFoundException,
     TaskNotFoundException,
     InvalidTaskDataException,
 )
+from app.api.conditional import etag_dependency
 from app.db.config import get_db
 from app.tasks.ai_tasks import research_task, writing_task
+from app.api.responses import FastJSONRoute
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 AgentType = Literal["researcher", "writer"]
 
@@ -63,9 +66,11 @@ async def run_agent_on_task(
 
     ai_result = ""
     task_title = db_task.title
-    # Le contexte pour l'IA peut être le `context` fourni, ou la description existante de la tâche, ou une combinaison.
-    # Pour l'instant, si `context` est fourni, il est prioritaire. Sinon, on utilise la description de la tâche.
-    effective_context = context if context is not None else db_task.description
+    # Le contexte combine le `context` fourni (prioritaire), la description de la tâche
+    # et les sorties précédentes pertinentes, le tout borné au budget de tokens du modèle.
+    effective_context = context_service.build_task_context(
+        db, db_task, agent_type, user_context=context
+    )
 
     try:
         if agent_type == "researcher":
@@ -189,8 +194,16 @@ async def run_agent_on_task_async(
     )
 
 
+def _project_tasks_fingerprint(project_id: int, db: Session = Depends(get_db)):
+    return task_service.get_project_tasks_fingerprint(db, project_id)
+
+
 # Endpoint pour récupérer les tâches d'un projet spécifique
-@router.get("/project/{project_id}", response_model=List[schemas.Task])
+@router.get(
+    "/project/{project_id}",
+    response_model=List[schemas.Task],
+    dependencies=[Depends(etag_dependency(_project_tasks_fingerprint))],
+)
 def get_tasks_for_project_endpoint(
     project_id: int, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
 ):
@@ -205,6 +218,24 @@ def get_tasks_for_project_endpoint(
     return tasks
 
 
+@router.patch("/bulk", response_model=schemas.TaskBulkResult)
+def bulk_update_tasks_endpoint(
+    bulk: schemas.TaskBulkUpdate, db: Session = Depends(get_db)
+):
+    """
+    Applique plusieurs changements de statut/ordre et suppressions en une requête.
+
+    Pour un glisser-déposer, envoyer after_id / before_id (voisines de la carte
+    à sa nouvelle position): seule la tâche déplacée est réécrite.
+    """
+    try:
+        return task_service.bulk_update(db, bulk)
+    except TaskNotFoundException as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except InvalidTaskDataException as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.put("/{task_id}", response_model=schemas.Task)
 def update_task_endpoint(
     task_id: int, task: schemas.TaskUpdate, db: Session = Depends(get_db)
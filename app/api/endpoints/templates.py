@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict
 
+from app.api.conditional import etag_dependency
 from app.db.config import get_db
 from app.dependencies import get_current_admin_user, User
 from app.schemas.schemas import (
@@ -16,11 +17,22 @@ from app.schemas.schemas import (
     Project,
 )
 from app.services import template_service
+from app.api.responses import FastJSONRoute
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 
-@router.get("/", response_model=List[BlogTemplate])
+def _templates_fingerprint(
+    active_only: bool = Query(True), db: Session = Depends(get_db)
+) -> str:
+    return template_service.get_templates_fingerprint(db, active_only=active_only)
+
+
+@router.get(
+    "/",
+    response_model=List[BlogTemplate],
+    dependencies=[Depends(etag_dependency(_templates_fingerprint))],
+)
 def get_templates(
     category: Optional[str] = Query(None, description="Filtrer par catégorie"),
     difficulty: Optional[str] = Query(None, description="Filtrer par difficulté"),
@@ -58,7 +70,7 @@ def get_template_stats(db: Session = Depends(get_db)):
 
     Retourne:
     - Nombre total de templates
-    - Distribution par difficulté
+    - Distribution par difficulté, par catégorie et par ton
     - Templates style Boulet
     - Catégories disponibles
     """
@@ -147,14 +159,11 @@ def preview_template_tasks_endpoint(
 
     Permet de prévisualiser sans créer effectivement le projet.
     """
-    template = template_service.get_template_by_id(db, request.template_id)
-    if not template:
-        raise HTTPException(status_code=404, detail="Template non trouvé")
-
-    # Use the internal task generation function directly
-    tasks = template_service._generate_tasks_from_template(
-        template, request.customization
+    tasks = template_service.preview_template_tasks(
+        db, request.template_id, request.customization
     )
+    if tasks is None:
+        raise HTTPException(status_code=404, detail="Template non trouvé")
     return tasks
 
 
@@ -0,0 +1,36 @@
+"""
+Classe de réponse JSON rapide et classe de route associée
+"""
+
+from typing import Any
+
+from fastapi.datastructures import Default, DefaultPlaceholder
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+
+from app.core.serialization import dumps_bytes
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse sérialisée par app.core.serialization (orjson si disponible)"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps_bytes(content)
+
+
+class FastJSONRoute(APIRoute):
+    """
+    Route dont la classe de réponse par défaut est FastJSONResponse
+
+    La classe reste un "défaut" FastAPI: les endpoints avec response_model
+    conservent la sérialisation directe en octets par Pydantic (plus rapide
+    que tout encodeur appliqué à un dict intermédiaire); seuls les endpoints
+    qui renvoient des dict/list bruts passent par FastJSONResponse.
+    Définir default_response_class sur l'application désactiverait ce
+    chemin rapide pour toutes les routes.
+    """
+
+    def __init__(self, path: str, endpoint, *, response_class=Default(JSONResponse), **kwargs):
+        if isinstance(response_class, DefaultPlaceholder):
+            response_class = Default(FastJSONResponse)
+        super().__init__(path, endpoint, response_class=response_class, **kwargs)
@@ -0,0 +1,154 @@
+"""
+Executors nommés pour le travail bloquant
+Isole les appels LLM longs du travail DB/CPU pour éviter la famine du pool par défaut
+"""
+
+import asyncio
+import functools
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+
+# Noms des executors disponibles
+LLM_EXECUTOR = "llm"
+DB_EXECUTOR = "db"
+
+# Nombre d'échantillons conservés pour les percentiles de temps d'attente
+QUEUE_SAMPLE_SIZE = 200
+
+
+class InstrumentedExecutor:
+    """
+    ThreadPoolExecutor nommé avec métriques de saturation
+
+    Mesure le temps passé en file d'attente (soumission -> début d'exécution)
+    ainsi que le nombre de tâches actives et en attente.
+    """
+
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"geekblog-{name}"
+        )
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._active = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._queue_waits: deque = deque(maxlen=QUEUE_SAMPLE_SIZE)
+        self._max_queue_wait = 0.0
+
+    def _instrument(self, func: Callable, submitted_at: float) -> Callable:
+        def wrapper():
+            started = time.monotonic()
+            with self._lock:
+                self._pending -= 1
+                self._active += 1
+                wait = started - submitted_at
+                self._queue_waits.append(wait)
+                self._max_queue_wait = max(self._max_queue_wait, wait)
+            try:
+                result = func()
+            except Exception:
+                with self._lock:
+                    self._failed += 1
+                raise
+            finally:
+                with self._lock:
+                    self._active -= 1
+                    self._completed += 1
+            return result
+
+        return wrapper
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """Exécute une fonction bloquante dans ce pool sans bloquer la boucle"""
+        call = functools.partial(func, *args, **kwargs)
+        with self._lock:
+            self._pending += 1
+            self._submitted += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self._instrument(call, time.monotonic())
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Métriques de saturation et de file d'attente"""
+        with self._lock:
+            waits = sorted(self._queue_waits)
+            stats = {
+                "max_workers": self.max_workers,
+                "active": self._active,
+                "queued": self._pending,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "saturation": round(self._active / self.max_workers, 2),
+                "max_queue_wait_ms": round(self._max_queue_wait * 1000, 1),
+            }
+
+        if waits:
+            stats["avg_queue_wait_ms"] = round(sum(waits) / len(waits) * 1000, 1)
+            stats["p95_queue_wait_ms"] = round(
+                waits[min(len(waits) - 1, int(len(waits) * 0.95))] * 1000, 1
+            )
+        else:
+            stats["avg_queue_wait_ms"] = 0.0
+            stats["p95_queue_wait_ms"] = 0.0
+        return stats
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._executor.shutdown(wait=wait)
+
+
+_executors: Dict[str, InstrumentedExecutor] = {}
+_registry_lock = threading.Lock()
+
+_DEFAULT_SIZES = {
+    LLM_EXECUTOR: ("LLM_EXECUTOR_WORKERS", 8),
+    DB_EXECUTOR: ("DB_EXECUTOR_WORKERS", 4),
+}
+
+
+def get_executor(name: str) -> InstrumentedExecutor:
+    """Retourne l'executor nommé, créé à la première utilisation"""
+    with _registry_lock:
+        if name not in _executors:
+            env_var, default = _DEFAULT_SIZES.get(name, (None, 4))
+            size = int(os.getenv(env_var, default)) if env_var else default
+            _executors[name] = InstrumentedExecutor(name, max(1, size))
+        return _executors[name]
+
+
+async def run_in_llm_executor(func: Callable, *args, **kwargs) -> Any:
+    """Exécute un appel LLM bloquant (crews CrewAI) dans le pool dédié"""
+    return await get_executor(LLM_EXECUTOR).run(func, *args, **kwargs)
+
+
+async def run_in_db_executor(func: Callable, *args, **kwargs) -> Any:
+    """Exécute du travail DB ou CPU bloquant dans le pool dédié"""
+    return await get_executor(DB_EXECUTOR).run(func, *args, **kwargs)
+
+
+def get_executor_stats(name: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Métriques de tous les executors créés (ou d'un seul)"""
+    with _registry_lock:
+        executors = dict(_executors)
+    if name is not None:
+        executors = {name: executors[name]} if name in executors else {}
+    return {key: executor.get_stats() for key, executor in executors.items()}
+
+
+def shutdown_executors(wait: bool = False) -> None:
+    """Arrête tous les executors (arrêt de l'application)"""
+    with _registry_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait)
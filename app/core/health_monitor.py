@@ -0,0 +1,250 @@
+"""
+Échantillonneur de santé en arrière-plan
+Les sondes (/health, /health/ready, /health/detailed) lisent un instantané
+rafraîchi périodiquement au lieu d'interroger DB, Redis et le système à chaque requête
+"""
+
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+import psutil
+from sqlalchemy import func, text
+
+from app.core.executors import run_in_db_executor
+from app.db.config import SessionLocal
+from app.models.job_models import AsyncJob
+
+# Intervalle de rafraîchissement de l'instantané (secondes)
+HEALTH_SAMPLE_INTERVAL = float(os.getenv("HEALTH_SAMPLE_INTERVAL", "10"))
+
+# Un instantané plus vieux que STALE_FACTOR intervalles est considéré périmé
+STALE_FACTOR = 3
+
+# Statuts AsyncJob comptés comme file d'attente (non terminés)
+QUEUED_JOB_STATUSES = ("PENDING", "PROGRESS", "RETRY")
+
+
+def check_database(db) -> Dict[str, Any]:
+    """Connectivité et temps de réponse de la base"""
+    try:
+        started = time.perf_counter()
+        db.execute(text("SELECT 1")).fetchone()
+        status = {
+            "status": "healthy",
+            "dialect": db.bind.dialect.name,
+            "response_time_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+
+        if db.bind.dialect.name == "postgresql":
+            stats = db.execute(
+                text("""
+                SELECT
+                    count(*) as connection_count,
+                    max(state_change) as last_activity
+                FROM pg_stat_activity
+                WHERE datname = current_database()
+            """)
+            ).fetchone()
+            status["connections"] = stats.connection_count if stats else 0
+            status["last_activity"] = (
+                stats.last_activity.isoformat() if stats and stats.last_activity else None
+            )
+        return status
+    except Exception as e:
+        return {"status": "unhealthy", "error": str(e)}
+
+
+def collect_queue_metrics(db) -> Dict[str, Any]:
+    """Jobs asynchrones non terminés, par statut"""
+    try:
+        rows = (
+            db.query(AsyncJob.status, func.count(AsyncJob.id))
+            .filter(AsyncJob.status.in_(QUEUED_JOB_STATUSES))
+            .group_by(AsyncJob.status)
+            .all()
+        )
+        by_status = {status: count for status, count in rows}
+        return {"jobs": by_status, "pending_jobs": sum(by_status.values())}
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def collect_system_metrics() -> Dict[str, Any]:
+    """
+    Ressources système
+
+    cpu_percent(interval=None) ne dort pas: il mesure l'utilisation depuis
+    l'appel précédent, c'est-à-dire sur l'intervalle de l'échantillonneur.
+    """
+    try:
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage("/")
+        return {
+            "cpu_percent": psutil.cpu_percent(interval=None),
+            "memory": {
+                "percent": memory.percent,
+                "available_mb": memory.available / 1024 / 1024,
+                "total_mb": memory.total / 1024 / 1024,
+            },
+            "disk": {
+                "percent": disk.percent,
+                "free_gb": disk.free / 1024 / 1024 / 1024,
+                "total_gb": disk.total / 1024 / 1024 / 1024,
+            },
+        }
+    except Exception as e:
+        return {"error": str(e)}
+
+
+class HealthSampler:
+    """
+    Rafraîchit un instantané de santé dans un thread démon
+
+    L'instantané est un dict remplacé d'un bloc à chaque échantillon: sa
+    lecture ne prend aucun verrou et ne fait aucune E/S. Redis n'est vérifié
+    que si REDIS_URL est défini (la pile n'en dépend plus), avec un client
+    unique réutilisé d'un échantillon à l'autre.
+    """
+
+    def __init__(
+        self,
+        interval: float = HEALTH_SAMPLE_INTERVAL,
+        session_factory: Callable = SessionLocal,
+        redis_url: Optional[str] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.interval = max(0.1, interval)
+        self._session_factory = session_factory
+        self._redis_url = redis_url
+        self._redis_client = None
+        self._clock = clock
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._sampled_at: Optional[float] = None
+        self._refresh_lock = threading.RLock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _check_redis(self) -> Dict[str, Any]:
+        try:
+            if self._redis_client is None:
+                import redis
+
+                self._redis_client = redis.from_url(
+                    self._redis_url, socket_timeout=1, socket_connect_timeout=1
+                )
+            info = self._redis_client.info()
+            return {
+                "status": "healthy",
+                "version": info.get("redis_version", "unknown"),
+                "connected_clients": info.get("connected_clients", 0),
+                "used_memory_human": info.get("used_memory_human", "unknown"),
+            }
+        except Exception as e:
+            return {"status": "unhealthy", "error": str(e)}
+
+    def refresh(self) -> Dict[str, Any]:
+        """Collecte un échantillon (bloquant: thread de l'échantillonneur ou executor DB)"""
+        with self._refresh_lock:
+            started = time.perf_counter()
+            db = self._session_factory()
+            try:
+                database = check_database(db)
+                queue = collect_queue_metrics(db)
+            finally:
+                db.close()
+
+            components = {"database": database}
+            if self._redis_url:
+                components["redis"] = self._check_redis()
+
+            snapshot = {
+                "collected_at": datetime.utcnow().isoformat(),
+                "collection_ms": round((time.perf_counter() - started) * 1000, 2),
+                "components": components,
+                "queue": queue,
+                "metrics": collect_system_metrics(),
+            }
+            self._snapshot = snapshot
+            self._sampled_at = self._clock()
+            return snapshot
+
+    def snapshot(self) -> Optional[Dict[str, Any]]:
+        """Dernier instantané (None avant le premier échantillon)"""
+        return self._snapshot
+
+    def age(self) -> Optional[float]:
+        """Âge du dernier instantané en secondes"""
+        if self._sampled_at is None:
+            return None
+        return self._clock() - self._sampled_at
+
+    def is_stale(self) -> bool:
+        age = self.age()
+        return age is None or age > self.interval * STALE_FACTOR
+
+    def refresh_if_stale(self) -> Optional[Dict[str, Any]]:
+        """Rafraîchit seulement si nécessaire (une seule collecte pour des appels simultanés)"""
+        with self._refresh_lock:
+            if self.is_stale():
+                return self.refresh()
+            return self._snapshot
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"Échec de l'échantillonnage de santé: {e}")
+            self._stop.wait(self.interval)
+
+    def start(self) -> None:
+        """Démarre le thread d'échantillonnage (sans effet s'il tourne déjà)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        # Amorce la mesure CPU: le premier cpu_percent(interval=None) renvoie 0.0
+        psutil.cpu_percent(interval=None)
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="geekblog-health-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+
+health_sampler = HealthSampler(redis_url=os.getenv("REDIS_URL"))
+
+
+def start_health_sampler() -> bool:
+    """Démarre l'échantillonneur partagé (désactivable via HEALTH_SAMPLER=false)"""
+    if os.getenv("HEALTH_SAMPLER", "true").lower() != "true":
+        return False
+    health_sampler.start()
+    return True
+
+
+def stop_health_sampler() -> None:
+    health_sampler.stop()
+
+
+async def get_health_snapshot(sampler: Optional[HealthSampler] = None) -> Dict[str, Any]:
+    """
+    Instantané de santé courant
+
+    Chemin normal: lecture directe de l'instantané. S'il est absent ou
+    périmé (échantillonneur désactivé ou bloqué), une collecte est faite
+    dans l'executor DB, jamais sur la boucle d'événements.
+    """
+    sampler = sampler or health_sampler
+    if sampler.is_stale():
+        await run_in_db_executor(sampler.refresh_if_stale)
+    snapshot = dict(sampler.snapshot())
+    snapshot["age_s"] = round(sampler.age(), 3)
+    return snapshot
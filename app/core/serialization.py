@@ -0,0 +1,65 @@
+"""
+Sérialisation JSON rapide (orjson si disponible, json de la bibliothèque standard sinon)
+Utilisée par les colonnes CompatJSON, l'engine SQLAlchemy et les réponses de l'API
+"""
+
+import json
+import os
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    orjson = None
+
+
+# JSON_BACKEND=json force la bibliothèque standard (diagnostic, comparaison)
+JSON_BACKEND = (
+    "orjson"
+    if orjson is not None and os.getenv("JSON_BACKEND", "orjson").lower() == "orjson"
+    else "json"
+)
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY if orjson is not None else 0
+)
+
+
+def _stdlib_dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def dumps_bytes(value: Any) -> bytes:
+    """
+    Sérialise en JSON UTF-8 compact
+
+    Les valeurs refusées par orjson (entiers > 64 bits, sous-classes non
+    gérées) sont sérialisées par la bibliothèque standard.
+    """
+    if JSON_BACKEND == "orjson":
+        try:
+            return orjson.dumps(value, option=_ORJSON_OPTIONS)
+        except TypeError:
+            pass
+    return _stdlib_dumps(value).encode("utf-8")
+
+
+def dumps(value: Any) -> str:
+    """Sérialise en texte JSON compact (colonnes JSON stockées en Text)"""
+    if JSON_BACKEND == "orjson":
+        try:
+            return orjson.dumps(value, option=_ORJSON_OPTIONS).decode("utf-8")
+        except TypeError:
+            pass
+    return _stdlib_dumps(value)
+
+
+def loads(data: Any) -> Any:
+    """
+    Désérialise du texte ou des octets JSON
+
+    Lève ValueError si le contenu n'est pas du JSON valide (comme json.loads).
+    """
+    if JSON_BACKEND == "orjson":
+        return orjson.loads(data)
+    return json.loads(data)
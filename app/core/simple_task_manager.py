@@ -9,6 +9,8 @@ from datetime import datetime, timezone
 from typing import Dict, Any, Optional, Callable, Coroutine
 from enum import Enum
 
+from app.core.executors import run_in_db_executor
+
 
 class TaskStatus(str, Enum):
     """Statuts des tâches de background"""
@@ -74,9 +76,8 @@ class SimpleTaskManager:
         return task_id
 
     async def _sync_wrapper(self, func: Callable, *args, **kwargs) -> Any:
-        """Wrapper pour exécuter une fonction synchrone dans un thread"""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, func, *args, **kwargs)
+        """Wrapper pour exécuter une fonction synchrone dans le pool DB/CPU dédié"""
+        return await run_in_db_executor(func, *args, **kwargs)
 
     async def _execute_task(self, task_id: str, coro: Coroutine) -> Any:
         """
@@ -8,7 +8,12 @@ from contextlib import contextmanager
 from sqlalchemy.orm import Session
 
 from app.db.config import SessionLocal
-from app.core.task_manager import task_manager, background_task, BackgroundTaskResult
+from app.core.task_manager import (
+    task_manager,
+    background_task,
+    current_task_id,
+    BackgroundTaskResult,
+)
 
 
 # ===== COMPATIBILITY LAYER =====
@@ -114,9 +119,9 @@ def create_compatible_task(name: str, bind: bool = True):
         @background_task(name)
         async def async_wrapper(*args, **kwargs):
             # Récupérer l'ID de la tâche actuelle depuis le task_manager
-            # Pour l'instant, on utilise un ID généré - pourrait être amélioré
+            # (ID généré si la fonction est appelée hors du task_manager)
             import uuid
-            task_id = str(uuid.uuid4())
+            task_id = current_task_id.get() or str(uuid.uuid4())
             
             if bind:
                 # Créer un objet self compatible avec JobAwareTask
@@ -4,6 +4,7 @@ Architecture simplifiée pour single-user avec persistance en base
 """
 
 import asyncio
+import contextvars
 import uuid
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional, Callable, Coroutine, List
@@ -11,11 +12,18 @@ from enum import Enum
 from sqlalchemy.orm import Session
 from contextlib import asynccontextmanager
 
+from app.core.executors import run_in_db_executor
 from app.db.config import SessionLocal
 from app.services import job_service
 from app.models.job_models import AsyncJob
 
 
+# ID de la tâche de background en cours d'exécution (visible dans sa coroutine)
+current_task_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "current_task_id", default=None
+)
+
+
 class TaskStatus(str, Enum):
     """Statuts des tâches de background"""
     PENDING = "PENDING"
@@ -110,14 +118,15 @@ class BackgroundTaskManager:
         return task_id
 
     async def _sync_wrapper(self, func: Callable, *args, **kwargs) -> Any:
-        """Wrapper pour exécuter une fonction synchrone dans un thread"""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, func, *args, **kwargs)
+        """Wrapper pour exécuter une fonction synchrone dans le pool DB/CPU dédié"""
+        return await run_in_db_executor(func, *args, **kwargs)
 
     async def _execute_task(self, task_id: str, coro: Coroutine) -> Any:
         """
         Exécute une tâche avec gestion d'erreurs et mise à jour de statut
         """
+        # Contexte propre à l'asyncio.Task: n'affecte pas l'appelant
+        current_task_id.set(task_id)
         try:
             # Marquer comme en cours
             await self.update_task_status(
@@ -229,19 +238,18 @@ class BackgroundTaskManager:
         """Crée un enregistrement de job en base"""
         # Utiliser job_service si disponible, sinon créer directement
         try:
-            job_service.create_job(
+            job_service.create_job_record(
                 db=db,
                 job_id=task_id,
                 job_type=task_name,
-                status="PENDING",
-                progress=0,
-                step="Initialisation"
             )
+            db.commit()
         except Exception:
             # Fallback: création directe
+            db.rollback()
             job = AsyncJob(
                 id=task_id,
-                job_type=task_name,
+                type=task_name,
                 status="PENDING",
                 progress=0,
                 step="Initialisation",
@@ -261,6 +269,7 @@ class BackgroundTaskManager:
                 status=task_info["status"],
                 status_message=task_info.get("error")
             )
+            db.commit()
         except Exception:
             # Fallback: mise à jour directe
             job = db.query(AsyncJob).filter(AsyncJob.id == task_id).first()
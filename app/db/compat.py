@@ -15,15 +15,18 @@ from sqlalchemy import (
 )
 from sqlalchemy.dialects.sqlite import JSON as SQLiteJSON
 from sqlalchemy.dialects.postgresql import JSON as PostgreSQLJSON
-import json
 import enum
 from typing import Type, Any
+from app.core import serialization
 from app.db.config import get_database_type
 
 
 class CompatJSON(TypeDecorator):
     """
     Type JSON compatible SQLite/PostgreSQL
+
+    Sur SQLite, la valeur est stockée en texte via app.core.serialization
+    (orjson si disponible).
     """
     impl = Text
     cache_ok = True
@@ -40,7 +43,7 @@ class CompatJSON(TypeDecorator):
         if value is None:
             return None
         if dialect.name == 'sqlite':
-            return json.dumps(value, ensure_ascii=False)
+            return serialization.dumps(value)
         return value
 
     def process_result_value(self, value, dialect):
@@ -48,7 +51,7 @@ class CompatJSON(TypeDecorator):
             return None
         if dialect.name == 'sqlite':
             try:
-                return json.loads(value)
+                return serialization.loads(value)
             except (ValueError, TypeError):
                 return value
         return value
@@ -4,6 +4,8 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 
+from app.core import serialization
+
 load_dotenv()
 
 # Détection automatique du type de base de données
@@ -25,6 +27,8 @@ if DATABASE_URL.startswith("sqlite"):
     engine = create_engine(
         DATABASE_URL,
         echo=False,  # Debug SQL
+        json_serializer=serialization.dumps,
+        json_deserializer=serialization.loads,
         connect_args={
             "check_same_thread": False,  # Nécessaire pour FastAPI
             "timeout": 20,  # Timeout de connexion
@@ -32,7 +36,12 @@ if DATABASE_URL.startswith("sqlite"):
     )
 else:
     # Configuration PostgreSQL (production)
-    engine = create_engine(DATABASE_URL, echo=False)
+    engine = create_engine(
+        DATABASE_URL,
+        echo=False,
+        json_serializer=serialization.dumps,
+        json_deserializer=serialization.loads,
+    )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -0,0 +1,37 @@
+"""
+Empreintes de contenu calculées sur des lignes brutes (requêtes Core)
+Servent de validateurs (ETag) sans chargement ORM ni sérialisation Pydantic
+"""
+
+import hashlib
+from typing import Iterable, List, Type
+
+from pydantic import BaseModel
+from sqlalchemy import Column
+
+
+def schema_columns(model, schema: Type[BaseModel]) -> List[Column]:
+    """
+    Colonnes de la table d'un modèle exposées par un schéma de réponse
+
+    Limiter l'empreinte à ces colonnes évite de lire les gros champs
+    non exposés et les changements qui ne modifient pas la réponse.
+    """
+    fields = schema.model_fields
+    return [column for column in model.__table__.columns if column.name in fields]
+
+
+def rows_fingerprint(*parts: Iterable) -> str:
+    """
+    Empreinte SHA-256 d'une ou plusieurs séquences de lignes
+
+    Les valeurs sont hachées via repr(): stable pour les types renvoyés par
+    les pilotes (int, str, datetime, enum, dict JSON).
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        for row in part:
+            digest.update(repr(tuple(row)).encode("utf-8"))
+            digest.update(b"\x1e")
+        digest.update(b"\x1d")
+    return digest.hexdigest()
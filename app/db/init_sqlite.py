@@ -16,6 +16,8 @@ from app.db.config import engine, get_database_type
 from app.models.models import Base
 from app.models.job_models import AsyncJob
 from app.models.workflow_models import WorkflowExecution, TaskOutput
+from app.models.llm_models import LLMCall
+from app.db.search_index import install_search_index
 
 # Configuration du logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -40,6 +42,11 @@ def create_sqlite_database():
         # Créer toutes les tables
         logger.info("🏗️  Création des tables...")
         Base.metadata.create_all(bind=engine)
+
+        # Index de recherche FTS5 (table virtuelle + triggers)
+        logger.info("🔎 Création de l'index de recherche...")
+        with engine.begin() as conn:
+            install_search_index(conn)
         
         logger.info("✅ Base de données SQLite initialisée avec succès!")
         logger.info(f"📍 Localisation: {engine.url}")
@@ -0,0 +1,49 @@
+"""Add llm_calls table for LLM call instrumentation
+
+Revision ID: b7d2e91c4a10
+Revises: '40bbac09f9db'
+Create Date: 2026-10-19 09:12:03.418211
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "b7d2e91c4a10"
+down_revision = "40bbac09f9db"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "llm_calls",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("crew_type", sa.String(length=32), nullable=False),
+        sa.Column("model", sa.String(length=64), nullable=False),
+        sa.Column("success", sa.Boolean(), nullable=False),
+        sa.Column("wall_time", sa.Float(), nullable=False),
+        sa.Column("prompt_tokens", sa.Integer(), nullable=False),
+        sa.Column("completion_tokens", sa.Integer(), nullable=False),
+        sa.Column("retries", sa.Integer(), nullable=False),
+        sa.Column("cost_usd", sa.Float(), nullable=True),
+        sa.Column("error", sa.String(length=255), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "idx_llm_calls_crew_created", "llm_calls", ["crew_type", "created_at"]
+    )
+    op.create_index("idx_llm_calls_model", "llm_calls", ["model"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_llm_calls_model", table_name="llm_calls")
+    op.drop_index("idx_llm_calls_crew_created", table_name="llm_calls")
+    op.drop_table("llm_calls")
@@ -0,0 +1,25 @@
+"""Add assembly_manifest to projects for incremental assembly
+
+Revision ID: c41e7a9d2f63
+Revises: 'b7d2e91c4a10'
+Create Date: 2026-10-19 10:02:47.551903
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "c41e7a9d2f63"
+down_revision = "b7d2e91c4a10"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Empreintes et positions des sections de final_content
+    op.add_column("projects", sa.Column("assembly_manifest", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("projects", "assembly_manifest")
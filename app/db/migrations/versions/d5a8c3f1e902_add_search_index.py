@@ -0,0 +1,194 @@
+"""Add full-text search index (SQLite FTS5 / PostgreSQL tsvector)
+
+Revision ID: d5a8c3f1e902
+Revises: 'c41e7a9d2f63'
+Create Date: 2026-10-19 11:20:14.907312
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "d5a8c3f1e902"
+down_revision = "c41e7a9d2f63"
+branch_labels = None
+depends_on = None
+
+
+# DDL figé à cette révision (app/db/search_index.py peut évoluer ensuite).
+# Rowid FTS5 = clé source * 4 + code entité (projet 1, tâche 2, output 3).
+SQLITE_UPGRADE = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(
+        entity_type UNINDEXED,
+        entity_id UNINDEXED,
+        project_id UNINDEXED,
+        task_id UNINDEXED,
+        title,
+        body,
+        tokenize = 'unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_projects_ai AFTER INSERT ON projects BEGIN
+        INSERT INTO search_index(rowid, entity_type, entity_id, project_id, task_id, title, body)
+        VALUES (new.id * 4 + 1, 'project', new.id, new.id, NULL, new.name, coalesce(new.description, ''));
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_projects_au AFTER UPDATE OF name, description ON projects BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 1;
+        INSERT INTO search_index(rowid, entity_type, entity_id, project_id, task_id, title, body)
+        VALUES (new.id * 4 + 1, 'project', new.id, new.id, NULL, new.name, coalesce(new.description, ''));
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_projects_ad AFTER DELETE ON projects BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_tasks_ai AFTER INSERT ON tasks BEGIN
+        INSERT INTO search_index(rowid, entity_type, entity_id, project_id, task_id, title, body)
+        VALUES (new.id * 4 + 2, 'task', new.id, new.project_id, new.id, new.title, coalesce(new.description, ''));
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_tasks_au AFTER UPDATE OF title, description, project_id ON tasks BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 2;
+        INSERT INTO search_index(rowid, entity_type, entity_id, project_id, task_id, title, body)
+        VALUES (new.id * 4 + 2, 'task', new.id, new.project_id, new.id, new.title, coalesce(new.description, ''));
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_tasks_ad AFTER DELETE ON tasks BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 2;
+    END
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS search_output_keys (
+        key INTEGER PRIMARY KEY,
+        output_id VARCHAR NOT NULL UNIQUE
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_outputs_ai AFTER INSERT ON task_outputs BEGIN
+        INSERT INTO search_output_keys(output_id) VALUES (new.id);
+        INSERT INTO search_index(rowid, entity_type, entity_id, project_id, task_id, title, body)
+        VALUES (
+            (SELECT key FROM search_output_keys WHERE output_id = new.id) * 4 + 3,
+            'output', new.id,
+            (SELECT project_id FROM tasks WHERE id = new.task_id), new.task_id, '', new.content
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_outputs_au AFTER UPDATE OF content, task_id ON task_outputs BEGIN
+        DELETE FROM search_index
+        WHERE rowid = (SELECT key FROM search_output_keys WHERE output_id = old.id) * 4 + 3;
+        INSERT INTO search_index(rowid, entity_type, entity_id, project_id, task_id, title, body)
+        VALUES (
+            (SELECT key FROM search_output_keys WHERE output_id = new.id) * 4 + 3,
+            'output', new.id,
+            (SELECT project_id FROM tasks WHERE id = new.task_id), new.task_id, '', new.content
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_outputs_ad AFTER DELETE ON task_outputs BEGIN
+        DELETE FROM search_index
+        WHERE rowid = (SELECT key FROM search_output_keys WHERE output_id = old.id) * 4 + 3;
+        DELETE FROM search_output_keys WHERE output_id = old.id;
+    END
+    """,
+]
+
+# Index rempli avec les données existantes (seulement s'il vient d'être créé)
+SQLITE_BACKFILL = [
+    """
+    INSERT INTO search_index(rowid, entity_type, entity_id, project_id, task_id, title, body)
+    SELECT id * 4 + 1, 'project', id, id, NULL, name, coalesce(description, '') FROM projects
+    """,
+    """
+    INSERT INTO search_index(rowid, entity_type, entity_id, project_id, task_id, title, body)
+    SELECT id * 4 + 2, 'task', id, project_id, id, title, coalesce(description, '') FROM tasks
+    """,
+    "INSERT OR IGNORE INTO search_output_keys(output_id) SELECT id FROM task_outputs",
+    """
+    INSERT INTO search_index(rowid, entity_type, entity_id, project_id, task_id, title, body)
+    SELECT k.key * 4 + 3, 'output', o.id, t.project_id, o.task_id, '', o.content
+    FROM task_outputs o
+    JOIN search_output_keys k ON k.output_id = o.id
+    JOIN tasks t ON t.id = o.task_id
+    """,
+]
+
+SQLITE_DOWNGRADE = [
+    f"DROP TRIGGER IF EXISTS search_{table}_{suffix}"
+    for table in ("projects", "tasks", "outputs")
+    for suffix in ("ai", "au", "ad")
+] + ["DROP TABLE IF EXISTS search_index", "DROP TABLE IF EXISTS search_output_keys"]
+
+# Titres (poids A) devant descriptions et contenus (poids B)
+POSTGRES_UPGRADE = [
+    """
+    ALTER TABLE projects ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('french', coalesce(name, '')), 'A')
+        || setweight(to_tsvector('french', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_projects_search_vector ON projects USING GIN (search_vector)",
+    """
+    ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('french', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('french', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_tasks_search_vector ON tasks USING GIN (search_vector)",
+    """
+    ALTER TABLE task_outputs ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (setweight(to_tsvector('french', coalesce(content, '')), 'B')) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_task_outputs_search_vector ON task_outputs USING GIN (search_vector)",
+]
+
+POSTGRES_DOWNGRADE = [
+    f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector"
+    for table in ("projects", "tasks", "task_outputs")
+]
+
+
+def _statements(sqlite, postgresql):
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        return sqlite
+    if dialect == "postgresql":
+        return postgresql
+    return []
+
+
+def _sqlite_index_exists() -> bool:
+    bind = op.get_bind()
+    return bind.dialect.name == "sqlite" and (
+        bind.execute(
+            sa.text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'search_index'")
+        ).first()
+        is not None
+    )
+
+
+def upgrade() -> None:
+    backfill = not _sqlite_index_exists()
+    for statement in _statements(SQLITE_UPGRADE, POSTGRES_UPGRADE):
+        op.execute(statement)
+    if backfill:
+        for statement in _statements(SQLITE_BACKFILL, []):
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    for statement in _statements(SQLITE_DOWNGRADE, POSTGRES_DOWNGRADE):
+        op.execute(statement)
@@ -0,0 +1,25 @@
+"""Add content_minhash to task_outputs for near-duplicate detection
+
+Revision ID: e8b1f4c7a093
+Revises: 'd5a8c3f1e902'
+Create Date: 2026-10-19 12:05:38.214470
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "e8b1f4c7a093"
+down_revision = "d5a8c3f1e902"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Signature MinHash (64 x uint32) calculée à la sauvegarde; NULL pour l'historique
+    op.add_column("task_outputs", sa.Column("content_minhash", sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("task_outputs", "content_minhash")
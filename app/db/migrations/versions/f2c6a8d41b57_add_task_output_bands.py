@@ -0,0 +1,58 @@
+"""Add task_output_bands: indexed LSH band keys for near-duplicate lookup
+
+Revision ID: f2c6a8d41b57
+Revises: 'e8b1f4c7a093'
+Create Date: 2026-10-19 16:42:09.318564
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "f2c6a8d41b57"
+down_revision = "e8b1f4c7a093"
+branch_labels = None
+depends_on = None
+
+
+# Découpage figé à cette révision: 16 bandes de 4 valeurs uint32 (16 octets),
+# clé = numéro de bande (1 octet) + octets de la bande
+LSH_BANDS = 16
+BAND_BYTES = 16
+
+
+def _band_keys(signature: bytes):
+    return [
+        bytes([band]) + signature[band * BAND_BYTES : (band + 1) * BAND_BYTES]
+        for band in range(LSH_BANDS)
+    ]
+
+
+def upgrade() -> None:
+    bands = op.create_table(
+        "task_output_bands",
+        sa.Column("output_id", sa.String(), nullable=False),
+        sa.Column("band_key", sa.LargeBinary(), nullable=False),
+        sa.ForeignKeyConstraint(["output_id"], ["task_outputs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("output_id", "band_key"),
+    )
+    op.create_index("idx_output_band_key", "task_output_bands", ["band_key"])
+
+    # Clés des signatures déjà calculées
+    rows = op.get_bind().execute(
+        sa.text("SELECT id, content_minhash FROM task_outputs WHERE content_minhash IS NOT NULL")
+    )
+    keys = [
+        {"output_id": output_id, "band_key": key}
+        for output_id, signature in rows
+        if signature and len(signature) == LSH_BANDS * BAND_BYTES
+        for key in _band_keys(bytes(signature))
+    ]
+    if keys:
+        op.bulk_insert(bands, keys)
+
+
+def downgrade() -> None:
+    op.drop_index("idx_output_band_key", table_name="task_output_bands")
+    op.drop_table("task_output_bands")
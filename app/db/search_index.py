@@ -0,0 +1,203 @@
+"""
+Index de recherche plein texte (projets, tâches, outputs)
+SQLite: table virtuelle FTS5 maintenue par triggers
+PostgreSQL: colonnes tsvector générées + index GIN
+"""
+
+from sqlalchemy import text
+
+SEARCH_TABLE = "search_index"
+
+# Le rowid FTS5 encode l'entité (clé source * 4 + code: projet 1, tâche 2, output 3):
+# les triggers mettent à jour une ligne par clé, sans parcours de l'index
+
+SQLITE_SEARCH_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(
+        entity_type UNINDEXED,
+        entity_id UNINDEXED,
+        project_id UNINDEXED,
+        task_id UNINDEXED,
+        title,
+        body,
+        tokenize = 'unicode61 remove_diacritics 2'
+    )
+    """,
+    # Projets
+    f"""
+    CREATE TRIGGER IF NOT EXISTS search_projects_ai AFTER INSERT ON projects BEGIN
+        INSERT INTO {SEARCH_TABLE}(rowid, entity_type, entity_id, project_id, task_id, title, body)
+        VALUES (new.id * 4 + 1, 'project', new.id, new.id, NULL, new.name, coalesce(new.description, ''));
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS search_projects_au AFTER UPDATE OF name, description ON projects BEGIN
+        DELETE FROM {SEARCH_TABLE} WHERE rowid = old.id * 4 + 1;
+        INSERT INTO {SEARCH_TABLE}(rowid, entity_type, entity_id, project_id, task_id, title, body)
+        VALUES (new.id * 4 + 1, 'project', new.id, new.id, NULL, new.name, coalesce(new.description, ''));
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS search_projects_ad AFTER DELETE ON projects BEGIN
+        DELETE FROM {SEARCH_TABLE} WHERE rowid = old.id * 4 + 1;
+    END
+    """,
+    # Tâches
+    f"""
+    CREATE TRIGGER IF NOT EXISTS search_tasks_ai AFTER INSERT ON tasks BEGIN
+        INSERT INTO {SEARCH_TABLE}(rowid, entity_type, entity_id, project_id, task_id, title, body)
+        VALUES (new.id * 4 + 2, 'task', new.id, new.project_id, new.id, new.title, coalesce(new.description, ''));
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS search_tasks_au AFTER UPDATE OF title, description, project_id ON tasks BEGIN
+        DELETE FROM {SEARCH_TABLE} WHERE rowid = old.id * 4 + 2;
+        INSERT INTO {SEARCH_TABLE}(rowid, entity_type, entity_id, project_id, task_id, title, body)
+        VALUES (new.id * 4 + 2, 'task', new.id, new.project_id, new.id, new.title, coalesce(new.description, ''));
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS search_tasks_ad AFTER DELETE ON tasks BEGIN
+        DELETE FROM {SEARCH_TABLE} WHERE rowid = old.id * 4 + 2;
+    END
+    """,
+    # Outputs: id texte, clé entière stable via une table de correspondance
+    # (le rowid implicite de task_outputs peut changer après un VACUUM)
+    """
+    CREATE TABLE IF NOT EXISTS search_output_keys (
+        key INTEGER PRIMARY KEY,
+        output_id VARCHAR NOT NULL UNIQUE
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS search_outputs_ai AFTER INSERT ON task_outputs BEGIN
+        INSERT INTO search_output_keys(output_id) VALUES (new.id);
+        INSERT INTO {SEARCH_TABLE}(rowid, entity_type, entity_id, project_id, task_id, title, body)
+        VALUES (
+            (SELECT key FROM search_output_keys WHERE output_id = new.id) * 4 + 3,
+            'output', new.id,
+            (SELECT project_id FROM tasks WHERE id = new.task_id), new.task_id, '', new.content
+        );
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS search_outputs_au AFTER UPDATE OF content, task_id ON task_outputs BEGIN
+        DELETE FROM {SEARCH_TABLE}
+        WHERE rowid = (SELECT key FROM search_output_keys WHERE output_id = old.id) * 4 + 3;
+        INSERT INTO {SEARCH_TABLE}(rowid, entity_type, entity_id, project_id, task_id, title, body)
+        VALUES (
+            (SELECT key FROM search_output_keys WHERE output_id = new.id) * 4 + 3,
+            'output', new.id,
+            (SELECT project_id FROM tasks WHERE id = new.task_id), new.task_id, '', new.content
+        );
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS search_outputs_ad AFTER DELETE ON task_outputs BEGIN
+        DELETE FROM {SEARCH_TABLE}
+        WHERE rowid = (SELECT key FROM search_output_keys WHERE output_id = old.id) * 4 + 3;
+        DELETE FROM search_output_keys WHERE output_id = old.id;
+    END
+    """,
+]
+
+SQLITE_BACKFILL = [
+    f"""
+    INSERT INTO {SEARCH_TABLE}(rowid, entity_type, entity_id, project_id, task_id, title, body)
+    SELECT id * 4 + 1, 'project', id, id, NULL, name, coalesce(description, '') FROM projects
+    """,
+    f"""
+    INSERT INTO {SEARCH_TABLE}(rowid, entity_type, entity_id, project_id, task_id, title, body)
+    SELECT id * 4 + 2, 'task', id, project_id, id, title, coalesce(description, '') FROM tasks
+    """,
+    "INSERT OR IGNORE INTO search_output_keys(output_id) SELECT id FROM task_outputs",
+    f"""
+    INSERT INTO {SEARCH_TABLE}(rowid, entity_type, entity_id, project_id, task_id, title, body)
+    SELECT k.key * 4 + 3, 'output', o.id, t.project_id, o.task_id, '', o.content
+    FROM task_outputs o
+    JOIN search_output_keys k ON k.output_id = o.id
+    JOIN tasks t ON t.id = o.task_id
+    """,
+]
+
+SQLITE_DROP = [
+    f"DROP TRIGGER IF EXISTS search_{table}_{suffix}"
+    for table in ("projects", "tasks", "outputs")
+    for suffix in ("ai", "au", "ad")
+] + [f"DROP TABLE IF EXISTS {SEARCH_TABLE}", "DROP TABLE IF EXISTS search_output_keys"]
+
+# Les titres pèsent plus que les descriptions et contenus (poids A / B)
+POSTGRES_SEARCH_DDL = [
+    """
+    ALTER TABLE projects ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('french', coalesce(name, '')), 'A')
+        || setweight(to_tsvector('french', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_projects_search_vector ON projects USING GIN (search_vector)",
+    """
+    ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('french', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('french', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_tasks_search_vector ON tasks USING GIN (search_vector)",
+    """
+    ALTER TABLE task_outputs ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (setweight(to_tsvector('french', coalesce(content, '')), 'B')) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_task_outputs_search_vector ON task_outputs USING GIN (search_vector)",
+]
+
+POSTGRES_DROP = [
+    f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector"
+    for table in ("projects", "tasks", "task_outputs")
+]
+
+
+def _sqlite_index_exists(connection) -> bool:
+    return (
+        connection.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": SEARCH_TABLE},
+        ).first()
+        is not None
+    )
+
+
+def install_search_index(connection) -> bool:
+    """
+    Crée l'index de recherche s'il n'existe pas (idempotent).
+
+    Sur SQLite, un index nouvellement créé est rempli à partir des données
+    existantes; ensuite les triggers le maintiennent à chaque écriture.
+
+    Args:
+        connection: Connexion SQLAlchemy (ou op.get_bind() dans une migration)
+
+    Returns:
+        True si le dialecte est supporté et l'index installé
+    """
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        created = not _sqlite_index_exists(connection)
+        for statement in SQLITE_SEARCH_DDL:
+            connection.execute(text(statement))
+        if created:
+            for statement in SQLITE_BACKFILL:
+                connection.execute(text(statement))
+        return True
+    if dialect == "postgresql":
+        for statement in POSTGRES_SEARCH_DDL:
+            connection.execute(text(statement))
+        return True
+    return False
+
+
+def drop_search_index(connection) -> None:
+    """Supprime l'index de recherche et ses triggers / colonnes générées."""
+    statements = SQLITE_DROP if connection.dialect.name == "sqlite" else POSTGRES_DROP
+    for statement in statements:
+        connection.execute(text(statement))
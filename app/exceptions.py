@@ -50,6 +50,17 @@ class CannotDeleteArchivedProject(ProjectServiceError):
         )
 
 
+class FinalContentModified(ProjectServiceError):
+    """Raised when an incremental assembly would overwrite a final article it did not produce."""
+
+    def __init__(self, project_id: int):
+        self.project_id = project_id
+        super().__init__(
+            f"Final content of project {project_id} was not produced by the incremental "
+            "assembly (missing or outdated manifest). Use force=true to rebuild it."
+        )
+
+
 class TemplateServiceError(GeekBlogError):
     """Base exception for template service operations."""
 
@@ -69,3 +80,28 @@ class InvalidTemplateCustomization(TemplateServiceError):
 
     def __init__(self, message: str):
         super().__init__(f"Invalid template customization: {message}")
+
+
+class WorkflowServiceError(GeekBlogError):
+    """Base exception for workflow service operations."""
+
+    pass
+
+
+class WorkflowNotFound(WorkflowServiceError):
+    """Raised when a workflow execution cannot be found by ID."""
+
+    def __init__(self, workflow_id: str):
+        self.workflow_id = workflow_id
+        super().__init__(f"Workflow '{workflow_id}' not found")
+
+
+class WorkflowNotResumable(WorkflowServiceError):
+    """Raised when attempting to resume a workflow that is still running or completed."""
+
+    def __init__(self, workflow_id: str, status: str):
+        self.workflow_id = workflow_id
+        self.status = status
+        super().__init__(
+            f"Workflow '{workflow_id}' cannot be resumed from status '{status}'"
+        )
@@ -1,9 +1,38 @@
 import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from app.api.api import api_router
+from app.api.responses import FastJSONRoute
 from fastapi.middleware.cors import CORSMiddleware
+from app.core.executors import run_in_db_executor, run_in_llm_executor, shutdown_executors
+from app.core.health_monitor import start_health_sampler, stop_health_sampler
+from app.services import ai_service
+from app.services.template_service import warm_template_cache
 
-app = FastAPI(title="GeekBlog API", version="0.1.0", openapi_url="/api/v1/openapi.json")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Charger et compiler les templates actifs avant les premières requêtes
+    await run_in_db_executor(warm_template_cache)
+    # CrewAI/Groq sont chargés au premier crew; AI_WARMUP=true paie ce coût au démarrage
+    if os.getenv("AI_WARMUP", "false").lower() == "true":
+        await run_in_llm_executor(ai_service.warm_ai_stack)
+    # Les sondes de santé lisent un instantané rafraîchi en arrière-plan
+    start_health_sampler()
+    yield
+    stop_health_sampler()
+    # Libérer les pools de threads nommés (LLM, DB) à l'arrêt
+    shutdown_executors()
+
+
+app = FastAPI(
+    title="GeekBlog API",
+    version="0.1.0",
+    openapi_url="/api/v1/openapi.json",
+    lifespan=lifespan,
+)
+# Routes déclarées sur l'application (les routeurs inclus ont leur propre route_class)
+app.router.route_class = FastJSONRoute
 
 # CORS (Cross-Origin Resource Sharing) - Configuration via variables d'environnement
 allowed_origins_str = os.getenv(
@@ -15,8 +44,9 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
     allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE"],
-    allow_headers=["Content-Type", "Authorization", "Accept"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
+    allow_headers=["Content-Type", "Authorization", "Accept", "If-None-Match"],
+    expose_headers=["ETag"],
 )
 
 
@@ -0,0 +1,35 @@
+"""
+Modèle pour le suivi des appels LLM (latence, tokens, coût)
+"""
+
+from sqlalchemy import Column, Integer, String, Float, Boolean, Index
+from app.db.config import Base
+from app.db.compat import DateTimeFunc, DateTimeType
+
+
+class LLMCall(Base):
+    """
+    Une ligne par kickoff de crew (tentative réussie ou échouée)
+    Table volontairement compacte: pas de contenu, seulement les mesures
+    """
+
+    __tablename__ = "llm_calls"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    crew_type = Column(String(32), nullable=False)  # planner, researcher, writer, finisher
+    model = Column(String(64), nullable=False)
+    success = Column(Boolean, nullable=False, default=True)
+
+    wall_time = Column(Float, nullable=False)  # Secondes, retries et attentes inclus
+    prompt_tokens = Column(Integer, nullable=False, default=0)
+    completion_tokens = Column(Integer, nullable=False, default=0)
+    retries = Column(Integer, nullable=False, default=0)
+    cost_usd = Column(Float, nullable=True)  # None si le modèle n'a pas de tarif connu
+    error = Column(String(255), nullable=True)
+
+    created_at = Column(DateTimeType, server_default=DateTimeFunc)
+
+    __table_args__ = (
+        Index("idx_llm_calls_crew_created", "crew_type", "created_at"),
+        Index("idx_llm_calls_model", "model"),
+    )
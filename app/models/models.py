@@ -24,6 +24,8 @@ class Project(Base):
     # Contenu final assemblé
     final_content = Column(Text, nullable=True)
     final_content_updated_at = Column(DateTimeType, nullable=True)
+    # Empreintes et positions des sections pour l'assemblage incrémental
+    assembly_manifest = Column(JSON, nullable=True)
 
     # Extensions pour gestion avancée des projets
     archived = Column(Boolean, default=False, nullable=False)
@@ -5,6 +5,7 @@ Modèles pour la gestion des workflows orchestrés
 from sqlalchemy import (
     Column,
     Integer,
+    LargeBinary,
     String,
     Text,
     ForeignKey,
@@ -113,6 +114,7 @@ class TaskOutput(Base):
     output_type = Column(get_enum_type(TaskOutputType), nullable=False)
     content = Column(Text, nullable=False)
     content_hash = Column(String(64), nullable=True)  # SHA-256 pour déduplication
+    content_minhash = Column(LargeBinary, nullable=True)  # Signature MinHash (quasi-doublons)
 
     # Métadonnées enrichies
     output_metadata = Column(JSON, nullable=True)
@@ -139,3 +141,21 @@ class TaskOutput(Base):
         # Contraintes CHECK pour SQLite (ignorées par PostgreSQL)
         get_enum_check_constraint("output_type", TaskOutputType),
     ]))
+
+
+class TaskOutputBand(Base):
+    """
+    Clés de bandes LSH des signatures MinHash des outputs
+
+    Une ligne par bande (numéro de bande + valeurs de la bande): la recherche
+    de quasi-doublons ne charge que les outputs partageant une bande.
+    """
+
+    __tablename__ = "task_output_bands"
+
+    output_id = Column(
+        String, ForeignKey("task_outputs.id", ondelete="CASCADE"), primary_key=True
+    )
+    band_key = Column(LargeBinary, primary_key=True)
+
+    __table_args__ = (Index("idx_output_band_key", "band_key"),)
@@ -13,6 +13,8 @@ class TaskBase(BaseModel):
 
 class TaskCreate(TaskBase):
     project_id: int
+    # Sans ordre, la tâche est ajoutée en fin de projet (ordres espacés de ORDER_GAP)
+    order: Optional[int] = None
 
 
 class TaskUpdate(TaskBase):
@@ -40,6 +42,33 @@ class Task(TaskBase):
         from_attributes = True
 
 
+class TaskBulkItem(BaseModel):
+    """Modification d'une tâche dans une opération en lot"""
+
+    id: int
+    status: Optional[str] = None
+    order: Optional[int] = None
+    # Déplacement relatif (glisser-déposer): placer après / avant ces tâches
+    after_id: Optional[int] = None
+    before_id: Optional[int] = None
+
+
+class TaskBulkUpdate(BaseModel):
+    """Modifications et suppressions de tâches appliquées en une transaction"""
+
+    updates: List[TaskBulkItem] = []
+    delete_ids: List[int] = []
+
+
+class TaskBulkResult(BaseModel):
+    updated: int
+    deleted: int
+    rebalanced: bool = False
+    # Tâches réécrites seulement par le rééquilibrage (incluses dans tasks)
+    reordered: int = 0
+    tasks: List[Task] = []
+
+
 # Project Schemas
 class ProjectBase(BaseModel):
     name: str
@@ -188,3 +217,23 @@ class ProjectFromTemplate(BaseModel):
 
     template_id: int
     customization: TemplateCustomization
+
+
+# Search Schemas
+class SearchResult(BaseModel):
+    type: Literal["project", "task", "output"]
+    id: str
+    project_id: Optional[int] = None
+    task_id: Optional[int] = None
+    title: str
+    snippet: str
+    score: float
+
+
+class SearchResponse(BaseModel):
+    query: str
+    total: int
+    limit: int
+    offset: int
+    took_ms: float
+    results: List[SearchResult]
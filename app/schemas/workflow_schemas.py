@@ -38,6 +38,7 @@ class WorkflowStep(BaseModel):
     progress: float = Field(ge=0, le=100)
     timestamp: Optional[datetime] = None
     metadata: Optional[Dict[str, Any]] = None
+    checkpoints: Optional[Dict[str, Dict[str, Any]]] = None
 
 
 class WorkflowExecutionCreate(BaseModel):
@@ -157,6 +158,14 @@ class WorkflowLaunchResponse(BaseModel):
     message: str = "Workflow lancé avec succès"
 
 
+class WorkflowResumeResponse(WorkflowLaunchResponse):
+    """Réponse à la reprise d'un workflow depuis ses checkpoints"""
+
+    resumed_from_step: Optional[str] = None
+    skipped_steps: List[str] = []
+    message: str = "Workflow repris avec succès"
+
+
 class WorkflowOutputsResponse(BaseModel):
     """Réponse contenant les outputs d'un workflow"""
 
@@ -167,6 +176,19 @@ class WorkflowOutputsResponse(BaseModel):
     outputs_by_type: Dict[str, int]
 
 
+class IncrementalAssemblyResponse(BaseModel):
+    """Résultat d'un assemblage incrémental de l'article final"""
+
+    project_id: int
+    updated: bool
+    full_rebuild: bool
+    changed_sections: List[int] = []
+    reused_sections: int = 0
+    removed_sections: List[int] = []
+    near_duplicate_sections: List[int] = []
+    content_length: int = 0
+
+
 class BatchJobStatus(BaseModel):
     """Statut d'un groupe de jobs (pour les recherches parallèles)"""
 
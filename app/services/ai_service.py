@@ -1,12 +1,35 @@
+from __future__ import annotations
+
 import os
+import re
+import time
 import asyncio
-from typing import Optional  # Ajout de l'import Optional
+import functools
+import threading
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional  # Ajout de l'import Optional
 from dotenv import load_dotenv
-from crewai import Agent, Task, Crew, Process
+
+from app.core.executors import run_in_llm_executor
+from app.db.config import SessionLocal
+from app.services import llm_stats_service
+from app.services.assembly_service import SECTION_SEPARATOR
+from app.services.llm_gateway import LLMGateway, estimate_tokens
+from app.services.model_router import (
+    FINISHER,
+    PLANNER,
+    RESEARCHER,
+    WRITER,
+    ModelRouter,
+    estimate_cost,
+    main_model,
+)
+
+if TYPE_CHECKING:
+    from crewai import Agent, Crew, Process, Task
+    from langchain_groq import ChatGroq
 
 # Charger les variables d'environnement
 load_dotenv()
-from langchain_groq import ChatGroq
 
 # Désactiver temporairement les outils de recherche pour éviter les erreurs de validation
 # TODO: Implémenter les outils de recherche compatibles avec CrewAI 0.140.0
@@ -15,35 +38,285 @@ print("Search tools disabled temporarily. AI features will work without web sear
 
 # Configuration du LLM (Groq dans cet exemple)
 # Assurez-vous que GROQ_API_KEY est défini dans vos variables d'environnement
-try:
-    llm = ChatGroq(
-        api_key=os.getenv("GROQ_API_KEY"),
-        model="llama3-8b-8192",  # ou llama3-70b-8192 pour plus de puissance
-        temperature=0.7,
+LLM_MODEL = main_model()  # GROQ_MODEL, ou llama3-8b-8192 par défaut
+
+# Passerelle partagée: tous les kickoff passent par elle (débit, concurrence, retry)
+llm_gateway = LLMGateway(max_retries=int(os.getenv("LLM_MAX_RETRIES", "3")))
+
+# Routeur de modèles: un modèle principal et des replis par type de crew
+model_router = ModelRouter()
+_llm_cache: dict = {}
+
+# --- Chargement paresseux de la pile IA ---
+# CrewAI et langchain_groq représentent l'essentiel du temps d'import de
+# l'application (plusieurs secondes). Ils ne sont importés, et le LLM et les
+# agents créés, qu'au premier usage: premier appel d'un crew, premier accès à
+# une classe CrewAI du module (ai_service.Crew...) ou is_llm_available().
+# warm_ai_stack() permet de payer ce coût au démarrage (AI_WARMUP=true).
+_AI_STACK_CLASSES = frozenset(("Agent", "Task", "Crew", "Process", "ChatGroq"))
+
+# LLM par défaut et agents, créés par _load_ai_stack()
+llm = None
+planner_agent = None
+researcher_agent = None
+writer_agent = None
+critic_agent = None
+style_agent = None
+fact_checker_agent = None
+proofreader_agent = None
+
+_ai_stack_lock = threading.Lock()
+_ai_stack_loaded = False
+
+
+def _build_llm(model: str):
+    """Crée le client ChatGroq d'un modèle (None si la configuration est invalide)"""
+    try:
+        return ChatGroq(
+            api_key=os.getenv("GROQ_API_KEY"),
+            model=model,
+            temperature=0.7,
+        )
+    except Exception as e:
+        print(f"Erreur lors de l'initialisation du LLM Groq ({model}): {e}")
+        print("Veuillez vérifier que GROQ_API_KEY est bien configuré.")
+        return None
+
+
+def _load_ai_stack() -> None:
+    """Importe CrewAI et langchain_groq, puis crée le LLM par défaut et les agents (une seule fois)"""
+    global _ai_stack_loaded, llm
+    if _ai_stack_loaded:
+        return
+    with _ai_stack_lock:
+        if _ai_stack_loaded:
+            return
+        from crewai import Agent, Crew, Process, Task
+        from langchain_groq import ChatGroq
+
+        # Classes publiées dans le module (fonctions ci-dessous et ai_service.Crew...)
+        globals().update(Agent=Agent, Task=Task, Crew=Crew, Process=Process, ChatGroq=ChatGroq)
+        llm = _build_llm(LLM_MODEL)
+        _create_agents()
+        _ai_stack_loaded = True
+
+
+def _create_agents() -> None:
+    """Crée les agents avec les classes CrewAI et le LLM par défaut chargés"""
+    global planner_agent, researcher_agent, writer_agent
+    global critic_agent, style_agent, fact_checker_agent, proofreader_agent
+    planner_agent = _create_planner_agent()
+    researcher_agent = _create_researcher_agent()
+    writer_agent = _create_writer_agent()
+    critic_agent = _create_critic_agent()
+    style_agent = _create_style_agent()
+    fact_checker_agent = _create_fact_checker_agent()
+    proofreader_agent = _create_proofreader_agent()
+
+
+def __getattr__(name: str):
+    # PEP 562: les classes CrewAI/Groq déclenchent le chargement de la pile IA
+    if name in _AI_STACK_CLASSES:
+        _load_ai_stack()
+        if name in globals():
+            return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _with_ai_stack(func):
+    """Décorateur: charge la pile IA avant l'exécution de la fonction"""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        _load_ai_stack()
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def is_llm_available() -> bool:
+    """True si le LLM par défaut est configuré (charge la pile IA au besoin)"""
+    _load_ai_stack()
+    return llm is not None
+
+
+def warm_ai_stack() -> bool:
+    """
+    Précharge la pile IA (imports, LLM par défaut, agents)
+
+    Retourne True si le LLM par défaut est disponible.
+    """
+    return is_llm_available()
+
+
+@_with_ai_stack
+def get_llm(model: str):
+    """Retourne le client ChatGroq d'un modèle, créé à la première utilisation"""
+    if model == LLM_MODEL:
+        return llm
+    if model not in _llm_cache:
+        _llm_cache[model] = _build_llm(model)
+    return _llm_cache[model]
+
+
+@_with_ai_stack
+def _agent_for_llm(agent: Agent, model_llm) -> Agent:
+    """Copie d'un agent avec un autre LLM, sans modifier l'agent partagé"""
+    return Agent(
+        role=agent.role,
+        goal=agent.goal,
+        backstory=agent.backstory,
+        verbose=agent.verbose,
+        allow_delegation=agent.allow_delegation,
+        tools=agent.tools or [],
+        llm=model_llm,
     )
-except Exception as e:
-    print(f"Erreur lors de l'initialisation du LLM Groq: {e}")
-    print("Veuillez vérifier que GROQ_API_KEY est bien configuré.")
-    llm = None  # Mettre à None pour éviter les erreurs si la clé n'est pas là
+
+
+def _extract_token_usage(result, crew) -> tuple[Optional[int], Optional[int]]:
+    """Tokens (prompt, complétion) rapportés par CrewAI, si disponibles"""
+    usage = getattr(result, "token_usage", None) or getattr(crew, "usage_metrics", None)
+    if usage is None:
+        return None, None
+
+    def _read(key):
+        value = usage.get(key) if isinstance(usage, dict) else getattr(usage, key, None)
+        return value if isinstance(value, int) and value > 0 else None
+
+    return _read("prompt_tokens"), _read("completion_tokens")
+
+
+def _record_llm_call(**fields) -> None:
+    """Persiste une mesure d'appel LLM; l'instrumentation ne doit jamais faire échouer un crew"""
+    if os.getenv("LLM_CALL_LOGGING", "true").lower() != "true":
+        return
+    db = SessionLocal()
+    try:
+        llm_stats_service.record_llm_call(db, **fields)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"Impossible d'enregistrer l'appel LLM: {e}")
+    finally:
+        db.close()
+
+
+@_with_ai_stack
+def _run_crew(crew_type: str, tasks: list[Task], call_info: Optional[dict] = None):
+    """
+    Lance un crew sur le modèle routé, avec repli sur les modèles suivants en cas d'erreur
+
+    Chaque tentative est mesurée (durée, tokens, retries, coût) et enregistrée
+    dans la table llm_calls. Si call_info est fourni, il est complété avec les
+    mesures de la tentative réussie (destiné à TaskOutput.output_metadata).
+    """
+    base_agents = [task.agent for task in tasks]
+    prompt_estimate = sum(estimate_tokens(str(task.description)) for task in tasks)
+    failed_models = []
+    last_error = None
+
+    for model in model_router.candidates(crew_type):
+        model_llm = get_llm(model)
+        if not model_llm:
+            continue
+
+        # Les agents partagés utilisent LLM_MODEL; les autres modèles utilisent des copies
+        clones = {}
+        for task, agent in zip(tasks, base_agents):
+            if model != LLM_MODEL:
+                agent = clones.setdefault(id(agent), _agent_for_llm(agent, model_llm))
+            task.agent = agent
+        agents = list({id(task.agent): task.agent for task in tasks}.values())
+
+        crew = Crew(
+            agents=agents,
+            tasks=tasks,
+            process=Process.sequential,
+            verbose=2,
+        )
+
+        call_stats = {}
+        started = time.monotonic()
+        try:
+            result = llm_gateway.call(
+                model,
+                crew.kickoff,
+                estimated_tokens=prompt_estimate,
+                requests=len(tasks),
+                call_stats=call_stats,
+            )
+        except Exception as e:
+            print(f"Échec du crew {crew_type} avec {model}: {e}")
+            _record_llm_call(
+                crew_type=crew_type,
+                model=model,
+                wall_time=round(time.monotonic() - started, 3),
+                prompt_tokens=prompt_estimate,
+                retries=call_stats.get("retries", 0),
+                success=False,
+                error=str(e),
+            )
+            failed_models.append(model)
+            last_error = e
+            continue
+
+        wall_time = round(time.monotonic() - started, 3)
+        prompt_tokens, completion_tokens = _extract_token_usage(result, crew)
+        prompt_tokens = prompt_tokens or prompt_estimate
+        completion_tokens = completion_tokens or estimate_tokens(str(result))
+        measures = {
+            "crew_type": crew_type,
+            "model_used": model,
+            "processing_time": wall_time,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+            "retries": call_stats.get("retries", 0),
+            "cost_usd": estimate_cost(model, prompt_tokens, completion_tokens),
+        }
+        if failed_models:
+            measures["fallback_from"] = failed_models
+
+        _record_llm_call(
+            crew_type=crew_type,
+            model=model,
+            wall_time=wall_time,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            retries=measures["retries"],
+            cost_usd=measures["cost_usd"],
+        )
+        if call_info is not None:
+            call_info.update(measures)
+        return result
+
+    if last_error is not None:
+        raise last_error
+    raise EnvironmentError(
+        "LLM non initialisé. Vérifiez la configuration de GROQ_API_KEY."
+    )
+
 
 # L'outil search_tool est défini ci-dessus lors de l'import
 
 # --- Agent Planificateur (déjà défini) ---
-planner_agent = Agent(
-    role="Planificateur de Contenu Expert",
-    goal="Décomposer un objectif de contenu principal en une liste de tâches actionnables, claires et concises pour la création d'un article de blog.",
-    backstory=(
-        "Vous êtes un stratège de contenu chevronné avec une expertise dans la décomposition de sujets complexes "
-        "en plans structurés. Votre force réside dans l'identification des étapes logiques nécessaires "
-        "pour produire un contenu complet et engageant. Vous vous concentrez sur la création de titres de tâches "
-        "qui sont auto-explicatifs et mènent à des actions spécifiques."
-    ),
-    verbose=True,
-    allow_delegation=False,  # Ce planificateur ne délègue pas, il produit le plan.
-    llm=llm,  # Utiliser le LLM configuré
-)
+def _create_planner_agent() -> Agent:
+    return Agent(
+        role="Planificateur de Contenu Expert",
+        goal="Décomposer un objectif de contenu principal en une liste de tâches actionnables, claires et concises pour la création d'un article de blog.",
+        backstory=(
+            "Vous êtes un stratège de contenu chevronné avec une expertise dans la décomposition de sujets complexes "
+            "en plans structurés. Votre force réside dans l'identification des étapes logiques nécessaires "
+            "pour produire un contenu complet et engageant. Vous vous concentrez sur la création de titres de tâches "
+            "qui sont auto-explicatifs et mènent à des actions spécifiques."
+        ),
+        verbose=True,
+        allow_delegation=False,  # Ce planificateur ne délègue pas, il produit le plan.
+        llm=llm,  # Utiliser le LLM configuré
+    )
 
 
+@_with_ai_stack
 def create_planning_task(project_goal: str) -> Task:
     """Crée une tâche pour l'agent planificateur."""
     return Task(
@@ -73,7 +346,10 @@ def create_planning_task(project_goal: str) -> Task:
     )
 
 
-def run_planning_crew(project_goal: str) -> list[str]:
+@_with_ai_stack
+def run_planning_crew(
+    project_goal: str, call_info: Optional[dict] = None
+) -> list[str]:
     """Exécute le crew de planification et retourne une liste de titres de tâches."""
     if not llm:
         raise EnvironmentError(
@@ -82,14 +358,7 @@ def run_planning_crew(project_goal: str) -> list[str]:
 
     planning_task_instance = create_planning_task(project_goal)
 
-    planning_crew = Crew(
-        agents=[planner_agent],
-        tasks=[planning_task_instance],
-        process=Process.sequential,
-        verbose=2,  # Niveau de verbosité pour le logging du crew
-    )
-
-    result = planning_crew.kickoff()
+    result = _run_crew(PLANNER, [planning_task_instance], call_info)
 
     if isinstance(result, str):
         # Nettoyer le résultat: séparer par ligne et enlever les lignes vides
@@ -103,21 +372,23 @@ def run_planning_crew(project_goal: str) -> list[str]:
 
 
 # --- Agent Chercheur ---
-researcher_agent = Agent(
-    role="Chercheur Expert du Web",
-    goal="Trouver et synthétiser des informations pertinentes et à jour sur un sujet donné en utilisant des sources web fiables.",
-    backstory=(
-        "Vous êtes un spécialiste de la recherche d'informations, capable de naviguer sur le web pour extraire "
-        "des données clés, des statistiques, des arguments et des exemples concrets. Vous savez évaluer la fiabilité "
-        "des sources et fournir un résumé concis et exploitable des informations trouvées."
-    ),
-    verbose=True,
-    allow_delegation=False,
-    tools=[search_tool] if search_tool else [],  # Outil de recherche web si disponible
-    llm=llm,
-)
+def _create_researcher_agent() -> Agent:
+    return Agent(
+        role="Chercheur Expert du Web",
+        goal="Trouver et synthétiser des informations pertinentes et à jour sur un sujet donné en utilisant des sources web fiables.",
+        backstory=(
+            "Vous êtes un spécialiste de la recherche d'informations, capable de naviguer sur le web pour extraire "
+            "des données clés, des statistiques, des arguments et des exemples concrets. Vous savez évaluer la fiabilité "
+            "des sources et fournir un résumé concis et exploitable des informations trouvées."
+        ),
+        verbose=True,
+        allow_delegation=False,
+        tools=[search_tool] if search_tool else [],  # Outil de recherche web si disponible
+        llm=llm,
+    )
 
 
+@_with_ai_stack
 def create_research_task(
     task_title: str, research_context: Optional[str] = None
 ) -> Task:
@@ -142,7 +413,12 @@ def create_research_task(
     )
 
 
-def run_research_crew(task_title: str, research_context: Optional[str] = None) -> str:
+@_with_ai_stack
+def run_research_crew(
+    task_title: str,
+    research_context: Optional[str] = None,
+    call_info: Optional[dict] = None,
+) -> str:
     """Exécute le crew de recherche et retourne le résultat textuel."""
     if not llm:
         raise EnvironmentError(
@@ -151,32 +427,27 @@ def run_research_crew(task_title: str, research_context: Optional[str] = None) -
 
     research_task_instance = create_research_task(task_title, research_context)
 
-    research_crew = Crew(
-        agents=[researcher_agent],
-        tasks=[research_task_instance],
-        process=Process.sequential,
-        verbose=2,
-    )
-
-    result = research_crew.kickoff()
+    result = _run_crew(RESEARCHER, [research_task_instance], call_info)
     return result if isinstance(result, str) else str(result)
 
 
 # --- Agent Rédacteur ---
-writer_agent = Agent(
-    role="Rédacteur de Contenu Polyvalent",
-    goal="Rédiger un texte clair, engageant et bien structuré sur un sujet donné, en se basant sur des informations fournies ou un contexte spécifique.",
-    backstory=(
-        "Vous êtes un rédacteur talentueux capable d'adapter votre style à différents besoins. Vous pouvez rédiger des introductions, "
-        "des sections de développement, des conclusions, ou même des articles complets. Vous portez une attention particulière "
-        "à la clarté, à la fluidité du texte et à l'engagement du lecteur."
-    ),
-    verbose=True,
-    allow_delegation=False,  # Pourrait déléguer à un chercheur si besoin, mais on le gère séparément pour l'instant
-    llm=llm,
-)
+def _create_writer_agent() -> Agent:
+    return Agent(
+        role="Rédacteur de Contenu Polyvalent",
+        goal="Rédiger un texte clair, engageant et bien structuré sur un sujet donné, en se basant sur des informations fournies ou un contexte spécifique.",
+        backstory=(
+            "Vous êtes un rédacteur talentueux capable d'adapter votre style à différents besoins. Vous pouvez rédiger des introductions, "
+            "des sections de développement, des conclusions, ou même des articles complets. Vous portez une attention particulière "
+            "à la clarté, à la fluidité du texte et à l'engagement du lecteur."
+        ),
+        verbose=True,
+        allow_delegation=False,  # Pourrait déléguer à un chercheur si besoin, mais on le gère séparément pour l'instant
+        llm=llm,
+    )
 
 
+@_with_ai_stack
 def create_writing_task(task_title: str, writing_context: Optional[str] = None) -> Task:
     """Crée une tâche pour l'agent rédacteur."""
     description = f"Sujet de rédaction: '{task_title}'.\n"
@@ -199,7 +470,12 @@ def create_writing_task(task_title: str, writing_context: Optional[str] = None)
     )
 
 
-def run_writing_crew(task_title: str, writing_context: Optional[str] = None) -> str:
+@_with_ai_stack
+def run_writing_crew(
+    task_title: str,
+    writing_context: Optional[str] = None,
+    call_info: Optional[dict] = None,
+) -> str:
     """Exécute le crew de rédaction et retourne le texte produit."""
     if not llm:
         raise EnvironmentError(
@@ -208,89 +484,90 @@ def run_writing_crew(task_title: str, writing_context: Optional[str] = None) ->
 
     writing_task_instance = create_writing_task(task_title, writing_context)
 
-    writing_crew = Crew(
-        agents=[writer_agent],
-        tasks=[writing_task_instance],
-        process=Process.sequential,
-        verbose=2,
-    )
-
-    result = writing_crew.kickoff()
+    result = _run_crew(WRITER, [writing_task_instance], call_info)
     return result if isinstance(result, str) else str(result)
 
 
 # --- Crew de Finition ---
 
 # Agent Critique
-critic_agent = Agent(
-    role="Critique de Contenu Constructif",
-    goal=(
-        "Analyser un article de blog assemblé pour identifier les faiblesses structurelles, les incohérences logiques, "
-        "les manques d'informations clés, et les opportunités d'amélioration du flux et de l'engagement."
-    ),
-    backstory=(
-        "Vous êtes un éditeur expérimenté avec un œil aiguisé pour les détails et la vue d'ensemble. "
-        "Votre objectif n'est pas de réécrire, mais de fournir des critiques actionnables et spécifiques "
-        "qui aideront à élever la qualité du texte. Vous êtes direct mais toujours constructif."
-    ),
-    verbose=True,
-    allow_delegation=False,
-    llm=llm,
-)
+def _create_critic_agent() -> Agent:
+    return Agent(
+        role="Critique de Contenu Constructif",
+        goal=(
+            "Analyser un article de blog assemblé pour identifier les faiblesses structurelles, les incohérences logiques, "
+            "les manques d'informations clés, et les opportunités d'amélioration du flux et de l'engagement."
+        ),
+        backstory=(
+            "Vous êtes un éditeur expérimenté avec un œil aiguisé pour les détails et la vue d'ensemble. "
+            "Votre objectif n'est pas de réécrire, mais de fournir des critiques actionnables et spécifiques "
+            "qui aideront à élever la qualité du texte. Vous êtes direct mais toujours constructif."
+        ),
+        verbose=True,
+        allow_delegation=False,
+        llm=llm,
+    )
+
 
 # Agent Style
-style_agent = Agent(
-    role="Maître du Style et de la Réécriture",
-    goal=(
-        "Réécrire et améliorer le style d'un article de blog en se basant sur les critiques fournies, "
-        "pour le rendre plus percutant, fluide, engageant et adapté au public cible. "
-        "Améliorer la clarté, la concision et l'impact du texte."
-    ),
-    backstory=(
-        "Vous êtes un virtuose des mots, capable de transformer un texte brut en une œuvre captivante. "
-        "Vous comprenez l'importance du ton, du rythme et du choix des mots. Vous travaillez en étroite collaboration "
-        "avec le critique pour adresser spécifiquement les points soulevés."
-    ),
-    verbose=True,
-    allow_delegation=False,
-    llm=llm,
-)
+def _create_style_agent() -> Agent:
+    return Agent(
+        role="Maître du Style et de la Réécriture",
+        goal=(
+            "Réécrire et améliorer le style d'un article de blog en se basant sur les critiques fournies, "
+            "pour le rendre plus percutant, fluide, engageant et adapté au public cible. "
+            "Améliorer la clarté, la concision et l'impact du texte."
+        ),
+        backstory=(
+            "Vous êtes un virtuose des mots, capable de transformer un texte brut en une œuvre captivante. "
+            "Vous comprenez l'importance du ton, du rythme et du choix des mots. Vous travaillez en étroite collaboration "
+            "avec le critique pour adresser spécifiquement les points soulevés."
+        ),
+        verbose=True,
+        allow_delegation=False,
+        llm=llm,
+    )
+
 
 # Agent Vérificateur de Faits
-fact_checker_agent = Agent(
-    role="Vérificateur de Faits Méticuleux",
-    goal=(
-        "Vérifier l'exactitude des faits, chiffres, statistiques, dates, et noms propres présentés dans un article de blog, "
-        "en utilisant des outils de recherche web. Identifier et signaler toute information incorrecte ou douteuse."
-    ),
-    backstory=(
-        "Vous êtes un détective de l'information, obsédé par la précision. Vous ne laissez aucune affirmation non vérifiée. "
-        "Vous utilisez des outils de recherche de manière efficace pour valider chaque information quantifiable ou factuelle. "
-        "Votre travail garantit la crédibilité du contenu."
-    ),
-    verbose=True,
-    allow_delegation=False,
-    tools=[search_tool] if search_tool else [],
-    llm=llm,
-)
+def _create_fact_checker_agent() -> Agent:
+    return Agent(
+        role="Vérificateur de Faits Méticuleux",
+        goal=(
+            "Vérifier l'exactitude des faits, chiffres, statistiques, dates, et noms propres présentés dans un article de blog, "
+            "en utilisant des outils de recherche web. Identifier et signaler toute information incorrecte ou douteuse."
+        ),
+        backstory=(
+            "Vous êtes un détective de l'information, obsédé par la précision. Vous ne laissez aucune affirmation non vérifiée. "
+            "Vous utilisez des outils de recherche de manière efficace pour valider chaque information quantifiable ou factuelle. "
+            "Votre travail garantit la crédibilité du contenu."
+        ),
+        verbose=True,
+        allow_delegation=False,
+        tools=[search_tool] if search_tool else [],
+        llm=llm,
+    )
+
 
 # Agent Correcteur
-proofreader_agent = Agent(
-    role="Correcteur Orthographique et Grammatical Impitoyable",
-    goal=(
-        "Éliminer toutes les erreurs d'orthographe, de grammaire, de ponctuation, de syntaxe et de typographie "
-        "d'un article de blog pour garantir une présentation impeccable."
-    ),
-    backstory=(
-        "Vous avez un œil de lynx pour la moindre coquille. Aucune erreur ne vous échappe. "
-        "Vous êtes le dernier rempart avant la publication, assurant que le texte est parfait sur le plan linguistique."
-    ),
-    verbose=True,
-    allow_delegation=False,
-    llm=llm,
-)
+def _create_proofreader_agent() -> Agent:
+    return Agent(
+        role="Correcteur Orthographique et Grammatical Impitoyable",
+        goal=(
+            "Éliminer toutes les erreurs d'orthographe, de grammaire, de ponctuation, de syntaxe et de typographie "
+            "d'un article de blog pour garantir une présentation impeccable."
+        ),
+        backstory=(
+            "Vous avez un œil de lynx pour la moindre coquille. Aucune erreur ne vous échappe. "
+            "Vous êtes le dernier rempart avant la publication, assurant que le texte est parfait sur le plan linguistique."
+        ),
+        verbose=True,
+        allow_delegation=False,
+        llm=llm,
+    )
 
 
+@_with_ai_stack
 def create_refinement_tasks(raw_article_content: str) -> list[Task]:
     """Crée la séquence de tâches pour le Crew de Finition."""
 
@@ -357,7 +634,10 @@ def create_refinement_tasks(raw_article_content: str) -> list[Task]:
     return [critique_task, styling_task, fact_checking_task, proofreading_task]
 
 
-def run_finishing_crew(raw_article_content: str) -> str:
+@_with_ai_stack
+def run_finishing_crew(
+    raw_article_content: str, call_info: Optional[dict] = None
+) -> str:
     """Exécute le Crew de Finition sur un contenu d'article brut."""
     if not llm:
         raise EnvironmentError(
@@ -368,15 +648,8 @@ def run_finishing_crew(raw_article_content: str) -> str:
 
     refinement_tasks_instances = create_refinement_tasks(raw_article_content)
 
-    finishing_crew = Crew(
-        agents=[critic_agent, style_agent, fact_checker_agent, proofreader_agent],
-        tasks=refinement_tasks_instances,
-        process=Process.sequential,  # Les tâches s'exécutent en séquence
-        verbose=2,
-    )
-
-    # Le résultat final du crew séquentiel est le résultat de la dernière tâche
-    final_refined_article = finishing_crew.kickoff()
+    # Les tâches s'exécutent en séquence: le résultat final est celui de la dernière tâche
+    final_refined_article = _run_crew(FINISHER, refinement_tasks_instances, call_info)
 
     return (
         final_refined_article
@@ -385,32 +658,323 @@ def run_finishing_crew(raw_article_content: str) -> str:
     )
 
 
+# --- Finition par sections (articles longs) ---
+
+# Taille maximale d'une section envoyée au crew de finition
+FINISHING_CHUNK_TOKENS = int(os.getenv("FINISHING_CHUNK_TOKENS", "2000"))
+# Au-delà de ce volume, la finition passe en mode découpé
+FINISHING_CHUNKED_THRESHOLD_TOKENS = int(
+    os.getenv("FINISHING_CHUNKED_THRESHOLD_TOKENS", "3000")
+)
+
+# Étapes de la finition découpée (style, faits et correction par section, puis cohérence)
+CHUNKED_FINISHING_STEPS = ["style", "fact_check", "proofread", "consistency"]
+
+# Séparateur produit par output_service.merge_outputs_for_assembly
+_SECTION_SEPARATOR_RE = re.compile(r"\n\s*---\s*\n")
+_SECTION_HEADER_RE = re.compile(r"(?m)^(?=# )")
+_CONSISTENCY_MARKER_RE = re.compile(
+    r"\[\[SECTION (\d+)\]\]\s*(.*?)(?=\[\[SECTION \d+\]\]|\Z)", re.S
+)
+
+
+def _split_oversized_section(section: str, max_tokens: int) -> list[str]:
+    """Découpe une section trop longue par paragraphes"""
+    if estimate_tokens(section) <= max_tokens:
+        return [section]
+
+    chunks, current = [], []
+    for paragraph in section.split("\n\n"):
+        if current and estimate_tokens("\n\n".join(current + [paragraph])) > max_tokens:
+            chunks.append("\n\n".join(current))
+            current = []
+        current.append(paragraph)
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
+def _split_article(
+    content: str, max_tokens: int = FINISHING_CHUNK_TOKENS
+) -> tuple[list[str], list[str]]:
+    """
+    Découpe un article et retient le séparateur d'origine entre sections
+
+    Returns:
+        (sections, séparateurs): séparateurs[i] se place entre les sections i et i + 1
+    """
+    parts = [p.strip() for p in _SECTION_SEPARATOR_RE.split(content) if p.strip()]
+    joiner = SECTION_SEPARATOR
+    if len(parts) <= 1:
+        parts = [p.strip() for p in _SECTION_HEADER_RE.split(content) if p.strip()]
+        joiner = "\n\n"
+
+    sections, separators = [], []
+    for part in parts:
+        chunks = _split_oversized_section(part, max_tokens)
+        if sections:
+            separators.append(joiner)
+        separators.extend(["\n\n"] * (len(chunks) - 1))
+        sections.extend(chunks)
+    return sections, separators
+
+
+def split_article_sections(
+    content: str, max_tokens: int = FINISHING_CHUNK_TOKENS
+) -> list[str]:
+    """
+    Découpe un article assemblé en sections
+
+    Utilise les séparateurs '---' de l'assemblage, sinon les en-têtes '# ',
+    puis redécoupe par paragraphes les sections dépassant max_tokens.
+    """
+    return _split_article(content, max_tokens)[0]
+
+
+def join_article_sections(sections: list[str], separators: list[str]) -> str:
+    """Recompose un article découpé par _split_article avec ses séparateurs d'origine"""
+    return sections[0] + "".join(
+        separator + section for separator, section in zip(separators, sections[1:])
+    )
+
+
+def _split_opening(section: str) -> tuple[str, str, str]:
+    """Sépare une section en (en-tête, premier paragraphe, reste)"""
+    header = ""
+    body = section
+    if section.startswith("#"):
+        header, _, body = section.partition("\n")
+        body = body.lstrip("\n")
+    opening, _, rest = body.partition("\n\n")
+    return header, opening, rest
+
+
+@_with_ai_stack
+def create_section_refinement_tasks(section_content: str) -> list[Task]:
+    """Crée les tâches de finition d'une seule section (style, vérification des faits, correction)."""
+    refine_task = Task(
+        description=(
+            "Voici UNE section d'un article de blog plus long, les autres sections sont traitées séparément:\n\n"
+            f"'''\n{section_content}\n'''\n\n"
+            "Réécrivez cette section pour améliorer la fluidité, la clarté, la concision et l'engagement. "
+            "Conservez le titre de section (ligne commençant par '#') à l'identique s'il existe. "
+            "N'ajoutez ni introduction ni conclusion globale à l'article."
+        ),
+        expected_output="La section réécrite, titre inclus, sans commentaire additionnel.",
+        agent=style_agent,
+    )
+
+    fact_checking_task = Task(
+        description=(
+            "Vérifiez tous les faits, chiffres, statistiques, dates et noms propres de la section réécrite "
+            "(voir contexte de la tâche précédente) avec l'outil de recherche web. "
+            "Corrigez directement les informations incorrectes, sans changer la structure de la section."
+        ),
+        expected_output=(
+            "La section complète avec les faits vérifiés et corrigés, titre inclus. "
+            "Une information invérifiable peut être signalée par [Vérification nécessaire: ...]."
+        ),
+        agent=fact_checker_agent,
+        context=[refine_task],
+    )
+
+    proofreading_task = Task(
+        description=(
+            "Corrigez toutes les erreurs d'orthographe, de grammaire, de ponctuation et de typographie "
+            "de la section vérifiée (voir contexte de la tâche précédente), sans en changer la structure."
+        ),
+        expected_output="La section finale corrigée, titre inclus.",
+        agent=proofreader_agent,
+        context=[fact_checking_task],
+    )
+
+    return [refine_task, fact_checking_task, proofreading_task]
+
+
+@_with_ai_stack
+def run_section_finishing_crew(
+    section_content: str, call_info: Optional[dict] = None
+) -> str:
+    """Exécute la finition d'une seule section d'article."""
+    if not llm:
+        raise EnvironmentError(
+            "LLM non initialisé. Vérifiez la configuration de GROQ_API_KEY."
+        )
+
+    tasks = create_section_refinement_tasks(section_content)
+    result = _run_crew(FINISHER, tasks, call_info)
+    return result if isinstance(result, str) else str(result)
+
+
+@_with_ai_stack
+def create_consistency_task(sections: list[str]) -> Task:
+    """
+    Crée la passe de cohérence globale.
+
+    Seuls le plan et le premier paragraphe de chaque section sont envoyés,
+    le coût reste donc faible quelle que soit la longueur de l'article.
+    """
+    outline = "\n".join(
+        _split_opening(section)[0] or f"Section {index}"
+        for index, section in enumerate(sections, start=1)
+    )
+    openings = "\n\n".join(
+        f"[[SECTION {index}]]\n{_split_opening(section)[1]}"
+        for index, section in enumerate(sections, start=1)
+        if index > 1
+    )
+    return Task(
+        description=(
+            f"Plan d'un article de blog dont les sections ont été révisées séparément:\n{outline}\n\n"
+            "Voici le premier paragraphe de chaque section à partir de la deuxième:\n\n"
+            f"{openings}\n\n"
+            "Harmonisez ces paragraphes d'ouverture: transitions naturelles avec la section précédente, "
+            "terminologie et ton cohérents. Conservez chaque marqueur [[SECTION n]] suivi du paragraphe révisé, "
+            "sans autre texte."
+        ),
+        expected_output="Les marqueurs [[SECTION n]] suivis chacun du paragraphe d'ouverture révisé.",
+        agent=critic_agent,
+    )
+
+
+def apply_consistency_pass(sections: list[str], revised: str) -> list[str]:
+    """Remplace les paragraphes d'ouverture révisés (les sections non reconnues restent intactes)"""
+    stitched = list(sections)
+    for match in _CONSISTENCY_MARKER_RE.finditer(revised or ""):
+        index = int(match.group(1)) - 1
+        opening = match.group(2).strip()
+        if not (0 < index < len(stitched)) or not opening:
+            continue
+        header, _, rest = _split_opening(stitched[index])
+        head = f"{header}\n\n{opening}" if header else opening
+        stitched[index] = f"{head}\n\n{rest}" if rest else head
+    return stitched
+
+
+def run_consistency_pass(
+    sections: list[str], call_info: Optional[dict] = None
+) -> list[str]:
+    """Exécute la passe de cohérence et retourne les sections recousues."""
+    if len(sections) <= 1:
+        return sections
+    revised = _run_crew(FINISHER, [create_consistency_task(sections)], call_info)
+    return apply_consistency_pass(sections, str(revised))
+
+
+def _merge_call_infos(section_infos: list[dict], stitch_info: dict, wall_time: float) -> dict:
+    """Agrège les mesures des appels d'une finition découpée"""
+    infos = [info for info in section_infos + [stitch_info] if info]
+    costs = [info.get("cost_usd") for info in infos]
+    models = sorted({info["model_used"] for info in infos if "model_used" in info})
+
+    merged = {
+        "crew_type": FINISHER,
+        "chunked": True,
+        "chunks": len(section_infos),
+        "finishing_steps": list(CHUNKED_FINISHING_STEPS),
+        # La critique de l'article entier n'a pas d'équivalent par section
+        "skipped_finishing_steps": ["critique"],
+        "processing_time": round(wall_time, 3),
+        "model_used": models[0] if len(models) == 1 else models,
+        "cost_usd": round(sum(costs), 6) if costs and None not in costs else None,
+    }
+    for key in ("prompt_tokens", "completion_tokens", "total_tokens", "retries"):
+        merged[key] = sum(info.get(key, 0) for info in infos)
+    return merged
+
+
+async def run_finishing_crew_chunked(
+    raw_article_content: str,
+    on_progress: Optional[Callable[[int, int], Awaitable[None]]] = None,
+    call_info: Optional[dict] = None,
+) -> str:
+    """
+    Finition découpée: sections raffinées en parallèle puis passe de cohérence.
+
+    La durée dépend de la plus grande section et non de la longueur totale.
+    Les articles courts ou d'une seule section utilisent le crew complet.
+    Les sections sont recousues avec leurs séparateurs d'origine; call_info
+    indique les étapes exécutées (la critique globale n'est pas faite).
+
+    Args:
+        on_progress: Callback async (sections terminées, total) appelé après chaque section
+    """
+    sections, separators = _split_article(raw_article_content)
+    if (
+        len(sections) <= 1
+        or estimate_tokens(raw_article_content) <= FINISHING_CHUNKED_THRESHOLD_TOKENS
+    ):
+        return await run_finishing_crew_async(raw_article_content, call_info)
+
+    started = time.monotonic()
+    section_infos = [{} for _ in sections]
+    done = 0
+
+    async def refine(index: int, section: str) -> str:
+        nonlocal done
+        refined = await run_in_llm_executor(
+            run_section_finishing_crew, section, section_infos[index]
+        )
+        done += 1
+        if on_progress:
+            await on_progress(done, len(sections))
+        return refined
+
+    refined_sections = await asyncio.gather(
+        *(refine(index, section) for index, section in enumerate(sections))
+    )
+
+    stitch_info = {}
+    stitched = await run_in_llm_executor(
+        run_consistency_pass, list(refined_sections), stitch_info
+    )
+
+    if call_info is not None:
+        call_info.update(
+            _merge_call_infos(section_infos, stitch_info, time.monotonic() - started)
+        )
+    return join_article_sections(stitched, separators)
+
+
 # ========== ASYNC WRAPPERS FOR NON-BLOCKING EXECUTION ==========
-# These async functions use asyncio.to_thread to prevent blocking the FastAPI event loop
+# These async functions run in the dedicated LLM executor so long crews never starve
+# the default pool used by the event loop and DB work
 
 
-async def run_planning_crew_async(project_goal: str) -> list[str]:
+async def run_planning_crew_async(
+    project_goal: str, call_info: Optional[dict] = None
+) -> list[str]:
     """Async wrapper for run_planning_crew that doesn't block the event loop."""
-    return await asyncio.to_thread(run_planning_crew, project_goal)
+    return await run_in_llm_executor(run_planning_crew, project_goal, call_info)
 
 
 async def run_research_crew_async(
-    task_title: str, research_context: Optional[str] = None
+    task_title: str,
+    research_context: Optional[str] = None,
+    call_info: Optional[dict] = None,
 ) -> str:
     """Async wrapper for run_research_crew that doesn't block the event loop."""
-    return await asyncio.to_thread(run_research_crew, task_title, research_context)
+    return await run_in_llm_executor(
+        run_research_crew, task_title, research_context, call_info
+    )
 
 
 async def run_writing_crew_async(
-    task_title: str, writing_context: Optional[str] = None
+    task_title: str,
+    writing_context: Optional[str] = None,
+    call_info: Optional[dict] = None,
 ) -> str:
     """Async wrapper for run_writing_crew that doesn't block the event loop."""
-    return await asyncio.to_thread(run_writing_crew, task_title, writing_context)
+    return await run_in_llm_executor(
+        run_writing_crew, task_title, writing_context, call_info
+    )
 
 
-async def run_finishing_crew_async(raw_content: str) -> str:
+async def run_finishing_crew_async(
+    raw_content: str, call_info: Optional[dict] = None
+) -> str:
     """Async wrapper for run_finishing_crew that doesn't block the event loop."""
-    return await asyncio.to_thread(run_finishing_crew, raw_content)
+    return await run_in_llm_executor(run_finishing_crew, raw_content, call_info)
 
 
 if __name__ == "__main__":
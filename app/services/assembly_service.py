@@ -0,0 +1,214 @@
+"""
+Service d'assemblage incrémental de l'article final
+Une section par tâche, empreinte par section, seules les sections modifiées sont re-rendues
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.exceptions import FinalContentModified, ProjectNotFound
+from app.models.models import Project, Task
+from app.models.workflow_models import TaskOutput, TaskOutputType
+from app.services import similarity_service
+from app.services.output_service import calculate_content_hash
+
+
+# Même séparateur que output_service.merge_outputs_for_assembly (découpage de la finition)
+SECTION_SEPARATOR = "\n\n---\n\n"
+
+# Sources d'une section, par ordre de préférence
+SECTION_OUTPUT_TYPES = [TaskOutputType.WRITING, TaskOutputType.RESEARCH]
+
+MANIFEST_VERSION = 1
+
+
+def _latest_output_refs(db: Session, task_ids: List[int]) -> Dict[int, Any]:
+    """
+    Dernier output préféré de chaque tâche, sans charger le contenu
+
+    Retourne {task_id: (output_id, output_type, content_hash, content_minhash)}
+    """
+    if not task_ids:
+        return {}
+    rows = (
+        db.query(
+            TaskOutput.id,
+            TaskOutput.task_id,
+            TaskOutput.output_type,
+            TaskOutput.content_hash,
+            TaskOutput.content_minhash,
+        )
+        .filter(
+            TaskOutput.task_id.in_(task_ids),
+            TaskOutput.output_type.in_(SECTION_OUTPUT_TYPES),
+        )
+        .order_by(TaskOutput.created_at.desc(), TaskOutput.id.desc())
+        .all()
+    )
+
+    preference = {output_type: rank for rank, output_type in enumerate(SECTION_OUTPUT_TYPES)}
+    refs: Dict[int, Any] = {}
+    for output_id, task_id, output_type, content_hash, content_minhash in rows:
+        current = refs.get(task_id)
+        if current is None or preference[output_type] < preference[current[1]]:
+            refs[task_id] = (output_id, output_type, content_hash, content_minhash)
+    return refs
+
+
+def section_fingerprint(task: Task, output_ref: Optional[Any]) -> Optional[str]:
+    """
+    Empreinte de la source d'une section (titre + output ou description)
+
+    None si la tâche n'a ni output ni description (pas de section).
+    """
+    if output_ref:
+        source = f"output:{output_ref[1].value}:{output_ref[2]}"
+    elif task.description and task.description.strip():
+        source = f"description:{calculate_content_hash(task.description)}"
+    else:
+        return None
+    return hashlib.sha256(f"{task.title}\x1f{source}".encode("utf-8")).hexdigest()
+
+
+def render_section(task: Task, body: str) -> str:
+    """Rend une section au format de l'assemblage (titre de tâche en en-tête)"""
+    return f"# {task.title}\n\n{body.strip()}"
+
+
+def assemble_project_incremental(
+    db: Session,
+    project_id: int,
+    refine_section: Optional[Callable[[str], str]] = None,
+    force: bool = False,
+) -> Dict[str, Any]:
+    """
+    Met à jour Project.final_content en ne re-rendant que les sections modifiées
+
+    Les empreintes et positions des sections sont conservées dans
+    Project.assembly_manifest. Un final_content que l'assemblage n'a pas
+    produit (article du workflow, édition manuelle: manifeste absent ou hash
+    différent) n'est jamais écrasé sans force.
+
+    Args:
+        refine_section: Fonction optionnelle appliquée aux seules sections
+            modifiées (ex: ai_service.run_section_finishing_crew)
+        force: Ignorer le manifeste et tout reconstruire
+
+    Returns:
+        Résumé: sections modifiées, réutilisées, supprimées, reconstruction
+        complète, et sections quasi identiques à une section précédente
+        (signalées, pas retirées)
+
+    Raises:
+        ProjectNotFound: Si le projet n'existe pas
+        FinalContentModified: Si final_content non vide n'est pas décrit par
+            le manifeste et que force est faux
+    """
+    project = db.query(Project).filter(Project.id == project_id).first()
+    if not project:
+        raise ProjectNotFound(project_id)
+
+    tasks = (
+        db.query(Task)
+        .filter(Task.project_id == project_id)
+        .order_by(Task.order, Task.id)
+        .all()
+    )
+    refs = _latest_output_refs(db, [task.id for task in tasks])
+
+    manifest = project.assembly_manifest or {}
+    current_content = project.final_content or ""
+    manifest_valid = (
+        not force
+        and manifest.get("version") == MANIFEST_VERSION
+        and manifest.get("content_hash") == calculate_content_hash(current_content)
+    )
+    if not force and not manifest_valid and current_content.strip():
+        raise FinalContentModified(project_id)
+    previous = (
+        {entry["task_id"]: entry for entry in manifest.get("sections", [])}
+        if manifest_valid
+        else {}
+    )
+
+    # Charger le contenu des seuls outputs dont la section a changé
+    fingerprints = {task.id: section_fingerprint(task, refs.get(task.id)) for task in tasks}
+    changed_ids = [
+        task.id
+        for task in tasks
+        if fingerprints[task.id]
+        and previous.get(task.id, {}).get("fingerprint") != fingerprints[task.id]
+    ]
+    changed_output_ids = [refs[tid][0] for tid in changed_ids if tid in refs]
+    contents = {}
+    if changed_output_ids:
+        contents = dict(
+            db.query(TaskOutput.id, TaskOutput.content)
+            .filter(TaskOutput.id.in_(changed_output_ids))
+            .all()
+        )
+
+    sections: List[str] = []
+    entries: List[Dict[str, Any]] = []
+    offset = 0
+    for task in tasks:
+        fingerprint = fingerprints[task.id]
+        if not fingerprint:
+            continue
+
+        if task.id in changed_ids:
+            body = contents[refs[task.id][0]] if task.id in refs else task.description
+            text = render_section(task, body)
+            if refine_section:
+                text = refine_section(text)
+            refined = refine_section is not None
+        else:
+            entry = previous[task.id]
+            text = current_content[entry["start"] : entry["end"]]
+            refined = entry.get("refined", False)
+
+        if sections:
+            offset += len(SECTION_SEPARATOR)
+        entries.append(
+            {
+                "task_id": task.id,
+                "fingerprint": fingerprint,
+                "start": offset,
+                "end": offset + len(text),
+                "refined": refined,
+            }
+        )
+        sections.append(text)
+        offset += len(text)
+
+    removed = [tid for tid in previous if tid not in {e["task_id"] for e in entries}]
+    near_duplicates = similarity_service.find_repeated(
+        (task.id, refs[task.id][3]) for task in tasks if task.id in refs
+    )
+    new_content = SECTION_SEPARATOR.join(sections)
+    updated = new_content != current_content or not manifest_valid
+
+    if updated:
+        project.final_content = new_content
+        project.final_content_updated_at = datetime.now(timezone.utc)
+        project.assembly_manifest = {
+            "version": MANIFEST_VERSION,
+            "content_hash": calculate_content_hash(new_content),
+            "sections": entries,
+        }
+        db.add(project)
+        db.commit()
+
+    return {
+        "project_id": project_id,
+        "updated": updated,
+        "full_rebuild": not manifest_valid,
+        "changed_sections": changed_ids,
+        "reused_sections": len(entries) - len(changed_ids),
+        "removed_sections": removed,
+        "near_duplicate_sections": list(near_duplicates),
+        "content_length": len(new_content),
+    }
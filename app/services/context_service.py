@@ -0,0 +1,210 @@
+"""
+Service de construction du contexte des crews IA
+Sélectionne et réduit les sorties précédentes selon un budget de tokens par modèle
+"""
+
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.models import Task
+from app.models.workflow_models import TaskOutput, TaskOutputType
+from app.services.llm_gateway import CHARS_PER_TOKEN, estimate_tokens
+from app.services.model_router import RESEARCHER, WRITER, ModelRouter
+
+
+# Fenêtre de contexte des modèles Groq (tokens)
+MODEL_CONTEXT_WINDOWS: Dict[str, int] = {
+    "llama3-8b-8192": 8192,
+    "llama3-70b-8192": 8192,
+}
+DEFAULT_CONTEXT_WINDOW = 8192
+
+# Part de la fenêtre réservée au contexte (le reste: consignes de la tâche et réponse)
+CONTEXT_WINDOW_SHARE = float(os.getenv("CONTEXT_WINDOW_SHARE", "0.4"))
+
+# Nombre maximum de sections précédentes considérées
+MAX_PRIOR_SECTIONS = 5
+
+OMISSION_MARKER = "[…]"
+
+_WORD_RE = re.compile(r"\w{4,}", re.UNICODE)
+_SENTENCE_END_RE = re.compile(r"[.!?…](?=\s|$)")
+
+_router = ModelRouter()
+
+
+def get_context_budget(crew_type: str, model: Optional[str] = None) -> int:
+    """
+    Budget de tokens du contexte pour un crew
+
+    CONTEXT_TOKEN_BUDGET force une valeur fixe; sinon une part de la fenêtre
+    du modèle principal du crew (le plus petit des candidats).
+    """
+    forced = os.getenv("CONTEXT_TOKEN_BUDGET")
+    if forced:
+        return int(forced)
+
+    models = [model] if model else _router.candidates(crew_type)
+    window = min(MODEL_CONTEXT_WINDOWS.get(m, DEFAULT_CONTEXT_WINDOW) for m in models)
+    return int(window * CONTEXT_WINDOW_SHARE)
+
+
+def _keywords(text: str) -> set:
+    return {word.lower() for word in _WORD_RE.findall(text or "")}
+
+
+def _truncate_at_sentence(text: str, max_tokens: int) -> str:
+    """Coupe un texte à la dernière fin de phrase tenant dans le budget"""
+    limit = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= limit:
+        return text
+    head = text[:limit]
+    ends = list(_SENTENCE_END_RE.finditer(head))
+    if ends and ends[-1].end() > limit // 2:
+        head = head[: ends[-1].end()]
+    return head.rstrip() + f" {OMISSION_MARKER}"
+
+
+def trim_to_budget(text: str, max_tokens: int, topic: str = "") -> str:
+    """
+    Réduit un texte à max_tokens par sélection extractive de paragraphes
+
+    Le premier paragraphe est toujours conservé, puis les paragraphes les plus
+    proches du sujet (mots communs), restitués dans l'ordre d'origine.
+    """
+    if not text or max_tokens <= 0:
+        return ""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
+    if len(paragraphs) <= 1:
+        return _truncate_at_sentence(text, max_tokens)
+
+    topic_words = _keywords(topic)
+    ranked = sorted(
+        range(1, len(paragraphs)),
+        key=lambda i: (-len(_keywords(paragraphs[i]) & topic_words), i),
+    )
+
+    kept = {0}
+    used = estimate_tokens(paragraphs[0])
+    for index in ranked:
+        cost = estimate_tokens(paragraphs[index])
+        if used + cost <= max_tokens:
+            kept.add(index)
+            used += cost
+
+    if used > max_tokens:
+        return _truncate_at_sentence(paragraphs[0], max_tokens)
+
+    parts = []
+    for index, paragraph in enumerate(paragraphs):
+        if index in kept:
+            parts.append(paragraph)
+        elif not parts or parts[-1] != OMISSION_MARKER:
+            parts.append(OMISSION_MARKER)
+    return "\n\n".join(parts)
+
+
+def _latest_outputs_by_task(
+    db: Session, task_ids: List[int], output_types: List[TaskOutputType]
+) -> Dict[int, TaskOutput]:
+    """Dernier output (types par ordre de préférence) de chaque tâche, en une requête"""
+    if not task_ids:
+        return {}
+    outputs = (
+        db.query(TaskOutput)
+        .filter(
+            TaskOutput.task_id.in_(task_ids),
+            TaskOutput.output_type.in_(output_types),
+        )
+        .order_by(TaskOutput.created_at.desc())
+        .all()
+    )
+
+    preference = {output_type: rank for rank, output_type in enumerate(output_types)}
+    latest: Dict[int, TaskOutput] = {}
+    for output in outputs:
+        current = latest.get(output.task_id)
+        if current is None or preference[output.output_type] < preference[current.output_type]:
+            latest[output.task_id] = output
+    return latest
+
+
+def _prior_sections(db: Session, task: Task) -> List[Tuple[str, str]]:
+    """Sorties des tâches précédentes du projet, la plus proche en premier"""
+    prior_tasks = (
+        db.query(Task)
+        .filter(
+            Task.project_id == task.project_id,
+            Task.id != task.id,
+            Task.order <= (task.order or 0),
+        )
+        .order_by(Task.order.desc(), Task.id.desc())
+        .limit(MAX_PRIOR_SECTIONS)
+        .all()
+    )
+    latest = _latest_outputs_by_task(
+        db,
+        [t.id for t in prior_tasks],
+        [TaskOutputType.WRITING, TaskOutputType.RESEARCH],
+    )
+    return [(t.title, latest[t.id].content) for t in prior_tasks if t.id in latest]
+
+
+def build_task_context(
+    db: Session,
+    task: Task,
+    crew_type: str,
+    user_context: Optional[str] = None,
+    max_tokens: Optional[int] = None,
+) -> str:
+    """
+    Construire le contexte d'un crew de recherche ou de rédaction
+
+    Priorités, chaque bloc étant réduit au budget restant:
+    1. Le contexte fourni explicitement (au plus la moitié du budget)
+    2. Pour le rédacteur: la recherche de la même tâche
+    3. La description de la tâche
+    4. Les sections précédentes du projet les plus proches du sujet
+    """
+    budget = max_tokens if max_tokens is not None else get_context_budget(crew_type)
+    topic = task.title or ""
+    blocks: List[Tuple[str, str, int]] = []  # (titre, contenu, plafond)
+
+    if user_context:
+        blocks.append(("", user_context, budget // 2))
+
+    if crew_type == WRITER:
+        research = _latest_outputs_by_task(db, [task.id], [TaskOutputType.RESEARCH])
+        if task.id in research:
+            blocks.append(("Recherche pour cette tâche", research[task.id].content, budget))
+
+    description = (task.description or "").strip()
+    if description and description != topic and description != (user_context or "").strip():
+        blocks.append(("Description de la tâche", description, budget))
+
+    if crew_type in (RESEARCHER, WRITER):
+        prior = _prior_sections(db, task)
+        prior.sort(key=lambda section: -len(_keywords(section[1]) & _keywords(topic)))
+        for title, content in prior:
+            blocks.append((f"Section précédente: {title}", content, budget // 4))
+
+    parts = []
+    remaining = budget
+    for title, content, cap in blocks:
+        header = f"## {title}\n" if title else ""
+        allowance = min(cap, remaining) - estimate_tokens(header)
+        if allowance <= 0:
+            continue
+        trimmed = trim_to_budget(content, allowance, topic=topic)
+        if not trimmed:
+            continue
+        parts.append(header + trimmed)
+        remaining -= estimate_tokens(header + trimmed)
+
+    return "\n\n".join(parts)
@@ -0,0 +1,341 @@
+"""
+Passerelle LLM: limitation de débit et de concurrence pour les appels Groq
+
+- Token bucket par modèle (requêtes/minute et tokens/minute)
+- Concurrence adaptative AIMD selon les 429 et la latence observée
+- Retry avec backoff exponentiel et jitter sur les erreurs transitoires
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, Optional
+
+
+# Approximation grossière: ~4 caractères par token pour les modèles Llama
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """Estime le nombre de tokens d'un texte sans tokenizer"""
+    if not text:
+        return 0
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+@dataclass
+class ModelBudget:
+    """Budget de débit d'un modèle côté fournisseur"""
+
+    rpm: int = 30  # Requêtes par minute
+    tpm: int = 30000  # Tokens par minute
+    max_concurrency: int = 8  # Plafond de la concurrence adaptative
+    latency_target: float = 60.0  # Latence (s) au-delà de laquelle on réduit
+
+
+# Budgets par défaut (limites Groq conservatrices), surchargeables via LLM_MODEL_BUDGETS
+DEFAULT_MODEL_BUDGETS: Dict[str, ModelBudget] = {
+    "llama3-8b-8192": ModelBudget(rpm=30, tpm=30000, max_concurrency=8),
+    "llama3-70b-8192": ModelBudget(rpm=30, tpm=6000, max_concurrency=4),
+}
+
+
+def load_model_budgets() -> Dict[str, ModelBudget]:
+    """
+    Charge les budgets par modèle
+
+    LLM_MODEL_BUDGETS accepte un JSON {"modele": {"rpm": 30, "tpm": 6000}}
+    qui complète ou remplace les budgets par défaut.
+    """
+    budgets = {name: ModelBudget(**asdict(b)) for name, b in DEFAULT_MODEL_BUDGETS.items()}
+
+    raw = os.getenv("LLM_MODEL_BUDGETS")
+    if raw:
+        try:
+            for model, values in json.loads(raw).items():
+                base = asdict(budgets.get(model, ModelBudget()))
+                base.update(values)
+                budgets[model] = ModelBudget(**base)
+        except (ValueError, TypeError) as e:
+            print(f"LLM_MODEL_BUDGETS invalide, budgets par défaut conservés: {e}")
+
+    return budgets
+
+
+class TokenBucket:
+    """
+    Seau à jetons thread-safe avec rechargement continu
+
+    Les réservations peuvent rendre le solde négatif: l'appelant reçoit le
+    délai à attendre, ce qui évite les boucles d'attente actives et sert
+    les demandes dans l'ordre d'arrivée.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        refill_per_second: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._last_refill = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_per_second)
+
+    def reserve(self, amount: float) -> float:
+        """Réserve des jetons et retourne le délai d'attente en secondes"""
+        amount = min(float(amount), self.capacity)
+        with self._lock:
+            self._refill()
+            self._tokens -= amount
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.refill_per_second
+
+    def debit(self, amount: float) -> None:
+        """Débite des jetons consommés après coup (ex: tokens de complétion)"""
+        with self._lock:
+            self._refill()
+            self._tokens = max(-self.capacity, self._tokens - float(amount))
+
+    @property
+    def available(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+
+class AIMDLimiter:
+    """
+    Limiteur de concurrence AIMD (Additive Increase, Multiplicative Decrease)
+
+    +1 slot par fenêtre de succès, division par deux sur un 429,
+    légère réduction si la latence dépasse la cible.
+    """
+
+    def __init__(
+        self,
+        initial_limit: float = 2,
+        min_limit: float = 1,
+        max_limit: float = 8,
+        decrease_factor: float = 0.5,
+        latency_target: Optional[float] = None,
+    ):
+        self.min_limit = float(min_limit)
+        self.max_limit = float(max_limit)
+        self.decrease_factor = decrease_factor
+        self.latency_target = latency_target
+        self._limit = min(max(float(initial_limit), self.min_limit), self.max_limit)
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> float:
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self) -> None:
+        """Attend qu'un slot de concurrence soit libre"""
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+
+    def release(self, latency: float, rate_limited: bool = False) -> None:
+        """Libère un slot et adapte la limite selon le résultat de l'appel"""
+        with self._cond:
+            self._in_flight -= 1
+            if rate_limited:
+                self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+            elif self.latency_target and latency > self.latency_target:
+                self._limit = max(self.min_limit, self._limit * 0.9)
+            else:
+                self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+            self._cond.notify_all()
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """Détecte une erreur 429 quel que soit le client (groq, litellm, langchain)"""
+    status = getattr(exc, "status_code", None) or getattr(
+        getattr(exc, "response", None), "status_code", None
+    )
+    if status == 429:
+        return True
+    message = str(exc).lower()
+    return "429" in message or "rate limit" in message or "rate_limit" in message
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """Détecte les erreurs réseau ou serveur qui méritent un nouvel essai"""
+    status = getattr(exc, "status_code", None) or getattr(
+        getattr(exc, "response", None), "status_code", None
+    )
+    if isinstance(status, int) and status >= 500:
+        return True
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return True
+    name = type(exc).__name__.lower()
+    return "timeout" in name or "connection" in name
+
+
+def get_retry_after(exc: BaseException) -> Optional[float]:
+    """Extrait l'en-tête Retry-After d'une réponse 429 si disponible"""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class _ModelState:
+    """État de limitation et compteurs d'un modèle"""
+
+    def __init__(self, budget: ModelBudget):
+        self.budget = budget
+        self.request_bucket = TokenBucket(budget.rpm, budget.rpm / 60.0)
+        self.token_bucket = TokenBucket(budget.tpm, budget.tpm / 60.0)
+        self.limiter = AIMDLimiter(
+            initial_limit=min(2, budget.max_concurrency),
+            max_limit=budget.max_concurrency,
+            latency_target=budget.latency_target,
+        )
+        self.calls = 0
+        self.failures = 0
+        self.rate_limited = 0
+        self.retries = 0
+
+
+class LLMGateway:
+    """
+    Point de passage unique des appels LLM bloquants
+
+    Usage:
+        result = llm_gateway.call("llama3-8b-8192", crew.kickoff, estimated_tokens=800)
+    """
+
+    def __init__(
+        self,
+        budgets: Optional[Dict[str, ModelBudget]] = None,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_cap: float = 30.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.budgets = budgets if budgets is not None else load_model_budgets()
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self._sleep = sleep
+        self._models: Dict[str, _ModelState] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, model: str) -> _ModelState:
+        with self._lock:
+            if model not in self._models:
+                self._models[model] = _ModelState(self.budgets.get(model, ModelBudget()))
+            return self._models[model]
+
+    def _backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Backoff exponentiel avec full jitter, borné par Retry-After si fourni"""
+        if retry_after is not None:
+            return retry_after + random.uniform(0, self.backoff_base)
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2**attempt))
+
+    def _wait_for_budget(self, state: _ModelState, requests: int, tokens: int) -> None:
+        delay = max(
+            state.request_bucket.reserve(requests),
+            state.token_bucket.reserve(tokens) if tokens else 0.0,
+        )
+        if delay > 0:
+            self._sleep(delay)
+
+    def call(
+        self,
+        model: str,
+        func: Callable[[], Any],
+        estimated_tokens: int = 0,
+        requests: int = 1,
+        call_stats: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """
+        Exécute un appel LLM bloquant en respectant le budget du modèle
+
+        Args:
+            model: Nom du modèle (clé des budgets)
+            func: Appel à exécuter (ex: crew.kickoff)
+            estimated_tokens: Tokens de prompt estimés, réservés avant l'appel
+            requests: Nombre de requêtes LLM effectuées par l'appel (tâches du crew)
+            call_stats: Dict complété avec le nombre de retries effectués
+
+        Returns:
+            Le résultat de func()
+        """
+        state = self._state(model)
+        attempt = 0
+        if call_stats is not None:
+            call_stats["retries"] = 0
+
+        while True:
+            self._wait_for_budget(state, requests, estimated_tokens)
+            state.limiter.acquire()
+            started = time.monotonic()
+            try:
+                result = func()
+            except Exception as exc:
+                rate_limited = is_rate_limit_error(exc)
+                state.limiter.release(time.monotonic() - started, rate_limited=rate_limited)
+                state.failures += 1
+                if rate_limited:
+                    state.rate_limited += 1
+
+                if attempt >= self.max_retries or not (
+                    rate_limited or is_transient_error(exc)
+                ):
+                    raise
+
+                attempt += 1
+                state.retries += 1
+                if call_stats is not None:
+                    call_stats["retries"] = attempt
+                self._sleep(self._backoff_delay(attempt, get_retry_after(exc)))
+                continue
+
+            state.limiter.release(time.monotonic() - started)
+            state.calls += 1
+            # Les tokens de complétion ne sont connus qu'après l'appel
+            state.token_bucket.debit(estimate_tokens(str(result)))
+            return result
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Statistiques courantes par modèle"""
+        with self._lock:
+            states = dict(self._models)
+        return {
+            model: {
+                "concurrency_limit": round(state.limiter.limit, 2),
+                "in_flight": state.limiter.in_flight,
+                "calls": state.calls,
+                "failures": state.failures,
+                "rate_limited": state.rate_limited,
+                "retries": state.retries,
+                "requests_available": round(state.request_bucket.available, 2),
+                "tokens_available": round(state.token_bucket.available, 2),
+            }
+            for model, state in states.items()
+        }
@@ -0,0 +1,121 @@
+"""
+Service de suivi des appels LLM
+Enregistrement compact des kickoffs et statistiques par type de crew
+"""
+
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.llm_models import LLMCall
+
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def record_llm_call(
+    db: Session,
+    crew_type: str,
+    model: str,
+    wall_time: float,
+    prompt_tokens: int = 0,
+    completion_tokens: int = 0,
+    retries: int = 0,
+    success: bool = True,
+    cost_usd: Optional[float] = None,
+    error: Optional[str] = None,
+) -> LLMCall:
+    """
+    Enregistrer un kickoff de crew
+    """
+    call = LLMCall(
+        crew_type=crew_type,
+        model=model,
+        success=success,
+        wall_time=wall_time,
+        prompt_tokens=prompt_tokens or 0,
+        completion_tokens=completion_tokens or 0,
+        retries=retries or 0,
+        cost_usd=cost_usd,
+        error=error[:255] if error else None,
+    )
+    db.add(call)
+    db.flush()
+    return call
+
+
+def percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    """Percentile par rang le plus proche sur une liste déjà triée"""
+    if not sorted_values:
+        return None
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def _summarize(calls: List[LLMCall]) -> Dict[str, Any]:
+    wall_times = sorted(call.wall_time for call in calls)
+    successes = sum(1 for call in calls if call.success)
+    prompt_tokens = sum(call.prompt_tokens for call in calls)
+    completion_tokens = sum(call.completion_tokens for call in calls)
+
+    return {
+        "calls": len(calls),
+        "success_rate": round(successes / len(calls), 3) if calls else None,
+        "retries": sum(call.retries for call in calls),
+        "wall_time": {
+            **{
+                f"p{pct}": round(percentile(wall_times, pct), 3)
+                for pct in PERCENTILES
+            },
+            "avg": round(sum(wall_times) / len(wall_times), 3),
+            "total": round(sum(wall_times), 3),
+        },
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "cost_usd": round(sum(call.cost_usd or 0 for call in calls), 6),
+    }
+
+
+def get_llm_stats(
+    db: Session,
+    hours: Optional[int] = 24,
+    crew_type: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Statistiques des appels LLM par type de crew (et par modèle)
+
+    Args:
+        hours: Fenêtre glissante en heures (None = tout l'historique)
+        crew_type: Restreindre à un type de crew
+    """
+    query = db.query(LLMCall)
+    if hours:
+        since = datetime.now(timezone.utc) - timedelta(hours=hours)
+        query = query.filter(LLMCall.created_at >= since)
+    if crew_type:
+        query = query.filter(LLMCall.crew_type == crew_type)
+
+    by_crew: Dict[str, List[LLMCall]] = defaultdict(list)
+    by_crew_model: Dict[str, Dict[str, List[LLMCall]]] = defaultdict(
+        lambda: defaultdict(list)
+    )
+    calls = query.all()
+    for call in calls:
+        by_crew[call.crew_type].append(call)
+        by_crew_model[call.crew_type][call.model].append(call)
+
+    crews = {}
+    for crew, crew_calls in by_crew.items():
+        crews[crew] = _summarize(crew_calls)
+        crews[crew]["models"] = {
+            model: _summarize(model_calls)
+            for model, model_calls in by_crew_model[crew].items()
+        }
+
+    return {
+        "window_hours": hours,
+        "total_calls": len(calls),
+        "crews": crews,
+    }
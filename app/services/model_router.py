@@ -0,0 +1,108 @@
+"""
+Routage des modèles LLM par type de crew
+Choix du modèle (planner, researcher, writer, finisher), modèles de repli et coût estimé
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+# Types de crew routés
+PLANNER = "planner"
+RESEARCHER = "researcher"
+WRITER = "writer"
+FINISHER = "finisher"
+CREW_TYPES = (PLANNER, RESEARCHER, WRITER, FINISHER)
+
+DEFAULT_MODEL = "llama3-8b-8192"
+LARGE_MODEL = "llama3-70b-8192"
+
+# Prix Groq en USD par million de tokens (entrée, sortie)
+MODEL_PRICING: Dict[str, tuple] = {
+    "llama3-8b-8192": (0.05, 0.08),
+    "llama3-70b-8192": (0.59, 0.79),
+}
+
+
+@dataclass
+class ModelRoute:
+    """Modèle principal et modèles de repli pour un type de crew"""
+
+    primary: str
+    fallbacks: List[str] = field(default_factory=list)
+
+    @property
+    def candidates(self) -> List[str]:
+        """Modèles à essayer dans l'ordre, sans doublon"""
+        seen = []
+        for model in [self.primary, *self.fallbacks]:
+            if model and model not in seen:
+                seen.append(model)
+        return seen
+
+
+def main_model() -> str:
+    """Modèle principal de l'application: GROQ_MODEL, sinon DEFAULT_MODEL"""
+    return os.getenv("GROQ_MODEL") or DEFAULT_MODEL
+
+
+def default_routes() -> Dict[str, List[str]]:
+    """
+    Routes par défaut: le modèle principal pour tous les crews
+
+    L'autre modèle ne sert que de repli quand le principal échoue. Router
+    un crew vers le modèle plus puissant (et plus coûteux) est un choix
+    explicite: LLM_MODEL_WRITER=llama3-70b-8192, LLM_MODEL_FINISHER=...
+    """
+    primary = main_model()
+    fallback = LARGE_MODEL if primary != LARGE_MODEL else DEFAULT_MODEL
+    return {crew_type: [primary, fallback] for crew_type in CREW_TYPES}
+
+
+def load_routes() -> Dict[str, ModelRoute]:
+    """
+    Charge les routes depuis l'environnement
+
+    LLM_MODEL_<CREW> fixe le modèle principal (ex: LLM_MODEL_WRITER=llama3-70b-8192)
+    LLM_FALLBACK_<CREW> liste les replis séparés par des virgules
+    """
+    defaults = default_routes()
+    routes = {}
+    for crew_type in CREW_TYPES:
+        default_primary, *default_fallbacks = defaults[crew_type]
+        primary = os.getenv(f"LLM_MODEL_{crew_type.upper()}", default_primary)
+
+        raw_fallbacks = os.getenv(f"LLM_FALLBACK_{crew_type.upper()}")
+        if raw_fallbacks is not None:
+            fallbacks = [m.strip() for m in raw_fallbacks.split(",") if m.strip()]
+        else:
+            fallbacks = default_fallbacks
+
+        routes[crew_type] = ModelRoute(primary=primary, fallbacks=fallbacks)
+    return routes
+
+
+def estimate_cost(
+    model: str, prompt_tokens: int, completion_tokens: int
+) -> Optional[float]:
+    """Coût estimé en USD d'un appel, None si le modèle n'a pas de tarif connu"""
+    pricing = MODEL_PRICING.get(model)
+    if not pricing:
+        return None
+    input_price, output_price = pricing
+    cost = (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
+    return round(cost, 6)
+
+
+class ModelRouter:
+    """Sélectionne les modèles candidats d'un crew"""
+
+    def __init__(self, routes: Optional[Dict[str, ModelRoute]] = None):
+        self.routes = routes if routes is not None else load_routes()
+
+    def get_route(self, crew_type: str) -> ModelRoute:
+        return self.routes.get(crew_type) or ModelRoute(primary=main_model())
+
+    def candidates(self, crew_type: str) -> List[str]:
+        return self.get_route(crew_type).candidates
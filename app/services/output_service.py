@@ -2,14 +2,22 @@
 Service pour la gestion des outputs de tâches
 """
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.sql import func
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timezone, timedelta
 import hashlib
 
-from app.models.workflow_models import TaskOutput, TaskOutputType
+from app.db.fingerprint import rows_fingerprint
+from app.models.workflow_models import TaskOutput, TaskOutputType, WorkflowExecution
 from app.models.models import Task
+from app.services import similarity_service, style_service
+
+# Outputs rédigés (prose) dont la conformité de style est mesurée à la sauvegarde
+STYLED_OUTPUT_TYPES = frozenset(
+    {TaskOutputType.WRITING, TaskOutputType.ASSEMBLY, TaskOutputType.FINISHING}
+)
 
 
 def calculate_content_hash(content: str) -> str:
@@ -29,6 +37,13 @@ def save_task_output(
 ) -> TaskOutput:
     """
     Sauvegarder le résultat d'une tâche
+
+    Un contenu identique (SHA-256) pour la même tâche n'est pas dupliqué.
+    Un contenu quasi identique à l'output du même type d'une autre tâche du
+    projet (MinHash) est conservé mais signalé dans les métadonnées
+    (near_duplicate_of, near_duplicate_similarity).
+    Les outputs rédigés reçoivent leur score de conformité au profil de
+    style (métadonnée style).
     """
     # Calculer le hash du contenu
     content_hash = calculate_content_hash(content)
@@ -44,7 +59,7 @@ def save_task_output(
         return existing
 
     # Enrichir les métadonnées
-    enriched_metadata = metadata or {}
+    enriched_metadata = dict(metadata or {})
     enriched_metadata.update(
         {
             "word_count": len(content.split()),
@@ -53,6 +68,18 @@ def save_task_output(
         }
     )
 
+    # Empreinte MinHash et recherche de quasi-doublons dans le projet
+    signature = similarity_service.minhash_signature(content)
+    near_duplicate = similarity_service.find_near_duplicate_output(
+        db, task_id, output_type, signature
+    )
+    if near_duplicate:
+        enriched_metadata["near_duplicate_of"] = near_duplicate[0]
+        enriched_metadata["near_duplicate_similarity"] = near_duplicate[1]
+
+    if output_type in STYLED_OUTPUT_TYPES:
+        enriched_metadata["style"] = style_service.score_text(db, content)
+
     # Créer le nouvel output
     output = TaskOutput(
         task_id=task_id,
@@ -60,16 +87,103 @@ def save_task_output(
         output_type=output_type,
         content=content,
         content_hash=content_hash,
-        metadata=enriched_metadata,
+        content_minhash=similarity_service.signature_to_bytes(signature),
+        output_metadata=enriched_metadata,
     )
 
     db.add(output)
     db.flush()  # Use flush to get the ID before transaction commit
+    similarity_service.index_output_bands(db, output.id, signature)
     db.refresh(output)
 
     return output
 
 
+def create_output(
+    db: Session,
+    task_id: int,
+    output_type: TaskOutputType,
+    content: str,
+    ai_generated: bool = False,
+    workflow_execution_id: Optional[str] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> TaskOutput:
+    """
+    Créer et persister l'output d'une tâche (tâches BackgroundTasks)
+    """
+    output_metadata = {"ai_generated": ai_generated}
+    output_metadata.update(metadata or {})
+
+    output = save_task_output(
+        db=db,
+        task_id=task_id,
+        output_type=output_type,
+        content=content,
+        workflow_execution_id=workflow_execution_id,
+        metadata=output_metadata,
+    )
+    db.commit()
+    return output
+
+
+def create_project_output(
+    db: Session,
+    project_id: int,
+    output_type: TaskOutputType,
+    content: str,
+    ai_generated: bool = False,
+    workflow_execution_id: Optional[str] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> Optional[TaskOutput]:
+    """
+    Créer un output au niveau projet (assemblage, finition)
+
+    Comme pour l'orchestrateur Celery, l'output est rattaché à la première
+    tâche du projet qui sert de référence.
+    """
+    reference_task = (
+        db.query(Task)
+        .filter(Task.project_id == project_id)
+        .order_by(Task.order, Task.id)
+        .first()
+    )
+    if not reference_task:
+        return None
+
+    return create_output(
+        db=db,
+        task_id=reference_task.id,
+        output_type=output_type,
+        content=content,
+        ai_generated=ai_generated,
+        workflow_execution_id=workflow_execution_id,
+        metadata=metadata,
+    )
+
+
+def get_output_by_id(db: Session, output_id: str) -> Optional[TaskOutput]:
+    """
+    Récupérer un output par son ID
+    """
+    return db.query(TaskOutput).filter(TaskOutput.id == output_id).first()
+
+
+def get_outputs_by_project_and_type(
+    db: Session, project_id: int, output_type: TaskOutputType
+) -> List[TaskOutput]:
+    """
+    Récupérer les outputs d'un type donné pour toutes les tâches d'un projet
+    """
+    return (
+        db.query(TaskOutput)
+        .options(joinedload(TaskOutput.task))
+        .join(Task, TaskOutput.task_id == Task.id)
+        .filter(Task.project_id == project_id, TaskOutput.output_type == output_type)
+        .order_by(Task.order, TaskOutput.created_at)
+        .all()
+    )
+
+
 def get_outputs_by_task(
     db: Session, task_id: int, output_type: Optional[TaskOutputType] = None
 ) -> List[TaskOutput]:
@@ -102,6 +216,35 @@ def get_outputs_by_workflow(
     return query.order_by(TaskOutput.created_at).all()
 
 
+def get_workflow_outputs_fingerprint(db: Session, workflow_id: str) -> Optional[str]:
+    """
+    Empreinte des outputs d'un workflow (liste et statistiques exposées)
+
+    Les contenus ne sont pas relus: leur hash SHA-256 est stocké.
+    Retourne None si le workflow n'existe pas.
+    """
+    exists = db.execute(
+        select(WorkflowExecution.id).where(WorkflowExecution.id == workflow_id)
+    ).first()
+    if exists is None:
+        return None
+    rows = db.execute(
+        select(
+            TaskOutput.id,
+            TaskOutput.task_id,
+            TaskOutput.output_type,
+            TaskOutput.content_hash,
+            TaskOutput.created_at,
+            TaskOutput.output_metadata,
+            Task.title,
+        )
+        .outerjoin(Task, TaskOutput.task_id == Task.id)
+        .where(TaskOutput.workflow_execution_id == workflow_id)
+        .order_by(TaskOutput.created_at, TaskOutput.id)
+    ).all()
+    return rows_fingerprint(rows)
+
+
 def get_latest_output(
     db: Session, task_id: int, output_type: Optional[TaskOutputType] = None
 ) -> Optional[TaskOutput]:
@@ -117,26 +260,46 @@ def get_latest_output(
 
 
 def merge_outputs_for_assembly(
-    db: Session, task_ids: List[int], separator: str = "\n\n---\n\n"
+    db: Session,
+    task_ids: List[int],
+    separator: str = "\n\n---\n\n",
+    skip_near_duplicates: bool = True,
 ) -> str:
     """
     Fusionner les outputs de plusieurs tâches pour l'assemblage
+
+    Avec skip_near_duplicates, une recherche quasi identique (MinHash) à
+    celle d'une tâche précédente n'est pas répétée dans l'assemblage.
     """
-    outputs = []
+    latest_outputs = []
 
     for task_id in task_ids:
         latest_output = get_latest_output(
             db, task_id, output_type=TaskOutputType.RESEARCH
         )
-
         if latest_output:
-            # Inclure le titre de la tâche comme en-tête
-            task = db.query(Task).filter(Task.id == task_id).first()
-            if task:
-                section_header = f"# {task.title}\n\n"
-                outputs.append(section_header + latest_output.content)
-            else:
-                outputs.append(latest_output.content)
+            latest_outputs.append((task_id, latest_output))
+
+    repeated = (
+        similarity_service.find_repeated(
+            (output.id, output.content_minhash) for _, output in latest_outputs
+        )
+        if skip_near_duplicates
+        else {}
+    )
+
+    outputs = []
+    for task_id, latest_output in latest_outputs:
+        if latest_output.id in repeated:
+            continue
+
+        # Inclure le titre de la tâche comme en-tête
+        task = db.query(Task).filter(Task.id == task_id).first()
+        if task:
+            section_header = f"# {task.title}\n\n"
+            outputs.append(section_header + latest_output.content)
+        else:
+            outputs.append(latest_output.content)
 
     return separator.join(outputs)
 
@@ -149,6 +312,7 @@ def cleanup_old_outputs(
     """
     cutoff_date = datetime.utcnow() - timedelta(days=days_old)
 
+    conditions = [TaskOutput.created_at < cutoff_date]
     if keep_latest_per_task:
         # Sous-requête pour identifier les derniers outputs par tâche
         latest_outputs = (
@@ -160,27 +324,25 @@ def cleanup_old_outputs(
         )
 
         # Supprimer seulement les outputs qui ne sont pas les derniers
-        deleted_count = (
-            db.query(TaskOutput)
+        conditions.append(
+            ~db.query(TaskOutput)
             .filter(
-                TaskOutput.created_at < cutoff_date,
-                ~db.query(TaskOutput)
-                .filter(
-                    TaskOutput.task_id == latest_outputs.c.task_id,
-                    TaskOutput.created_at == latest_outputs.c.max_created,
-                )
-                .exists(),
+                TaskOutput.task_id == latest_outputs.c.task_id,
+                TaskOutput.created_at == latest_outputs.c.max_created,
             )
-            .delete(synchronize_session=False)
-        )
-    else:
-        # Supprimer tous les outputs anciens
-        deleted_count = (
-            db.query(TaskOutput)
-            .filter(TaskOutput.created_at < cutoff_date)
-            .delete(synchronize_session=False)
+            .exists()
         )
 
+    # Les bandes LSH d'abord: pas de cascade SQL avec une suppression en masse
+    similarity_service.delete_output_bands(
+        db, select(TaskOutput.id).where(*conditions)
+    )
+    deleted_count = (
+        db.query(TaskOutput)
+        .filter(*conditions)
+        .delete(synchronize_session=False)
+    )
+
     db.commit()
     return deleted_count
 
@@ -1,5 +1,10 @@
+import uuid
+
+from sqlalchemy import bindparam, insert, select
 from sqlalchemy.orm import Session
+from app.db.fingerprint import rows_fingerprint, schema_columns
 from app.models import models
+from app.models.workflow_models import TaskOutput, TaskOutputBand
 from app.schemas import schemas
 from app.exceptions import (
     ProjectNotFound,
@@ -7,9 +12,12 @@ from app.exceptions import (
     ProjectNotArchived,
     CannotDeleteArchivedProject,
 )
-from typing import List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any
 from datetime import datetime
 
+# Nombre de tâches copiées par INSERT ... SELECT lors d'une duplication
+DUPLICATION_BATCH_SIZE = 500
+
 
 def create_project(
     db: Session, project: schemas.ProjectCreate, commit: bool = True
@@ -41,6 +49,28 @@ def get_project(db: Session, project_id: int) -> Optional[models.Project]:
     return db.query(models.Project).filter(models.Project.id == project_id).first()
 
 
+def get_project_fingerprint(db: Session, project_id: int) -> Optional[str]:
+    """
+    Empreinte de la représentation d'un projet (schemas.Project, tâches incluses)
+
+    Deux requêtes Core sur les seules colonnes exposées, sans chargement ORM.
+    Retourne None si le projet n'existe pas.
+    """
+    project_row = db.execute(
+        select(*schema_columns(models.Project, schemas.Project)).where(
+            models.Project.id == project_id
+        )
+    ).first()
+    if project_row is None:
+        return None
+    task_rows = db.execute(
+        select(*schema_columns(models.Task, schemas.Task))
+        .where(models.Task.project_id == project_id)
+        .order_by(models.Task.id)
+    ).all()
+    return rows_fingerprint([project_row], task_rows)
+
+
 def get_projects(db: Session, skip: int = 0, limit: int = 100) -> List[models.Project]:
     return db.query(models.Project).offset(skip).limit(limit).all()
 
@@ -223,15 +253,30 @@ def update_project_settings(
 
 
 def duplicate_project(
-    db: Session, project_id: int, new_name: Optional[str] = None
+    db: Session,
+    project_id: int,
+    new_name: Optional[str] = None,
+    include_outputs: bool = False,
+    batch_size: int = DUPLICATION_BATCH_SIZE,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+    stats: Optional[Dict[str, int]] = None,
 ) -> models.Project:
     """
-    Duplique un projet avec toutes ses tâches.
+    Duplique un projet avec toutes ses tâches, côté base de données.
+
+    Les tâches sont copiées par lots (un INSERT multi-lignes par lot) et les
+    IDs sont remappés via RETURNING; les outputs sont copiés via INSERT ...
+    SELECT (leur contenu ne transite pas par Python). Toute la duplication
+    est validée en une seule transaction.
 
     Args:
         db: Session de base de données
         project_id: ID du projet à dupliquer
         new_name: Nouveau nom (si None, ajoute "- Copie" au nom original)
+        include_outputs: Copier aussi le dernier output de chaque type par tâche
+        batch_size: Nombre de tâches par INSERT
+        on_progress: Callback (tâches copiées, total) appelé après chaque lot
+        stats: Dictionnaire optionnel complété avec tasks_copied et outputs_copied
 
     Returns:
         Nouveau projet dupliqué
@@ -247,36 +292,175 @@ def duplicate_project(
     if not new_name:
         new_name = f"{original_project.name} - Copie"
 
-    # Création du nouveau projet
-    new_project = models.Project(
-        name=new_name,
-        description=original_project.description,
-        settings=original_project.settings.copy()
-        if original_project.settings
-        else None,
-        tags=original_project.tags,
-    )
+    try:
+        # Création du nouveau projet (flush seulement: transaction unique)
+        new_project = models.Project(
+            name=new_name,
+            description=original_project.description,
+            settings=original_project.settings.copy()
+            if original_project.settings
+            else None,
+            tags=original_project.tags,
+        )
+        db.add(new_project)
+        db.flush()
+
+        source_task_ids = [
+            task_id
+            for (task_id,) in db.query(models.Task.id)
+            .filter(models.Task.project_id == project_id)
+            .order_by(models.Task.id)
+        ]
+
+        outputs_copied = 0
+        for start in range(0, len(source_task_ids), batch_size):
+            batch = source_task_ids[start : start + batch_size]
+            task_map = _copy_tasks_batch(db, batch, new_project.id)
+            if include_outputs:
+                outputs_copied += _copy_latest_outputs(db, task_map)
+            if on_progress:
+                on_progress(start + len(batch), len(source_task_ids))
 
-    db.add(new_project)
-    db.commit()
-    db.refresh(new_project)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
 
-    # Duplication des tâches
-    for task in original_project.tasks:
-        new_task = models.Task(
-            project_id=new_project.id,
-            title=task.title,
-            description=task.description,
-            status="À faire",  # Reset du statut pour la copie
-            order=task.order,
+    if stats is not None:
+        stats.update(
+            {"tasks_copied": len(source_task_ids), "outputs_copied": outputs_copied}
         )
-        db.add(new_task)
 
-    db.commit()
     db.refresh(new_project)
     return new_project
 
 
+def _copy_tasks_batch(
+    db: Session, task_ids: List[int], new_project_id: int
+) -> Dict[int, int]:
+    """
+    Copie un lot de tâches vers le nouveau projet en un seul INSERT multi-lignes.
+
+    Les IDs créés sont lus par RETURNING, dans l'ordre des paramètres
+    (sort_by_parameter_order): chaque nouvel ID correspond à sa ligne source,
+    quelles que soient les autres tâches du projet.
+
+    Returns:
+        Mapping {ID source: nouvel ID}
+    """
+    sources = (
+        db.query(
+            models.Task.id,
+            models.Task.title,
+            models.Task.description,
+            models.Task.order,
+        )
+        .filter(models.Task.id.in_(task_ids))
+        .order_by(models.Task.id)
+        .all()
+    )
+    if not sources:
+        return {}
+
+    tasks = models.Task.__table__
+    new_ids = (
+        db.execute(
+            insert(tasks).returning(tasks.c.id, sort_by_parameter_order=True),
+            [
+                {
+                    "project_id": new_project_id,
+                    "title": source.title,
+                    "description": source.description,
+                    "status": "À faire",  # Reset du statut pour la copie
+                    "order": source.order,
+                }
+                for source in sources
+            ],
+        )
+        .scalars()
+        .all()
+    )
+    if len(new_ids) != len(sources):
+        raise ValueError(
+            f"Task copy inserted {len(new_ids)} rows for {len(sources)} source tasks"
+        )
+    return {source.id: new_id for source, new_id in zip(sources, new_ids)}
+
+
+def _copy_latest_outputs(db: Session, task_map: Dict[int, int]) -> int:
+    """
+    Copie le dernier output de chaque type par tâche, sans charger leur contenu.
+
+    Le contenu, son content_hash, sa signature MinHash et ses clés de bandes
+    LSH sont recopiés côté base (INSERT ... SELECT par output); hash et
+    signature identiques permettent la déduplication en aval. Le lien
+    vers l'exécution de workflow d'origine n'est pas conservé.
+
+    Returns:
+        Nombre d'outputs copiés
+    """
+    rows = (
+        db.query(TaskOutput.id, TaskOutput.task_id, TaskOutput.output_type)
+        .filter(TaskOutput.task_id.in_(list(task_map)))
+        .order_by(TaskOutput.created_at.desc(), TaskOutput.id.desc())
+        .all()
+    )
+
+    latest = {}
+    for output_id, task_id, output_type in rows:
+        latest.setdefault((task_id, output_type), output_id)
+    if not latest:
+        return 0
+
+    copies = [
+        {
+            "new_id": str(uuid.uuid4()),
+            "new_task_id": task_map[task_id],
+            "source_id": output_id,
+        }
+        for (task_id, _), output_id in latest.items()
+    ]
+
+    outputs = TaskOutput.__table__
+    db.execute(
+        insert(outputs).from_select(
+            [
+                "id",
+                "task_id",
+                "output_type",
+                "content",
+                "content_hash",
+                "content_minhash",
+                "output_metadata",
+                "created_at",
+            ],
+            select(
+                bindparam("new_id"),
+                bindparam("new_task_id"),
+                outputs.c.output_type,
+                outputs.c.content,
+                outputs.c.content_hash,
+                outputs.c.content_minhash,
+                outputs.c.output_metadata,
+                outputs.c.created_at,
+            ).where(outputs.c.id == bindparam("source_id")),
+        ),
+        copies,
+    )
+
+    bands = TaskOutputBand.__table__
+    db.execute(
+        insert(bands).from_select(
+            ["output_id", "band_key"],
+            select(bindparam("new_id"), bands.c.band_key).where(
+                bands.c.output_id == bindparam("source_id")
+            ),
+        ),
+        copies,
+    )
+    return len(latest)
+
+
 def get_projects_filtered(
     db: Session,
     skip: int = 0,
@@ -0,0 +1,244 @@
+"""
+Service de recherche plein texte sur les projets, tâches et outputs
+SQLite: FTS5 (bm25, snippet) - PostgreSQL: tsvector (ts_rank, ts_headline)
+"""
+
+import html
+import re
+import time
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+from app.db.search_index import SEARCH_TABLE
+from app.models.models import Task
+
+
+ENTITY_TYPES = ("project", "task", "output")
+
+MAX_QUERY_TERMS = 8
+SNIPPET_TOKENS = 16
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_END = "</mark>"
+
+# Délimiteurs passés à snippet()/ts_headline: le texte indexé (tâches, outputs
+# LLM) est échappé avant que ces sentinelles deviennent des balises <mark>
+_SENTINEL_START = "\x02"
+_SENTINEL_END = "\x03"
+
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def parse_terms(query: str) -> List[str]:
+    """Termes de la requête utilisateur (la syntaxe FTS/tsquery n'est jamais exposée)"""
+    return _TERM_RE.findall(query or "")[:MAX_QUERY_TERMS]
+
+
+def _fts5_query(terms: List[str]) -> str:
+    # Chaque terme entre guillemets, en préfixe; termes combinés en ET
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def _tsquery(terms: List[str]) -> str:
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def highlight(snippet: Optional[str]) -> str:
+    """Extrait HTML sûr: contenu échappé, seuls les termes trouvés sont balisés"""
+    escaped = html.escape(snippet or "")
+    return escaped.replace(_SENTINEL_START, HIGHLIGHT_START).replace(
+        _SENTINEL_END, HIGHLIGHT_END
+    )
+
+
+def _search_sqlite(db, terms, types, project_id, limit, offset):
+    filters = ["search_index MATCH :match", "entity_type IN :types"]
+    params: Dict[str, Any] = {"match": _fts5_query(terms), "types": list(types)}
+    if project_id is not None:
+        filters.append("project_id = :project_id")
+        params["project_id"] = project_id
+    where = " AND ".join(filters)
+
+    total = db.execute(
+        text(f"SELECT count(*) FROM {SEARCH_TABLE} WHERE {where}").bindparams(
+            bindparam("types", expanding=True)
+        ),
+        params,
+    ).scalar()
+
+    # bm25: poids nuls pour les colonnes non indexées, titre 5x le corps
+    rows = db.execute(
+        text(
+            f"""
+            SELECT entity_type, entity_id, project_id, task_id, title,
+                   snippet({SEARCH_TABLE}, -1, :hl_start, :hl_end, '…', :tokens) AS snippet,
+                   bm25({SEARCH_TABLE}, 0, 0, 0, 0, 5.0, 1.0) AS score
+            FROM {SEARCH_TABLE}
+            WHERE {where}
+            ORDER BY score
+            LIMIT :limit OFFSET :offset
+            """
+        ).bindparams(bindparam("types", expanding=True)),
+        {
+            **params,
+            "hl_start": _SENTINEL_START,
+            "hl_end": _SENTINEL_END,
+            "tokens": SNIPPET_TOKENS,
+            "limit": limit,
+            "offset": offset,
+        },
+    ).all()
+
+    # bm25 est négatif (plus petit = plus pertinent): exposé en score positif
+    return total, [
+        {
+            "type": row.entity_type,
+            "id": str(row.entity_id),
+            "project_id": row.project_id,
+            "task_id": row.task_id,
+            "title": row.title or "",
+            "snippet": highlight(row.snippet),
+            "score": round(-row.score, 4),
+        }
+        for row in rows
+    ]
+
+
+_POSTGRES_DOCUMENTS = {
+    "project": """
+        SELECT 'project' AS entity_type, CAST(p.id AS TEXT) AS entity_id, p.id AS project_id,
+               NULL::integer AS task_id, p.name AS title,
+               coalesce(p.description, p.name) AS document,
+               ts_rank(p.search_vector, q.query) AS score
+        FROM projects p, q WHERE p.search_vector @@ q.query {project_filter}
+    """,
+    "task": """
+        SELECT 'task', CAST(t.id AS TEXT), t.project_id, t.id, t.title,
+               coalesce(t.description, t.title),
+               ts_rank(t.search_vector, q.query)
+        FROM tasks t, q WHERE t.search_vector @@ q.query {project_filter}
+    """,
+    "output": """
+        SELECT 'output', o.id, t.project_id, o.task_id, '', o.content,
+               ts_rank(o.search_vector, q.query)
+        FROM task_outputs o JOIN tasks t ON t.id = o.task_id, q
+        WHERE o.search_vector @@ q.query {project_filter}
+    """,
+}
+_POSTGRES_PROJECT_COLUMNS = {"project": "p.id", "task": "t.project_id", "output": "t.project_id"}
+
+
+def _search_postgresql(db, terms, types, project_id, limit, offset):
+    parts = []
+    for entity_type in types:
+        project_filter = (
+            f"AND {_POSTGRES_PROJECT_COLUMNS[entity_type]} = :project_id"
+            if project_id is not None
+            else ""
+        )
+        parts.append(_POSTGRES_DOCUMENTS[entity_type].format(project_filter=project_filter))
+    matches = " UNION ALL ".join(parts)
+    params = {"tsquery": _tsquery(terms), "project_id": project_id}
+
+    total = db.execute(
+        text(
+            f"WITH q AS (SELECT to_tsquery('french', :tsquery) AS query) "
+            f"SELECT count(*) FROM ({matches}) m"
+        ),
+        params,
+    ).scalar()
+
+    # ts_headline (coûteux) n'est calculé que pour la page retournée
+    rows = db.execute(
+        text(
+            f"""
+            WITH q AS (SELECT to_tsquery('french', :tsquery) AS query),
+            page AS (
+                SELECT * FROM ({matches}) m
+                ORDER BY score DESC
+                LIMIT :limit OFFSET :offset
+            )
+            SELECT entity_type, entity_id, project_id, task_id, title, score,
+                   ts_headline('french', document, q.query, :headline_options) AS snippet
+            FROM page, q
+            ORDER BY score DESC
+            """
+        ),
+        {
+            **params,
+            "limit": limit,
+            "offset": offset,
+            "headline_options": (
+                f'StartSel="{_SENTINEL_START}", StopSel="{_SENTINEL_END}", '
+                f"MaxWords={SNIPPET_TOKENS}, MinWords=5, MaxFragments=1"
+            ),
+        },
+    ).all()
+
+    return total, [
+        {
+            "type": row.entity_type,
+            "id": str(row.entity_id),
+            "project_id": row.project_id,
+            "task_id": row.task_id,
+            "title": row.title or "",
+            "snippet": highlight(row.snippet),
+            "score": round(float(row.score), 4),
+        }
+        for row in rows
+    ]
+
+
+def _fill_output_titles(db: Session, results: List[Dict[str, Any]]) -> None:
+    """Les outputs prennent le titre courant de leur tâche"""
+    task_ids = {r["task_id"] for r in results if r["type"] == "output" and r["task_id"]}
+    if not task_ids:
+        return
+    titles = dict(db.query(Task.id, Task.title).filter(Task.id.in_(task_ids)).all())
+    for result in results:
+        if result["type"] == "output":
+            result["title"] = titles.get(result["task_id"], "")
+
+
+def search(
+    db: Session,
+    query: str,
+    types: Optional[List[str]] = None,
+    project_id: Optional[int] = None,
+    limit: int = 20,
+    offset: int = 0,
+) -> Dict[str, Any]:
+    """
+    Recherche classée avec extraits surlignés et pagination
+
+    Args:
+        query: Texte libre (chaque terme est cherché en préfixe, tous requis)
+        types: Restreindre à certains types d'entités (project, task, output)
+        project_id: Restreindre à un projet
+
+    Returns:
+        {query, total, limit, offset, took_ms, results}
+    """
+    started = time.perf_counter()
+    terms = parse_terms(query)
+    types = [t for t in (types or ENTITY_TYPES) if t in ENTITY_TYPES]
+
+    total, results = 0, []
+    if terms and types:
+        backend = (
+            _search_postgresql
+            if db.get_bind().dialect.name == "postgresql"
+            else _search_sqlite
+        )
+        total, results = backend(db, terms, types, project_id, limit, offset)
+        _fill_output_titles(db, results)
+
+    return {
+        "query": query,
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+        "took_ms": round((time.perf_counter() - started) * 1000, 2),
+        "results": results,
+    }
@@ -0,0 +1,338 @@
+"""
+Service de détection de quasi-doublons (MinHash + LSH)
+Empreintes calculées à la sauvegarde des outputs, clés de bandes LSH indexées en base
+"""
+
+import os
+import re
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from app.models.models import Task
+from app.models.workflow_models import TaskOutput, TaskOutputBand, TaskOutputType
+
+
+# 64 permutations en 16 bandes de 4 lignes: un couple de similarité
+# Jaccard 0.8 est candidat avec une probabilité > 99.9%, à 0.3 < 13%
+NUM_PERM = 64
+LSH_BANDS = 16
+LSH_ROWS = NUM_PERM // LSH_BANDS
+
+SHINGLE_SIZE = 3  # mots par bardeau (contenus)
+TITLE_NGRAM = 3  # caractères par n-gramme (titres)
+
+NEAR_DUPLICATE_THRESHOLD = float(os.getenv("NEAR_DUPLICATE_THRESHOLD", "0.8"))
+TITLE_SIMILARITY_THRESHOLD = 0.7  # même seuil que le merge de planning_task (Celery)
+
+_SHINGLE_MULTIPLIER = np.uint32(0x01000193)
+_WORD_HASH_BASE = 0x9E3779B1
+_MAX_WORD_BYTES = 64  # au-delà, les octets partagent le dernier poids
+
+# Permutations fixes (graine constante): les signatures stockées restent comparables
+# h -> a * h + b (mod 2^32), a impair: bijection sur 32 bits
+_rng = np.random.RandomState(0x6EEB)
+_PERM_A = (_rng.randint(0, 1 << 31, size=NUM_PERM, dtype=np.int64) * 2 + 1).astype(np.uint32)
+_PERM_B = _rng.randint(0, 1 << 31, size=NUM_PERM, dtype=np.int64).astype(np.uint32)
+
+# Octets faisant partie d'un mot: alphanumériques ASCII, "_" et tout octet
+# UTF-8 non ASCII (lettres accentuées)
+_WORD_BYTES = np.zeros(256, dtype=bool)
+for _byte in b"abcdefghijklmnopqrstuvwxyz0123456789_":
+    _WORD_BYTES[_byte] = True
+_WORD_BYTES[0x80:] = True
+
+# Poids positionnels du haché polynomial des mots (mod 2^32)
+_WORD_POWERS = np.array(
+    [pow(_WORD_HASH_BASE, i, 1 << 32) for i in range(_MAX_WORD_BYTES)], dtype=np.uint32
+)
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _mix32(values: np.ndarray) -> np.ndarray:
+    """Finaliseur (xorshift-multiply) pour répartir les bits des hachés"""
+    values = values ^ (values >> np.uint32(16))
+    values = values * np.uint32(0x45D9F3B)
+    return values ^ (values >> np.uint32(16))
+
+
+def _word_hashes(text: str) -> np.ndarray:
+    """
+    Hachés 32 bits des mots d'un texte, sans boucle Python
+
+    Le découpage en mots et le haché polynomial sont faits sur le tableau
+    d'octets UTF-8 (frontières par différence, sommes par np.add.reduceat).
+    """
+    data = np.frombuffer(text.lower().encode("utf-8"), dtype=np.uint8)
+    is_word = _WORD_BYTES[data]
+    edges = np.diff(np.concatenate(([0], is_word.view(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    if starts.size == 0:
+        return np.empty(0, dtype=np.uint32)
+    lengths = np.flatnonzero(edges == -1) - starts
+
+    positions = np.flatnonzero(is_word)
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    in_word = positions - np.repeat(starts, lengths)
+    weights = _WORD_POWERS[np.minimum(in_word, _MAX_WORD_BYTES - 1)]
+    terms = data[positions].astype(np.uint32) * weights
+    return _mix32(np.add.reduceat(terms, offsets, dtype=np.uint32))
+
+
+def _shingle_hashes(text: str, size: int = SHINGLE_SIZE) -> np.ndarray:
+    """
+    Hachés 32 bits des bardeaux de `size` mots consécutifs
+
+    Les répétitions ne sont pas éliminées: elles ne changent pas le minimum
+    et un tri coûterait plus cher que les colonnes en trop.
+    """
+    words = _word_hashes(text)
+    if len(words) <= size:
+        return words
+
+    count = len(words) - size + 1
+    shingles = words[:count].copy()
+    for offset in range(1, size):
+        shingles = shingles * _SHINGLE_MULTIPLIER + words[offset : offset + count]
+    return _mix32(shingles)
+
+
+def minhash_signature(text: str) -> Optional[np.ndarray]:
+    """
+    Signature MinHash (NUM_PERM valeurs uint32) d'un contenu
+
+    Returns:
+        None si le contenu ne contient aucun mot
+    """
+    hashes = _shingle_hashes(text or "")
+    if hashes.size == 0:
+        return None
+    # Une ligne par permutation (arithmétique modulo 2^32), minimum sur les bardeaux
+    permuted = np.multiply.outer(_PERM_A, hashes)
+    permuted += _PERM_B[:, None]
+    return permuted.min(axis=1)
+
+
+def signature_to_bytes(signature: Optional[np.ndarray]) -> Optional[bytes]:
+    """Sérialisation compacte pour TaskOutput.content_minhash (256 octets)"""
+    if signature is None:
+        return None
+    return signature.astype("<u4").tobytes()
+
+
+def signature_from_bytes(data: Optional[bytes]) -> Optional[np.ndarray]:
+    if not data or len(data) != NUM_PERM * 4:
+        return None
+    return np.frombuffer(data, dtype="<u4")
+
+
+def band_keys(signature: np.ndarray, bands: int = LSH_BANDS) -> List[bytes]:
+    """
+    Clés des bandes LSH d'une signature (TaskOutputBand.band_key)
+
+    Le numéro de bande préfixe les valeurs: deux bandes de rang différent
+    ne se confondent pas dans l'index.
+    """
+    rows = NUM_PERM // bands
+    data = signature.astype("<u4")
+    return [
+        bytes([band]) + data[band * rows : (band + 1) * rows].tobytes()
+        for band in range(bands)
+    ]
+
+
+def estimate_similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """Estimation de la similarité de Jaccard entre deux signatures"""
+    return float(np.count_nonzero(a == b)) / NUM_PERM
+
+
+class MinHashLSH:
+    """
+    Index LSH en bandes sur des signatures MinHash
+
+    Deux signatures partageant une bande complète sont candidates; la
+    similarité estimée est ensuite vérifiée sur la signature entière.
+    """
+
+    def __init__(self, bands: int = LSH_BANDS):
+        self.bands = bands
+        self.rows = NUM_PERM // bands
+        self._buckets: List[Dict[bytes, List[Hashable]]] = [{} for _ in range(bands)]
+        self._signatures: Dict[Hashable, np.ndarray] = {}
+        self._positions: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _band_keys(self, signature: np.ndarray) -> Iterable[Tuple[int, bytes]]:
+        for band in range(self.bands):
+            yield band, signature[band * self.rows : (band + 1) * self.rows].tobytes()
+
+    def add(self, key: Hashable, signature: np.ndarray) -> None:
+        self._positions.setdefault(key, len(self._positions))
+        self._signatures[key] = signature
+        for band, band_key in self._band_keys(signature):
+            self._buckets[band].setdefault(band_key, []).append(key)
+
+    def query(
+        self, signature: np.ndarray, threshold: float = NEAR_DUPLICATE_THRESHOLD
+    ) -> List[Tuple[Hashable, float]]:
+        """
+        Quasi-doublons d'une signature
+
+        Returns:
+            [(clé, similarité estimée)] par similarité décroissante,
+            puis par ordre d'ajout
+        """
+        candidates = set()
+        for band, band_key in self._band_keys(signature):
+            candidates.update(self._buckets[band].get(band_key, ()))
+
+        matches = []
+        for key in candidates:
+            similarity = estimate_similarity(signature, self._signatures[key])
+            if similarity >= threshold:
+                matches.append((key, similarity))
+        return sorted(matches, key=lambda match: (-match[1], self._positions[match[0]]))
+
+
+def find_repeated(
+    items: Iterable[Tuple[Hashable, Optional[bytes]]],
+    threshold: float = NEAR_DUPLICATE_THRESHOLD,
+) -> Dict[Hashable, Tuple[Hashable, float]]:
+    """
+    Éléments quasi identiques à un élément précédent de la séquence
+
+    Args:
+        items: (clé, signature sérialisée) dans l'ordre de lecture;
+            les éléments sans signature ne sont jamais signalés
+
+    Returns:
+        {clé: (clé du premier élément similaire, similarité estimée)}
+    """
+    index = MinHashLSH()
+    repeated: Dict[Hashable, Tuple[Hashable, float]] = {}
+    for key, data in items:
+        signature = signature_from_bytes(data)
+        if signature is None:
+            continue
+        matches = index.query(signature, threshold)
+        if matches:
+            repeated[key] = matches[0]
+        else:
+            index.add(key, signature)
+    return repeated
+
+
+def index_output_bands(db: Session, output_id: str, signature: Optional[np.ndarray]) -> None:
+    """Enregistrer les clés de bandes LSH d'un output (sans effet sans signature)"""
+    if signature is None:
+        return
+    db.execute(
+        insert(TaskOutputBand.__table__),
+        [{"output_id": output_id, "band_key": key} for key in band_keys(signature)],
+    )
+
+
+def delete_output_bands(db: Session, output_ids) -> None:
+    """
+    Supprimer les clés de bandes d'outputs (liste d'IDs ou sous-requête)
+
+    À appeler avant une suppression en masse des outputs: SQLite n'applique
+    pas le ON DELETE CASCADE, et une bande orpheline resterait candidate.
+    """
+    db.execute(
+        delete(TaskOutputBand).where(TaskOutputBand.output_id.in_(output_ids))
+    )
+
+
+def find_near_duplicate_output(
+    db: Session,
+    task_id: int,
+    output_type: TaskOutputType,
+    signature: Optional[np.ndarray],
+    threshold: float = NEAR_DUPLICATE_THRESHOLD,
+) -> Optional[Tuple[str, float]]:
+    """
+    Output du même type, dans une autre tâche du projet, quasi identique
+
+    Les candidats sont lus par l'index des clés de bandes (task_output_bands):
+    seuls les outputs partageant une bande sont chargés, puis vérifiés sur la
+    signature entière. Les versions successives d'une même tâche ne sont pas
+    comparées: une révision proche de la précédente est attendue, pas un doublon.
+
+    Returns:
+        (output_id, similarité estimée) du plus proche, ou None
+    """
+    if signature is None:
+        return None
+    project_id = db.query(Task.project_id).filter(Task.id == task_id).scalar()
+    if project_id is None:
+        return None
+
+    sharing_a_band = select(TaskOutputBand.output_id).where(
+        TaskOutputBand.band_key.in_(band_keys(signature))
+    )
+    candidates = (
+        db.query(TaskOutput.id, TaskOutput.content_minhash)
+        .join(Task, TaskOutput.task_id == Task.id)
+        .filter(
+            TaskOutput.id.in_(sharing_a_band),
+            Task.project_id == project_id,
+            TaskOutput.output_type == output_type,
+            TaskOutput.task_id != task_id,
+        )
+        .order_by(TaskOutput.created_at, TaskOutput.id)
+        .all()
+    )
+
+    index = MinHashLSH()
+    for output_id, data in candidates:
+        candidate = signature_from_bytes(data)
+        if candidate is not None:
+            index.add(output_id, candidate)
+    matches = index.query(signature, threshold)
+    return matches[0] if matches else None
+
+
+def _title_ngrams(title: str) -> frozenset:
+    normalized = " ".join(_WORD_RE.findall(title.lower()))
+    if len(normalized) <= TITLE_NGRAM:
+        return frozenset([normalized]) if normalized else frozenset()
+    return frozenset(
+        normalized[i : i + TITLE_NGRAM] for i in range(len(normalized) - TITLE_NGRAM + 1)
+    )
+
+
+class TitleIndex:
+    """
+    Détection de titres quasi identiques (Jaccard exact sur n-grammes de caractères)
+
+    Les titres sont trop courts pour MinHash: les ensembles de n-grammes
+    sont comparés directement.
+    """
+
+    def __init__(self, titles: Sequence[str] = (), threshold: float = TITLE_SIMILARITY_THRESHOLD):
+        self.threshold = threshold
+        self._entries: List[Tuple[str, frozenset]] = []
+        for title in titles:
+            self.add(title)
+
+    def add(self, title: str) -> None:
+        self._entries.append((title, _title_ngrams(title)))
+
+    def find(self, title: str) -> Optional[Tuple[str, float]]:
+        """(titre existant le plus proche, similarité) au-delà du seuil, ou None"""
+        ngrams = _title_ngrams(title)
+        if not ngrams:
+            return None
+        best = None
+        for existing, existing_ngrams in self._entries:
+            union = len(ngrams | existing_ngrams)
+            similarity = len(ngrams & existing_ngrams) / union if union else 0.0
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (existing, similarity)
+        return best
@@ -0,0 +1,195 @@
+"""
+Service de conformité de style (profil Boulet)
+Score en processus d'un texte généré contre le profil issu de l'analyse du blog
+"""
+
+import json
+import logging
+import math
+import os
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Profil de référence: moyennes du rapport de analyze_blog.py
+# (blog_analysis_report.json, export WordPress du blog)
+DEFAULT_PROFILE = {
+    "sentence_length": 11.30,  # mots par phrase
+    "personal_pronouns": 0.0337,  # ratios par mot
+    "questions": 0.0082,
+    "exclamations": 0.0122,
+    "informal": 0.0035,
+    "signature_expressions": 3,  # expressions signature distinctes attendues
+}
+
+# Poids des métriques dans le score global (somme = 1)
+METRIC_WEIGHTS = {
+    "sentence_length": 0.25,
+    "personal_pronouns": 0.25,
+    "signature_expressions": 0.2,
+    "informal": 0.1,
+    "questions": 0.1,
+    "exclamations": 0.1,
+}
+
+STYLE_CONFORMANCE_THRESHOLD = float(os.getenv("STYLE_CONFORMANCE_THRESHOLD", "0.7"))
+
+# En deçà, les ratios ne sont pas significatifs: le texte n'est jamais conforme
+STYLE_MIN_WORDS = int(os.getenv("STYLE_MIN_WORDS", "150"))
+
+# Mêmes définitions que analyze_blog.py, pour rester comparable au profil
+SENTENCE_SPLIT_RE = re.compile(r"[.!?]+")
+PERSONAL_PRONOUN_RE = re.compile(r"\b(je|j\'|me|moi|mon|ma|mes|nous|notre|nos)\b")
+INFORMAL_EXPRESSIONS = (
+    "bref", "en fait", "du coup", "genre", "style", "truc", "machin", "super",
+    "cool", "top", "génial", "excellent", "incroyable", "impressionnant",
+)
+
+
+def _alternation(terms: Iterable[str]) -> "re.Pattern":
+    """Regex unique sur frontières de mots, les termes longs d'abord (plus long à gauche)"""
+    ordered = sorted({term.lower() for term in terms if term}, key=len, reverse=True)
+    if not ordered:
+        return re.compile(r"(?!x)x")
+    return re.compile(
+        r"(?<!\w)(?:" + "|".join(re.escape(term) for term in ordered) + r")(?!\w)"
+    )
+
+
+INFORMAL_RE = _alternation(INFORMAL_EXPRESSIONS)
+
+
+def load_profile(path: Optional[str] = None) -> Dict[str, float]:
+    """
+    Profil de style, éventuellement relu d'un rapport analyze_blog.py
+
+    STYLE_PROFILE_PATH (ou path) pointe vers un blog_analysis_report.json;
+    sans fichier lisible, le profil par défaut s'applique.
+    """
+    path = path or os.getenv("STYLE_PROFILE_PATH")
+    profile = dict(DEFAULT_PROFILE)
+    if not path:
+        return profile
+    try:
+        with open(path, encoding="utf-8") as f:
+            report = json.load(f)
+        writing = report["writing_style"]
+        profile.update(
+            {
+                "sentence_length": report["content_analysis"]["avg_sentence_length"],
+                "personal_pronouns": writing["avg_personal_pronouns"],
+                "questions": writing["avg_questions"],
+                "exclamations": writing["avg_exclamations"],
+                "informal": writing["avg_informal"],
+            }
+        )
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning("Profil de style illisible (%s), profil par défaut: %s", path, e)
+    return profile
+
+
+STYLE_PROFILE = load_profile()
+
+
+@lru_cache(maxsize=32)
+def compile_expressions(expressions: Tuple[str, ...]) -> "re.Pattern":
+    """Matcher des expressions signature, compilé une fois par ensemble d'expressions"""
+    return _alternation(expressions)
+
+
+def template_expressions(db: Session) -> Tuple[str, ...]:
+    """
+    Expressions signature de tous les templates actifs (tous niveaux)
+
+    Lues dans le cache des templates compilés: aucune requête hors rechargement.
+    """
+    from app.services.template_service import template_cache
+
+    expressions = set()
+    for compiled in template_cache.get_all(db):
+        for level in compiled.expressions.values():
+            if isinstance(level, dict):
+                expressions.update(
+                    value.strip() for value in level.values() if isinstance(value, str)
+                )
+    return tuple(sorted(expression for expression in expressions if expression))
+
+
+def _closeness(value: float, target: float) -> float:
+    """
+    1 à la cible, décroît avec l'écart relatif (symétrique en plus ou en moins)
+
+    Racine du rapport min/max: un écart d'un facteur 4 vaut 0.5.
+    """
+    if target <= 0:
+        return 1.0
+    if value <= 0:
+        return 0.0
+    return math.sqrt(min(value, target) / max(value, target))
+
+
+def score_style(
+    text: str,
+    expressions: Iterable[str] = (),
+    profile: Optional[Dict[str, float]] = None,
+    threshold: float = STYLE_CONFORMANCE_THRESHOLD,
+) -> Dict[str, Any]:
+    """
+    Score de conformité d'un texte au profil de style
+
+    Chaque métrique vaut 1 à la cible du profil; le score est leur moyenne
+    pondérée. Un passage par expression régulière précompilée par famille de
+    termes: coût de l'ordre de la milliseconde pour un article.
+    """
+    profile = profile or STYLE_PROFILE
+    words = len(text.split())
+    sentences = sum(1 for s in SENTENCE_SPLIT_RE.split(text) if s.strip())
+    lowered = text.lower()
+
+    def ratio(count: int) -> float:
+        return count / words if words else 0.0
+
+    found = Counter(
+        compile_expressions(tuple(sorted(set(expressions)))).findall(lowered)
+    )
+    values = {
+        "sentence_length": words / sentences if sentences else 0.0,
+        "personal_pronouns": ratio(len(PERSONAL_PRONOUN_RE.findall(lowered))),
+        "questions": ratio(text.count("?")),
+        "exclamations": ratio(text.count("!")),
+        "informal": ratio(len(INFORMAL_RE.findall(lowered))),
+        "signature_expressions": len(found),
+    }
+
+    metrics = {}
+    for name, value in values.items():
+        target = profile[name]
+        if name == "signature_expressions":
+            # Plafonné: au-delà de la cible, pas de pénalité
+            closeness = min(1.0, value / target) if target else 1.0
+        else:
+            closeness = _closeness(value, target)
+        metrics[name] = {
+            "value": round(value, 4),
+            "target": round(target, 4),
+            "score": round(closeness, 3),
+        }
+
+    score = math.fsum(METRIC_WEIGHTS[name] * metrics[name]["score"] for name in metrics)
+    return {
+        "score": round(score, 3),
+        "conforms": words >= STYLE_MIN_WORDS and score >= threshold,
+        "word_count": words,
+        "metrics": metrics,
+        "expressions_found": sorted(found),
+    }
+
+
+def score_text(db: Session, text: str) -> Dict[str, Any]:
+    """Score d'un texte avec les expressions signature des templates actifs"""
+    return score_style(text, expressions=template_expressions(db))
@@ -1,8 +1,20 @@
+from datetime import datetime, timezone
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session
+from app.db.fingerprint import rows_fingerprint, schema_columns
 from app.models import models
+from app.models.workflow_models import TaskOutput
 from app.schemas import schemas
-from app.services.exceptions import ProjectNotFoundException
-from typing import List, Optional
+from app.services import similarity_service
+from app.services.exceptions import (
+    InvalidTaskDataException,
+    ProjectNotFoundException,
+    TaskNotFoundException,
+)
+from typing import Any, Dict, List, Optional
+
+# Écart entre deux ordres consécutifs: déplacer une carte ne réécrit qu'une ligne
+ORDER_GAP = 1024
 
 
 def create_task(db: Session, task: schemas.TaskCreate) -> models.Task:
@@ -13,11 +25,21 @@ def create_task(db: Session, task: schemas.TaskCreate) -> models.Task:
     if not db_project:
         raise ProjectNotFoundException(task.project_id)
 
+    order = task.order
+    if order is None:
+        # Sans ordre explicite, la tâche va en fin de projet, à ORDER_GAP de la dernière
+        last_order = (
+            db.query(func.max(models.Task.order))
+            .filter(models.Task.project_id == task.project_id)
+            .scalar()
+        )
+        order = order_between(last_order, None)
+
     db_task = models.Task(
         title=task.title,
         description=task.description,
         status=task.status,
-        order=task.order,
+        order=order,
         project_id=task.project_id,
     )
     db.add(db_task)
@@ -42,6 +64,16 @@ def get_tasks_by_project(
     )
 
 
+def get_project_tasks_fingerprint(db: Session, project_id: int) -> str:
+    """Empreinte des tâches d'un projet (colonnes de schemas.Task, requête Core)"""
+    rows = db.execute(
+        select(*schema_columns(models.Task, schemas.Task))
+        .where(models.Task.project_id == project_id)
+        .order_by(models.Task.id)
+    ).all()
+    return rows_fingerprint(rows)
+
+
 def update_task(
     db: Session, task_id: int, task_update: schemas.TaskUpdate
 ) -> Optional[models.Task]:
@@ -76,3 +108,164 @@ def delete_task(db: Session, task_id: int) -> Optional[models.Task]:
     db.delete(db_task)
     db.commit()
     return db_task
+
+
+def order_between(previous: Optional[int], next_: Optional[int]) -> Optional[int]:
+    """
+    Ordre à donner à une tâche placée entre deux voisines.
+
+    Retourne None quand il n'y a plus d'entier libre entre les deux:
+    les ordres du projet doivent alors être rééquilibrés.
+    """
+    if previous is None and next_ is None:
+        return ORDER_GAP
+    if previous is None:
+        return next_ - ORDER_GAP
+    if next_ is None:
+        return previous + ORDER_GAP
+    if next_ - previous < 2:
+        return None
+    return (previous + next_) // 2
+
+
+def rebalance_orders(db: Session, project_id: int) -> Dict[int, int]:
+    """
+    Réespace les ordres des tâches d'un projet (ORDER_GAP, 2*ORDER_GAP, ...).
+
+    Opération rare (plus d'espace entre deux voisines); pas de commit.
+
+    Returns:
+        Mapping {task_id: nouvel ordre}
+    """
+    task_ids = [
+        task_id
+        for (task_id,) in db.query(models.Task.id)
+        .filter(models.Task.project_id == project_id)
+        .order_by(models.Task.order, models.Task.id)
+    ]
+    orders = {task_id: (i + 1) * ORDER_GAP for i, task_id in enumerate(task_ids)}
+    if orders:
+        db.execute(
+            update(models.Task),
+            [{"id": task_id, "order": order} for task_id, order in orders.items()],
+        )
+    return orders
+
+
+def bulk_update(db: Session, bulk: schemas.TaskBulkUpdate) -> Dict[str, Any]:
+    """
+    Applique des changements de statut/ordre et des suppressions en une transaction.
+
+    Les mises à jour sont envoyées en executemany. Un déplacement relatif
+    (after_id / before_id) calcule un ordre entre les deux voisines, sans
+    toucher aux autres tâches sauf s'il faut rééquilibrer le projet.
+
+    Raises:
+        TaskNotFoundException: Si une tâche référencée n'existe pas
+        InvalidTaskDataException: Si un déplacement référence une tâche d'un autre projet
+    """
+    referenced = set(bulk.delete_ids)
+    for item in bulk.updates:
+        referenced.update(
+            task_id for task_id in (item.id, item.after_id, item.before_id) if task_id
+        )
+
+    rows = (
+        db.query(models.Task.id, models.Task.project_id, models.Task.order)
+        .filter(models.Task.id.in_(referenced))
+        .all()
+    )
+    projects = {task_id: project_id for task_id, project_id, _ in rows}
+    orders = {task_id: order for task_id, _, order in rows}
+    missing = sorted(referenced - set(projects))
+    if missing:
+        raise TaskNotFoundException(missing[0])
+
+    now = datetime.now(timezone.utc)
+    pending: Dict[int, Dict[str, Any]] = {}
+    touched = set()
+    reordered = set()
+    rebalanced = False
+
+    try:
+        for item in bulk.updates:
+            values = pending.setdefault(item.id, {"id": item.id, "updated_at": now})
+            if item.status is not None:
+                values["status"] = item.status
+
+            new_order = item.order
+            if new_order is None and (item.after_id or item.before_id):
+                neighbours = [n for n in (item.after_id, item.before_id) if n]
+                if any(projects[n] != projects[item.id] for n in neighbours):
+                    raise InvalidTaskDataException(
+                        f"Task {item.id} can only be moved next to tasks of its project"
+                    )
+                previous = orders[item.after_id] if item.after_id else None
+                next_ = orders[item.before_id] if item.before_id else None
+                new_order = order_between(previous, next_)
+                if new_order is None:
+                    # Écrire les changements en attente avant de réespacer le projet
+                    _flush_pending(db, pending)
+                    new_orders = rebalance_orders(db, projects[item.id])
+                    orders.update(new_orders)
+                    reordered.update(new_orders)
+                    rebalanced = True
+                    values = pending.setdefault(item.id, {"id": item.id, "updated_at": now})
+                    previous = orders[item.after_id] if item.after_id else None
+                    next_ = orders[item.before_id] if item.before_id else None
+                    new_order = order_between(previous, next_)
+
+            if new_order is not None:
+                values["order"] = new_order
+                orders[item.id] = new_order
+            touched.add(item.id)
+
+        _flush_pending(db, pending)
+
+        deleted = 0
+        if bulk.delete_ids:
+            # Suppression en masse sans cascade ORM: les outputs (FK non nulle,
+            # sans ondelete) et leurs bandes LSH partent d'abord
+            similarity_service.delete_output_bands(
+                db,
+                select(TaskOutput.id).where(TaskOutput.task_id.in_(bulk.delete_ids)),
+            )
+            db.query(TaskOutput).filter(TaskOutput.task_id.in_(bulk.delete_ids)).delete(
+                synchronize_session=False
+            )
+            deleted = (
+                db.query(models.Task)
+                .filter(models.Task.id.in_(bulk.delete_ids))
+                .delete(synchronize_session=False)
+            )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    touched -= set(bulk.delete_ids)
+    # Tâches réordonnées uniquement par le rééquilibrage, comptées à part
+    reordered -= touched | set(bulk.delete_ids)
+    returned = touched | reordered
+    tasks = (
+        db.query(models.Task)
+        .filter(models.Task.id.in_(returned))
+        .order_by(models.Task.order, models.Task.id)
+        .all()
+        if returned
+        else []
+    )
+    return {
+        "updated": len(touched),
+        "deleted": deleted,
+        "rebalanced": rebalanced,
+        "reordered": len(reordered),
+        "tasks": tasks,
+    }
+
+
+def _flush_pending(db: Session, pending: Dict[int, Dict[str, Any]]) -> None:
+    """Envoie les mises à jour accumulées en un executemany puis vide le tampon"""
+    if pending:
+        db.execute(update(models.Task), list(pending.values()))
+        pending.clear()
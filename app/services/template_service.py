@@ -2,16 +2,33 @@
 Service pour la gestion des templates de blog basés sur l'analyse du blog Boulet.
 """
 
+import copy
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
-from typing import List, Optional, Dict, Any
+from sqlalchemy import and_, func, select
+from typing import Callable, List, Optional, Dict, Any
 
+from app.db.fingerprint import rows_fingerprint, schema_columns
 from app.models.models import BlogTemplate, Project, Task
+from app.schemas import schemas
 from app.schemas.schemas import (
     BlogTemplateCreate,
     BlogTemplateUpdate,
     TemplateCustomization,
 )
+from app.services.task_service import ORDER_GAP
+
+logger = logging.getLogger(__name__)
+
+# Durée de vie du cache: borne le délai de propagation entre workers
+TEMPLATE_CACHE_TTL = float(os.getenv("TEMPLATE_CACHE_TTL", "300"))
+
+# Niveaux toujours présents dans la distribution des difficultés
+TEMPLATE_DIFFICULTIES = ["Facile", "Moyen", "Avancé"]
 
 
 def get_templates(
@@ -33,11 +50,19 @@ def get_templates(
 
     Returns:
         Liste des templates correspondant aux critères
-    """
-    query = db.query(BlogTemplate)
 
+    Les templates actifs sont servis depuis le cache, sans requête.
+    """
     if active_only:
-        query = query.filter(BlogTemplate.is_active == True)
+        return [
+            compiled.template
+            for compiled in template_cache.get_all(db)
+            if (not category or compiled.template.category == category)
+            and (not difficulty or compiled.template.difficulty == difficulty)
+            and (not tone or compiled.template.tone == tone)
+        ]
+
+    query = db.query(BlogTemplate)
 
     if category:
         query = query.filter(BlogTemplate.category == category)
@@ -51,9 +76,9 @@ def get_templates(
     return query.order_by(BlogTemplate.name).all()
 
 
-def get_template_by_id(db: Session, template_id: int) -> Optional[BlogTemplate]:
+def get_template_by_id(db: Session, template_id: int) -> Optional[schemas.BlogTemplate]:
     """
-    Récupère un template par son ID.
+    Récupère un template actif par son ID (depuis le cache).
 
     Args:
         db: Session de base de données
@@ -62,16 +87,13 @@ def get_template_by_id(db: Session, template_id: int) -> Optional[BlogTemplate]:
     Returns:
         Template trouvé ou None
     """
-    return (
-        db.query(BlogTemplate)
-        .filter(and_(BlogTemplate.id == template_id, BlogTemplate.is_active == True))
-        .first()
-    )
+    compiled = template_cache.get_by_id(db, template_id)
+    return compiled.template if compiled else None
 
 
-def get_template_by_slug(db: Session, slug: str) -> Optional[BlogTemplate]:
+def get_template_by_slug(db: Session, slug: str) -> Optional[schemas.BlogTemplate]:
     """
-    Récupère un template par son slug.
+    Récupère un template actif par son slug (depuis le cache).
 
     Args:
         db: Session de base de données
@@ -80,9 +102,15 @@ def get_template_by_slug(db: Session, slug: str) -> Optional[BlogTemplate]:
     Returns:
         Template trouvé ou None
     """
+    compiled = template_cache.get_by_slug(db, slug)
+    return compiled.template if compiled else None
+
+
+def _get_db_template(db: Session, template_id: int) -> Optional[BlogTemplate]:
+    """Template actif chargé depuis la base (pour les écritures)."""
     return (
         db.query(BlogTemplate)
-        .filter(and_(BlogTemplate.slug == slug, BlogTemplate.is_active == True))
+        .filter(and_(BlogTemplate.id == template_id, BlogTemplate.is_active == True))
         .first()
     )
 
@@ -102,6 +130,7 @@ def create_template(db: Session, template: BlogTemplateCreate) -> BlogTemplate:
     db.add(db_template)
     db.commit()
     db.refresh(db_template)
+    template_cache.invalidate()
     return db_template
 
 
@@ -119,16 +148,17 @@ def update_template(
     Returns:
         Template mis à jour ou None si non trouvé
     """
-    db_template = get_template_by_id(db, template_id)
+    db_template = _get_db_template(db, template_id)
     if not db_template:
         return None
 
     update_data = template_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_template, field, value)
+    for field_name, value in update_data.items():
+        setattr(db_template, field_name, value)
 
     db.commit()
     db.refresh(db_template)
+    template_cache.invalidate()
     return db_template
 
 
@@ -143,13 +173,14 @@ def deactivate_template(db: Session, template_id: int) -> Optional[BlogTemplate]
     Returns:
         Template désactivé ou None si non trouvé
     """
-    db_template = get_template_by_id(db, template_id)
+    db_template = _get_db_template(db, template_id)
     if not db_template:
         return None
 
     db_template.is_active = False
     db.commit()
     db.refresh(db_template)
+    template_cache.invalidate()
     return db_template
 
 
@@ -168,9 +199,10 @@ def create_project_from_template(
     Returns:
         Projet créé ou None si template non trouvé
     """
-    template = get_template_by_id(db, template_id)
-    if not template:
+    compiled = template_cache.get_by_id(db, template_id)
+    if not compiled:
         return None
+    template = compiled.template
 
     try:
         # Création du projet avec nom personnalisé via project_service
@@ -187,7 +219,7 @@ def create_project_from_template(
         db_project = create_project(db=db, project=project_data, commit=False)
 
         # Génération des tâches basées sur la structure du template
-        tasks = _generate_tasks_from_template(template, customization)
+        tasks = compiled.generate_tasks(customization)
 
         # Création des tâches
         for i, task_data in enumerate(tasks):
@@ -195,7 +227,7 @@ def create_project_from_template(
                 project_id=db_project.id,
                 title=task_data["title"],
                 description=task_data["description"],
-                order=i + 1,
+                order=(i + 1) * ORDER_GAP,
                 status="À faire",
             )
             db.add(task)
@@ -233,25 +265,35 @@ def _generate_tasks_from_template(
     Returns:
         Liste des tâches à créer
     """
-    structure = template.template_structure
-    expressions = template.sample_expressions or {}
+    return compile_template(template).generate_tasks(customization)
 
-    # Sélection des expressions selon le niveau de localisation
-    level_expressions = expressions.get(customization.localization_level, {})
 
-    # Use Strategy Pattern to get the appropriate task generator
-    generator_func_name = TASK_GENERATORS.get(template.slug)
-    if generator_func_name:
-        # Get the actual function by name
-        generator_func = globals()[generator_func_name]
-        tasks = generator_func(customization, level_expressions)
-    else:
-        # Generic fallback for templates without specific logic
-        tasks = []
-        for step in structure.get("steps", []):
-            tasks.append({"title": step["title"], "description": step["description"]})
+def _generic_steps_generator(
+    steps: List[Dict[str, str]],
+) -> Callable[[TemplateCustomization, Dict[str, str]], List[Dict[str, str]]]:
+    """Générateur générique: les étapes de template_structure, figées à la compilation."""
+
+    def generate(
+        customization: TemplateCustomization, expressions: Dict[str, str]
+    ) -> List[Dict[str, str]]:
+        return [dict(step) for step in steps]
+
+    return generate
+
+
+def preview_template_tasks(
+    db: Session, template_id: int, customization: TemplateCustomization
+) -> Optional[List[Dict[str, str]]]:
+    """
+    Aperçu des tâches d'un template, sans création ni requête (cache).
 
-    return tasks
+    Returns:
+        Liste des tâches ou None si template non trouvé
+    """
+    compiled = template_cache.get_by_id(db, template_id)
+    if not compiled:
+        return None
+    return compiled.generate_tasks(customization)
 
 
 def _generate_guide_pratique_tasks(
@@ -342,6 +384,186 @@ def _generate_comparaison_analyse_tasks(
     ]
 
 
+# ====== CACHE DES TEMPLATES COMPILÉS ======
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """Template actif détaché de la session, avec son générateur de tâches résolu."""
+
+    template: schemas.BlogTemplate
+    generator: Callable[[TemplateCustomization, Dict[str, str]], List[Dict[str, str]]]
+    expressions: Dict[str, Dict[str, str]] = field(default_factory=dict)
+
+    def generate_tasks(self, customization: TemplateCustomization) -> List[Dict[str, str]]:
+        # Sélection des expressions selon le niveau de localisation
+        level_expressions = self.expressions.get(customization.localization_level, {})
+        return self.generator(customization, level_expressions)
+
+
+def compile_template(template: BlogTemplate) -> CompiledTemplate:
+    """Résout une fois le générateur (Strategy Pattern) et fige les données du template."""
+    generator_func_name = TASK_GENERATORS.get(template.slug)
+    if generator_func_name:
+        generator = globals()[generator_func_name]
+    else:
+        # Generic fallback for templates without specific logic
+        steps = [
+            {"title": step["title"], "description": step["description"]}
+            for step in (template.template_structure or {}).get("steps", [])
+        ]
+        generator = _generic_steps_generator(steps)
+
+    return CompiledTemplate(
+        template=schemas.BlogTemplate.model_validate(template),
+        generator=generator,
+        expressions=dict(template.sample_expressions or {}),
+    )
+
+
+@dataclass(frozen=True)
+class _TemplateSnapshot:
+    version: int
+    loaded_at: float
+    digest: str
+    ordered: List[CompiledTemplate]
+    by_id: Dict[int, CompiledTemplate]
+    by_slug: Dict[str, CompiledTemplate]
+
+
+class TemplateCache:
+    """
+    Cache en mémoire versionné des templates actifs compilés.
+
+    Chargé en une requête (au démarrage ou au premier accès), invalidé par les
+    écritures du service. Un snapshot chargé pendant une invalidation concurrente
+    n'est pas installé (comparaison de version). Le TTL borne la durée pendant
+    laquelle un autre worker peut servir une version périmée.
+    """
+
+    def __init__(self, ttl: float = TEMPLATE_CACHE_TTL, clock=time.monotonic):
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._version = 0
+        self._snapshot: Optional[_TemplateSnapshot] = None
+        self._stats: Optional[tuple] = None  # (version, loaded_at, stats)
+        self.loads = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def invalidate(self) -> None:
+        """Périme le snapshot courant; le prochain accès recharge."""
+        with self._lock:
+            self._version += 1
+            self._snapshot = None
+            self._stats = None
+
+    def load(self, db: Session) -> _TemplateSnapshot:
+        """Charge et compile tous les templates actifs."""
+        version = self._version
+        templates = (
+            db.query(BlogTemplate)
+            .filter(BlogTemplate.is_active == True)
+            .order_by(BlogTemplate.name)
+            .all()
+        )
+        ordered = [compile_template(template) for template in templates]
+        snapshot = _TemplateSnapshot(
+            version=version,
+            loaded_at=self._clock(),
+            digest=rows_fingerprint(
+                [compiled.template.model_dump_json()] for compiled in ordered
+            ),
+            ordered=ordered,
+            by_id={c.template.id: c for c in ordered},
+            by_slug={c.template.slug: c for c in ordered},
+        )
+        with self._lock:
+            if self._version == version:
+                self._snapshot = snapshot
+                self.loads += 1
+        return snapshot
+
+    def _current(self, db: Session) -> _TemplateSnapshot:
+        snapshot = self._snapshot
+        if snapshot is None or self._clock() - snapshot.loaded_at > self.ttl:
+            snapshot = self.load(db)
+        return snapshot
+
+    def get_all(self, db: Session) -> List[CompiledTemplate]:
+        return self._current(db).ordered
+
+    def digest(self, db: Session) -> str:
+        """Empreinte du snapshot courant (calculée une fois par chargement)."""
+        return self._current(db).digest
+
+    def get_by_id(self, db: Session, template_id: int) -> Optional[CompiledTemplate]:
+        return self._current(db).by_id.get(template_id)
+
+    def get_by_slug(self, db: Session, slug: str) -> Optional[CompiledTemplate]:
+        return self._current(db).by_slug.get(slug)
+
+    def get_stats(self, db: Session) -> Dict[str, Any]:
+        """Statistiques des templates actifs, recalculées après invalidation ou TTL."""
+        cached = self._stats
+        if (
+            cached is not None
+            and cached[0] == self._version
+            and self._clock() - cached[1] <= self.ttl
+        ):
+            return copy.deepcopy(cached[2])
+
+        version = self._version
+        stats = compute_template_stats(db)
+        with self._lock:
+            if self._version == version:
+                self._stats = (version, self._clock(), stats)
+        return copy.deepcopy(stats)
+
+
+template_cache = TemplateCache()
+
+
+def warm_template_cache() -> int:
+    """
+    Précharge le cache au démarrage de l'application.
+
+    Désactivable via TEMPLATE_CACHE_WARMUP=false. Retourne le nombre de
+    templates chargés (0 en cas d'erreur: le cache se chargera au premier accès).
+    """
+    if os.getenv("TEMPLATE_CACHE_WARMUP", "true").lower() != "true":
+        return 0
+
+    from app.db.config import SessionLocal
+
+    db = SessionLocal()
+    try:
+        return len(template_cache.load(db).ordered)
+    except Exception as e:
+        logger.warning("Préchargement du cache des templates impossible: %s", e)
+        return 0
+    finally:
+        db.close()
+
+
+def get_templates_fingerprint(db: Session, active_only: bool = True) -> str:
+    """
+    Empreinte de la liste des templates (validateur ETag).
+
+    Templates actifs: empreinte du snapshot en cache, sans requête. Sinon,
+    empreinte des colonnes exposées lues par une requête Core.
+    """
+    if active_only:
+        return template_cache.digest(db)
+    rows = db.execute(
+        select(*schema_columns(BlogTemplate, schemas.BlogTemplate)).order_by(BlogTemplate.id)
+    ).all()
+    return rows_fingerprint(rows)
+
+
 def get_template_categories(db: Session) -> List[str]:
     """
     Récupère toutes les catégories de templates disponibles.
@@ -350,55 +572,73 @@ def get_template_categories(db: Session) -> List[str]:
         db: Session de base de données
 
     Returns:
-        Liste des catégories uniques
+        Liste des catégories uniques, triées
     """
-    categories = (
-        db.query(BlogTemplate.category)
-        .filter(BlogTemplate.is_active == True)
-        .distinct()
-        .all()
-    )
+    return get_template_stats(db)["categories"]
 
-    return [cat[0] for cat in categories if cat[0]]
 
-
-def get_template_stats(db: Session) -> Dict[str, Any]:
+def compute_template_stats(db: Session) -> Dict[str, Any]:
     """
-    Récupère les statistiques des templates.
+    Calcule les statistiques des templates actifs en une seule requête groupée.
 
     Args:
         db: Session de base de données
 
     Returns:
-        Dictionnaire avec les statistiques
+        Dictionnaire avec les statistiques et les répartitions
     """
-    total_templates = (
-        db.query(BlogTemplate).filter(BlogTemplate.is_active == True).count()
+    rows = (
+        db.query(
+            BlogTemplate.category,
+            BlogTemplate.tone,
+            BlogTemplate.difficulty,
+            BlogTemplate.is_boulet_style,
+            func.count(BlogTemplate.id),
+        )
+        .filter(BlogTemplate.is_active == True)
+        .group_by(
+            BlogTemplate.category,
+            BlogTemplate.tone,
+            BlogTemplate.difficulty,
+            BlogTemplate.is_boulet_style,
+        )
+        .all()
     )
 
-    categories = get_template_categories(db)
-
-    difficulty_stats = {}
-    for difficulty in ["Facile", "Moyen", "Avancé"]:
-        count = (
-            db.query(BlogTemplate)
-            .filter(
-                and_(
-                    BlogTemplate.difficulty == difficulty,
-                    BlogTemplate.is_active == True,
-                )
-            )
-            .count()
-        )
-        difficulty_stats[difficulty] = count
+    total_templates = 0
+    boulet_style_templates = 0
+    difficulty_stats = {difficulty: 0 for difficulty in TEMPLATE_DIFFICULTIES}
+    category_stats: Dict[str, int] = {}
+    tone_stats: Dict[str, int] = {}
+    for category, tone, difficulty, is_boulet_style, count in rows:
+        total_templates += count
+        if is_boulet_style:
+            boulet_style_templates += count
+        if difficulty:
+            difficulty_stats[difficulty] = difficulty_stats.get(difficulty, 0) + count
+        if category:
+            category_stats[category] = category_stats.get(category, 0) + count
+        if tone:
+            tone_stats[tone] = tone_stats.get(tone, 0) + count
 
     return {
         "total_templates": total_templates,
-        "categories": categories,
+        "categories": sorted(category_stats),
         "difficulty_distribution": difficulty_stats,
-        "boulet_style_templates": db.query(BlogTemplate)
-        .filter(
-            and_(BlogTemplate.is_boulet_style == True, BlogTemplate.is_active == True)
-        )
-        .count(),
+        "category_distribution": dict(sorted(category_stats.items())),
+        "tone_distribution": dict(sorted(tone_stats.items())),
+        "boulet_style_templates": boulet_style_templates,
     }
+
+
+def get_template_stats(db: Session) -> Dict[str, Any]:
+    """
+    Récupère les statistiques des templates (snapshot en cache).
+
+    Args:
+        db: Session de base de données
+
+    Returns:
+        Dictionnaire avec les statistiques
+    """
+    return template_cache.get_stats(db)
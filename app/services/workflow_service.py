@@ -9,6 +9,11 @@ from datetime import datetime, timezone
 
 from app.models.workflow_models import WorkflowExecution, WorkflowType, WorkflowStatus
 from app.models.job_models import AsyncJob
+from app.exceptions import WorkflowNotFound, WorkflowNotResumable
+
+
+# Étapes du workflow complet, dans l'ordre d'exécution
+FULL_ARTICLE_STEPS = ["planning", "research", "assembly", "finishing"]
 
 
 def create_workflow_execution(
@@ -24,7 +29,7 @@ def create_workflow_execution(
         project_id=project_id,
         workflow_type=workflow_type,
         status=WorkflowStatus.PENDING,
-        metadata=metadata or {},
+        workflow_metadata=metadata or {},
         current_step={"step_name": "initialization", "progress": 0},
     )
     db.add(workflow)
@@ -52,6 +57,10 @@ def update_workflow_status(
         workflow.updated_at = func.now()
 
         if current_step:
+            # Les checkpoints survivent aux changements d'étape pour permettre la reprise
+            checkpoints = get_step_checkpoints(workflow)
+            if checkpoints and "checkpoints" not in current_step:
+                current_step = {**current_step, "checkpoints": checkpoints}
             workflow.current_step = current_step
 
         if error_details:
@@ -186,3 +195,114 @@ def calculate_workflow_progress(db: Session, workflow_id: str) -> float:
 
     total_progress = sum(job.progress for job in jobs)
     return total_progress / len(jobs)
+
+
+def get_step_checkpoints(workflow: Optional[WorkflowExecution]) -> Dict[str, Any]:
+    """
+    Récupérer les checkpoints des étapes terminées d'un workflow
+    """
+    if not workflow or not workflow.current_step:
+        return {}
+    return dict(workflow.current_step.get("checkpoints") or {})
+
+
+def record_step_checkpoint(
+    db: Session,
+    workflow_id: str,
+    step_name: str,
+    data: Optional[Dict[str, Any]] = None,
+) -> Optional[WorkflowExecution]:
+    """
+    Enregistrer un checkpoint pour une étape terminée du workflow
+
+    Les données du checkpoint (IDs d'outputs, compteurs...) permettent à une
+    reprise de sauter l'étape et de réutiliser ses résultats.
+    """
+    workflow = get_workflow_by_id(db, workflow_id)
+    if not workflow:
+        return None
+
+    checkpoints = get_step_checkpoints(workflow)
+    checkpoints[step_name] = {
+        "completed_at": datetime.now(timezone.utc).isoformat(),
+        **(data or {}),
+    }
+
+    # Réassigner un nouveau dict pour que SQLAlchemy détecte la modification JSON
+    workflow.current_step = {**(workflow.current_step or {}), "checkpoints": checkpoints}
+    workflow.updated_at = func.now()
+
+    db.flush()  # Let caller control transaction
+    db.refresh(workflow)
+    return workflow
+
+
+def drop_downstream_checkpoints(
+    db: Session,
+    workflow_id: str,
+    step_name: str,
+) -> List[str]:
+    """
+    Supprimer les checkpoints des étapes qui suivent step_name
+
+    Appelé quand step_name est ré-exécutée: les résultats des étapes suivantes
+    (assemblage, finition...) ne reflètent plus ses nouveaux outputs.
+
+    Returns:
+        Les étapes dont le checkpoint a été supprimé
+    """
+    workflow = get_workflow_by_id(db, workflow_id)
+    if not workflow or step_name not in FULL_ARTICLE_STEPS:
+        return []
+
+    downstream = FULL_ARTICLE_STEPS[FULL_ARTICLE_STEPS.index(step_name) + 1 :]
+    checkpoints = get_step_checkpoints(workflow)
+    dropped = [step for step in downstream if step in checkpoints]
+    if not dropped:
+        return []
+
+    for step in dropped:
+        del checkpoints[step]
+    workflow.current_step = {**(workflow.current_step or {}), "checkpoints": checkpoints}
+    workflow.updated_at = func.now()
+
+    db.flush()  # Let caller control transaction
+    return dropped
+
+
+def prepare_workflow_resume(db: Session, workflow_id: str) -> WorkflowExecution:
+    """
+    Préparer la reprise d'un workflow échoué ou annulé
+
+    Raises:
+        WorkflowNotFound: Si le workflow n'existe pas
+        WorkflowNotResumable: Si le workflow est en cours ou déjà terminé
+    """
+    workflow = get_workflow_by_id(db, workflow_id)
+    if not workflow:
+        raise WorkflowNotFound(workflow_id)
+
+    if workflow.status not in (WorkflowStatus.FAILED, WorkflowStatus.CANCELLED):
+        status = getattr(workflow.status, "value", workflow.status)
+        raise WorkflowNotResumable(workflow_id, status)
+
+    checkpoints = get_step_checkpoints(workflow)
+    resume_from = next(
+        (step for step in FULL_ARTICLE_STEPS if step not in checkpoints), None
+    )
+
+    workflow.status = WorkflowStatus.PENDING
+    workflow.error_details = None
+    workflow.completed_at = None
+    workflow.current_step = {
+        "step_name": resume_from or "finishing",
+        "progress": 0,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "resumed": True,
+        "checkpoints": checkpoints,
+    }
+    workflow.updated_at = func.now()
+
+    db.flush()  # Let caller control transaction
+    db.refresh(workflow)
+    return workflow
@@ -67,7 +67,7 @@ def planning_task(
             db.commit()
 
         # Vérifier que le LLM est configuré
-        if not ai_service.llm:
+        if not ai_service.is_llm_available():
             raise ValueError("Service IA non configuré (GROQ_API_KEY manquant)")
 
         # Mettre à jour le statut
@@ -155,13 +155,11 @@ def planning_task(
                         }
                     )
                 else:
-                    # Créer une nouvelle tâche
-                    order_start = max([t.order for t in existing_tasks] + [0]) + 1
+                    # Créer une nouvelle tâche (ajoutée en fin de projet)
                     task_create = TaskCreate(
                         title=ai_task_title,
                         project_id=project_id,
                         status="À faire",
-                        order=order_start + len(created_tasks),
                     )
                     new_task = task_service.create_task(db, task_create)
 
@@ -295,7 +293,7 @@ def research_task(
             },
         )
 
-        if not ai_service.llm:
+        if not ai_service.is_llm_available():
             raise ValueError("Service IA non configuré")
 
         self.update_state_with_db(
@@ -383,7 +381,7 @@ def writing_task(
             },
         )
 
-        if not ai_service.llm:
+        if not ai_service.is_llm_available():
             raise ValueError("Service IA non configuré")
 
         self.update_state_with_db(
@@ -469,7 +467,7 @@ def finishing_task(self, project_id: int, raw_content: str) -> dict:
             },
         )
 
-        if not ai_service.llm:
+        if not ai_service.is_llm_available():
             raise ValueError("Service IA non configuré")
 
         self.update_state_with_db(
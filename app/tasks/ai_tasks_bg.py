@@ -3,19 +3,33 @@ Tâches IA avec FastAPI BackgroundTasks - Remplacement de Celery
 Migration progressive des tâches ai_tasks.py vers BackgroundTasks
 """
 
+import os
 from typing import Optional
 from sqlalchemy.orm import Session
 
+from app.core.executors import run_in_llm_executor
 from app.core.task_compat import (
     create_compatible_task, 
     get_db,
     TaskCompatibilityMixin,
     add_signature_support
 )
-from app.services import ai_service, project_service, task_service, output_service
+from app.services import (
+    ai_service,
+    context_service,
+    project_service,
+    task_service,
+    output_service,
+    similarity_service,
+    style_service,
+)
+from app.services.model_router import RESEARCHER, WRITER
 from app.schemas.schemas import TaskCreate
 from app.models.workflow_models import TaskOutputType
 
+# Ne pas refaire passer par le LLM un contenu déjà conforme au profil de style
+SKIP_CONFORMING_FINISHING = os.getenv("SKIP_CONFORMING_FINISHING", "false").lower() == "true"
+
 
 @create_compatible_task(name="app.tasks.ai_tasks.planning_task")
 async def planning_task_bg(
@@ -60,7 +74,7 @@ async def planning_task_bg(
             db.commit()
 
         # Vérifier que le LLM est configuré
-        if not ai_service.llm:
+        if not ai_service.is_llm_available():
             raise ValueError("Service IA non configuré (GROQ_API_KEY manquant)")
 
         # Mettre à jour le statut
@@ -74,9 +88,9 @@ async def planning_task_bg(
         )
 
         # Exécuter la planification IA (fonction sync dans async wrapper)
-        import asyncio
-        loop = asyncio.get_event_loop()
-        task_titles = await loop.run_in_executor(None, ai_service.run_planning_crew, project_goal)
+        task_titles = await run_in_llm_executor(
+            ai_service.run_planning_crew, project_goal
+        )
 
         if not task_titles:
             # Mettre à jour le statut en échec
@@ -109,21 +123,20 @@ async def planning_task_bg(
             if not project:
                 raise ValueError(f"Projet {project_id} non trouvé")
 
-            # Logique de merge des tâches (comme dans l'original)
+            # Logique de merge des tâches (comme dans l'original): un titre
+            # quasi identique à une tâche existante ou déjà créée est mergé
             created_count = 0
             merged_count = 0
-            
+            known_titles = similarity_service.TitleIndex(
+                [task.title for task in project.tasks]
+            )
+
             for title in task_titles:
                 title_clean = title.strip()
                 if not title_clean:
                     continue
 
-                # Vérifier si la tâche existe déjà
-                existing_task = task_service.get_task_by_title_and_project(
-                    db, title_clean, project_id
-                )
-
-                if existing_task:
+                if known_titles.find(title_clean):
                     merged_count += 1
                     continue
 
@@ -136,6 +149,7 @@ async def planning_task_bg(
                 )
 
                 task_service.create_task(db, task_data)
+                known_titles.add(title_clean)
                 created_count += 1
 
             # Mettre à jour le statut du projet
@@ -196,6 +210,7 @@ async def research_task_bg(
     task_id: int,
     task_title: str,
     context: str,
+    workflow_execution_id: Optional[str] = None,
 ) -> dict:
     """
     Tâche asynchrone pour la recherche IA
@@ -217,7 +232,7 @@ async def research_task_bg(
                 raise ValueError(f"Tâche {task_id} non trouvée")
 
             # Vérifier que le LLM est configuré
-            if not ai_service.llm:
+            if not ai_service.is_llm_available():
                 raise ValueError("Service IA non configuré (GROQ_API_KEY manquant)")
 
             await self.update_state_with_db(
@@ -229,11 +244,15 @@ async def research_task_bg(
                 },
             )
 
+            # Réduire le contexte au budget du modèle (sorties précédentes pertinentes)
+            context = context_service.build_task_context(
+                db, task, RESEARCHER, user_context=context
+            )
+
             # Exécuter la recherche IA
-            import asyncio
-            loop = asyncio.get_event_loop()
-            research_content = await loop.run_in_executor(
-                None, ai_service.run_research_crew, task_title, context
+            llm_call_info = {}
+            research_content = await run_in_llm_executor(
+                ai_service.run_research_crew, task_title, context, llm_call_info
             )
 
             if not research_content:
@@ -253,12 +272,14 @@ async def research_task_bg(
             )
 
             # Sauvegarder le résultat
-            output_service.create_output(
+            output = output_service.create_output(
                 db=db,
                 task_id=task_id,
                 output_type=TaskOutputType.RESEARCH,
                 content=research_content,
                 ai_generated=True,
+                workflow_execution_id=workflow_execution_id,
+                metadata=llm_call_info,
             )
 
             return {
@@ -266,6 +287,8 @@ async def research_task_bg(
                 "message": "Recherche terminée avec succès",
                 "content": research_content,
                 "content_length": len(research_content),
+                "task_id": task_id,
+                "output_id": output.id,
             }
 
     except Exception as e:
@@ -291,6 +314,7 @@ async def writing_task_bg(
     task_id: int,
     task_title: str,
     context: str,
+    workflow_execution_id: Optional[str] = None,
 ) -> dict:
     """
     Tâche asynchrone pour l'écriture IA
@@ -311,7 +335,7 @@ async def writing_task_bg(
             if not task:
                 raise ValueError(f"Tâche {task_id} non trouvée")
 
-            if not ai_service.llm:
+            if not ai_service.is_llm_available():
                 raise ValueError("Service IA non configuré (GROQ_API_KEY manquant)")
 
             await self.update_state_with_db(
@@ -323,11 +347,15 @@ async def writing_task_bg(
                 },
             )
 
+            # Contexte borné: recherche de la même tâche en priorité, puis sections précédentes
+            context = context_service.build_task_context(
+                db, task, WRITER, user_context=context
+            )
+
             # Exécuter l'écriture IA
-            import asyncio
-            loop = asyncio.get_event_loop()
-            written_content = await loop.run_in_executor(
-                None, ai_service.run_writing_crew, task_title, context
+            llm_call_info = {}
+            written_content = await run_in_llm_executor(
+                ai_service.run_writing_crew, task_title, context, llm_call_info
             )
 
             if not written_content:
@@ -353,6 +381,8 @@ async def writing_task_bg(
                 output_type=TaskOutputType.WRITING,
                 content=written_content,
                 ai_generated=True,
+                workflow_execution_id=workflow_execution_id,
+                metadata=llm_call_info,
             )
 
             return {
@@ -384,6 +414,7 @@ async def finishing_task_bg(
     self: TaskCompatibilityMixin,
     project_id: int,
     raw_content: str,
+    workflow_execution_id: Optional[str] = None,
 ) -> dict:
     """
     Tâche asynchrone pour la finalisation IA
@@ -404,7 +435,7 @@ async def finishing_task_bg(
             if not project:
                 raise ValueError(f"Projet {project_id} non trouvé")
 
-            if not ai_service.llm:
+            if not ai_service.is_llm_available():
                 raise ValueError("Service IA non configuré (GROQ_API_KEY manquant)")
 
             await self.update_state_with_db(
@@ -416,12 +447,30 @@ async def finishing_task_bg(
                 },
             )
 
-            # Exécuter la finalisation IA
-            import asyncio
-            loop = asyncio.get_event_loop()
-            finished_content = await loop.run_in_executor(
-                None, ai_service.run_finishing_crew, raw_content
-            )
+            async def report_section_progress(done: int, total: int):
+                await self.update_state_with_db(
+                    state="PROGRESS",
+                    meta={
+                        "step": "Finalisation IA par sections",
+                        "progress": 50 + int(35 * done / total),
+                        "status_message": f"Section {done}/{total} raffinée",
+                    },
+                )
+
+            # Exécuter la finalisation IA (découpée par sections pour les articles longs)
+            llm_call_info = {}
+            if (
+                SKIP_CONFORMING_FINISHING
+                and style_service.score_text(db, raw_content)["conforms"]
+            ):
+                finished_content = raw_content
+                llm_call_info["finishing_skipped"] = "style_conforms"
+            else:
+                finished_content = await ai_service.run_finishing_crew_chunked(
+                    raw_content,
+                    on_progress=report_section_progress,
+                    call_info=llm_call_info,
+                )
 
             if not finished_content:
                 return {
@@ -446,6 +495,8 @@ async def finishing_task_bg(
                 output_type=TaskOutputType.FINISHING,
                 content=finished_content,
                 ai_generated=True,
+                workflow_execution_id=workflow_execution_id,
+                metadata=llm_call_info,
             )
 
             return {
@@ -3,10 +3,12 @@ Orchestrateur de workflows avec FastAPI BackgroundTasks
 Remplacement des primitives Celery (chain, group, chord)
 """
 
-from typing import List
+import asyncio
+from typing import List, Optional
 from sqlalchemy.orm import Session
 from datetime import datetime, timezone
 
+from app.core.task_manager import BackgroundTaskResult
 from app.core.task_compat import (
     create_compatible_task,
     get_db,
@@ -21,23 +23,72 @@ from app.services import workflow_service, output_service, project_service, task
 from app.models.workflow_models import WorkflowStatus, TaskOutputType
 
 
+# Intervalle de polling pour attendre la fin d'une sous-tâche
+STEP_POLL_INTERVAL = 0.1
+
+
+async def _wait_for_step(task_result: BackgroundTaskResult) -> Optional[dict]:
+    """Attend la fin d'une sous-tâche et retourne son statut final"""
+    while not await task_result.ready():
+        await asyncio.sleep(STEP_POLL_INTERVAL)
+    return await task_result.get_status()
+
+
+def _save_checkpoint(
+    workflow_execution_id: str, step_name: str, data: Optional[dict] = None
+) -> None:
+    """Persiste le checkpoint d'une étape terminée du workflow"""
+    with get_db() as db:
+        workflow_service.record_step_checkpoint(
+            db=db,
+            workflow_id=workflow_execution_id,
+            step_name=step_name,
+            data=data,
+        )
+        db.commit()
+
+
+def _rerun_step(workflow_execution_id: str, checkpoints: dict, step_name: str) -> None:
+    """
+    Invalide les checkpoints en aval d'une étape ré-exécutée
+
+    Une recherche relancée produit de nouveaux outputs: l'assemblage et la
+    finition checkpointés ne les contiennent pas et doivent être refaits.
+    """
+    with get_db() as db:
+        dropped = workflow_service.drop_downstream_checkpoints(
+            db=db, workflow_id=workflow_execution_id, step_name=step_name
+        )
+        db.commit()
+    for step in dropped:
+        checkpoints.pop(step, None)
+
+
 @create_compatible_task(name="app.tasks.orchestrator_tasks.full_article_workflow_task")
 async def full_article_workflow_task_bg(
     self: TaskCompatibilityMixin, 
     project_id: int, 
-    workflow_execution_id: str
+    workflow_execution_id: str,
+    resume: bool = False,
 ) -> dict:
     """
     Tâche orchestratrice principale pour la génération complète d'articles
     Version BackgroundTasks remplaçant Celery chain/group/chord
 
     Workflow: Planning → Research Coordination → Assembly → Finishing
+
+    Chaque étape terminée enregistre un checkpoint dans
+    WorkflowExecution.current_step. Avec resume=True, les étapes déjà
+    checkpointées sont sautées et leurs outputs (task_outputs) réutilisés.
+    Une étape ré-exécutée invalide les checkpoints des étapes suivantes.
     """
+    current_step = "initialization"
+    skipped_steps = []
     try:
         await self.update_state_with_db(
             state="PROGRESS",
             meta={
-                "step": "Initialisation workflow",
+                "step": "Reprise workflow" if resume else "Initialisation workflow",
                 "progress": 5,
                 "status_message": f"Démarrage du workflow complet pour le projet {project_id}",
             },
@@ -48,6 +99,12 @@ async def full_article_workflow_task_bg(
             project = project_service.get_project(db, project_id)
             if not project:
                 raise ValueError(f"Projet {project_id} non trouvé")
+            project_description = project.description
+
+            workflow = workflow_service.get_workflow_by_id(db, workflow_execution_id)
+            checkpoints = (
+                workflow_service.get_step_checkpoints(workflow) if resume else {}
+            )
 
             # Mettre à jour le workflow status
             workflow_service.update_workflow_step(
@@ -55,64 +112,130 @@ async def full_article_workflow_task_bg(
                 workflow_id=workflow_execution_id,
                 step_name="planning",
                 progress=10,
-                metadata={"project_name": project.name},
+                metadata={
+                    "project_name": project.name,
+                    "skipped_steps": list(checkpoints),
+                },
             )
+            db.commit()
 
         # ÉTAPE 1: Planning
-        await self.update_state_with_db(
-            state="PROGRESS",
-            meta={
-                "step": "Phase 1: Planification",
-                "progress": 20,
-                "status_message": "Exécution de la planification IA",
-            },
-        )
+        current_step = "planning"
+        if current_step in checkpoints:
+            planning_data = checkpoints[current_step]
+            skipped_steps.append(current_step)
+        else:
+            _rerun_step(workflow_execution_id, checkpoints, current_step)
+            await self.update_state_with_db(
+                state="PROGRESS",
+                meta={
+                    "step": "Phase 1: Planification",
+                    "progress": 20,
+                    "status_message": "Exécution de la planification IA",
+                },
+            )
 
-        planning_result = await planning_task_bg.delay(project_id, project.description)
-        planning_status = await planning_result.get_status()
-        
-        if not planning_status or planning_status.get("status") != "SUCCESS":
-            raise Exception("Échec de la planification")
+            planning_result = await planning_task_bg.delay(project_id, project_description)
+            planning_status = await _wait_for_step(planning_result)
 
-        planning_data = planning_status["result"]
-        if not planning_data.get("success"):
-            raise Exception(f"Planification échouée: {planning_data.get('message')}")
+            if not planning_status or planning_status.get("status") != "SUCCESS":
+                raise Exception("Échec de la planification")
+
+            planning_data = planning_status["result"]
+            if not planning_data.get("success"):
+                raise Exception(f"Planification échouée: {planning_data.get('message')}")
+
+            _save_checkpoint(
+                workflow_execution_id,
+                current_step,
+                {
+                    "success": True,
+                    "created_count": planning_data.get("created_count", 0),
+                    "merged_count": planning_data.get("merged_count", 0),
+                },
+            )
 
         # ÉTAPE 2: Coordination des recherches
-        await self.update_state_with_db(
-            state="PROGRESS",
-            meta={
-                "step": "Phase 2: Coordination recherches",
-                "progress": 40,
-                "status_message": "Lancement des recherches en parallèle",
-            },
-        )
+        # Relancée tant qu'une recherche a échoué: le coordinateur saute les
+        # tâches qui ont déjà un output de recherche pour ce workflow.
+        current_step = "research"
+        research_checkpoint = checkpoints.get(current_step)
+        if research_checkpoint and not research_checkpoint.get("failed_count"):
+            skipped_steps.append(current_step)
+        else:
+            _rerun_step(workflow_execution_id, checkpoints, current_step)
+            await self.update_state_with_db(
+                state="PROGRESS",
+                meta={
+                    "step": "Phase 2: Coordination recherches",
+                    "progress": 40,
+                    "status_message": "Lancement des recherches en parallèle",
+                },
+            )
 
-        research_result = await research_coordinator_task_bg.delay(workflow_execution_id)
-        research_status = await research_result.get_status()
-        
-        if not research_status or research_status.get("status") != "SUCCESS":
-            raise Exception("Échec de la coordination des recherches")
+            research_result = await research_coordinator_task_bg.delay(workflow_execution_id)
+            research_status = await _wait_for_step(research_result)
+
+            if not research_status or research_status.get("status") != "SUCCESS":
+                raise Exception("Échec de la coordination des recherches")
+
+            research_data = research_status["result"]
+            if not research_data.get("success"):
+                raise Exception(f"Recherches échouées: {research_data.get('message')}")
+
+            _save_checkpoint(
+                workflow_execution_id,
+                current_step,
+                {
+                    "successful_count": research_data.get("successful_count", 0),
+                    "skipped_count": research_data.get("skipped_count", 0),
+                    "failed_count": research_data.get("failed_count", 0),
+                },
+            )
 
         # ÉTAPE 3: Assemblage
-        await self.update_state_with_db(
-            state="PROGRESS",
-            meta={
-                "step": "Phase 3: Assemblage",
-                "progress": 70,
-                "status_message": "Assemblage des contenus",
-            },
-        )
+        current_step = "assembly"
+        assembled_content = None
+        assembly_checkpoint = checkpoints.get(current_step)
+        if assembly_checkpoint and assembly_checkpoint.get("output_id"):
+            with get_db() as db:
+                assembly_output = output_service.get_output_by_id(
+                    db, assembly_checkpoint["output_id"]
+                )
+                if assembly_output:
+                    assembled_content = assembly_output.content
+                    skipped_steps.append(current_step)
+
+        if assembled_content is None:
+            _rerun_step(workflow_execution_id, checkpoints, current_step)
+            await self.update_state_with_db(
+                state="PROGRESS",
+                meta={
+                    "step": "Phase 3: Assemblage",
+                    "progress": 70,
+                    "status_message": "Assemblage des contenus",
+                },
+            )
 
-        assembly_result = await assembly_task_bg.delay(project_id, workflow_execution_id)
-        assembly_status = await assembly_result.get_status()
-        
-        if not assembly_status or assembly_status.get("status") != "SUCCESS":
-            raise Exception("Échec de l'assemblage")
+            assembly_result = await assembly_task_bg.delay(project_id, workflow_execution_id)
+            assembly_status = await _wait_for_step(assembly_result)
+
+            if not assembly_status or assembly_status.get("status") != "SUCCESS":
+                raise Exception("Échec de l'assemblage")
+
+            assembly_data = assembly_status["result"]
+            if not assembly_data.get("success"):
+                raise Exception(f"Assemblage échoué: {assembly_data.get('message')}")
 
-        assembly_data = assembly_status["result"]
+            assembled_content = assembly_data.get("assembled_content", "")
+            _save_checkpoint(
+                workflow_execution_id,
+                current_step,
+                {"output_id": assembly_data.get("assembly_output_id")},
+            )
 
         # ÉTAPE 4: Finition
+        current_step = "finishing"
         await self.update_state_with_db(
             state="PROGRESS",
             meta={
@@ -124,42 +247,52 @@ async def full_article_workflow_task_bg(
 
         finishing_result = await finishing_task_bg.delay(
             project_id, 
-            assembly_data.get("assembled_content", "")
+            assembled_content,
+            workflow_execution_id,
         )
-        finishing_status = await finishing_result.get_status()
+        finishing_status = await _wait_for_step(finishing_result)
         
         if not finishing_status or finishing_status.get("status") != "SUCCESS":
             raise Exception("Échec de la finition")
 
+        finishing_data = finishing_status["result"]
+        if not finishing_data.get("success"):
+            raise Exception(f"Finition échouée: {finishing_data.get('message')}")
+
+        _save_checkpoint(workflow_execution_id, current_step)
+
         # Finalisation du workflow
         with get_db() as db:
-            workflow_service.update_workflow_step(
-                db=db,
-                workflow_id=workflow_execution_id,
-                step_name="completed",
-                progress=100,
-                metadata={"completed_at": datetime.now(timezone.utc).isoformat()},
+            workflow_service.mark_workflow_complete(
+                db=db, workflow_id=workflow_execution_id, success=True
             )
+            db.commit()
 
         return {
             "success": True,
             "message": "Workflow complet terminé avec succès",
             "workflow_id": workflow_execution_id,
             "project_id": project_id,
+            "resumed": resume,
+            "skipped_steps": skipped_steps,
             "planning_result": planning_data,
-            "finishing_result": finishing_status["result"],
+            "finishing_result": finishing_data,
         }
 
     except Exception as e:
-        # Marquer le workflow comme échoué
+        # Marquer le workflow comme échoué en conservant les checkpoints
         with get_db() as db:
-            workflow_service.update_workflow_step(
+            workflow_service.mark_workflow_complete(
                 db=db,
                 workflow_id=workflow_execution_id,
-                step_name="failed",
-                progress=0,
-                metadata={"error": str(e), "failed_at": datetime.now(timezone.utc).isoformat()},
+                success=False,
+                error_details={
+                    "error": str(e),
+                    "step": current_step,
+                    "failed_at": datetime.now(timezone.utc).isoformat(),
+                },
             )
+            db.commit()
 
         await self.update_state_with_db(
             state="FAILURE",
@@ -173,6 +306,7 @@ async def full_article_workflow_task_bg(
             "success": False,
             "message": f"Workflow échoué: {str(e)}",
             "workflow_id": workflow_execution_id,
+            "failed_step": current_step,
             "error": str(e),
         }
 
@@ -198,18 +332,37 @@ async def research_coordinator_task_bg(
 
         with get_db() as db:
             # Récupérer toutes les tâches du workflow
-            workflow = workflow_service.get_workflow(db, workflow_execution_id)
+            workflow = workflow_service.get_workflow_by_id(db, workflow_execution_id)
             if not workflow:
                 raise ValueError(f"Workflow {workflow_execution_id} non trouvé")
 
             project_id = workflow.project_id
             tasks = task_service.get_tasks_by_project(db, project_id)
-            
-            if not tasks:
+            context = f"Projet: {workflow.project.name}\nDescription: {workflow.project.description}"
+
+            # Les tâches ayant déjà un output de recherche pour ce workflow
+            # sont des noeuds terminés: on réutilise leur output (reprise)
+            completed_task_ids = {
+                output.task_id
+                for output in output_service.get_outputs_by_workflow(
+                    db, workflow_execution_id, TaskOutputType.RESEARCH
+                )
+            }
+            pending_tasks = [
+                (task.id, task.title)
+                for task in tasks
+                if task.id not in completed_task_ids
+            ]
+            skipped_count = len(tasks) - len(pending_tasks)
+
+            if not pending_tasks:
                 return {
                     "success": True,
                     "message": "Aucune tâche à traiter",
                     "research_results": [],
+                    "successful_count": 0,
+                    "skipped_count": skipped_count,
+                    "failed_count": 0,
                 }
 
         await self.update_state_with_db(
@@ -217,22 +370,23 @@ async def research_coordinator_task_bg(
             meta={
                 "step": "Lancement recherches parallèles",
                 "progress": 30,
-                "status_message": f"Lancement de {len(tasks)} recherches en parallèle",
+                "status_message": f"Lancement de {len(pending_tasks)} recherches en parallèle ({skipped_count} déjà terminées)",
             },
         )
 
         # Créer la liste des tâches de recherche à exécuter en parallèle
         research_tasks = []
-        for task in tasks:
-            context = f"Projet: {workflow.project.name}\nDescription: {workflow.project.description}"
-            research_tasks.append(research_task_bg.s(task.id, task.title, context))
+        for task_id, task_title in pending_tasks:
+            research_tasks.append(
+                research_task_bg.s(task_id, task_title, context, workflow_execution_id)
+            )
 
         # Exécuter toutes les recherches en parallèle avec group()
         research_group = group(*research_tasks)
         group_result = await research_group.apply_async()
         
         # Attendre que toutes les recherches se terminent
-        group_status = await group_result.get_status()
+        group_status = await _wait_for_step(group_result)
         research_results = group_status["result"] if group_status else []
 
         # Vérifier les résultats
@@ -259,6 +413,7 @@ async def research_coordinator_task_bg(
             "message": f"Coordination terminée: {successful_count} recherches réussies, {failed_count} échouées",
             "research_results": research_results,
             "successful_count": successful_count,
+            "skipped_count": skipped_count,
             "failed_count": failed_count,
         }
 
@@ -349,18 +504,21 @@ async def assembly_task_bg(
 
         # Sauvegarder le contenu assemblé
         with get_db() as db:
-            output_service.create_project_output(
+            assembly_output = output_service.create_project_output(
                 db=db,
                 project_id=project_id,
                 output_type=TaskOutputType.ASSEMBLY,
                 content=assembled_content,
                 ai_generated=False,  # Assemblage automatique
+                workflow_execution_id=workflow_execution_id,
             )
+            assembly_output_id = assembly_output.id if assembly_output else None
 
         return {
             "success": True,
             "message": f"Assemblage terminé: {len(assembled_content)} caractères",
             "assembled_content": assembled_content,
+            "assembly_output_id": assembly_output_id,
             "research_count": len(research_outputs),
             "writing_count": len(writing_outputs),
             "content_length": len(assembled_content),
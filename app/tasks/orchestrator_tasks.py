@@ -134,6 +134,18 @@ def research_coordinator_task(
             raise ValueError("Aucune tâche créée par la planification")
 
         with get_db() as db:
+            # Checkpoint de la planification: une reprise ne re-planifie pas
+            workflow_service.record_step_checkpoint(
+                db=db,
+                workflow_id=workflow_execution_id,
+                step_name="planning",
+                data={
+                    "success": True,
+                    "created_count": len(created_tasks),
+                    "merged_count": len(planning_result.get("enhanced_tasks", [])),
+                },
+            )
+
             # Mettre à jour le workflow
             workflow_service.update_workflow_step(
                 db=db,
@@ -221,6 +233,20 @@ def research_completion_task(
 
         # Vérifier que toutes les recherches ont réussi
         failed_tasks = [r for r in research_results if not r.get("success", False)]
+
+        # Checkpoint des recherches: avec des échecs, la reprise relance
+        # seulement les tâches sans output de recherche
+        with get_db() as db:
+            workflow_service.record_step_checkpoint(
+                db=db,
+                workflow_id=workflow_execution_id,
+                step_name="research",
+                data={
+                    "successful_count": len(research_results) - len(failed_tasks),
+                    "skipped_count": 0,
+                    "failed_count": len(failed_tasks),
+                },
+            )
         if failed_tasks:
             error_msg = f"{len(failed_tasks)} recherches ont échoué"
             with get_db() as db:
@@ -319,12 +345,19 @@ def assembly_task(
                     "source_task_count": len(task_ids),
                     "assembly_method": "merge_with_separator",
                     "total_research_words": sum(
-                        output.metadata.get("word_count", 0)
+                        (output.output_metadata or {}).get("word_count", 0)
                         for output in research_outputs
                     ),
                 },
             )
 
+            workflow_service.record_step_checkpoint(
+                db=db,
+                workflow_id=workflow_execution_id,
+                step_name="assembly",
+                data={"output_id": assembly_output.id},
+            )
+
         return {
             "success": True,
             "message": "Contenu assemblé avec succès",
@@ -398,7 +431,7 @@ def project_finishing_task(
 
             # Raffinage direct via le service IA
             try:
-                if ai_service.llm and hasattr(ai_service, "run_finishing_crew"):
+                if ai_service.is_llm_available() and hasattr(ai_service, "run_finishing_crew"):
                     final_content = ai_service.run_finishing_crew(raw_content)
                 else:
                     # Fallback simple si le service n'est pas disponible
@@ -414,6 +447,10 @@ def project_finishing_task(
                 project.final_content_updated_at = datetime.now(timezone.utc)
                 db.commit()
 
+            workflow_service.record_step_checkpoint(
+                db=db, workflow_id=workflow_execution_id, step_name="finishing"
+            )
+
             # Marquer le workflow comme terminé
             workflow_service.mark_workflow_complete(
                 db=db, workflow_id=workflow_execution_id, success=True
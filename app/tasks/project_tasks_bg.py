@@ -0,0 +1,72 @@
+"""
+Tâches de gestion de projets avec FastAPI BackgroundTasks
+Opérations en lot trop longues pour une requête HTTP (duplication de gros projets)
+"""
+
+import asyncio
+from typing import Optional
+
+from app.core.executors import run_in_db_executor
+from app.core.task_compat import create_compatible_task, get_db, TaskCompatibilityMixin
+from app.services import project_service
+
+
+def _duplicate_project_sync(
+    project_id: int,
+    new_name: Optional[str],
+    include_outputs: bool,
+    on_progress,
+) -> dict:
+    """Duplication complète dans une session dédiée (pool DB)"""
+    stats = {}
+    with get_db() as db:
+        new_project = project_service.duplicate_project(
+            db,
+            project_id,
+            new_name=new_name,
+            include_outputs=include_outputs,
+            on_progress=on_progress,
+            stats=stats,
+        )
+        return {"new_project_id": new_project.id, **stats}
+
+
+@create_compatible_task(name="app.tasks.project_tasks.duplicate_project_task")
+async def duplicate_project_task_bg(
+    self: TaskCompatibilityMixin,
+    project_id: int,
+    new_name: Optional[str] = None,
+    include_outputs: bool = False,
+) -> dict:
+    """
+    Duplique un projet volumineux en arrière-plan avec suivi de progression
+
+    Args:
+        project_id: ID du projet à dupliquer
+        new_name: Nouveau nom (si None, ajoute "- Copie" au nom original)
+        include_outputs: Copier aussi le dernier output de chaque type par tâche
+
+    Returns:
+        dict: success, new_project_id, tasks_copied, outputs_copied
+    """
+    loop = asyncio.get_running_loop()
+
+    def on_progress(done: int, total: int) -> None:
+        # Appelé depuis le pool DB: remonter la progression sur la boucle
+        asyncio.run_coroutine_threadsafe(
+            self.update_state_with_db(
+                state="PROGRESS",
+                meta={
+                    "step": "Copie des tâches",
+                    "progress": 10 + int(85 * done / total),
+                    "status_message": f"{done}/{total} tâches copiées",
+                },
+            ),
+            loop,
+        )
+
+    # Les erreurs remontent au task_manager qui marque le job en FAILURE
+    result = await run_in_db_executor(
+        _duplicate_project_sync, project_id, new_name, include_outputs, on_progress
+    )
+    return {"success": True, "project_id": project_id, **result}
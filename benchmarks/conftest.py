@@ -0,0 +1,65 @@
+"""
+Configuration des benchmarks (pytest-benchmark)
+
+Base de benchmark: BENCH_DATABASE_URL, ou à défaut une base SQLite jetable.
+La pile IA est remplacée par un ChatGroq factice (latence BENCH_LLM_LATENCY_MS):
+aucun appel réseau, résultats reproductibles.
+"""
+
+import asyncio
+import os
+import tempfile
+
+import pytest
+
+# Avant tout import de app: la configuration DB est lue à l'import
+_BENCH_DIR = tempfile.mkdtemp(prefix="geekblog-bench-")
+os.environ["DATABASE_URL"] = os.getenv(
+    "BENCH_DATABASE_URL", f"sqlite:///{os.path.join(_BENCH_DIR, 'bench.db')}"
+)
+os.environ.setdefault("GROQ_API_KEY", "bench-fake-key")
+os.environ["HEALTH_SAMPLER"] = "false"
+os.environ["AI_WARMUP"] = "false"
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.db.config import Base, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from benchmarks.fake_llm import install_fake_ai_stack  # noqa: E402
+
+# Latence simulée d'un appel LLM (une tâche de crew)
+BENCH_LLM_LATENCY_MS = float(os.getenv("BENCH_LLM_LATENCY_MS", "50"))
+
+
+def pytest_report_header(config):
+    return (
+        f"benchmark database: {engine.url.render_as_string(hide_password=True)}, "
+        f"fake LLM latency: {BENCH_LLM_LATENCY_MS:.0f} ms"
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def bench_database():
+    """Schéma créé une fois pour la session (base jetable ou dédiée)"""
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def fake_llm():
+    return install_fake_ai_stack(latency=BENCH_LLM_LATENCY_MS / 1000)
+
+
+@pytest.fixture(scope="session")
+def client(bench_database):
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def run():
+    """Exécute une coroutine sur une boucle dédiée (tâches du BackgroundTaskManager)"""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
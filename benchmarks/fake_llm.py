@@ -0,0 +1,195 @@
+"""
+Pile IA factice pour les benchmarks
+ChatGroq déterministe à latence configurable, et Agent/Task/Crew minimaux
+
+Seul l'appel au modèle est simulé: _run_crew, la passerelle LLM, le routeur
+de modèles et l'enregistrement des appels (llm_calls) s'exécutent réellement.
+"""
+
+import hashlib
+import random
+import re
+import threading
+import time
+from types import SimpleNamespace
+from typing import List, Optional
+
+from app.services import ai_service
+from app.services.llm_gateway import LLMGateway, ModelBudget, estimate_tokens
+from app.services.model_router import MODEL_PRICING
+
+# Contenu à réviser, entre ''' dans les prompts de rédaction et de finition
+_QUOTED_RE = re.compile(r"'''\n(.*?)\n'''", re.S)
+_SECTION_MARKER_RE = re.compile(r"\[\[SECTION \d+\]\]")
+
+# Titres distincts: le merge de planning_task fusionne les titres trop proches
+SECTION_TOPICS = (
+    "Introduction au déploiement",
+    "Installer Docker sur Linux",
+    "Écrire un Dockerfile minimal",
+    "Configurer PostgreSQL",
+    "Gérer les volumes de données",
+    "Orchestrer avec docker compose",
+    "Surveiller les conteneurs",
+    "Sécuriser les images",
+    "Automatiser avec GitHub Actions",
+    "Optimiser la taille des images",
+    "Déboguer un conteneur qui plante",
+    "Mettre à jour sans interruption",
+    "Sauvegarder et restaurer",
+    "Migrer vers Kubernetes",
+    "Mesurer les performances",
+    "Conclusion et retour d'expérience",
+)
+
+_WORDS = (
+    "je nous mon notre code python linux docker serveur base données application "
+    "conteneur image réseau volume cloud api déploiement test build cache requête "
+    "fichier configuration script commande terminal processus mémoire disque "
+    "performance sécurité mise jour version branche commit release monitoring "
+    "vraiment simple rapide efficace robuste pratique cool super génial "
+    "installer configurer lancer tester mesurer optimiser automatiser déboguer"
+).split()
+_ENDINGS = ".........?!"
+class FakeChatGroq:
+    """
+    Stand-in déterministe de ChatGroq
+
+    La réponse ne dépend que du prompt; chaque appel dort `latency` secondes
+    (simulation de l'aller-retour réseau et de la génération). La planification
+    renvoie `sections` titres, distincts jusqu'à len(SECTION_TOPICS).
+    """
+
+    def __init__(
+        self,
+        model: str = "fake",
+        latency: float = 0.0,
+        sections: int = 5,
+        words: int = 250,
+        **kwargs,
+    ):
+        self.model_name = model
+        self.latency = latency
+        self.sections = sections
+        self.words = words
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _generate(self, prompt: str) -> str:
+        if "liste de titres de tâches" in prompt:
+            return "\n".join(
+                f"- {SECTION_TOPICS[index % len(SECTION_TOPICS)]}"
+                for index in range(self.sections)
+            )
+        if _SECTION_MARKER_RE.search(prompt):
+            # Passe de cohérence: les ouvertures sont rendues inchangées
+            return ""
+        quoted = _QUOTED_RE.findall(prompt)
+        if quoted and "Sujet de rédaction" not in prompt:
+            # Révision: le texte est rendu tel quel (la longueur est conservée)
+            return quoted[-1]
+
+        # Texte pseudo-aléatoire amorcé par le prompt: déterministe, et
+        # distinct d'un prompt à l'autre (pas de quasi-doublons à l'assemblage)
+        digest = hashlib.blake2b(prompt.encode("utf-8"), digest_size=8).digest()
+        rng = random.Random(digest)
+        sentences, count = [], 0
+        while count < self.words:
+            words = rng.choices(_WORDS, k=rng.randint(6, 16))
+            count += len(words)
+            sentences.append(" ".join(words).capitalize() + rng.choice(_ENDINGS))
+        return " ".join(sentences)
+
+    def invoke(self, prompt: str) -> SimpleNamespace:
+        with self._lock:
+            self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return SimpleNamespace(content=self._generate(prompt))
+
+
+class FakeAgent:
+    """Agent CrewAI réduit à ses attributs"""
+
+    def __init__(self, role="", goal="", backstory="", llm=None, tools=None, **kwargs):
+        self.role = role
+        self.goal = goal
+        self.backstory = backstory
+        self.llm = llm
+        self.tools = tools or []
+        self.verbose = kwargs.get("verbose", False)
+        self.allow_delegation = kwargs.get("allow_delegation", False)
+
+
+class FakeTask:
+    """Tâche CrewAI: description, agent et tâches de contexte"""
+
+    def __init__(self, description="", expected_output="", agent=None, context=None, **kwargs):
+        self.description = description
+        self.expected_output = expected_output
+        self.agent = agent
+        self.context = context or []
+        self.output: Optional[str] = None
+
+
+class FakeCrew:
+    """
+    Exécution séquentielle comme Process.sequential de CrewAI
+
+    Chaque tâche reçoit en contexte la sortie de ses tâches de contexte, ou
+    à défaut celle de la tâche précédente.
+    """
+
+    def __init__(self, agents=None, tasks: Optional[List[FakeTask]] = None, **kwargs):
+        self.agents = agents or []
+        self.tasks = tasks or []
+        self.usage_metrics = None
+
+    def kickoff(self) -> str:
+        previous, prompt_tokens, completion_tokens = None, 0, 0
+        for task in self.tasks:
+            context = [t.output for t in task.context if t.output] or (
+                [previous] if previous else []
+            )
+            prompt = task.description + "".join(f"\n\n'''\n{c}\n'''" for c in context)
+            task.output = task.agent.llm.invoke(prompt).content
+            previous = task.output
+            prompt_tokens += estimate_tokens(prompt)
+            completion_tokens += estimate_tokens(task.output)
+        self.usage_metrics = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+        }
+        return previous or ""
+
+
+def install_fake_ai_stack(latency: float = 0.0, sections: int = 5) -> FakeChatGroq:
+    """
+    Remplace la pile IA (chargement paresseux de ai_service) par la pile factice
+
+    Tous les modèles routés partagent le même FakeChatGroq: modifier sa
+    latence ou son nombre de sections vaut pour les appels suivants.
+
+    La passerelle est recréée sans limite de débit: les budgets Groq
+    mesureraient les quotas du fournisseur, pas le code de l'application.
+    """
+    llm = FakeChatGroq(model=ai_service.LLM_MODEL, latency=latency, sections=sections)
+    namespace = vars(ai_service)
+    namespace.update(
+        Agent=FakeAgent,
+        Task=FakeTask,
+        Crew=FakeCrew,
+        Process=SimpleNamespace(sequential="sequential"),
+        ChatGroq=lambda **kwargs: llm,
+        llm=llm,
+    )
+    ai_service._create_agents()
+    ai_service._llm_cache.clear()
+    ai_service._ai_stack_loaded = True
+    ai_service.llm_gateway = LLMGateway(
+        budgets={
+            model: ModelBudget(rpm=10**9, tpm=10**12, max_concurrency=64)
+            for model in MODEL_PRICING
+        }
+    )
+    return llm
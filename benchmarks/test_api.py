@@ -0,0 +1,191 @@
+"""
+Benchmarks des endpoints de l'API (débit et latence en processus)
+CRUD projets/tâches, statut des jobs, outputs de workflow
+"""
+
+import itertools
+import socket
+from urllib.parse import urlparse
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.endpoints import jobs_bg
+from app.db.config import SessionLocal
+from app.models.job_models import AsyncJob
+from app.models.workflow_models import TaskOutputType, WorkflowType
+from app.services import output_service, task_service, workflow_service
+
+API = "/api/v1"
+TASKS_PER_PROJECT = 20
+
+_counter = itertools.count()
+
+
+def _call(client, method, url, expected=200, **kwargs):
+    response = client.request(method, url, **kwargs)
+    assert response.status_code == expected, response.text
+    return response
+
+
+def _create_project(client, name: str, tasks: int = TASKS_PER_PROJECT) -> dict:
+    created = _call(
+        client,
+        "POST",
+        f"{API}/projects/",
+        201,
+        json={"name": name, "description": "Lecture et mise à jour"},
+    ).json()
+    for order in range(tasks):
+        _call(
+            client,
+            "POST",
+            f"{API}/tasks/",
+            201,
+            json={"title": f"Tâche {order}", "project_id": created["id"], "order": order},
+        )
+    return created
+
+
+@pytest.fixture(scope="module")
+def project(client):
+    """Projet de référence avec ses tâches"""
+    return _create_project(client, "Projet benchmark")
+
+
+@pytest.fixture(scope="module")
+def workflow_id(client):
+    """Workflow terminé avec un output de recherche par tâche"""
+    project = _create_project(client, "Projet workflow")
+    with SessionLocal() as db:
+        workflow = workflow_service.create_workflow_execution(
+            db, project["id"], WorkflowType.FULL_ARTICLE
+        )
+        for task in task_service.get_tasks_by_project(db, project["id"]):
+            output_service.save_task_output(
+                db,
+                task.id,
+                TaskOutputType.RESEARCH,
+                f"Résultats de recherche pour {task.title}. " * 40,
+                workflow_execution_id=workflow.id,
+            )
+        db.commit()
+        return workflow.id
+
+
+@pytest.mark.benchmark(group="api-projects")
+class TestProjectEndpoints:
+    def test_create_project(self, benchmark, client):
+        benchmark(
+            lambda: _call(
+                client,
+                "POST",
+                f"{API}/projects/",
+                201,
+                json={"name": f"Projet {next(_counter)}", "description": "Création"},
+            )
+        )
+
+    def test_read_project(self, benchmark, client, project):
+        benchmark(_call, client, "GET", f"{API}/projects/{project['id']}")
+
+    def test_read_project_not_modified(self, benchmark, client, project):
+        url = f"{API}/projects/{project['id']}"
+        etag = _call(client, "GET", url).headers["etag"]
+
+        benchmark(_call, client, "GET", url, 304, headers={"If-None-Match": etag})
+
+    def test_list_projects(self, benchmark, client, project):
+        benchmark(_call, client, "GET", f"{API}/projects/?limit=100")
+
+    def test_update_project(self, benchmark, client, project):
+        benchmark(
+            lambda: _call(
+                client,
+                "PUT",
+                f"{API}/projects/{project['id']}",
+                json={"description": f"Révision {next(_counter)}"},
+            )
+        )
+
+
+@pytest.mark.benchmark(group="api-tasks")
+class TestTaskEndpoints:
+    def test_create_task(self, benchmark, client, project):
+        benchmark(
+            lambda: _call(
+                client,
+                "POST",
+                f"{API}/tasks/",
+                201,
+                json={"title": f"Tâche {next(_counter)}", "project_id": project["id"]},
+            )
+        )
+
+    def test_project_tasks(self, benchmark, client, project):
+        benchmark(_call, client, "GET", f"{API}/tasks/project/{project['id']}")
+
+    def test_update_task(self, benchmark, client, project):
+        tasks = _call(client, "GET", f"{API}/tasks/project/{project['id']}").json()
+
+        benchmark(
+            lambda: _call(
+                client,
+                "PUT",
+                f"{API}/tasks/{tasks[0]['id']}",
+                json={"description": f"Révision {next(_counter)}"},
+            )
+        )
+
+
+@pytest.fixture(scope="module")
+def job_id():
+    with SessionLocal() as db:
+        job = AsyncJob(id=f"bench-job-{next(_counter)}", type="writing", status="PROGRESS")
+        db.add(job)
+        db.commit()
+        return job.id
+
+
+def _redis_reachable(url: str) -> bool:
+    parsed = urlparse(url)
+    try:
+        address = (parsed.hostname or "localhost", parsed.port or 6379)
+        with socket.create_connection(address, timeout=0.2):
+            return True
+    except OSError:
+        return False
+
+
+@pytest.mark.benchmark(group="api-jobs")
+class TestJobStatusEndpoints:
+    def test_background_job_status(self, benchmark, job_id):
+        """Routeur BackgroundTasks (jobs_bg), servi ici par une application dédiée"""
+        app = FastAPI()
+        app.include_router(jobs_bg.router, prefix=f"{API}/jobs")
+        with TestClient(app) as jobs_client:
+            benchmark(_call, jobs_client, "GET", f"{API}/jobs/{job_id}/status")
+
+    def test_celery_job_status(self, benchmark, client, job_id):
+        """Route montée /jobs/{id}/status (interroge le backend de résultats Celery)"""
+        from app.celery_config import REDIS_URL
+
+        if not _redis_reachable(REDIS_URL):
+            pytest.skip(f"Redis injoignable ({REDIS_URL})")
+        benchmark(_call, client, "GET", f"{API}/jobs/{job_id}/status")
+
+
+@pytest.mark.benchmark(group="api-workflows")
+class TestWorkflowOutputEndpoints:
+    def test_workflow_outputs(self, benchmark, client, workflow_id):
+        response = benchmark(
+            _call, client, "GET", f"{API}/projects/workflows/{workflow_id}/outputs"
+        )
+        assert response.json()["total_outputs"] == TASKS_PER_PROJECT
+
+    def test_workflow_outputs_not_modified(self, benchmark, client, workflow_id):
+        url = f"{API}/projects/workflows/{workflow_id}/outputs"
+        etag = _call(client, "GET", url).headers["etag"]
+
+        benchmark(_call, client, "GET", url, 304, headers={"If-None-Match": etag})
@@ -0,0 +1,138 @@
+"""
+Benchmarks des écritures en base: SQLite et PostgreSQL
+Débit d'écriture des motifs de l'application (commit par ligne, lot, progression de job)
+
+PostgreSQL n'est mesuré que si BENCH_POSTGRES_URL pointe vers une base
+jetable: le schéma y est créé puis supprimé.
+"""
+
+import itertools
+import os
+import tempfile
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core import serialization
+from app.db.config import Base
+from app.models.job_models import AsyncJob
+from app.models.models import Project, Task
+from app.models.workflow_models import TaskOutputType
+from app.services import output_service
+
+BATCH_ROWS = 100
+
+_counter = itertools.count()
+
+
+def _engine(url: str):
+    """Moteur configuré comme app.db.config (sérialiseur JSON, options SQLite)"""
+    options = {}
+    if url.startswith("sqlite"):
+        options["connect_args"] = {"check_same_thread": False, "timeout": 20}
+    return create_engine(
+        url,
+        json_serializer=serialization.dumps,
+        json_deserializer=serialization.loads,
+        **options,
+    )
+
+
+@pytest.fixture(scope="module", params=["sqlite", "postgresql"])
+def session_factory(request):
+    if request.param == "sqlite":
+        directory = tempfile.mkdtemp(prefix="geekblog-bench-")
+        url = f"sqlite:///{os.path.join(directory, 'writes.db')}"
+    else:
+        url = os.getenv("BENCH_POSTGRES_URL")
+        if not url:
+            pytest.skip("BENCH_POSTGRES_URL non défini")
+
+    engine = _engine(url)
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def project_id(session_factory):
+    with session_factory() as db:
+        project = Project(name="Écritures benchmark", description="Débit d'écriture")
+        db.add(project)
+        db.commit()
+        return project.id
+
+
+def _report_rate(benchmark, rows: int) -> None:
+    benchmark.extra_info["rows_per_round"] = rows
+    # --benchmark-disable: une seule exécution, sans statistiques
+    if benchmark.disabled or benchmark.stats is None:
+        return
+    benchmark.extra_info["rows_per_second"] = round(rows / benchmark.stats.stats.mean, 1)
+
+
+@pytest.mark.benchmark(group="db-writes")
+class TestDatabaseWrites:
+    def test_insert_commit_per_row(self, benchmark, session_factory, project_id):
+        """Création d'une tâche par requête API"""
+
+        def insert():
+            with session_factory() as db:
+                db.add(Task(title=f"Tâche {next(_counter)}", project_id=project_id))
+                db.commit()
+
+        benchmark(insert)
+        _report_rate(benchmark, 1)
+
+    def test_insert_batch(self, benchmark, session_factory, project_id):
+        """Tâches d'une planification, en une transaction"""
+
+        def insert_batch():
+            with session_factory() as db:
+                db.add_all(
+                    Task(title=f"Tâche {next(_counter)}", project_id=project_id, order=order)
+                    for order in range(BATCH_ROWS)
+                )
+                db.commit()
+
+        benchmark(insert_batch)
+        _report_rate(benchmark, BATCH_ROWS)
+
+    def test_job_progress_update(self, benchmark, session_factory):
+        """Mise à jour de progression d'un AsyncJob (BackgroundTaskManager)"""
+        job_id = f"bench-writes-{next(_counter)}"
+        with session_factory() as db:
+            db.add(AsyncJob(id=job_id, type="writing", status="PROGRESS", progress=0))
+            db.commit()
+
+        def update_progress():
+            with session_factory() as db:
+                job = db.get(AsyncJob, job_id)
+                job.progress = (job.progress or 0) % 100 + 1
+                job.step = f"Étape {job.progress}"
+                db.commit()
+
+        benchmark(update_progress)
+        _report_rate(benchmark, 1)
+
+    def test_save_task_output(self, benchmark, session_factory, project_id):
+        """Output rédigé: hash, MinHash, quasi-doublons et score de style inclus"""
+        with session_factory() as db:
+            task = Task(title="Rédaction", project_id=project_id)
+            db.add(task)
+            db.commit()
+            task_id = task.id
+
+        def save_output():
+            with session_factory() as db:
+                output_service.create_output(
+                    db,
+                    task_id,
+                    TaskOutputType.WRITING,
+                    f"Version {next(_counter)}. Du coup, je teste Docker sur mon serveur. " * 60,
+                )
+
+        benchmark(save_output)
+        _report_rate(benchmark, 1)
@@ -0,0 +1,108 @@
+"""
+Benchmarks du pipeline de jobs avec le LLM factice
+Surcoût du BackgroundTaskManager et durée d'un workflow complet selon le nombre de sections
+"""
+
+import asyncio
+import itertools
+
+import pytest
+
+from app.core.task_manager import task_manager
+from app.db.config import SessionLocal
+from app.models.workflow_models import WorkflowStatus, WorkflowType
+from app.schemas.schemas import ProjectCreate
+from app.services import project_service, workflow_service
+from app.tasks.orchestrator_bg import _wait_for_step, full_article_workflow_task_bg
+
+CONCURRENT_JOBS = 50
+
+_counter = itertools.count()
+
+
+async def _noop():
+    return {"success": True}
+
+
+def _noop_sync():
+    return {"success": True}
+
+
+async def _submit_and_wait(func) -> dict:
+    task_id = await task_manager.submit_task(func, "bench.noop")
+    running = task_manager._running_tasks.get(task_id)
+    if running is not None:
+        await running
+    return await task_manager.get_task_status(task_id)
+
+
+@pytest.mark.benchmark(group="task-manager")
+class TestTaskManagerOverhead:
+    """Soumission → fin d'une tâche vide: persistance AsyncJob et mises à jour de statut"""
+
+    def test_async_task(self, benchmark, run):
+        status = benchmark(lambda: run(_submit_and_wait(_noop)))
+        assert status["status"] == "SUCCESS"
+
+    def test_sync_task(self, benchmark, run):
+        status = benchmark(lambda: run(_submit_and_wait(_noop_sync)))
+        assert status["status"] == "SUCCESS"
+
+    def test_concurrent_tasks(self, benchmark, run):
+        async def submit_many():
+            return await asyncio.gather(
+                *(_submit_and_wait(_noop) for _ in range(CONCURRENT_JOBS))
+            )
+
+        statuses = benchmark.pedantic(lambda: run(submit_many()), rounds=5)
+        assert all(status["status"] == "SUCCESS" for status in statuses)
+        benchmark.extra_info["jobs_per_round"] = CONCURRENT_JOBS
+
+
+def _new_workflow():
+    """Projet neuf et son exécution de workflow (commités)"""
+    with SessionLocal() as db:
+        project = project_service.create_project(
+            db,
+            ProjectCreate(
+                name=f"Workflow benchmark {next(_counter)}",
+                description="Déployer une application Python avec Docker",
+            ),
+        )
+        workflow = workflow_service.create_workflow_execution(
+            db, project.id, WorkflowType.FULL_ARTICLE
+        )
+        db.commit()
+        return (project.id, workflow.id), {}
+
+
+async def _run_workflow(project_id: int, workflow_id: str) -> dict:
+    result = await full_article_workflow_task_bg.delay(project_id, workflow_id)
+    status = await _wait_for_step(result)
+    return status["result"]
+
+
+@pytest.mark.benchmark(group="workflow")
+@pytest.mark.parametrize("sections", [3, 6, 12])
+def test_full_workflow(benchmark, run, fake_llm, sections):
+    """Planification → recherches parallèles → assemblage → finition, de bout en bout"""
+    fake_llm.sections = sections
+    calls_before = fake_llm.calls
+
+    result = benchmark.pedantic(
+        lambda project_id, workflow_id: run(_run_workflow(project_id, workflow_id)),
+        setup=_new_workflow,
+        rounds=3,
+    )
+
+    assert result["success"], result
+    with SessionLocal() as db:
+        workflow = workflow_service.get_workflow_by_id(db, result["workflow_id"])
+        assert workflow.status == WorkflowStatus.COMPLETED
+    benchmark.extra_info.update(
+        {
+            "sections": sections,
+            "llm_latency_ms": fake_llm.latency * 1000,
+            "llm_calls_per_workflow": (fake_llm.calls - calls_before) / 3,
+        }
+    )
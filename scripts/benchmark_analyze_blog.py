@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmark of analyze_blog.py --workers on a synthetic WordPress export.
+
+Generates a deterministic export (French geek-blog vocabulary, HTML markup,
+categories and tags), then times the analysis with an increasing number of
+worker processes. Every parallel report is checked against the serial one.
+
+XML parsing stays in the main process: its duration is printed as the
+serial part of the work, which bounds the achievable speedup.
+
+The incremental mode (--cache) is then timed on a cold cache and on a
+refresh after 1% new posts were published.
+
+Usage:
+    python scripts/benchmark_analyze_blog.py [--posts 3000] [--workers 1,2,4,8]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+
+def setup_path():
+    """Add project root to path for imports."""
+    project_root = Path(__file__).parent.parent
+    if str(project_root) not in sys.path:
+        sys.path.insert(0, str(project_root))
+
+
+setup_path()
+
+import analyze_blog  # noqa: E402
+
+WORDS = (
+    "je pense que le code python sur linux est super cool du coup la base de données "
+    "postgresql avec docker et kubernetes en fait c'est génial ! pourquoi pas ? "
+    "le machine learning sur mac nous aide pour notre api et mon application "
+    "une pull request sur github avant le deploy du serveur cloud "
+    "le la les un une des de du et ou mais donc car avec sans pour par sur dans"
+).split()
+MARKUP = (
+    "",
+    '<img src="https://example.org/image.png" />',
+    "<code>pip install geekblog</code>",
+    "<ul><li>un</li><li>deux</li></ul>",
+    "<h2>Intertitre</h2>",
+    " https://example.org/source ",
+)
+TITLES = (
+    "Comment installer {}",
+    "Test du {}",
+    "Top 10 des astuces {}",
+    "Mon avis sur {}",
+    "Partie 2 : {}",
+    "Nouvelle sortie de {}",
+)
+
+
+def write_export(path: str, posts: int, seed: int = 42) -> None:
+    """Deterministic WXR export with `posts` published posts."""
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as out:
+        out.write(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/" '
+            'xmlns:wp="http://wordpress.org/export/1.2/"><channel><title>Bench</title>\n'
+        )
+        for index in range(posts):
+            paragraphs = "\n\n".join(
+                "<p>{}. {}</p>".format(
+                    " ".join(rng.choice(WORDS) for _ in range(rng.randint(30, 120))),
+                    rng.choice(MARKUP),
+                )
+                for _ in range(rng.randint(3, 12))
+            )
+            categories = "".join(
+                f'<category domain="category" nicename="c"><![CDATA[Cat {rng.randint(1, 8)}]]></category>'
+                for _ in range(rng.randint(1, 2))
+            )
+            tags = "".join(
+                f'<category domain="post_tag" nicename="t"><![CDATA[tag{rng.randint(1, 60)}]]></category>'
+                for _ in range(rng.randint(0, 4))
+            )
+            title = escape(rng.choice(TITLES).format(rng.choice(WORDS)))
+            out.write(
+                f'<item><guid isPermaLink="false">https://bench.example/?p={index}</guid>'
+                f"<title>{title}</title>"
+                f"<pubDate>Mon, {1 + index % 28:02d} Jan {2010 + index % 15} 10:00:00 +0000</pubDate>"
+                f"{categories}{tags}"
+                f"<content:encoded><![CDATA[{paragraphs}]]></content:encoded>"
+                "<wp:post_type>post</wp:post_type><wp:status>publish</wp:status></item>\n"
+            )
+        out.write("</channel></rss>\n")
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def run(posts: int, worker_counts: list[int]) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "export.xml")
+        write_export(path, posts)
+        size_mb = os.path.getsize(path) / 1024 / 1024
+
+        parse_time, _ = timed(lambda: sum(1 for _ in analyze_blog.iter_posts(path)))
+        print(
+            f"{posts} posts, {size_mb:.1f} MB, {os.cpu_count()} CPU cores, "
+            f"XML parsing (serial part): {parse_time:.2f}s\n"
+        )
+        print(f"{'workers':>8}{'time':>10}{'posts/s':>10}{'speedup':>10}{'efficiency':>12}")
+
+        baseline = reference = None
+        for workers in worker_counts:
+            elapsed, report = timed(
+                lambda: analyze_blog.analyze_export(path, workers=workers)
+            )
+            if reference is None:
+                baseline, reference = elapsed, report
+            elif report != reference:
+                raise SystemExit(f"Report with {workers} workers differs from the serial one")
+
+            speedup = baseline / elapsed
+            print(
+                f"{workers:>8}{elapsed:>9.2f}s{posts / elapsed:>10.0f}"
+                f"{speedup:>9.2f}x{speedup / workers:>11.0%}"
+            )
+
+        cache_path = os.path.join(directory, "cache.sqlite")
+        print("\nincremental (--cache)")
+        for label, export_posts in (("cold cache", posts), ("+1% new posts", posts + posts // 100)):
+            write_export(path, export_posts)
+            cache = analyze_blog.FeatureCache(cache_path)
+            try:
+                elapsed, report = timed(lambda: analyze_blog.analyze_export(path, cache=cache))
+            finally:
+                cache.close()
+            if report != analyze_blog.analyze_export(path):
+                raise SystemExit(f"Incremental report ({label}) differs from a full analysis")
+            print(
+                f"{label:>16}{elapsed:>9.2f}s  {cache.hits} reused, {cache.misses} analyzed"
+            )
+
+
+def main():
+    cores = os.cpu_count() or 1
+    default_workers = sorted({1, *[2**i for i in range(1, 8) if 2**i <= cores], cores})
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--posts", type=int, default=3000)
+    parser.add_argument(
+        "--workers",
+        default=",".join(map(str, default_workers)),
+        help="comma-separated worker counts (first one is the baseline)",
+    )
+    args = parser.parse_args()
+    run(args.posts, [int(count) for count in args.workers.split(",")])
+
+
+if __name__ == "__main__":
+    main()
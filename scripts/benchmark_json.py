@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark of the JSON serialization paths (stdlib json vs orjson).
+
+Measures, on realistic rows (seeded BlogTemplate rows and AsyncJob rows with
+progress history and results):
+    - CompatJSON bind / result processing (SQLite JSON columns)
+    - ORM reload of all the rows
+    - rendering of raw dict API responses (JSONResponse vs FastJSONResponse)
+
+Usage:
+    python scripts/benchmark_json.py [--rounds 200] [--jobs 200]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+def setup_path():
+    """Add project root to path for imports."""
+    project_root = Path(__file__).parent.parent
+    if str(project_root) not in sys.path:
+        sys.path.insert(0, str(project_root))
+
+
+setup_path()
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.api.responses import FastJSONResponse  # noqa: E402
+from app.core import serialization  # noqa: E402
+from app.db.compat import CompatJSON  # noqa: E402
+from app.db.config import Base  # noqa: E402
+from app.db.seed_templates import seed_templates  # noqa: E402
+from app.models import models, job_models, workflow_models  # noqa: E402,F401
+
+BACKENDS = ["json", "orjson"] if serialization.orjson is not None else ["json"]
+
+
+def make_job(index: int) -> job_models.AsyncJob:
+    """AsyncJob as written by a full research workflow."""
+    history = [
+        {
+            "step": f"Étape {step}",
+            "progress": step * 10.0,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "message": f"Recherche en cours pour la section {step} de l'article…",
+        }
+        for step in range(1, 11)
+    ]
+    return job_models.AsyncJob(
+        id=f"bench-{index}",
+        type="RESEARCH",
+        status="SUCCESS",
+        progress=100.0,
+        job_metadata={
+            "agent": "researcher",
+            "model": "llama-3.3-70b",
+            "attempt": 1,
+            "result": {
+                "success": True,
+                "summary": "Synthèse des sources trouvées. " * 40,
+                "sources": [f"https://example.org/article/{i}" for i in range(8)],
+                "tokens": {"prompt": 1843, "completion": 962},
+            },
+        },
+        progress_history=history,
+    )
+
+
+def timed(function, rounds: int) -> float:
+    """Median duration of one call, in microseconds."""
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(samples)
+
+
+def build_database(jobs: int):
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    seed_templates(session)
+    session.add_all(make_job(i) for i in range(jobs))
+    session.commit()
+    return engine, session
+
+
+def json_values(session):
+    """All JSON column values of the seeded rows."""
+    values = []
+    for template in session.query(models.BlogTemplate).all():
+        values += [
+            template.template_structure,
+            template.sample_expressions,
+            template.additional_metadata,
+        ]
+    for job in session.query(job_models.AsyncJob).all():
+        values += [job.job_metadata, job.progress_history]
+    return [value for value in values if value is not None]
+
+
+def run(rounds: int, jobs: int) -> None:
+    engine, session = build_database(jobs)
+    values = json_values(session)
+    dialect = engine.dialect
+    column_type = CompatJSON()
+    payload = [
+        {"id": job.id, "status": job.status, "progress_history": job.progress_history}
+        for job in session.query(job_models.AsyncJob).all()
+    ]
+    session.close()
+
+    print(f"{len(values)} JSON values, {jobs} jobs, median of {rounds} rounds\n")
+    print(f"{'path':<34}" + "".join(f"{backend:>12}" for backend in BACKENDS))
+
+    results = {}
+    for backend in BACKENDS:
+        serialization.JSON_BACKEND = backend
+        encoded = [column_type.process_bind_param(value, dialect) for value in values]
+
+        def reload_rows():
+            with sessionmaker(bind=engine)() as db:
+                db.query(models.BlogTemplate).all()
+                db.query(job_models.AsyncJob).all()
+
+        response_class = FastJSONResponse if backend == "orjson" else JSONResponse
+        results[backend] = {
+            "CompatJSON bind (all values)": timed(
+                lambda: [column_type.process_bind_param(v, dialect) for v in values], rounds
+            ),
+            "CompatJSON result (all values)": timed(
+                lambda: [column_type.process_result_value(v, dialect) for v in encoded],
+                rounds,
+            ),
+            "ORM reload (templates + jobs)": timed(reload_rows, max(rounds // 10, 5)),
+            "dict response render": timed(
+                lambda: response_class(payload).body, rounds
+            ),
+        }
+
+    for path in results[BACKENDS[0]]:
+        row = "".join(f"{results[b][path]:>10.0f}µs" for b in BACKENDS)
+        speedup = (
+            f"   x{results['json'][path] / results['orjson'][path]:.1f}"
+            if len(BACKENDS) == 2
+            else ""
+        )
+        print(f"{path:<34}{row}{speedup}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--jobs", type=int, default=200)
+    args = parser.parse_args()
+    run(args.rounds, args.jobs)
+
+
+if __name__ == "__main__":
+    main()
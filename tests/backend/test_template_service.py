@@ -3,6 +3,7 @@ Tests pour le service de gestion des templates de blog.
 """
 
 import pytest
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 from app.models.models import BlogTemplate, Task
@@ -211,6 +212,36 @@ class TestTemplateService:
         assert stats["difficulty_distribution"]["Moyen"] == 2
         assert stats["difficulty_distribution"]["Avancé"] == 1
         assert stats["boulet_style_templates"] == 4
+        assert stats["category_distribution"] == {"Test": 5}
+        assert stats["tone_distribution"] == {"Neutre": 5}
+
+    def test_template_stats_single_query_and_refresh(
+        self, db_session: Session, sample_template: BlogTemplate
+    ):
+        """Stats en une requête groupée, servies en cache puis rafraîchies."""
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = db_session.get_bind().engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            stats = template_service.get_template_stats(db_session)
+            template_service.get_template_stats(db_session)
+            template_service.get_template_categories(db_session)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert len(statements) == 1
+        assert "GROUP BY" in statements[0]
+        assert stats["total_templates"] == 1
+
+        template_service.update_template(
+            db_session, sample_template.id, BlogTemplateUpdate(tone="Pratique")
+        )
+        stats = template_service.get_template_stats(db_session)
+        assert stats["tone_distribution"] == {"Pratique": 1}
 
 
 class TestProjectFromTemplate:
@@ -348,6 +379,76 @@ class TestProjectFromTemplate:
         # dans la génération des tâches (à implémenter si nécessaire)
 
 
+class TestTemplateCache:
+    """Tests pour le cache en mémoire des templates compilés."""
+
+    def test_reads_served_without_queries(
+        self, db_session: Session, sample_template: BlogTemplate
+    ):
+        """Après chargement, liste, slug et aperçu ne touchent plus la base."""
+        template_service.get_templates(db_session)
+        loads = template_service.template_cache.loads
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = db_session.get_bind().engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            customization = TemplateCustomization(title="Titre", theme="Thème")
+            assert template_service.get_template_by_slug(db_session, "template-test")
+            assert len(template_service.get_templates(db_session, category="Test")) == 1
+            tasks = template_service.preview_template_tasks(
+                db_session, sample_template.id, customization
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert [t["title"] for t in tasks] == ["Step 1", "Step 2"]
+        assert statements == []
+        assert template_service.template_cache.loads == loads
+
+    def test_writes_invalidate_cache(
+        self, db_session: Session, sample_template: BlogTemplate
+    ):
+        """Les écritures du service incrémentent la version et rechargent."""
+        template_service.get_templates(db_session)
+        version = template_service.template_cache.version
+
+        template_service.update_template(
+            db_session, sample_template.id, BlogTemplateUpdate(name="Renommé")
+        )
+
+        assert template_service.template_cache.version == version + 1
+        assert template_service.get_template_by_slug(db_session, "template-test").name == (
+            "Renommé"
+        )
+
+        template_service.deactivate_template(db_session, sample_template.id)
+        assert template_service.get_template_by_id(db_session, sample_template.id) is None
+
+    def test_stale_load_is_not_installed(
+        self, db_session: Session, sample_template: BlogTemplate
+    ):
+        """Un chargement concurrent d'une invalidation n'écrase pas le cache."""
+        cache = template_service.TemplateCache()
+        original_compile = template_service.compile_template
+
+        def compile_during_invalidation(template):
+            cache.invalidate()
+            return original_compile(template)
+
+        template_service.compile_template = compile_during_invalidation
+        try:
+            cache.load(db_session)
+        finally:
+            template_service.compile_template = original_compile
+
+        assert cache.loads == 0
+        assert cache._snapshot is None
+
+
 @pytest.fixture
 def sample_template(db_session: Session) -> BlogTemplate:
     """Fixture pour créer un template de test."""
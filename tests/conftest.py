@@ -3,6 +3,8 @@ Configuration de test globale pour GeekBlog
 Fournit les fixtures partagées pour tous les tests
 """
 
+import os
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
@@ -11,7 +13,9 @@ from sqlalchemy.pool import StaticPool
 
 from app.main import app
 from app.db.config import get_db, Base
+from app.db.search_index import drop_search_index, install_search_index
 from app.models.models import Project, Task
+from app.services.template_service import template_cache
 
 # Configuration de la base de données de test
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
@@ -24,17 +28,33 @@ engine = create_engine(
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+def pytest_configure(config):
+    """Variables lues au démarrage de l'app ou à l'appel, donc avant tout test"""
+    # Les tests de crews ne doivent pas écrire dans la base de développement
+    os.environ.setdefault("LLM_CALL_LOGGING", "false")
+    # Le cache des templates se charge depuis la base de test, pas au démarrage
+    os.environ.setdefault("TEMPLATE_CACHE_WARMUP", "false")
+    # Pas d'échantillonneur de santé en arrière-plan sur la base de développement
+    os.environ.setdefault("HEALTH_SAMPLER", "false")
+
+
 @pytest.fixture(scope="session")
 def db_engine():
     """Engine de base de données pour les tests"""
     Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        install_search_index(connection)
     yield engine
+    with engine.begin() as connection:
+        drop_search_index(connection)
     Base.metadata.drop_all(bind=engine)
 
 
 @pytest.fixture(scope="function")
 def db_session(db_engine):
     """Session de base de données isolée par test"""
+    # Les caches en mémoire ne doivent pas survivre au rollback du test
+    template_cache.invalidate()
     connection = db_engine.connect()
     transaction = connection.begin()
     session = TestingSessionLocal(bind=connection)
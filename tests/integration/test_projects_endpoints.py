@@ -235,3 +235,116 @@ class TestProjectsEdgeCases:
         assert data["name"] == update_data["name"]
         # Description doit rester inchangée
         assert data["description"] == sample_project.description
+
+
+@pytest.mark.integration
+@pytest.mark.requires_db
+class TestConditionalGet:
+    """Tests des GET conditionnels (ETag / If-None-Match)"""
+
+    def test_project_not_modified(
+        self, client: TestClient, sample_project: Project, monkeypatch
+    ):
+        url = f"/api/v1/projects/{sample_project.id}"
+        first = client.get(url)
+        etag = first.headers["ETag"]
+
+        # Le 304 est décidé avant le chargement ORM de l'endpoint
+        from app.api.endpoints import projects
+
+        def fail(*args, **kwargs):
+            raise AssertionError("chargement complet inattendu")
+
+        monkeypatch.setattr(projects.project_service, "get_project", fail)
+        cached = client.get(url, headers={"If-None-Match": etag})
+
+        assert first.status_code == 200
+        assert etag.startswith('W/"')
+        assert cached.status_code == 304
+        assert cached.headers["ETag"] == etag
+        assert cached.content == b""
+
+    def test_etag_changes_with_project_or_tasks(
+        self, client: TestClient, sample_project: Project, db_session: Session
+    ):
+        url = f"/api/v1/projects/{sample_project.id}"
+        etag = client.get(url).headers["ETag"]
+
+        db_session.add(Task(project_id=sample_project.id, title="Nouvelle tâche"))
+        db_session.commit()
+        response = client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert [t["title"] for t in response.json()["tasks"]] == ["Nouvelle tâche"]
+
+    def test_missing_project_still_404(self, client: TestClient):
+        response = client.get("/api/v1/projects/9999", headers={"If-None-Match": "*"})
+
+        assert response.status_code == 404
+        assert "ETag" not in response.headers
+
+    def test_workflow_outputs_and_templates(
+        self, client: TestClient, sample_task: Task, db_session: Session
+    ):
+        from app.models.workflow_models import TaskOutputType, WorkflowExecution, WorkflowType
+        from app.services import output_service
+
+        workflow = WorkflowExecution(
+            project_id=sample_task.project_id, workflow_type=WorkflowType.FULL_ARTICLE
+        )
+        db_session.add(workflow)
+        db_session.commit()
+        url = f"/api/v1/projects/workflows/{workflow.id}/outputs"
+        empty = client.get(url)
+        output_service.create_output(
+            db_session,
+            sample_task.id,
+            TaskOutputType.RESEARCH,
+            "Résultat de recherche",
+            workflow_execution_id=workflow.id,
+        )
+        updated = client.get(url, headers={"If-None-Match": empty.headers["ETag"]})
+        templates = client.get("/api/v1/templates/")
+        filtered = client.get("/api/v1/templates/", params={"category": "Guide"})
+
+        assert updated.status_code == 200
+        assert updated.json()["outputs"][0]["word_count"] == 3
+        assert client.get(url, headers={"If-None-Match": updated.headers["ETag"]}).status_code == 304
+        assert templates.headers["ETag"] != filtered.headers["ETag"]
+        assert (
+            client.get(
+                "/api/v1/templates/", headers={"If-None-Match": templates.headers["ETag"]}
+            ).status_code
+            == 304
+        )
+
+
+@pytest.mark.integration
+@pytest.mark.requires_db
+class TestWorkflowStatus:
+    """Tests du statut détaillé d'un workflow"""
+
+    def test_status_returns_workflow_metadata(
+        self, client: TestClient, sample_project: Project, db_session: Session
+    ):
+        from app.models.workflow_models import WorkflowType
+        from app.services import workflow_service
+
+        workflow = workflow_service.create_workflow_execution(
+            db_session, sample_project.id, WorkflowType.FULL_ARTICLE, {"source": "kanban"}
+        )
+        db_session.commit()
+
+        response = client.get(f"/api/v1/projects/workflows/{workflow.id}/status")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["id"] == workflow.id
+        assert data["metadata"] == {"source": "kanban"}
+        assert data["total_jobs"] == 0
+
+    def test_status_unknown_workflow(self, client: TestClient):
+        response = client.get("/api/v1/projects/workflows/inconnu/status")
+
+        assert response.status_code == 404
@@ -7,6 +7,8 @@ import pytest
 from fastapi.testclient import TestClient
 
 from app.models.models import Project, Task
+from app.models.workflow_models import TaskOutput, TaskOutputBand, TaskOutputType
+from app.services import output_service
 
 
 @pytest.mark.integration
@@ -186,6 +188,27 @@ class TestTasksByProject:
         tasks = response.json()
         assert len(tasks) == 2
 
+    def test_get_tasks_conditional(
+        self,
+        client: TestClient,
+        sample_project: Project,
+        multiple_tasks: list[Task],
+        db_session,
+    ):
+        """Test ETag / 304 sur la liste des tâches d'un projet"""
+        url = f"/api/v1/tasks/project/{sample_project.id}"
+        etag = client.get(url).headers["ETag"]
+
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+        paged = client.get(f"{url}?limit=2", headers={"If-None-Match": etag})
+        assert paged.status_code == 200
+
+        multiple_tasks[0].status = "Terminé"
+        db_session.commit()
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()[0]["status"] == "Terminé"
+
 
 @pytest.mark.integration
 @pytest.mark.requires_ai
@@ -295,3 +318,168 @@ class TestTasksValidation:
 
         # Devrait passer ou échouer selon les contraintes
         assert response.status_code in [201, 422]
+
+
+@pytest.mark.integration
+@pytest.mark.requires_db
+class TestTasksBulk:
+    """Tests des opérations en lot (Kanban)"""
+
+    @staticmethod
+    def _project_order(db_session, project_id):
+        db_session.expire_all()
+        tasks = (
+            db_session.query(Task)
+            .filter(Task.project_id == project_id)
+            .order_by(Task.order, Task.id)
+            .all()
+        )
+        return [task.title for task in tasks]
+
+    def test_bulk_status_change_and_delete(
+        self, client: TestClient, db_session, multiple_tasks
+    ):
+        """Changement de statut de plusieurs tâches et suppression en une requête"""
+        deleted_id = multiple_tasks[3].id
+        payload = {
+            "updates": [
+                {"id": multiple_tasks[0].id, "status": "Terminé"},
+                {"id": multiple_tasks[1].id, "status": "Terminé"},
+            ],
+            "delete_ids": [deleted_id],
+        }
+
+        response = client.patch("/api/v1/tasks/bulk", json=payload)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["updated"] == 2
+        assert data["deleted"] == 1
+        assert {task["status"] for task in data["tasks"]} == {"Terminé"}
+        db_session.expire_all()
+        assert db_session.get(Task, deleted_id) is None
+
+    def test_bulk_delete_task_with_outputs(
+        self, client: TestClient, db_session, multiple_tasks
+    ):
+        """Les outputs d'une tâche supprimée en lot sont supprimés avec elle"""
+        deleted_id = multiple_tasks[0].id
+        kept_id = multiple_tasks[1].id
+        for task_id in (deleted_id, kept_id):
+            output_service.save_task_output(
+                db_session, task_id, TaskOutputType.RESEARCH, f"Recherche {task_id}"
+            )
+        db_session.commit()
+
+        response = client.patch("/api/v1/tasks/bulk", json={"delete_ids": [deleted_id]})
+
+        assert response.status_code == 200
+        assert response.json()["deleted"] == 1
+        db_session.expire_all()
+        remaining = {output.task_id for output in db_session.query(TaskOutput).all()}
+        assert remaining == {kept_id}
+        # Les bandes LSH des outputs supprimés ne restent pas orphelines
+        banded = {
+            output_id for (output_id,) in db_session.query(TaskOutputBand.output_id)
+        }
+        assert banded == {output.id for output in db_session.query(TaskOutput).all()}
+
+    def test_move_between_gapped_orders_rewrites_one_row(
+        self, client: TestClient, db_session, multiple_tasks
+    ):
+        """Avec des ordres espacés, un déplacement ne réécrit que la carte déplacée"""
+        for index, task in enumerate(multiple_tasks):
+            task.order = (index + 1) * 1024
+        db_session.commit()
+        first, second, _, last = multiple_tasks
+
+        response = client.patch(
+            "/api/v1/tasks/bulk",
+            json={"updates": [{"id": last.id, "after_id": first.id, "before_id": second.id}]},
+        )
+
+        data = response.json()
+        assert data["rebalanced"] is False
+        assert [task["id"] for task in data["tasks"]] == [last.id]
+        assert data["tasks"][0]["order"] == 1536
+        assert self._project_order(db_session, first.project_id) == [
+            "Task 1",
+            "Task 4",
+            "Task 2",
+            "Task 3",
+        ]
+
+    def test_move_without_gap_rebalances(
+        self, client: TestClient, db_session, multiple_tasks
+    ):
+        """Sans espace entre les voisines, le projet est réespacé une fois"""
+        first, second, third, last = multiple_tasks
+
+        response = client.patch(
+            "/api/v1/tasks/bulk",
+            json={
+                "updates": [
+                    {"id": last.id, "after_id": first.id, "before_id": second.id},
+                    {"id": third.id, "before_id": first.id, "status": "En cours"},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["rebalanced"] is True
+        # Seules les deux tâches demandées sont "updated", les voisines réespacées à part
+        assert data["updated"] == 2
+        assert data["reordered"] == 2
+        assert self._project_order(db_session, first.project_id) == [
+            "Task 3",
+            "Task 1",
+            "Task 4",
+            "Task 2",
+        ]
+
+    def test_created_tasks_get_gapped_orders(
+        self, client: TestClient, db_session, sample_project: Project
+    ):
+        """Les tâches créées sans ordre sont espacées: le premier déplacement ne rééquilibre pas"""
+        task_ids = []
+        for index in range(3):
+            response = client.post(
+                "/api/v1/tasks/",
+                json={"title": f"Carte {index}", "project_id": sample_project.id},
+            )
+            task_ids.append(response.json()["id"])
+        first, second, last = task_ids
+
+        response = client.patch(
+            "/api/v1/tasks/bulk",
+            json={"updates": [{"id": last, "after_id": first, "before_id": second}]},
+        )
+
+        data = response.json()
+        assert data["rebalanced"] is False
+        assert data["reordered"] == 0
+        assert [task["order"] for task in data["tasks"]] == [1536]
+
+    def test_bulk_unknown_task(self, client: TestClient, multiple_tasks):
+        """Une tâche inexistante annule toute l'opération"""
+        response = client.patch(
+            "/api/v1/tasks/bulk",
+            json={"updates": [{"id": multiple_tasks[0].id, "status": "Terminé"}, {"id": 99999}]},
+        )
+
+        assert response.status_code == 404
+
+    def test_bulk_preflight_allows_patch(self, client: TestClient):
+        """Le frontend (autre origine) peut envoyer PATCH /tasks/bulk"""
+        response = client.options(
+            "/api/v1/tasks/bulk",
+            headers={
+                "Origin": "http://localhost:3000",
+                "Access-Control-Request-Method": "PATCH",
+                "Access-Control-Request-Headers": "Content-Type",
+            },
+        )
+
+        assert response.status_code == 200
+        assert "PATCH" in response.headers["access-control-allow-methods"]
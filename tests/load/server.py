@@ -0,0 +1,181 @@
+"""
+Serveur des tests de charge: l'application avec le LLM factice des benchmarks
+Lancé en sous-processus par le pilote (python -m tests.load.server --port 8765)
+
+Ajoute à l'application, sous /api/v1/load:
+- le lancement d'un workflow complet via le BackgroundTaskManager (la route
+  generate-article passe encore par Celery et exige Redis);
+- les statistiques DB instrumentées (attentes de verrou, erreurs "locked").
+Le routeur jobs_bg (statut des jobs BackgroundTasks) est monté sous /api/v1/bg-jobs.
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Une écriture plus longue que ce seuil a attendu un verrou (SQLite: busy timeout)
+DEFAULT_LOCK_WAIT_MS = 50.0
+
+_WRITE_PREFIXES = ("INSERT", "UPDATE", "DELETE")
+
+
+class DbStats:
+    """Compteurs alimentés par les événements du moteur SQLAlchemy"""
+
+    def __init__(self, lock_wait_ms: float = DEFAULT_LOCK_WAIT_MS):
+        self.lock_wait = lock_wait_ms / 1000
+        self._lock = threading.Lock()
+        self.statements = 0
+        self.writes = 0
+        self.lock_waits = 0
+        self.lock_wait_s = 0.0
+        self.max_write_s = 0.0
+        self.locked_errors = 0
+        self.errors = 0
+
+    def record(self, statement: str, duration: float) -> None:
+        is_write = statement.lstrip()[:6].upper() in _WRITE_PREFIXES
+        with self._lock:
+            self.statements += 1
+            if not is_write:
+                return
+            self.writes += 1
+            self.max_write_s = max(self.max_write_s, duration)
+            if duration >= self.lock_wait:
+                self.lock_waits += 1
+                self.lock_wait_s += duration
+
+    def record_error(self, error: BaseException) -> None:
+        with self._lock:
+            self.errors += 1
+            if "locked" in str(error).lower():
+                self.locked_errors += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "statements": self.statements,
+                "writes": self.writes,
+                "lock_waits": self.lock_waits,
+                "lock_wait_s": round(self.lock_wait_s, 3),
+                "max_write_ms": round(self.max_write_s * 1000, 2),
+                "locked_errors": self.locked_errors,
+                "errors": self.errors,
+                "lock_wait_threshold_ms": self.lock_wait * 1000,
+            }
+
+
+def instrument_engine(engine, stats: DbStats) -> None:
+    """Chronomètre chaque requête et compte les erreurs de verrouillage"""
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("load_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _stop(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["load_query_start"].pop()
+        stats.record(statement, time.perf_counter() - started)
+
+    @event.listens_for(engine, "handle_error")
+    def _error(context):
+        starts = context.connection.info.get("load_query_start") if context.connection else None
+        if starts:
+            starts.pop()
+        stats.record_error(context.original_exception)
+
+
+def waiting_locks(db) -> int:
+    """Verrous PostgreSQL en attente à l'instant de la requête (0 sur SQLite)"""
+    from sqlalchemy import text
+
+    if db.bind.dialect.name != "postgresql":
+        return 0
+    return db.execute(text("SELECT count(*) FROM pg_locks WHERE NOT granted")).scalar() or 0
+
+
+def build_load_router(stats: DbStats):
+    from fastapi import APIRouter, Depends, HTTPException
+    from sqlalchemy.orm import Session
+
+    from app.core.executors import get_executor_stats
+    from app.db.config import get_db
+    from app.models.workflow_models import WorkflowType
+    from app.services import project_service, workflow_service
+    from app.tasks.orchestrator_bg import full_article_workflow_task_bg
+
+    router = APIRouter()
+
+    @router.post("/projects/{project_id}/workflows", status_code=202)
+    async def launch_workflow(project_id: int, db: Session = Depends(get_db)):
+        """Équivalent BackgroundTasks de /projects/{id}/workflows/generate-article"""
+        if not project_service.get_project(db, project_id=project_id):
+            raise HTTPException(status_code=404, detail="Project not found")
+        workflow = workflow_service.create_workflow_execution(
+            db, project_id, WorkflowType.FULL_ARTICLE
+        )
+        db.commit()
+        # submit_task crée l'enregistrement AsyncJob du job principal
+        job = await full_article_workflow_task_bg.delay(project_id, workflow.id)
+        return {"workflow_execution_id": workflow.id, "primary_job_id": job.id}
+
+    @router.get("/db-stats")
+    def db_stats(db: Session = Depends(get_db)):
+        return {
+            "database": db.bind.dialect.name,
+            "waiting_locks": waiting_locks(db),
+            **stats.to_dict(),
+            "executors": get_executor_stats(),
+        }
+
+    return router
+
+
+def create_app(database_url: str, llm_latency_ms: float, lock_wait_ms: float):
+    """Configure l'environnement puis importe et complète l'application"""
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.setdefault("GROQ_API_KEY", "load-fake-key")
+    os.environ["HEALTH_SAMPLER"] = "false"
+    os.environ["AI_WARMUP"] = "false"
+    if str(PROJECT_ROOT) not in sys.path:
+        sys.path.insert(0, str(PROJECT_ROOT))
+
+    from app.api.endpoints import jobs_bg
+    from app.db.config import Base, engine
+    from app.main import app
+    from benchmarks.fake_llm import install_fake_ai_stack
+
+    Base.metadata.create_all(bind=engine)
+    install_fake_ai_stack(latency=llm_latency_ms / 1000)
+
+    stats = DbStats(lock_wait_ms)
+    instrument_engine(engine, stats)
+    app.include_router(jobs_bg.router, prefix="/api/v1/bg-jobs")
+    app.include_router(build_load_router(stats), prefix="/api/v1/load")
+    return app
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serveur GeekBlog pour les tests de charge")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--llm-latency-ms", type=float, default=200.0)
+    parser.add_argument("--lock-wait-ms", type=float, default=DEFAULT_LOCK_WAIT_MS)
+    args = parser.parse_args(argv)
+
+    import uvicorn
+
+    app = create_app(args.database_url, args.llm_latency_ms, args.lock_wait_ms)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Tests du harnais de charge (tests/load)
+Agrégation des mesures, et un palier court de bout en bout contre le serveur factice
+"""
+
+import json
+import socket
+import time
+
+import pytest
+
+from tests.load import driver
+from tests.load.server import DbStats
+
+
+@pytest.mark.unit
+class TestMeasures:
+    """Percentiles, rapport par opération et suivi des workflows"""
+
+    def test_percentile_nearest_rank(self):
+        values = [float(value) for value in range(1, 101)]
+
+        assert driver.percentile(values, 50) == 50.0
+        assert driver.percentile(values, 95) == 95.0
+        assert driver.percentile(values, 99) == 99.0
+        assert driver.percentile([3.0, 1.0, 2.0], 100) == 3.0
+        assert driver.percentile([], 95) == 0.0
+
+    def test_recorder_counts_http_and_transport_errors(self):
+        recorder = driver.Recorder()
+        recorder.record("task_edit", 0.010, 200)
+        recorder.record("task_edit", 0.020, 500)
+        recorder.record("task_edit", 0.030, None, "ReadTimeout")
+        recorder.record("kanban_poll", 0.005, 304)
+
+        report = recorder.summary(elapsed=2.0)
+
+        assert report["task_edit"]["count"] == 3
+        assert report["task_edit"]["errors"] == 2
+        assert report["task_edit"]["error_rate"] == pytest.approx(0.6667)
+        assert report["task_edit"]["p50_ms"] == 20.0
+        assert report["task_edit"]["max_ms"] == 30.0
+        assert report["task_edit"]["rps"] == 1.5
+        assert report["task_edit"]["statuses"] == {200: 1, 500: 1, "ReadTimeout": 1}
+        assert report["kanban_poll"]["errors"] == 0
+
+    def test_workflows_capacity_and_completion(self):
+        workflows = driver.Workflows(limit=2)
+        workflows.active["job-1"] = {"started": time.perf_counter()}
+        assert workflows.has_capacity()
+        workflows.active["job-2"] = {"started": time.perf_counter()}
+        assert not workflows.has_capacity()
+
+        workflows.finish("job-1", "SUCCESS")
+        workflows.finish("job-2", "FAILURE")
+
+        summary = workflows.summary(elapsed=30.0)
+        assert summary["completed"] == 1
+        assert summary["failed"] == 1
+        assert summary["unfinished"] == 0
+        assert summary["completed_per_minute"] == 2.0
+
+    def test_db_delta_between_samples(self):
+        before = {"database": "sqlite", "statements": 10, "writes": 4, "lock_waits": 1,
+                  "lock_wait_s": 0.1, "locked_errors": 0, "errors": 0, "max_write_ms": 60.0}
+        after = {**before, "statements": 25, "writes": 9, "lock_waits": 3,
+                 "lock_wait_s": 0.35, "max_write_ms": 120.0}
+
+        delta = driver.db_delta(before, after, [{"waiting_locks": 0}, {"waiting_locks": 2}])
+
+        assert delta["writes"] == 5
+        assert delta["lock_waits"] == 2
+        assert delta["lock_wait_s"] == 0.25
+        assert delta["max_write_ms"] == 120.0
+        assert delta["max_waiting_locks"] == 2
+
+    def test_parse_mix(self):
+        mix = driver.parse_mix("workflow_launch=0,task_edit=40")
+
+        assert mix["workflow_launch"] == 0
+        assert mix["task_edit"] == 40
+        assert mix["kanban_poll"] == driver.DEFAULT_MIX["kanban_poll"]
+        with pytest.raises(Exception):
+            driver.parse_mix("inconnue=1")
+
+    def test_db_stats_lock_waits(self):
+        stats = DbStats(lock_wait_ms=50)
+        stats.record("SELECT 1", 0.2)
+        stats.record("UPDATE tasks SET status = ?", 0.01)
+        stats.record("  INSERT INTO tasks VALUES (?)", 0.08)
+        stats.record_error(Exception("database is locked"))
+
+        counters = stats.to_dict()
+        assert counters["statements"] == 3
+        assert counters["writes"] == 2
+        assert counters["lock_waits"] == 1
+        assert counters["max_write_ms"] == 80.0
+        assert counters["locked_errors"] == 1
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.mark.integration
+@pytest.mark.slow
+def test_short_load_run(tmp_path):
+    """Palier court: serveur en sous-processus, SQLite jetable, LLM factice rapide"""
+    output = tmp_path / "report.json"
+    exit_code = driver.main(
+        [
+            "--users", "3",
+            "--duration", "3",
+            "--workflows", "1",
+            "--projects", "1",
+            "--think-time", "0.1",
+            "--llm-latency-ms", "5",
+            "--mix", "workflow_launch=20",
+            "--drain", "30",
+            "--port", str(_free_port()),
+            "--database-url", f"sqlite:///{tmp_path / 'load.db'}",
+            "--output", str(output),
+        ]
+    )
+
+    report = json.loads(output.read_text())
+
+    stage = report["stages"][0]
+    operations = stage["operations"]
+    assert operations["kanban_poll"]["count"] > 0
+    assert all(op["errors"] == 0 for op in operations.values()), operations
+    assert exit_code == 0
+    assert stage["workflows"]["launched"] >= 1
+    assert stage["workflows"]["completed"] == stage["workflows"]["launched"]
+    assert stage["database"]["engine"] == "sqlite"
@@ -262,10 +262,7 @@ class TestAIServiceConfiguration:
         """Test initialisation réussie du LLM"""
         mock_chatgroq.return_value = Mock()
 
-        # Réimporter pour déclencher l'initialisation
-        import importlib
-
-        importlib.reload(ai_service)
+        assert ai_service._build_llm("llama3-8b-8192") is mock_chatgroq.return_value
 
         mock_chatgroq.assert_called_with(
             api_key="test_key", model="llama3-8b-8192", temperature=0.7
@@ -277,13 +274,16 @@ class TestAIServiceConfiguration:
         """Test échec initialisation LLM sans clé API"""
         mock_chatgroq.side_effect = Exception("API key required")
 
-        # Réimporter pour déclencher l'initialisation
-        import importlib
-
-        importlib.reload(ai_service)
+        # Vérifier que le LLM est None après échec
+        assert ai_service._build_llm("llama3-8b-8192") is None
 
-        # Vérifier que llm est None après échec
-        assert ai_service.llm is None
+    def test_ai_stack_loaded_on_first_use(self):
+        """Test chargement paresseux de CrewAI et des agents"""
+        assert ai_service.warm_ai_stack() is (ai_service.llm is not None)
+        assert ai_service._ai_stack_loaded
+        assert ai_service.planner_agent.role == "Planificateur de Contenu Expert"
+        with pytest.raises(AttributeError):
+            ai_service.unknown_attribute
 
     def test_search_tool_initialization(self):
         """Test initialisation de l'outil de recherche"""
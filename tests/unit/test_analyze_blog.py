@@ -0,0 +1,252 @@
+"""
+Tests unitaires de l'analyseur d'export WordPress (analyze_blog.py)
+Lecture en flux, vocabulaires et rapport en une passe
+"""
+
+import random
+import re
+
+import pytest
+
+import analyze_blog
+from analyze_blog import TermMatcher
+
+EXPORT = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"
+     xmlns:content="http://purl.org/rss/1.0/modules/content/"
+     xmlns:wp="http://wordpress.org/export/1.2/">
+<channel>
+  <title>Blog</title>
+  <wp:author><wp:author_login>admin</wp:author_login></wp:author>
+  <item>
+    <guid isPermaLink="false">https://blog.example/?p=1</guid>
+    <title>Comment installer Linux ?</title>
+    <pubDate>Mon, 02 Jan 2023 10:00:00 +0000</pubDate>
+    <category domain="category" nicename="tech"><![CDATA[Tech]]></category>
+    <category domain="post_tag" nicename="linux"><![CDATA[linux]]></category>
+    <content:encoded><![CDATA[<p>Je code en Python sur Linux. Du coup c'est cool !</p>
+
+<h2>Installation</h2><p>Voir https://example.org/guide et <code>apt install</code>.</p>]]></content:encoded>
+    <wp:post_type>post</wp:post_type>
+    <wp:status>publish</wp:status>
+  </item>
+  <item>
+    <title>Brouillon</title>
+    <content:encoded><![CDATA[<p>Pas publié</p>]]></content:encoded>
+    <wp:post_type>post</wp:post_type>
+    <wp:status>draft</wp:status>
+  </item>
+  <item>
+    <guid isPermaLink="false">https://blog.example/?p=3</guid>
+    <title>Top 5 des astuces</title>
+    <pubDate>Sun, 01 Jan 2023 10:00:00 +0000</pubDate>
+    <category domain="category" nicename="tech"><![CDATA[Tech]]></category>
+    <content:encoded><![CDATA[]]></content:encoded>
+    <wp:post_type>post</wp:post_type>
+    <wp:status>publish</wp:status>
+  </item>
+</channel>
+</rss>
+"""
+
+
+@pytest.fixture
+def export_file(tmp_path):
+    path = tmp_path / "export.xml"
+    path.write_text(EXPORT, encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.unit
+class TestTermMatcher:
+    """Tests du comptage de vocabulaire par trie"""
+
+    def test_matches_on_word_boundaries_only(self):
+        matcher = TermMatcher({"tech": ("app", "api")})
+
+        counts = matcher.count("une app, une application et l'api apis")
+
+        assert counts == {"tech": 2}
+
+    def test_multi_word_terms(self):
+        matcher = TermMatcher({"tech": ("machine learning", "mac", "base de données")})
+
+        counts = matcher.count("le machine learning sur mac avec une base de données")
+
+        assert counts == {"tech": 3}
+        assert matcher.count("une base  de données") == {"tech": 0}
+
+    def test_first_listed_term_wins_like_the_regex(self):
+        matcher = TermMatcher({"slang": ("azure", "ad", "azure ad"), "id": ("azure ad", "ad")})
+
+        assert matcher.count("azure ad") == {"slang": 2, "id": 1}
+
+    def test_counts_match_regex_alternation(self):
+        """Mêmes comptes que l'ancien re.findall(r"\\b(...)\\b") sur du texte aléatoire"""
+        vocabularies = {
+            "tech_terms": analyze_blog.TECH_TERMS,
+            "informal": analyze_blog.INFORMAL_EXPRESSIONS,
+            "geek_slang": analyze_blog.GEEK_SLANG,
+        }
+        regexes = {
+            name: re.compile(r"\b(" + "|".join(terms) + r")\b")
+            for name, terms in vocabularies.items()
+        }
+        words = [word for terms in vocabularies.values() for term in terms for word in term.split()]
+        words += ["le", "de", "et", "&"]
+        separators = [" ", " ", " ", "  ", "\n", ", ", "&"]
+        rng = random.Random(0)
+
+        for _ in range(500):
+            text = "".join(
+                rng.choice(words) + rng.choice(separators) for _ in range(rng.randint(5, 60))
+            )
+            expected = {name: len(regex.findall(text)) for name, regex in regexes.items()}
+            assert analyze_blog.TONE_MATCHER.count(text) == expected, text
+
+    def test_vocabularies_are_counted_independently(self):
+        matcher = TermMatcher({"a": ("pull request",), "b": ("pull", "request")})
+
+        assert matcher.count("une pull request") == {"a": 1, "b": 2}
+
+    def test_punctuation_is_part_of_terms(self):
+        matcher = TermMatcher({"sec": ("mitre att&ck",)})
+
+        assert matcher.count("la matrice mitre att&ck") == {"sec": 1}
+        assert matcher.count("mitre att ck") == {"sec": 0}
+
+
+@pytest.mark.unit
+class TestStreamingAnalysis:
+    """Tests de l'analyse en flux"""
+
+    def test_iter_posts_yields_published_posts_only(self, export_file):
+        posts = list(analyze_blog.iter_posts(export_file))
+
+        assert [post["title"] for post in posts] == [
+            "Comment installer Linux ?",
+            "Top 5 des astuces",
+        ]
+        assert posts[0]["categories"] == ["Tech"]
+        assert posts[0]["tags"] == ["linux"]
+
+    def test_report(self, export_file):
+        report = analyze_blog.analyze_export(export_file)
+
+        assert report["blog_info"]["total_posts"] == 2
+        assert report["blog_info"]["date_range"] == {
+            "earliest": "Sun, 01 Jan 2023 10:00:00 +0000",
+            "latest": "Mon, 02 Jan 2023 10:00:00 +0000",
+        }
+        assert report["categories"]["frequency_distribution"] == {"Tech": 2}
+        assert report["title_patterns"]["how_to"] == ["Comment installer Linux ?"]
+        assert report["title_patterns"]["lists"] == ["Top 5 des astuces"]
+
+        # Seul le premier article a du contenu
+        content = report["content_analysis"]
+        assert content["avg_headers"] == 1
+        assert content["avg_code_blocks"] == 1
+        assert content["avg_links"] == 1
+        assert report["writing_style"]["avg_tech_terms"] > 0
+        assert len(report["sample_posts"]) == 2
+
+
+@pytest.mark.unit
+class TestParallelAnalysis:
+    """Tests des accumulateurs fusionnables et du mode multi-processus"""
+
+    def test_merged_batches_give_the_serial_report(self, export_file):
+        posts = list(analyze_blog.iter_posts(export_file))
+
+        merged = analyze_blog.BlogStats()
+        for post in posts:
+            merged.merge(analyze_blog.analyze_posts([post]))
+
+        assert merged.report() == analyze_blog.analyze_posts(posts).report()
+
+    def test_process_pool_report_is_identical(self, export_file):
+        serial = analyze_blog.analyze_export(export_file)
+        parallel = analyze_blog.analyze_export(export_file, workers=2, batch_size=1)
+
+        assert parallel == serial
+
+
+@pytest.mark.unit
+class TestFeatureMatrix:
+    """Tests de la matrice de caractéristiques"""
+
+    def vector(self, **values):
+        return [values.get(field, 0) for field in analyze_blog.FEATURE_FIELDS]
+
+    def test_merge_concatenates_rows_and_categories(self):
+        first, second = analyze_blog.FeatureMatrix(), analyze_blog.FeatureMatrix()
+        first.add(self.vector(content_length=10, word_count=2), ["Tech"])
+        second.add(self.vector(content_length=30, word_count=4), ["Jeux", "Tech"])
+        second.add(self.vector(), ["Jeux"])
+
+        merged = first.merge(second)
+        matrix = merged.matrix()
+
+        assert matrix.shape == (3, len(analyze_blog.FEATURE_FIELDS))
+        stats = merged.statistics(matrix)
+        # Le troisième article, sans texte, est exclu des statistiques
+        assert stats["posts"] == 2
+        assert stats["by_category"]["Tech"]["posts"] == 2
+        assert stats["by_category"]["Tech"]["means"]["word_count"] == 3
+        assert stats["by_category"]["Jeux"]["means"]["content_length"] == 30
+        assert stats["features"]["content_length"]["p50"] == 20
+        assert sum(stats["histograms"]["word_count"]["counts"]) == 2
+
+    def test_empty_matrix(self):
+        features = analyze_blog.FeatureMatrix()
+        matrix = features.matrix()
+
+        assert features.means(matrix)["word_count"] == 0
+        assert features.statistics(matrix)["posts"] == 0
+
+
+@pytest.mark.unit
+class TestIncrementalCache:
+    """Tests du cache des résultats par article"""
+
+    def run(self, export_file, cache_path, **kwargs):
+        cache = analyze_blog.FeatureCache(cache_path)
+        try:
+            report = analyze_blog.analyze_export(export_file, cache=cache, **kwargs)
+            return report, (cache.hits, cache.misses)
+        finally:
+            cache.close()
+
+    def test_second_run_reuses_cached_features(self, export_file, tmp_path):
+        cache_path = str(tmp_path / "cache.sqlite")
+        full = analyze_blog.analyze_export(export_file)
+
+        first, first_counts = self.run(export_file, cache_path)
+        second, second_counts = self.run(export_file, cache_path)
+
+        assert first_counts == (0, 2)
+        assert second_counts == (2, 0)
+        assert first == second == full
+
+    def test_edited_post_is_reanalyzed(self, export_file, tmp_path):
+        cache_path = str(tmp_path / "cache.sqlite")
+        self.run(export_file, cache_path)
+
+        with open(export_file, encoding="utf-8") as f:
+            edited = f.read().replace("Du coup c'est cool", "C'est cool")
+        with open(export_file, "w", encoding="utf-8") as f:
+            f.write(edited)
+
+        report, counts = self.run(export_file, cache_path)
+
+        assert counts == (1, 1)
+        assert report == analyze_blog.analyze_export(export_file)
+
+    def test_cache_is_dropped_when_analysis_changes(self, export_file, tmp_path, monkeypatch):
+        cache_path = str(tmp_path / "cache.sqlite")
+        self.run(export_file, cache_path)
+
+        monkeypatch.setattr(analyze_blog, "ANALYSIS_VERSION", analyze_blog.ANALYSIS_VERSION + 1)
+        _, counts = self.run(export_file, cache_path)
+
+        assert counts == (0, 2)
@@ -0,0 +1,152 @@
+"""
+Tests unitaires pour l'assemblage incrémental de l'article final
+Empreintes par section, réutilisation et reconstruction complète
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.exceptions import FinalContentModified, ProjectNotFound
+from app.models.workflow_models import TaskOutputType
+from app.services import assembly_service, output_service
+
+
+@pytest.mark.unit
+class TestAssembleProjectIncremental:
+    """Tests de l'assemblage incrémental"""
+
+    def test_first_assembly_is_full_rebuild(self, db_session, sample_project, multiple_tasks):
+        output_service.create_output(
+            db_session, multiple_tasks[0].id, TaskOutputType.WRITING, "Contenu rédigé."
+        )
+
+        result = assembly_service.assemble_project_incremental(db_session, sample_project.id)
+
+        db_session.refresh(sample_project)
+        assert result["updated"] is True
+        assert result["full_rebuild"] is True
+        assert len(result["changed_sections"]) == 4
+        assert sample_project.final_content.startswith("# Task 1\n\nContenu rédigé.")
+        assert "# Task 4\n\nDescription for task 4" in sample_project.final_content
+        assert sample_project.final_content_updated_at is not None
+
+    def test_unchanged_project_reuses_all_sections(
+        self, db_session, sample_project, multiple_tasks
+    ):
+        assembly_service.assemble_project_incremental(db_session, sample_project.id)
+
+        result = assembly_service.assemble_project_incremental(db_session, sample_project.id)
+
+        assert result["updated"] is False
+        assert result["full_rebuild"] is False
+        assert result["changed_sections"] == []
+        assert result["reused_sections"] == 4
+
+    def test_only_changed_section_is_rendered(
+        self, db_session, sample_project, multiple_tasks
+    ):
+        assembly_service.assemble_project_incremental(db_session, sample_project.id)
+        output_service.create_output(
+            db_session, multiple_tasks[2].id, TaskOutputType.WRITING, "Nouvelle section 3."
+        )
+
+        result = assembly_service.assemble_project_incremental(db_session, sample_project.id)
+
+        db_session.refresh(sample_project)
+        assert result["changed_sections"] == [multiple_tasks[2].id]
+        assert result["reused_sections"] == 3
+        sections = sample_project.final_content.split(assembly_service.SECTION_SEPARATOR)
+        assert sections[2] == "# Task 3\n\nNouvelle section 3."
+        assert sections[3] == "# Task 4\n\nDescription for task 4"
+
+    def test_refine_applied_to_changed_sections_only(
+        self, db_session, sample_project, multiple_tasks
+    ):
+        assembly_service.assemble_project_incremental(db_session, sample_project.id)
+        multiple_tasks[1].description = "Description modifiée"
+        db_session.commit()
+        refined = []
+
+        def refine(section):
+            refined.append(section)
+            return section.upper()
+
+        assembly_service.assemble_project_incremental(
+            db_session, sample_project.id, refine_section=refine
+        )
+
+        db_session.refresh(sample_project)
+        assert refined == ["# Task 2\n\nDescription modifiée"]
+        assert "# TASK 2\n\nDESCRIPTION MODIFIÉE" in sample_project.final_content
+        assert sample_project.final_content.startswith("# Task 1")
+
+    def test_manual_edit_is_not_overwritten(
+        self, db_session, sample_project, multiple_tasks
+    ):
+        assembly_service.assemble_project_incremental(db_session, sample_project.id)
+        sample_project.final_content = "Édité à la main"
+        db_session.commit()
+
+        with pytest.raises(FinalContentModified):
+            assembly_service.assemble_project_incremental(db_session, sample_project.id)
+        assert sample_project.final_content == "Édité à la main"
+
+        result = assembly_service.assemble_project_incremental(
+            db_session, sample_project.id, force=True
+        )
+
+        assert result["full_rebuild"] is True
+        assert len(result["changed_sections"]) == 4
+
+    def test_workflow_article_without_manifest_is_not_overwritten(
+        self, db_session, sample_project, multiple_tasks
+    ):
+        """L'article fini du workflow n'a pas de manifeste: pas de reconstruction implicite"""
+        refine = MagicMock()
+        sample_project.final_content = "Article fini par le workflow"
+        db_session.commit()
+
+        with pytest.raises(FinalContentModified):
+            assembly_service.assemble_project_incremental(
+                db_session, sample_project.id, refine_section=refine
+            )
+
+        refine.assert_not_called()
+        assert sample_project.assembly_manifest is None
+
+    def test_deleted_task_section_is_removed(
+        self, db_session, sample_project, multiple_tasks
+    ):
+        assembly_service.assemble_project_incremental(db_session, sample_project.id)
+        removed_id = multiple_tasks[3].id
+        db_session.delete(multiple_tasks[3])
+        db_session.commit()
+
+        result = assembly_service.assemble_project_incremental(db_session, sample_project.id)
+
+        db_session.refresh(sample_project)
+        assert result["removed_sections"] == [removed_id]
+        assert "Task 4" not in sample_project.final_content
+
+    def test_unknown_project(self, db_session):
+        with pytest.raises(ProjectNotFound):
+            assembly_service.assemble_project_incremental(db_session, 9999)
+
+    def test_endpoint(self, client, sample_project, multiple_tasks):
+        response = client.post(f"/api/v1/projects/{sample_project.id}/assemble-incremental")
+        assert response.status_code == 200
+        assert response.json()["reused_sections"] == 0
+
+        missing = client.post("/api/v1/projects/9999/assemble-incremental")
+        assert missing.status_code == 404
+
+    def test_endpoint_conflict_on_foreign_content(
+        self, client, db_session, sample_project, multiple_tasks
+    ):
+        sample_project.final_content = "Édité à la main"
+        db_session.commit()
+        url = f"/api/v1/projects/{sample_project.id}/assemble-incremental"
+
+        assert client.post(url).status_code == 409
+        assert client.post(url, params={"force": True}).status_code == 200
@@ -0,0 +1,150 @@
+"""
+Tests unitaires pour la finition découpée par sections
+Découpage, passe de cohérence et exécution parallèle
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.services import ai_service
+from app.services.assembly_service import SECTION_SEPARATOR
+
+
+ARTICLE = (
+    "# Introduction\n\nDocker simplifie le déploiement.\n\nDeuxième paragraphe."
+    "\n\n---\n\n"
+    "# Concepts\n\nLes conteneurs isolent les processus.\n\nImages et volumes."
+    "\n\n---\n\n"
+    "# Conclusion\n\nDocker est incontournable."
+)
+
+
+@pytest.fixture
+def fake_section_crew(monkeypatch):
+    """Crew de section factice: lent et traçable"""
+    calls = []
+
+    def refine(section, call_info=None):
+        calls.append(section)
+        time.sleep(0.2)
+        if call_info is not None:
+            call_info.update(
+                {
+                    "model_used": "fast-model",
+                    "prompt_tokens": 10,
+                    "completion_tokens": 5,
+                    "total_tokens": 15,
+                    "retries": 0,
+                    "cost_usd": 0.001,
+                }
+            )
+        return section.replace("Docker", "DOCKER")
+
+    monkeypatch.setattr(ai_service, "run_section_finishing_crew", refine)
+    monkeypatch.setattr(ai_service, "run_consistency_pass", lambda sections, info=None: sections)
+    monkeypatch.setattr(ai_service, "FINISHING_CHUNKED_THRESHOLD_TOKENS", 0)
+    return calls
+
+
+@pytest.mark.unit
+class TestSplitArticleSections:
+    """Tests du découpage en sections"""
+
+    def test_split_on_assembly_separator(self):
+        sections = ai_service.split_article_sections(ARTICLE)
+        assert [s.splitlines()[0] for s in sections] == [
+            "# Introduction",
+            "# Concepts",
+            "# Conclusion",
+        ]
+
+    def test_split_on_headers_without_separator(self):
+        content = "# A\n\nTexte A\n\n# B\n\nTexte B"
+        assert ai_service.split_article_sections(content) == ["# A\n\nTexte A", "# B\n\nTexte B"]
+
+    def test_oversized_section_split_by_paragraphs(self):
+        section = "# Long\n\n" + "\n\n".join(["mot " * 50] * 6)
+        chunks = ai_service.split_article_sections(section, max_tokens=120)
+        assert len(chunks) > 1
+        assert all(ai_service.estimate_tokens(c) <= 120 for c in chunks)
+        assert chunks[0].startswith("# Long")
+
+        sections, separators = ai_service._split_article(section, max_tokens=120)
+        assert ai_service.join_article_sections(sections, separators) == section.strip()
+
+
+@pytest.mark.unit
+class TestConsistencyPass:
+    """Tests de l'application de la passe de cohérence"""
+
+    def test_openings_are_replaced(self):
+        sections = ai_service.split_article_sections(ARTICLE)
+        revised = (
+            "[[SECTION 2]]\nAprès cette introduction, voyons les conteneurs.\n"
+            "[[SECTION 3]]\nPour conclure, Docker est incontournable."
+        )
+        stitched = ai_service.apply_consistency_pass(sections, revised)
+
+        assert stitched[0] == sections[0]
+        assert stitched[1] == (
+            "# Concepts\n\nAprès cette introduction, voyons les conteneurs.\n\nImages et volumes."
+        )
+        assert stitched[2] == "# Conclusion\n\nPour conclure, Docker est incontournable."
+
+    def test_unparseable_output_keeps_sections(self):
+        sections = ai_service.split_article_sections(ARTICLE)
+        assert ai_service.apply_consistency_pass(sections, "Réponse libre") == sections
+        assert ai_service.apply_consistency_pass(sections, "[[SECTION 9]]\nHors limites") == sections
+
+
+@pytest.mark.unit
+class TestChunkedFinishing:
+    """Tests du pipeline de finition découpée"""
+
+    def test_sections_refined_in_parallel_with_progress(self, fake_section_crew):
+        progress = []
+
+        async def on_progress(done, total):
+            progress.append((done, total))
+
+        call_info = {}
+        started = time.monotonic()
+        result = asyncio.run(
+            ai_service.run_finishing_crew_chunked(ARTICLE, on_progress, call_info)
+        )
+        elapsed = time.monotonic() - started
+
+        assert len(fake_section_crew) == 3
+        assert elapsed < 0.5  # 3 sections de 0.2s en parallèle
+        assert progress == [(1, 3), (2, 3), (3, 3)]
+        assert result.count("DOCKER") == 2
+        assert "Docker" not in result
+        assert call_info["chunked"] is True
+        assert call_info["chunks"] == 3
+        assert call_info["model_used"] == "fast-model"
+        assert call_info["total_tokens"] == 45
+        assert call_info["finishing_steps"] == ["style", "fact_check", "proofread", "consistency"]
+        assert call_info["skipped_finishing_steps"] == ["critique"]
+
+    def test_sections_rejoined_with_original_separators(self, fake_section_crew):
+        result = asyncio.run(ai_service.run_finishing_crew_chunked(ARTICLE))
+        assert result == ARTICLE.replace("Docker", "DOCKER")
+        assert result.count(SECTION_SEPARATOR) == 2
+
+        by_headers = ARTICLE.replace(SECTION_SEPARATOR, "\n\n")
+        result = asyncio.run(ai_service.run_finishing_crew_chunked(by_headers))
+        assert result == by_headers.replace("Docker", "DOCKER")
+        assert "---" not in result
+
+    def test_short_article_uses_full_crew(self, monkeypatch, fake_section_crew):
+        monkeypatch.setattr(ai_service, "FINISHING_CHUNKED_THRESHOLD_TOKENS", 10_000)
+        monkeypatch.setattr(
+            ai_service, "run_finishing_crew", lambda content, call_info=None: "complet"
+        )
+
+        result = asyncio.run(ai_service.run_finishing_crew_chunked(ARTICLE))
+
+        assert result == "complet"
+        assert fake_section_crew == []
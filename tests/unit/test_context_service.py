@@ -0,0 +1,90 @@
+"""
+Tests unitaires pour le constructeur de contexte
+Budget de tokens, réduction extractive et priorité des sorties pertinentes
+"""
+
+import pytest
+
+from app.models.workflow_models import TaskOutputType
+from app.services import context_service, output_service
+from app.services.llm_gateway import estimate_tokens
+
+
+def _paragraphs(*topics: str, words: int = 60) -> str:
+    return "\n\n".join(f"{topic} " + "remplissage " * words for topic in topics)
+
+
+@pytest.mark.unit
+class TestTrimToBudget:
+    """Tests de la réduction extractive"""
+
+    def test_short_text_unchanged(self):
+        assert context_service.trim_to_budget("Court texte.", 100) == "Court texte."
+
+    def test_keeps_first_and_relevant_paragraphs(self):
+        text = _paragraphs("Introduction", "Cuisine italienne", "Docker volumes persistants")
+        trimmed = context_service.trim_to_budget(text, 400, topic="Docker volumes")
+
+        assert estimate_tokens(trimmed) <= 400
+        assert trimmed.startswith("Introduction")
+        assert "Docker volumes persistants" in trimmed
+        assert "Cuisine italienne" not in trimmed
+        assert context_service.OMISSION_MARKER in trimmed
+
+    def test_single_paragraph_cut_at_sentence(self):
+        text = "Première phrase courte. " * 100
+        trimmed = context_service.trim_to_budget(text, 50)
+        assert estimate_tokens(trimmed) <= 52
+        assert trimmed.endswith(context_service.OMISSION_MARKER)
+
+
+@pytest.mark.unit
+class TestBuildTaskContext:
+    """Tests de la construction du contexte d'une tâche"""
+
+    def test_writer_prefers_same_task_research(self, db_session, multiple_tasks):
+        first, target = multiple_tasks[0], multiple_tasks[1]
+        output_service.create_output(
+            db_session, first.id, TaskOutputType.WRITING, _paragraphs("Section un", words=400)
+        )
+        output_service.create_output(
+            db_session, target.id, TaskOutputType.RESEARCH, "Recherche ciblée sur la tâche 2."
+        )
+
+        context = context_service.build_task_context(
+            db_session, target, "writer", max_tokens=300
+        )
+
+        assert context.startswith("## Recherche pour cette tâche\nRecherche ciblée")
+        assert estimate_tokens(context) <= 300
+
+    def test_prior_sections_are_included_within_budget(self, db_session, multiple_tasks):
+        for task in multiple_tasks[:3]:
+            output_service.create_output(
+                db_session, task.id, TaskOutputType.RESEARCH, _paragraphs(task.title, words=300)
+            )
+
+        context = context_service.build_task_context(
+            db_session, multiple_tasks[3], "researcher", max_tokens=800
+        )
+
+        assert "Section précédente: Task 3" in context
+        assert estimate_tokens(context) <= 800
+
+    def test_user_context_capped_to_half_budget(self, db_session, sample_task):
+        huge = _paragraphs("Consigne", words=2000)
+        context = context_service.build_task_context(
+            db_session, sample_task, "researcher", user_context=huge, max_tokens=400
+        )
+
+        assert context.startswith("Consigne")
+        assert estimate_tokens(context) <= 400
+        assert "## Description de la tâche\nA test task" in context
+
+    def test_budget_from_model_window(self, monkeypatch):
+        monkeypatch.delenv("CONTEXT_TOKEN_BUDGET", raising=False)
+        assert context_service.get_context_budget("writer", model="llama3-8b-8192") == int(
+            8192 * context_service.CONTEXT_WINDOW_SHARE
+        )
+        monkeypatch.setenv("CONTEXT_TOKEN_BUDGET", "1000")
+        assert context_service.get_context_budget("writer") == 1000
@@ -0,0 +1,94 @@
+"""
+Tests unitaires pour les executors nommés
+Isolation LLM / DB et métriques de file d'attente
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.core.executors import (
+    InstrumentedExecutor,
+    get_executor,
+    get_executor_stats,
+    run_in_db_executor,
+    shutdown_executors,
+)
+
+
+@pytest.fixture
+def small_pool():
+    executor = InstrumentedExecutor("test", max_workers=1)
+    yield executor
+    executor.shutdown(wait=True)
+
+
+@pytest.mark.unit
+class TestInstrumentedExecutor:
+    """Tests du pool instrumenté"""
+
+    def test_run_passes_args_and_kwargs(self, small_pool):
+        def join(a, b, sep="-"):
+            return f"{a}{sep}{b}"
+
+        result = asyncio.run(small_pool.run(join, "x", "y", sep="+"))
+        assert result == "x+y"
+
+        stats = small_pool.get_stats()
+        assert stats["submitted"] == 1
+        assert stats["completed"] == 1
+        assert stats["queued"] == 0
+        assert stats["active"] == 0
+
+    def test_queue_wait_is_measured(self, small_pool):
+        """Une tâche soumise à un pool saturé accumule du temps d'attente"""
+
+        async def burst():
+            await asyncio.gather(
+                small_pool.run(time.sleep, 0.1), small_pool.run(time.sleep, 0.1)
+            )
+
+        asyncio.run(burst())
+
+        stats = small_pool.get_stats()
+        assert stats["completed"] == 2
+        assert stats["max_queue_wait_ms"] >= 80
+
+    def test_failures_are_counted(self, small_pool):
+        def boom():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            asyncio.run(small_pool.run(boom))
+        assert small_pool.get_stats()["failed"] == 1
+
+
+@pytest.mark.unit
+class TestExecutorIsolation:
+    """Les appels LLM longs ne retardent pas le travail DB"""
+
+    def test_llm_burst_does_not_delay_db_work(self, monkeypatch):
+        shutdown_executors(wait=True)
+        monkeypatch.setenv("LLM_EXECUTOR_WORKERS", "2")
+        monkeypatch.setenv("DB_EXECUTOR_WORKERS", "2")
+        llm = get_executor("llm")
+
+        async def scenario():
+            slow = [asyncio.ensure_future(llm.run(time.sleep, 0.3)) for _ in range(6)]
+            await asyncio.sleep(0.02)
+            started = time.monotonic()
+            await run_in_db_executor(lambda: None)
+            db_latency = time.monotonic() - started
+            await asyncio.gather(*slow)
+            return db_latency
+
+        try:
+            db_latency = asyncio.run(scenario())
+            assert db_latency < 0.2
+
+            stats = get_executor_stats()
+            assert stats["llm"]["max_queue_wait_ms"] >= 250
+            assert stats["db"]["max_queue_wait_ms"] < 200
+        finally:
+            shutdown_executors(wait=True)
@@ -0,0 +1,144 @@
+"""
+Tests unitaires pour l'échantillonneur de santé en arrière-plan
+Instantané, péremption et lecture par les endpoints /health
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.core import health_monitor
+from app.core.health_monitor import HealthSampler, get_health_snapshot
+from app.models.job_models import AsyncJob
+from tests.conftest import TestingSessionLocal
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def sampler(db_session, clock):
+    """Échantillonneur sur la connexion (transactionnelle) du test"""
+    return HealthSampler(
+        interval=10,
+        session_factory=lambda: TestingSessionLocal(bind=db_session.get_bind()),
+        clock=clock,
+    )
+
+
+@pytest.mark.unit
+class TestHealthSampler:
+    """Tests de l'instantané de santé"""
+
+    def test_refresh_collects_components_queue_and_metrics(self, sampler, db_session):
+        db_session.add_all(
+            [
+                AsyncJob(id="job-1", type="planning", status="PENDING"),
+                AsyncJob(id="job-2", type="writing", status="PROGRESS"),
+                AsyncJob(id="job-3", type="writing", status="SUCCESS"),
+            ]
+        )
+        db_session.flush()
+
+        snapshot = sampler.refresh()
+
+        assert snapshot["components"]["database"]["status"] == "healthy"
+        assert snapshot["components"]["database"]["dialect"] == "sqlite"
+        assert "redis" not in snapshot["components"]
+        assert snapshot["queue"] == {"jobs": {"PENDING": 1, "PROGRESS": 1}, "pending_jobs": 2}
+        assert "cpu_percent" in snapshot["metrics"]
+        assert sampler.snapshot() is snapshot
+
+    def test_staleness_follows_interval(self, sampler, clock):
+        assert sampler.is_stale()
+        sampler.refresh()
+        assert not sampler.is_stale()
+
+        clock.now += sampler.interval * health_monitor.STALE_FACTOR + 1
+        assert sampler.is_stale()
+
+    def test_refresh_if_stale_reuses_fresh_snapshot(self, sampler, monkeypatch):
+        calls = []
+        original = sampler.refresh
+        monkeypatch.setattr(sampler, "refresh", lambda: calls.append(1) or original())
+
+        first = sampler.refresh_if_stale()
+        assert sampler.refresh_if_stale() is first
+        assert len(calls) == 1
+
+    def test_database_failure_is_reported(self, clock):
+        def broken_session():
+            session = TestingSessionLocal()
+            session.execute = lambda *args, **kwargs: (_ for _ in ()).throw(
+                RuntimeError("base indisponible")
+            )
+            return session
+
+        sampler = HealthSampler(session_factory=broken_session, clock=clock)
+        database = sampler.refresh()["components"]["database"]
+
+        assert database == {"status": "unhealthy", "error": "base indisponible"}
+
+    def test_background_thread_refreshes_snapshot(self, db_session):
+        sampler = HealthSampler(
+            interval=0.1,
+            session_factory=lambda: TestingSessionLocal(bind=db_session.get_bind()),
+        )
+        sampler.start()
+        try:
+            deadline = time.monotonic() + 5
+            while sampler.snapshot() is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            sampler.stop()
+
+        assert sampler.snapshot() is not None
+        assert sampler._thread is None
+
+
+@pytest.mark.unit
+class TestHealthSnapshotRead:
+    """Lecture de l'instantané par les sondes"""
+
+    def test_fresh_snapshot_is_read_without_collection(self, sampler, monkeypatch):
+        sampler.refresh()
+        monkeypatch.setattr(
+            sampler, "refresh", lambda: pytest.fail("collecte inattendue")
+        )
+
+        snapshot = asyncio.run(get_health_snapshot(sampler))
+
+        assert snapshot["age_s"] == 0
+        assert snapshot["components"]["database"]["status"] == "healthy"
+
+    def test_missing_snapshot_is_collected_off_loop(self, sampler):
+        snapshot = asyncio.run(get_health_snapshot(sampler))
+
+        assert snapshot["components"]["database"]["status"] == "healthy"
+        assert not sampler.is_stale()
+
+    def test_detailed_endpoint_reads_snapshot(self, client, sampler, monkeypatch):
+        monkeypatch.setattr(health_monitor, "health_sampler", sampler)
+        sampler.refresh()
+
+        response = client.get("/api/v1/health/detailed")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] in ("healthy", "degraded")
+        assert data["components"]["database"]["status"] == "healthy"
+        assert data["queue"]["pending_jobs"] == 0
+        assert data["snapshot_age_s"] == 0
+
+        assert client.get("/api/v1/health/ready").json()["status"] == "ready"
@@ -0,0 +1,63 @@
+"""
+Tests du temps d'import de l'application (démarrage à froid de l'API)
+CrewAI et langchain_groq ne doivent être chargés qu'au premier crew
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Budget du temps d'import cumulé de app.main, mesuré par python -X importtime
+IMPORT_TIME_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "4000"))
+
+# Modules dont l'import déclenché par app.main est une régression
+LAZY_MODULES = ("crewai", "langchain_groq", "langchain_core")
+
+
+def _import_app_main():
+    """Importe app.main dans un interpréteur neuf; retourne (modules lourds chargés, temps en ms)"""
+    code = (
+        "import sys, app.main; "
+        f"print('loaded:' + ','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    # Lignes "import time: self [us] | cumulative | module" sur stderr
+    cumulative_us = None
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = [field.strip() for field in line[len("import time:"):].split("|")]
+        if fields[2] == "app.main":
+            cumulative_us = int(fields[1])
+    assert cumulative_us is not None, "app.main absent de la sortie -X importtime"
+
+    marker = result.stdout.rsplit("loaded:", 1)[-1].strip()
+    loaded = [name for name in marker.split(",") if name]
+    return loaded, cumulative_us / 1000
+
+
+@pytest.mark.unit
+@pytest.mark.slow
+class TestImportTime:
+    """Tests du démarrage à froid"""
+
+    def test_app_import_is_lazy_and_within_budget(self):
+        loaded, import_ms = _import_app_main()
+
+        assert loaded == [], f"Importés au démarrage: {loaded}"
+        assert import_ms <= IMPORT_TIME_BUDGET_MS, (
+            f"Import de app.main: {import_ms:.0f} ms (budget {IMPORT_TIME_BUDGET_MS:.0f} ms)"
+        )
@@ -0,0 +1,163 @@
+"""
+Tests unitaires pour la passerelle LLM
+Token bucket, concurrence AIMD et retry sur les 429
+"""
+
+import pytest
+
+from app.services.llm_gateway import (
+    AIMDLimiter,
+    LLMGateway,
+    ModelBudget,
+    TokenBucket,
+    is_rate_limit_error,
+    load_model_budgets,
+)
+
+
+class FakeClock:
+    """Horloge contrôlable pour les tests du token bucket"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+@pytest.fixture
+def sleeps():
+    return []
+
+
+@pytest.fixture
+def gateway(sleeps):
+    return LLMGateway(
+        budgets={"test-model": ModelBudget(rpm=60, tpm=6000, max_concurrency=4)},
+        max_retries=3,
+        sleep=sleeps.append,
+    )
+
+
+@pytest.mark.unit
+class TestTokenBucket:
+    """Tests du seau à jetons"""
+
+    def test_reserve_within_capacity(self):
+        """Les réservations sous la capacité sont immédiates"""
+        bucket = TokenBucket(capacity=10, refill_per_second=1, clock=FakeClock())
+        assert bucket.reserve(4) == 0.0
+        assert bucket.reserve(6) == 0.0
+
+    def test_reserve_over_capacity_returns_delay(self):
+        """Une réservation au-delà du solde retourne le délai de rechargement"""
+        bucket = TokenBucket(capacity=10, refill_per_second=2, clock=FakeClock())
+        bucket.reserve(10)
+        assert bucket.reserve(4) == pytest.approx(2.0)
+        # La dette s'accumule pour les appelants suivants
+        assert bucket.reserve(2) == pytest.approx(3.0)
+
+    def test_refill_over_time(self):
+        """Le solde se recharge avec le temps sans dépasser la capacité"""
+        clock = FakeClock()
+        bucket = TokenBucket(capacity=10, refill_per_second=1, clock=clock)
+        bucket.reserve(10)
+        clock.now = 4
+        assert bucket.available == pytest.approx(4)
+        clock.now = 100
+        assert bucket.available == pytest.approx(10)
+
+
+@pytest.mark.unit
+class TestAIMDLimiter:
+    """Tests de la concurrence adaptative"""
+
+    def test_additive_increase_on_success(self):
+        limiter = AIMDLimiter(initial_limit=2, max_limit=8)
+        for _ in range(2):
+            limiter.acquire()
+            limiter.release(latency=1.0)
+        assert limiter.limit == pytest.approx(2.9, abs=0.01)
+        assert limiter.in_flight == 0
+
+    def test_multiplicative_decrease_on_rate_limit(self):
+        limiter = AIMDLimiter(initial_limit=6, max_limit=8)
+        limiter.acquire()
+        limiter.release(latency=1.0, rate_limited=True)
+        assert limiter.limit == pytest.approx(3)
+
+    def test_decrease_on_slow_latency_and_floor(self):
+        limiter = AIMDLimiter(initial_limit=1, min_limit=1, latency_target=5)
+        limiter.acquire()
+        limiter.release(latency=10.0)
+        assert limiter.limit == 1
+
+
+@pytest.mark.unit
+class TestLLMGateway:
+    """Tests de la passerelle"""
+
+    def test_retries_on_rate_limit(self, gateway, sleeps):
+        """Un 429 est réessayé avec backoff puis l'appel aboutit"""
+        calls = {"count": 0}
+
+        def flaky():
+            calls["count"] += 1
+            if calls["count"] < 3:
+                raise RateLimitError("Too many requests")
+            return "ok"
+
+        assert gateway.call("test-model", flaky) == "ok"
+        assert calls["count"] == 3
+        assert len(sleeps) == 2
+
+        stats = gateway.get_stats()["test-model"]
+        assert stats["rate_limited"] == 2
+        assert stats["retries"] == 2
+        assert stats["calls"] == 1
+
+    def test_gives_up_after_max_retries(self, gateway):
+        def always_limited():
+            raise RateLimitError("rate limit")
+
+        with pytest.raises(RateLimitError):
+            gateway.call("test-model", always_limited)
+        assert gateway.get_stats()["test-model"]["retries"] == 3
+
+    def test_non_retryable_error_raised_immediately(self, gateway, sleeps):
+        def broken():
+            raise ValueError("bad prompt")
+
+        with pytest.raises(ValueError):
+            gateway.call("test-model", broken)
+        assert sleeps == []
+
+    def test_waits_when_token_budget_exhausted(self, gateway, sleeps):
+        """Un appel dépassant le budget de tokens attend le rechargement"""
+        gateway.call("test-model", lambda: "", estimated_tokens=6000)
+        gateway.call("test-model", lambda: "", estimated_tokens=100)
+        assert len(sleeps) == 1
+        assert sleeps[0] == pytest.approx(1.0, abs=0.1)
+
+    def test_unknown_model_uses_default_budget(self, gateway):
+        assert gateway.call("other-model", lambda: 42) == 42
+        assert "other-model" in gateway.get_stats()
+
+
+@pytest.mark.unit
+def test_is_rate_limit_error_detection():
+    assert is_rate_limit_error(RateLimitError())
+    assert is_rate_limit_error(Exception("Error code: 429 - rate_limit_exceeded"))
+    assert not is_rate_limit_error(Exception("invalid api key"))
+
+
+@pytest.mark.unit
+def test_load_model_budgets_override(monkeypatch):
+    monkeypatch.setenv("LLM_MODEL_BUDGETS", '{"llama3-8b-8192": {"tpm": 1000}}')
+    budgets = load_model_budgets()
+    assert budgets["llama3-8b-8192"].tpm == 1000
+    assert budgets["llama3-8b-8192"].rpm == 30
@@ -0,0 +1,92 @@
+"""
+Tests unitaires pour le suivi des appels LLM
+Enregistrement dans llm_calls et percentiles par type de crew
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.services import llm_stats_service
+
+
+@pytest.fixture
+def recorded_calls(db_session):
+    """Dix appels writer (1s à 10s) et un appel planner échoué"""
+    for seconds in range(1, 11):
+        llm_stats_service.record_llm_call(
+            db_session,
+            crew_type="writer",
+            model="llama3-70b-8192",
+            wall_time=float(seconds),
+            prompt_tokens=100,
+            completion_tokens=50,
+            retries=1 if seconds == 10 else 0,
+            cost_usd=0.001,
+        )
+    llm_stats_service.record_llm_call(
+        db_session,
+        crew_type="planner",
+        model="llama3-8b-8192",
+        wall_time=0.5,
+        success=False,
+        error="x" * 500,
+    )
+    db_session.commit()
+
+
+@pytest.mark.unit
+class TestLLMStats:
+    """Tests des statistiques d'appels LLM"""
+
+    def test_percentile_nearest_rank(self):
+        values = [float(v) for v in range(1, 11)]
+        assert llm_stats_service.percentile(values, 50) == 5.0
+        assert llm_stats_service.percentile(values, 90) == 9.0
+        assert llm_stats_service.percentile(values, 99) == 10.0
+        assert llm_stats_service.percentile([], 50) is None
+
+    def test_stats_per_crew_type(self, db_session, recorded_calls):
+        stats = llm_stats_service.get_llm_stats(db_session, hours=None)
+
+        assert stats["total_calls"] == 11
+        writer = stats["crews"]["writer"]
+        assert writer["calls"] == 10
+        assert writer["wall_time"]["p50"] == 5.0
+        assert writer["wall_time"]["p95"] == 10.0
+        assert writer["retries"] == 1
+        assert writer["prompt_tokens"] == 1000
+        assert writer["cost_usd"] == pytest.approx(0.01)
+        assert list(writer["models"]) == ["llama3-70b-8192"]
+
+        assert stats["crews"]["planner"]["success_rate"] == 0.0
+
+    def test_filter_by_crew_type(self, db_session, recorded_calls):
+        stats = llm_stats_service.get_llm_stats(db_session, hours=None, crew_type="planner")
+        assert list(stats["crews"]) == ["planner"]
+
+    def test_error_is_truncated(self, db_session):
+        call = llm_stats_service.record_llm_call(
+            db_session, "writer", "m", 1.0, success=False, error="e" * 400
+        )
+        assert len(call.error) == 255
+
+    def test_stats_endpoint(self, client, recorded_calls):
+        response = client.get("/api/v1/stats/llm", params={"crew_type": "writer"})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["crews"]["writer"]["wall_time"]["p90"] == 9.0
+
+    def test_stats_endpoint_full_history(self, client, db_session, recorded_calls):
+        old_call = llm_stats_service.record_llm_call(db_session, "writer", "m", 1.0)
+        old_call.created_at = datetime.now(timezone.utc) - timedelta(days=3)
+        db_session.commit()
+
+        recent = client.get("/api/v1/stats/llm").json()
+        everything = client.get("/api/v1/stats/llm", params={"hours": 0}).json()
+
+        assert recent["window_hours"] == 24
+        assert recent["total_calls"] == 11
+        assert everything["window_hours"] is None
+        assert everything["total_calls"] == 12
+        assert client.get("/api/v1/stats/llm", params={"hours": -1}).status_code == 422
@@ -0,0 +1,163 @@
+"""
+Tests unitaires pour le routage des modèles LLM
+Routes par crew, repli sur erreur et métadonnées d'appel
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from app.models.workflow_models import TaskOutputType
+from app.services import ai_service, output_service
+from app.services.llm_gateway import LLMGateway
+from app.services.model_router import (
+    PLANNER,
+    WRITER,
+    ModelRoute,
+    ModelRouter,
+    estimate_cost,
+    load_routes,
+)
+
+
+@pytest.fixture
+def recorded_calls(monkeypatch):
+    """Capture les appels enregistrés dans llm_calls"""
+    calls = []
+    monkeypatch.setattr(ai_service, "_record_llm_call", lambda **fields: calls.append(fields))
+    return calls
+
+
+@pytest.fixture
+def routed_service(monkeypatch, recorded_calls):
+    """ai_service avec un routeur à deux modèles et des LLM factices"""
+    # Pile IA chargée avant les patchs: un chargement ultérieur remplacerait llm
+    ai_service.warm_ai_stack()
+    router = ModelRouter(
+        {
+            PLANNER: ModelRoute(primary="fast-model", fallbacks=["strong-model"]),
+            WRITER: ModelRoute(primary="strong-model", fallbacks=["fast-model"]),
+        }
+    )
+    monkeypatch.setattr(ai_service, "model_router", router)
+    monkeypatch.setattr(ai_service, "llm_gateway", LLMGateway(max_retries=0))
+    monkeypatch.setattr(ai_service, "llm", Mock())
+    monkeypatch.setattr(ai_service, "get_llm", lambda model: Mock(name=model))
+    monkeypatch.setattr(ai_service, "_agent_for_llm", lambda agent, model_llm: agent)
+    return ai_service
+
+
+@pytest.mark.unit
+class TestModelRoutes:
+    """Tests de la configuration des routes"""
+
+    def test_default_routes_cover_all_crews(self):
+        routes = load_routes()
+        assert set(routes) == {"planner", "researcher", "writer", "finisher"}
+        assert all(route.fallbacks for route in routes.values())
+
+    def test_default_routes_use_main_model(self, monkeypatch):
+        monkeypatch.delenv("GROQ_MODEL", raising=False)
+        for variable in ("LLM_MODEL_WRITER", "LLM_MODEL_FINISHER"):
+            monkeypatch.delenv(variable, raising=False)
+        routes = load_routes()
+        assert {route.primary for route in routes.values()} == {"llama3-8b-8192"}
+
+        monkeypatch.setenv("GROQ_MODEL", "mixtral-8x7b-32768")
+        routes = load_routes()
+        assert {route.primary for route in routes.values()} == {"mixtral-8x7b-32768"}
+        assert ModelRouter({}).candidates("unknown") == ["mixtral-8x7b-32768"]
+
+    def test_large_model_is_opt_in(self, monkeypatch):
+        monkeypatch.delenv("GROQ_MODEL", raising=False)
+        monkeypatch.delenv("LLM_MODEL_FINISHER", raising=False)
+        monkeypatch.setenv("LLM_MODEL_WRITER", "llama3-70b-8192")
+        routes = load_routes()
+        assert routes[WRITER].primary == "llama3-70b-8192"
+        assert routes["finisher"].primary != "llama3-70b-8192"
+
+    def test_routes_from_environment(self, monkeypatch):
+        monkeypatch.setenv("LLM_MODEL_WRITER", "llama3-8b-8192")
+        monkeypatch.setenv("LLM_FALLBACK_WRITER", "")
+        route = load_routes()[WRITER]
+        assert route.candidates == ["llama3-8b-8192"]
+
+    def test_candidates_are_deduplicated(self):
+        route = ModelRoute(primary="a", fallbacks=["b", "a", "c"])
+        assert route.candidates == ["a", "b", "c"]
+
+    def test_unknown_crew_uses_default_model(self):
+        assert ModelRouter({}).candidates("unknown") == ["llama3-8b-8192"]
+
+    def test_estimate_cost(self):
+        assert estimate_cost("llama3-8b-8192", 1_000_000, 0) == pytest.approx(0.05)
+        assert estimate_cost("unknown-model", 100, 100) is None
+
+
+@pytest.mark.unit
+class TestCrewRouting:
+    """Tests du lancement des crews via le routeur"""
+
+    @patch("app.services.ai_service.Crew")
+    def test_call_info_records_model_and_usage(self, mock_crew, routed_service):
+        mock_crew.return_value.kickoff.return_value = "Texte rédigé"
+        call_info = {}
+
+        result = routed_service.run_writing_crew("Introduction", call_info=call_info)
+
+        assert result == "Texte rédigé"
+        assert call_info["model_used"] == "strong-model"
+        assert call_info["crew_type"] == WRITER
+        assert call_info["prompt_tokens"] > 0
+        assert call_info["completion_tokens"] > 0
+        assert call_info["processing_time"] >= 0
+        assert call_info["retries"] == 0
+        assert "fallback_from" not in call_info
+
+    @patch("app.services.ai_service.Crew")
+    def test_fallback_on_error(self, mock_crew, routed_service, recorded_calls):
+        """Une erreur sur le modèle principal bascule sur le repli"""
+        mock_crew.return_value.kickoff.side_effect = [
+            TimeoutError("request timed out"),
+            "Tâche 1\nTâche 2",
+        ]
+        routed_service.llm_gateway.max_retries = 0
+        call_info = {}
+
+        titles = routed_service.run_planning_crew("Objectif", call_info=call_info)
+
+        assert titles == ["Tâche 1", "Tâche 2"]
+        assert call_info["model_used"] == "strong-model"
+        assert call_info["fallback_from"] == ["fast-model"]
+
+        # Chaque tentative est enregistrée, y compris l'échec
+        assert [(c["model"], c.get("success", True)) for c in recorded_calls] == [
+            ("fast-model", False),
+            ("strong-model", True),
+        ]
+
+    @patch("app.services.ai_service.Crew")
+    def test_all_models_fail_raises_last_error(self, mock_crew, routed_service):
+        mock_crew.return_value.kickoff.side_effect = ValueError("API Error")
+
+        with pytest.raises(ValueError, match="API Error"):
+            routed_service.run_planning_crew("Objectif")
+        assert mock_crew.return_value.kickoff.call_count == 2
+
+
+@pytest.mark.unit
+def test_output_metadata_is_persisted(db_session, sample_task):
+    """Les métadonnées d'appel LLM sont enregistrées dans output_metadata"""
+    output = output_service.create_output(
+        db=db_session,
+        task_id=sample_task.id,
+        output_type=TaskOutputType.WRITING,
+        content="Contenu généré",
+        ai_generated=True,
+        metadata={"model_used": "llama3-70b-8192", "processing_time": 1.5},
+    )
+
+    saved = output_service.get_output_by_id(db_session, output.id)
+    assert saved.output_metadata["model_used"] == "llama3-70b-8192"
+    assert saved.output_metadata["processing_time"] == 1.5
+    assert saved.output_metadata["word_count"] == 2
+    assert saved.output_metadata["ai_generated"] is True
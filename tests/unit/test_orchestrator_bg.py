@@ -0,0 +1,223 @@
+"""
+Tests unitaires des orchestrateurs de workflows
+Reprise depuis les checkpoints (BackgroundTasks) et checkpoints de la chaîne Celery
+"""
+
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.models.workflow_models import TaskOutputType, WorkflowStatus, WorkflowType
+from app.services import output_service, workflow_service
+from app.tasks import orchestrator_bg, orchestrator_tasks
+
+
+class _Step:
+    """Sous-tâche simulée: .delay() enregistre l'appel et retourne un statut SUCCESS"""
+
+    def __init__(self, result: dict):
+        self.result = result
+        self.calls = []
+
+    async def delay(self, *args, **kwargs):
+        self.calls.append(args)
+        return {"status": "SUCCESS", "result": self.result}
+
+
+async def _finished(status):
+    return status
+
+
+@pytest.fixture
+def steps(db_session):
+    """Étapes simulées et sessions de l'orchestrateur redirigées vers la base de test"""
+
+    @contextmanager
+    def test_db():
+        yield db_session
+
+    steps = {
+        "planning_task_bg": _Step({"success": True, "created_count": 2}),
+        "research_coordinator_task_bg": _Step(
+            {"success": True, "successful_count": 2, "skipped_count": 1, "failed_count": 0}
+        ),
+        "assembly_task_bg": _Step(
+            {"success": True, "assembled_content": "Assemblage avec les nouvelles recherches"}
+        ),
+        "finishing_task_bg": _Step({"success": True}),
+    }
+    with patch.object(orchestrator_bg, "get_db", test_db), patch.object(
+        orchestrator_bg, "_wait_for_step", _finished
+    ), patch.multiple(orchestrator_bg, **steps):
+        yield steps
+
+
+@pytest.fixture
+def failed_workflow(db_session, sample_task):
+    """Workflow échoué en finition, avec un assemblage checkpointé"""
+    workflow = workflow_service.create_workflow_execution(
+        db_session, sample_task.project_id, WorkflowType.FULL_ARTICLE
+    )
+    stale_assembly = output_service.save_task_output(
+        db_session,
+        sample_task.id,
+        TaskOutputType.ASSEMBLY,
+        "Ancien assemblage",
+        workflow_execution_id=workflow.id,
+    )
+
+    def fail_with(research_failed_count: int):
+        workflow_service.record_step_checkpoint(db_session, workflow.id, "planning")
+        workflow_service.record_step_checkpoint(
+            db_session, workflow.id, "research", {"failed_count": research_failed_count}
+        )
+        workflow_service.record_step_checkpoint(
+            db_session, workflow.id, "assembly", {"output_id": stale_assembly.id}
+        )
+        workflow_service.mark_workflow_complete(
+            db_session, workflow.id, success=False, error_details={"error": "boom"}
+        )
+        workflow_service.prepare_workflow_resume(db_session, workflow.id)
+        db_session.commit()
+        return workflow
+
+    return fail_with
+
+
+async def _resume(workflow):
+    return await orchestrator_bg.full_article_workflow_task_bg(
+        workflow.project_id, workflow.id, resume=True
+    )
+
+
+@pytest.mark.unit
+class TestWorkflowResume:
+    """Tests de la reprise de full_article_workflow_task_bg"""
+
+    @pytest.mark.asyncio
+    async def test_resume_reuses_checkpointed_assembly(self, db_session, steps, failed_workflow):
+        """Sans recherche à relancer, l'assemblage checkpointé est réutilisé"""
+        workflow = failed_workflow(research_failed_count=0)
+
+        result = await _resume(workflow)
+
+        assert result["success"], result
+        assert result["skipped_steps"] == ["planning", "research", "assembly"]
+        assert not steps["research_coordinator_task_bg"].calls
+        assert not steps["assembly_task_bg"].calls
+        assert steps["finishing_task_bg"].calls[0][1] == "Ancien assemblage"
+
+    @pytest.mark.asyncio
+    async def test_research_rerun_invalidates_assembly(self, db_session, steps, failed_workflow):
+        """Une recherche relancée refait l'assemblage: la finition n'utilise pas l'ancien"""
+        workflow = failed_workflow(research_failed_count=1)
+
+        result = await _resume(workflow)
+
+        assert result["success"], result
+        assert result["skipped_steps"] == ["planning"]
+        assert not steps["planning_task_bg"].calls
+        assert len(steps["research_coordinator_task_bg"].calls) == 1
+        assert len(steps["assembly_task_bg"].calls) == 1
+        assert (
+            steps["finishing_task_bg"].calls[0][1]
+            == "Assemblage avec les nouvelles recherches"
+        )
+
+        db_session.refresh(workflow)
+        checkpoints = workflow_service.get_step_checkpoints(workflow)
+        assert workflow.status == WorkflowStatus.COMPLETED
+        assert checkpoints["research"]["failed_count"] == 0
+        assert checkpoints["assembly"]["output_id"] is None
+        assert "finishing" in checkpoints
+
+
+@pytest.mark.unit
+class TestDropDownstreamCheckpoints:
+    """Tests de l'invalidation des checkpoints en aval"""
+
+    def test_drop_after_research(self, db_session, sample_project):
+        workflow = workflow_service.create_workflow_execution(
+            db_session, sample_project.id, WorkflowType.FULL_ARTICLE
+        )
+        for step in workflow_service.FULL_ARTICLE_STEPS:
+            workflow_service.record_step_checkpoint(db_session, workflow.id, step)
+
+        dropped = workflow_service.drop_downstream_checkpoints(
+            db_session, workflow.id, "research"
+        )
+
+        assert dropped == ["assembly", "finishing"]
+        assert list(workflow_service.get_step_checkpoints(workflow)) == [
+            "planning",
+            "research",
+        ]
+
+    def test_drop_unknown_workflow(self, db_session):
+        assert workflow_service.drop_downstream_checkpoints(db_session, "missing", "planning") == []
+
+
+@pytest.mark.unit
+class TestCeleryChainCheckpoints:
+    """La chaîne Celery (route generate-article) enregistre les mêmes checkpoints"""
+
+    @pytest.fixture(autouse=True)
+    def celery_db(self, db_session):
+        @contextmanager
+        def test_db():
+            yield db_session
+
+        with patch.object(orchestrator_tasks, "get_db", test_db), patch.object(
+            orchestrator_tasks.JobAwareTask, "update_state_with_db"
+        ), patch.object(orchestrator_tasks, "chord", MagicMock()):
+            yield
+
+    def test_chain_checkpoints_allow_resume(self, db_session, sample_task):
+        workflow = workflow_service.create_workflow_execution(
+            db_session, sample_task.project_id, WorkflowType.FULL_ARTICLE
+        )
+        output_service.save_task_output(
+            db_session,
+            sample_task.id,
+            TaskOutputType.RESEARCH,
+            "Résultats de recherche",
+            workflow_execution_id=workflow.id,
+        )
+        planning_result = {
+            "success": True,
+            "created_tasks": [{"id": sample_task.id, "title": sample_task.title}],
+            "enhanced_tasks": [],
+        }
+
+        orchestrator_tasks.research_coordinator_task.run(planning_result, workflow.id)
+        completion = orchestrator_tasks.research_completion_task.run(
+            [{"success": True}], workflow.id
+        )
+        assembly = orchestrator_tasks.assembly_task.run(
+            completion, sample_task.project_id, workflow.id
+        )
+        workflow_service.mark_workflow_complete(
+            db_session, workflow.id, success=False, error_details={"error": "boom"}
+        )
+
+        checkpoints = workflow_service.get_step_checkpoints(workflow)
+        assert checkpoints["planning"]["created_count"] == 1
+        assert checkpoints["research"]["failed_count"] == 0
+        assert checkpoints["assembly"]["output_id"] == assembly["assembly_output_id"]
+
+        resumed = workflow_service.prepare_workflow_resume(db_session, workflow.id)
+        assert resumed.current_step["step_name"] == "finishing"
+
+    def test_failed_research_is_checkpointed(self, db_session, sample_project):
+        workflow = workflow_service.create_workflow_execution(
+            db_session, sample_project.id, WorkflowType.FULL_ARTICLE
+        )
+
+        with pytest.raises(ValueError):
+            orchestrator_tasks.research_completion_task.run(
+                [{"success": True}, {"success": False}], workflow.id
+            )
+
+        checkpoints = workflow_service.get_step_checkpoints(workflow)
+        assert checkpoints["research"]["failed_count"] == 1
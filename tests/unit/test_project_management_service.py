@@ -8,11 +8,14 @@ Tests pour :
 - Filtrage avancé
 """
 
+from datetime import datetime
+
 import pytest
 from sqlalchemy.orm import Session
 
 from app.models import models
-from app.services import project_service
+from app.models.workflow_models import TaskOutput, TaskOutputBand, TaskOutputType
+from app.services import output_service, project_service, similarity_service
 from app.exceptions import (
     ProjectNotFound,
     ProjectAlreadyArchived,
@@ -167,6 +170,89 @@ class TestProjectDuplication:
         assert duplicated_project is not None
         assert duplicated_project.name == custom_name
 
+    def test_duplicate_project_in_batches_with_progress(
+        self, db: Session, sample_project_with_tasks: models.Project
+    ):
+        """Test de duplication par lots avec remappage des IDs et progression"""
+        progress = []
+        stats = {}
+
+        duplicated_project = project_service.duplicate_project(
+            db=db,
+            project_id=sample_project_with_tasks.id,
+            batch_size=2,
+            on_progress=lambda done, total: progress.append((done, total)),
+            stats=stats,
+        )
+
+        total = len(sample_project_with_tasks.tasks)
+        assert progress[-1] == (total, total)
+        assert len(progress) == (total + 1) // 2
+        assert stats == {"tasks_copied": total, "outputs_copied": 0}
+        originals = sorted(sample_project_with_tasks.tasks, key=lambda t: t.id)
+        copies = sorted(duplicated_project.tasks, key=lambda t: t.id)
+        assert [t.title for t in copies] == [t.title for t in originals]
+        assert [t.order for t in copies] == [t.order for t in originals]
+
+    def test_task_batch_mapping_ignores_existing_target_tasks(
+        self,
+        db: Session,
+        sample_project: models.Project,
+        sample_project_with_tasks: models.Project,
+    ):
+        """Le remappage ne dépend pas des tâches déjà présentes dans le projet cible"""
+        db.add(models.Task(project_id=sample_project.id, title="Déjà là", status="À faire"))
+        db.flush()
+        originals = sorted(sample_project_with_tasks.tasks, key=lambda t: t.id)
+
+        task_map = project_service._copy_tasks_batch(
+            db, [task.id for task in originals], sample_project.id
+        )
+
+        assert list(task_map) == [task.id for task in originals]
+        for original in originals:
+            copy = db.get(models.Task, task_map[original.id])
+            assert copy.project_id == sample_project.id
+            assert (copy.title, copy.order) == (original.title, original.order)
+
+    def test_duplicate_project_with_latest_outputs(
+        self, db: Session, sample_project_with_tasks: models.Project
+    ):
+        """Test de copie du dernier output de chaque type par tâche"""
+        task = sorted(sample_project_with_tasks.tasks, key=lambda t: t.id)[0]
+        older = output_service.create_output(
+            db, task.id, TaskOutputType.RESEARCH, "Ancienne recherche"
+        )
+        older.created_at = datetime(2020, 1, 1)
+        db.commit()
+        latest = output_service.create_output(
+            db, task.id, TaskOutputType.RESEARCH, "Nouvelle recherche"
+        )
+        output_service.create_output(db, task.id, TaskOutputType.WRITING, "Rédaction")
+        stats = {}
+
+        duplicated_project = project_service.duplicate_project(
+            db=db,
+            project_id=sample_project_with_tasks.id,
+            include_outputs=True,
+            stats=stats,
+        )
+
+        new_task = sorted(duplicated_project.tasks, key=lambda t: t.id)[0]
+        copies = db.query(TaskOutput).filter(TaskOutput.task_id == new_task.id).all()
+        by_type = {output.output_type: output for output in copies}
+        assert stats["outputs_copied"] == 2
+        assert set(by_type) == {TaskOutputType.RESEARCH, TaskOutputType.WRITING}
+        assert by_type[TaskOutputType.RESEARCH].content == "Nouvelle recherche"
+        assert by_type[TaskOutputType.RESEARCH].content_hash == latest.content_hash
+        assert by_type[TaskOutputType.RESEARCH].id != latest.id
+        assert by_type[TaskOutputType.RESEARCH].content_minhash == latest.content_minhash
+        assert by_type[TaskOutputType.RESEARCH].content_minhash is not None
+        copied_bands = db.query(TaskOutputBand).filter(
+            TaskOutputBand.output_id == by_type[TaskOutputType.RESEARCH].id
+        )
+        assert copied_bands.count() == similarity_service.LSH_BANDS
+
     def test_duplicate_nonexistent_project(self, db: Session):
         """Test de duplication d'un projet inexistant"""
         result = project_service.duplicate_project(db=db, project_id=999)
@@ -0,0 +1,105 @@
+"""
+Tests unitaires pour la recherche plein texte
+Index maintenu par triggers, classement, extraits et pagination
+"""
+
+import pytest
+
+from app.models.models import Project, Task
+from app.models.workflow_models import TaskOutputType
+from app.services import output_service, search_service
+
+
+@pytest.fixture
+def indexed_project(db_session):
+    """Projet avec tâches et output, indexés par les triggers"""
+    project = Project(name="Kubernetes en production", description="Guide de déploiement")
+    db_session.add(project)
+    db_session.flush()
+    tasks = [
+        Task(project_id=project.id, title="Volumes persistants", description="Stockage des pods"),
+        Task(project_id=project.id, title="Réseau", description="Services et ingress Kubernetes"),
+    ]
+    db_session.add_all(tasks)
+    db_session.commit()
+    output_service.create_output(
+        db_session,
+        tasks[0].id,
+        TaskOutputType.WRITING,
+        "Les volumes persistants survivent au redémarrage des pods. " * 3,
+    )
+    return project, tasks
+
+
+@pytest.mark.unit
+class TestSearch:
+    """Tests de search_service.search"""
+
+    def test_title_matches_rank_first(self, db_session, indexed_project):
+        project, _ = indexed_project
+
+        result = search_service.search(db_session, "kubernetes")
+
+        assert result["total"] == 2
+        first = result["results"][0]
+        assert (first["type"], first["id"]) == ("project", str(project.id))
+        assert "<mark>Kubernetes</mark>" in first["snippet"]
+
+    def test_prefix_accents_and_output_title(self, db_session, indexed_project):
+        _, tasks = indexed_project
+
+        result = search_service.search(db_session, "redemarr", types=["output"])
+
+        assert result["total"] == 1
+        output = result["results"][0]
+        assert output["task_id"] == tasks[0].id
+        assert output["title"] == "Volumes persistants"
+
+    def test_index_follows_updates_and_deletes(self, db_session, indexed_project):
+        _, tasks = indexed_project
+        tasks[1].title = "Observabilité"
+        db_session.delete(tasks[0].outputs[0])
+        db_session.commit()
+
+        assert search_service.search(db_session, "réseau")["total"] == 0
+        assert search_service.search(db_session, "observabilite")["total"] == 1
+        assert search_service.search(db_session, "redemarrage")["total"] == 0
+
+    def test_pagination_and_project_filter(self, db_session, indexed_project):
+        project, _ = indexed_project
+        other = Project(name="Autre", description="Kubernetes ailleurs")
+        db_session.add(other)
+        db_session.commit()
+
+        page = search_service.search(db_session, "kubernetes", limit=1, offset=1)
+        scoped = search_service.search(db_session, "kubernetes", project_id=project.id)
+
+        assert page["total"] == 3
+        assert len(page["results"]) == 1
+        assert scoped["total"] == 2
+
+    def test_query_syntax_is_not_exposed(self, db_session, indexed_project):
+        result = search_service.search(db_session, 'pods" (')
+        assert result["total"] == 2
+        assert search_service.search(db_session, "***")["results"] == []
+
+    def test_snippet_escapes_indexed_content(self, db_session, indexed_project):
+        _, tasks = indexed_project
+        tasks[1].description = '<img src=x onerror="alert(1)"> Ingress & <b>TLS</b>'
+        db_session.commit()
+
+        snippet = search_service.search(db_session, "ingress", types=["task"])["results"][0][
+            "snippet"
+        ]
+
+        assert "<img" not in snippet and "<b>" not in snippet
+        assert "&lt;img src=x onerror=&quot;alert(1)&quot;&gt;" in snippet
+        assert "<mark>Ingress</mark> &amp; &lt;b&gt;TLS&lt;/b&gt;" in snippet
+
+    def test_endpoint(self, client, indexed_project):
+        response = client.get("/api/v1/search", params={"q": "volumes", "types": "task"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [r["title"] for r in data["results"]] == ["Volumes persistants"]
+        assert client.get("/api/v1/search").status_code == 422
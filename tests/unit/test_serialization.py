@@ -0,0 +1,69 @@
+"""
+Tests unitaires pour la sérialisation JSON rapide
+Repli sur la bibliothèque standard, colonnes CompatJSON et réponses de l'API
+"""
+
+import json
+
+import pytest
+from fastapi.datastructures import DefaultPlaceholder
+from sqlalchemy.dialects import sqlite
+
+from app.api.responses import FastJSONResponse
+from app.core import serialization
+from app.db.compat import CompatJSON
+
+
+@pytest.fixture(params=["json", "orjson"])
+def backend(request, monkeypatch):
+    if request.param == "orjson" and serialization.orjson is None:
+        pytest.skip("orjson non installé")
+    monkeypatch.setattr(serialization, "JSON_BACKEND", request.param)
+    return request.param
+
+
+@pytest.mark.unit
+class TestSerialization:
+    """Tests de app.core.serialization"""
+
+    def test_round_trip_is_compact_and_utf8(self, backend):
+        value = {"étape": "Planification", "progress": [10, 20.5], "ok": True, "none": None}
+
+        text = serialization.dumps(value)
+
+        assert text == '{"étape":"Planification","progress":[10,20.5],"ok":true,"none":null}'
+        assert serialization.loads(text) == value
+        assert serialization.loads(serialization.dumps_bytes(value)) == value
+
+    def test_orjson_falls_back_for_unsupported_values(self, backend):
+        huge = {"value": 2**70, "1": "clé entière"}
+
+        assert json.loads(serialization.dumps(huge)) == {"value": 2**70, "1": "clé entière"}
+        with pytest.raises(ValueError):
+            serialization.loads("{pas du json")
+
+    def test_compat_json_column(self, backend):
+        column = CompatJSON()
+        dialect = sqlite.dialect()
+
+        stored = column.process_bind_param({"steps": [{"title": "Intro"}]}, dialect)
+
+        assert column.process_result_value(stored, dialect) == {"steps": [{"title": "Intro"}]}
+        assert column.process_result_value("texte libre", dialect) == "texte libre"
+
+    def test_fast_response_and_route_class(self, client):
+        from app.api.endpoints import projects
+
+        body = FastJSONResponse({"date": "2024-01-01", "n": 1}).body
+        response = client.get("/api/v1/templates/stats")
+
+        assert json.loads(body) == {"date": "2024-01-01", "n": 1}
+        assert response.status_code == 200
+        # Les routes avec response_model gardent la sérialisation directe Pydantic
+        project_route = next(
+            route
+            for route in projects.router.routes
+            if route.path == "/{project_id}" and "GET" in route.methods
+        )
+        assert isinstance(project_route.response_class, DefaultPlaceholder)
+        assert project_route.response_class.value is FastJSONResponse
@@ -0,0 +1,164 @@
+"""
+Tests unitaires pour la détection de quasi-doublons
+Signatures MinHash, index LSH, signalement à la sauvegarde et à l'assemblage
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.workflow_models import TaskOutputBand, TaskOutputType
+from app.services import assembly_service, output_service, similarity_service
+
+
+def _text(seed: int, words: int = 400) -> str:
+    rng = random.Random(seed)
+    vocabulary = [f"terme{i}" for i in range(2000)]
+    return " ".join(rng.choice(vocabulary) for _ in range(words))
+
+
+def _edit(text: str, changes: int) -> str:
+    words = text.split()
+    for i in random.Random(changes).sample(range(len(words)), changes):
+        words[i] = "modifié"
+    return " ".join(words)
+
+
+@pytest.mark.unit
+class TestMinHash:
+    """Tests des signatures et de l'index LSH"""
+
+    def test_similarity_tracks_edits(self):
+        base = similarity_service.minhash_signature(_text(1))
+
+        close = similarity_service.minhash_signature(_edit(_text(1), 5))
+        distant = similarity_service.minhash_signature(_text(2))
+
+        assert similarity_service.estimate_similarity(base, close) >= 0.8
+        assert similarity_service.estimate_similarity(base, distant) < 0.1
+
+    def test_signature_is_stable_and_normalized(self):
+        signature = similarity_service.minhash_signature("Élan, l'été; RAPIDE!")
+
+        stored = similarity_service.signature_to_bytes(signature)
+
+        assert len(stored) == similarity_service.NUM_PERM * 4
+        assert (similarity_service.signature_from_bytes(stored) == signature).all()
+        assert (
+            similarity_service.minhash_signature("élan l été rapide") == signature
+        ).all()
+        assert similarity_service.minhash_signature("  --- ") is None
+
+    def test_lsh_query(self):
+        index = similarity_service.MinHashLSH()
+        index.add("a", similarity_service.minhash_signature(_text(1)))
+        index.add("b", similarity_service.minhash_signature(_text(2)))
+
+        matches = index.query(similarity_service.minhash_signature(_edit(_text(2), 3)))
+
+        assert [key for key, _ in matches] == ["b"]
+
+    def test_title_index(self):
+        titles = similarity_service.TitleIndex(["Introduction à Docker", "Conclusion"])
+
+        assert titles.find("Introduction a Docker")[0] == "Introduction à Docker"
+        assert titles.find("Sécurité des conteneurs") is None
+
+
+@pytest.mark.unit
+class TestNearDuplicateOutputs:
+    """Tests du signalement dans output_service et assembly_service"""
+
+    def test_save_flags_near_duplicate_from_other_task(self, db_session, multiple_tasks):
+        first = output_service.create_output(
+            db_session, multiple_tasks[0].id, TaskOutputType.RESEARCH, _text(1)
+        )
+
+        duplicate = output_service.create_output(
+            db_session, multiple_tasks[1].id, TaskOutputType.RESEARCH, _edit(_text(1), 5)
+        )
+        revision = output_service.create_output(
+            db_session, multiple_tasks[0].id, TaskOutputType.RESEARCH, _edit(_text(1), 6)
+        )
+        other_type = output_service.create_output(
+            db_session, multiple_tasks[2].id, TaskOutputType.WRITING, _text(1)
+        )
+
+        assert first.content_minhash is not None
+        assert duplicate.output_metadata["near_duplicate_of"] == first.id
+        assert duplicate.output_metadata["near_duplicate_similarity"] >= 0.8
+        assert "near_duplicate_of" not in revision.output_metadata
+        assert "near_duplicate_of" not in other_type.output_metadata
+
+    def test_candidates_come_from_band_index(self, db_session, multiple_tasks):
+        first = output_service.create_output(
+            db_session, multiple_tasks[0].id, TaskOutputType.RESEARCH, _text(1)
+        )
+        stored = (
+            db_session.query(TaskOutputBand.band_key)
+            .filter(TaskOutputBand.output_id == first.id)
+            .all()
+        )
+        signature = similarity_service.signature_from_bytes(first.content_minhash)
+
+        assert sorted(key for (key,) in stored) == sorted(
+            similarity_service.band_keys(signature)
+        )
+
+        # Sans clés de bandes, l'output n'est plus candidat
+        db_session.query(TaskOutputBand).filter(
+            TaskOutputBand.output_id == first.id
+        ).delete()
+        assert (
+            similarity_service.find_near_duplicate_output(
+                db_session, multiple_tasks[1].id, TaskOutputType.RESEARCH, signature
+            )
+            is None
+        )
+
+    def test_cleanup_removes_band_keys(self, db_session, multiple_tasks):
+        old = output_service.create_output(
+            db_session, multiple_tasks[0].id, TaskOutputType.RESEARCH, _text(1)
+        )
+        latest = output_service.create_output(
+            db_session, multiple_tasks[0].id, TaskOutputType.RESEARCH, _text(2)
+        )
+        old.created_at = datetime.utcnow() - timedelta(days=60)
+        db_session.commit()
+
+        assert output_service.cleanup_old_outputs(db_session, days_old=30) == 1
+
+        remaining = {
+            output_id for (output_id,) in db_session.query(TaskOutputBand.output_id)
+        }
+        assert remaining == {latest.id}
+        # Plus de bande orpheline: l'output supprimé n'est plus un quasi-doublon
+        assert (
+            similarity_service.find_near_duplicate_output(
+                db_session,
+                multiple_tasks[1].id,
+                TaskOutputType.RESEARCH,
+                similarity_service.minhash_signature(_text(1)),
+            )
+            is None
+        )
+
+    def test_assembly_skips_or_flags_near_duplicates(
+        self, db_session, sample_project, multiple_tasks
+    ):
+        contents = [_text(1), _edit(_text(1), 4), _text(3)]
+        for task, content in zip(multiple_tasks, contents):
+            output_service.create_output(db_session, task.id, TaskOutputType.RESEARCH, content)
+        task_ids = [task.id for task in multiple_tasks[:3]]
+
+        merged = output_service.merge_outputs_for_assembly(db_session, task_ids)
+        kept = output_service.merge_outputs_for_assembly(
+            db_session, task_ids, skip_near_duplicates=False
+        )
+        result = assembly_service.assemble_project_incremental(db_session, sample_project.id)
+
+        assert "# Task 2" not in merged
+        assert merged.count("\n\n---\n\n") == 1
+        assert kept.count("\n\n---\n\n") == 2
+        assert result["near_duplicate_sections"] == [multiple_tasks[1].id]
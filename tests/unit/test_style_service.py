@@ -0,0 +1,145 @@
+"""
+Tests unitaires du score de conformité de style
+Métriques du profil, expressions signature des templates et métadonnées à la sauvegarde
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from app.models.models import BlogTemplate
+from app.models.workflow_models import TaskOutputType
+from app.services import output_service, style_service
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Article de référence rédigé dans le style du blog
+STYLED_ARTICLE = (PROJECT_ROOT / "exemple_article_style_boulet.md").read_text(encoding="utf-8")
+
+FLAT_ARTICLE = "Le système est configuré selon la procédure. Le module est installé. " * 40
+
+EXPRESSIONS = ("Du coup", "En fait", "Au final", "Voici comment")
+
+
+@pytest.mark.unit
+class TestScoreStyle:
+    """Tests du score contre le profil"""
+
+    def test_reference_article_conforms(self):
+        result = style_service.score_style(STYLED_ARTICLE, EXPRESSIONS)
+
+        assert result["conforms"]
+        assert result["expressions_found"] == ["du coup", "en fait"]
+        assert result["metrics"]["signature_expressions"]["value"] == 2
+
+    def test_impersonal_text_does_not_conform(self):
+        result = style_service.score_style(FLAT_ARTICLE, EXPRESSIONS)
+
+        assert not result["conforms"]
+        assert result["score"] < 0.3
+        assert result["metrics"]["personal_pronouns"]["score"] == 0
+
+    def test_short_text_never_conforms(self):
+        result = style_service.score_style("Du coup, je pense que c'est cool !", EXPRESSIONS)
+
+        assert result["word_count"] < style_service.STYLE_MIN_WORDS
+        assert not result["conforms"]
+
+    def test_metric_at_target_scores_one(self):
+        profile = dict(style_service.DEFAULT_PROFILE, sentence_length=4)
+
+        result = style_service.score_style("Un deux trois quatre. " * 10, profile=profile)
+
+        assert result["metrics"]["sentence_length"]["score"] == 1
+
+    def test_profile_is_read_from_report(self, tmp_path):
+        report = tmp_path / "report.json"
+        report.write_text(
+            '{"content_analysis": {"avg_sentence_length": 9.5},'
+            ' "writing_style": {"avg_personal_pronouns": 0.05, "avg_questions": 0.01,'
+            ' "avg_exclamations": 0.02, "avg_informal": 0.004}}',
+            encoding="utf-8",
+        )
+
+        profile = style_service.load_profile(str(report))
+
+        assert profile["sentence_length"] == 9.5
+        assert profile["personal_pronouns"] == 0.05
+        assert style_service.load_profile(str(tmp_path / "absent.json")) == (
+            style_service.DEFAULT_PROFILE
+        )
+
+    def test_unreadable_profile_is_logged(self, tmp_path, caplog):
+        report = tmp_path / "report.json"
+        report.write_text("{}", encoding="utf-8")
+
+        with caplog.at_level("WARNING", logger="app.services.style_service"):
+            profile = style_service.load_profile(str(report))
+
+        assert profile == style_service.DEFAULT_PROFILE
+        assert "Profil de style illisible" in caplog.text
+
+    def test_scoring_an_article_is_cheap(self):
+        style_service.score_style(STYLED_ARTICLE, EXPRESSIONS)  # compilation du matcher
+
+        best = min(
+            _timed(lambda: style_service.score_style(STYLED_ARTICLE, EXPRESSIONS))
+            for _ in range(20)
+        )
+
+        assert best < 0.005, f"{best * 1000:.2f} ms par article"
+
+
+def _timed(function) -> float:
+    started = time.perf_counter()
+    function()
+    return time.perf_counter() - started
+
+
+@pytest.mark.unit
+class TestStyleMetadata:
+    """Tests des expressions des templates et de la sauvegarde des outputs"""
+
+    @pytest.fixture
+    def template(self, db_session):
+        template = BlogTemplate(
+            name="Guide",
+            slug="guide-style",
+            description="Guide",
+            icon="📘",
+            category="Guide",
+            difficulty="Facile",
+            estimated_duration="1h",
+            target_audience="Tous",
+            tone="Pratique",
+            template_structure={"steps": []},
+            sample_expressions={
+                "bas": {"opener": "Voici comment", "closer": "Au final"},
+                "moyen": {"opener": "En fait", "transition": "Du coup", "closer": "Au final"},
+            },
+        )
+        db_session.add(template)
+        db_session.flush()
+        return template
+
+    def test_template_expressions_are_deduplicated(self, db_session, template):
+        assert style_service.template_expressions(db_session) == (
+            "Au final",
+            "Du coup",
+            "En fait",
+            "Voici comment",
+        )
+
+    def test_written_outputs_store_style_scores(self, db_session, template, multiple_tasks):
+        writing = output_service.create_output(
+            db_session, multiple_tasks[0].id, TaskOutputType.WRITING, STYLED_ARTICLE
+        )
+        research = output_service.create_output(
+            db_session, multiple_tasks[1].id, TaskOutputType.RESEARCH, STYLED_ARTICLE
+        )
+
+        style = writing.output_metadata["style"]
+        assert style["conforms"]
+        assert style["expressions_found"] == ["du coup", "en fait"]
+        assert "style" not in research.output_metadata
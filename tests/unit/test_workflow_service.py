@@ -0,0 +1,117 @@
+"""
+Tests unitaires pour le service de workflows
+Checkpoints d'étapes et reprise des workflows échoués
+"""
+
+import pytest
+
+from app.exceptions import WorkflowNotFound, WorkflowNotResumable
+from app.models.workflow_models import WorkflowStatus, WorkflowType
+from app.services import workflow_service
+
+
+@pytest.fixture
+def workflow(db_session, sample_project):
+    """Workflow d'article complet pour les tests"""
+    workflow = workflow_service.create_workflow_execution(
+        db=db_session,
+        project_id=sample_project.id,
+        workflow_type=WorkflowType.FULL_ARTICLE,
+    )
+    db_session.commit()
+    return workflow
+
+
+@pytest.mark.unit
+class TestStepCheckpoints:
+    """Tests des checkpoints d'étapes"""
+
+    def test_record_step_checkpoint(self, db_session, workflow):
+        """Un checkpoint est enregistré dans current_step"""
+        workflow_service.record_step_checkpoint(
+            db_session, workflow.id, "planning", {"created_count": 5}
+        )
+
+        checkpoints = workflow_service.get_step_checkpoints(workflow)
+        assert list(checkpoints) == ["planning"]
+        assert checkpoints["planning"]["created_count"] == 5
+        assert "completed_at" in checkpoints["planning"]
+
+    def test_checkpoints_survive_step_updates(self, db_session, workflow):
+        """Les changements d'étape conservent les checkpoints"""
+        workflow_service.record_step_checkpoint(db_session, workflow.id, "planning")
+        workflow_service.update_workflow_step(
+            db_session, workflow.id, step_name="research", progress=40
+        )
+
+        assert workflow.current_step["step_name"] == "research"
+        assert "planning" in workflow_service.get_step_checkpoints(workflow)
+
+    def test_checkpoints_survive_failure(self, db_session, workflow):
+        """Un échec conserve les checkpoints pour la reprise"""
+        workflow_service.record_step_checkpoint(db_session, workflow.id, "planning")
+        workflow_service.record_step_checkpoint(db_session, workflow.id, "research")
+        workflow_service.mark_workflow_complete(
+            db_session,
+            workflow.id,
+            success=False,
+            error_details={"error": "boom", "step": "assembly"},
+        )
+
+        assert workflow.status == WorkflowStatus.FAILED
+        assert list(workflow_service.get_step_checkpoints(workflow)) == [
+            "planning",
+            "research",
+        ]
+
+    def test_record_checkpoint_unknown_workflow(self, db_session):
+        """Un workflow inexistant retourne None"""
+        assert (
+            workflow_service.record_step_checkpoint(db_session, "missing", "planning")
+            is None
+        )
+
+
+@pytest.mark.unit
+class TestWorkflowResume:
+    """Tests de la préparation d'une reprise"""
+
+    def test_prepare_resume_failed_workflow(self, db_session, workflow):
+        """La reprise repart de la première étape non checkpointée"""
+        workflow_service.record_step_checkpoint(db_session, workflow.id, "planning")
+        workflow_service.record_step_checkpoint(db_session, workflow.id, "research")
+        workflow_service.mark_workflow_complete(
+            db_session, workflow.id, success=False, error_details={"error": "boom"}
+        )
+
+        resumed = workflow_service.prepare_workflow_resume(db_session, workflow.id)
+
+        assert resumed.status == WorkflowStatus.PENDING
+        assert resumed.error_details is None
+        assert resumed.current_step["step_name"] == "assembly"
+        assert resumed.current_step["resumed"] is True
+        assert "research" in workflow_service.get_step_checkpoints(resumed)
+
+    def test_prepare_resume_running_workflow(self, db_session, workflow):
+        """Un workflow en cours ne peut pas être repris"""
+        workflow_service.update_workflow_step(
+            db_session, workflow.id, step_name="planning", progress=10
+        )
+
+        with pytest.raises(WorkflowNotResumable):
+            workflow_service.prepare_workflow_resume(db_session, workflow.id)
+
+    def test_prepare_resume_not_found(self, db_session):
+        """Un workflow inexistant lève WorkflowNotFound"""
+        with pytest.raises(WorkflowNotFound):
+            workflow_service.prepare_workflow_resume(db_session, "missing")
+
+    def test_resume_endpoint_conflict(self, client, workflow):
+        """L'endpoint refuse de reprendre un workflow non échoué"""
+        response = client.post(f"/api/v1/projects/workflows/{workflow.id}/resume")
+        assert response.status_code == 409
+
+    def test_resume_endpoint_not_found(self, client):
+        """L'endpoint retourne 404 pour un workflow inexistant"""
+        response = client.post("/api/v1/projects/workflows/missing/resume")
+        assert response.status_code == 404